@@ -0,0 +1,49 @@
+"""Per-call cost of validated vs. trusted scalar membership evaluation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_membership_functions
+"""
+
+import timeit
+
+from src.mostly.membership_functions import (
+    MembershipFunction,
+    MFBimodalGaussian,
+    MFGaussian,
+    MFGeneralizedBell,
+    MFTrapezoidal,
+    MFTriangular,
+)
+
+CASES: dict[str, MembershipFunction] = {
+    "MFTriangular (regular)": MFTriangular(a=0.0, b=5.0, c=10.0),
+    "MFTriangular (left)": MFTriangular(a=0.0, b=0.0, c=10.0),
+    "MFTrapezoidal (regular)": MFTrapezoidal(a=0.0, b=4.0, c=6.0, d=10.0),
+    "MFTrapezoidal (right)": MFTrapezoidal(a=0.0, b=4.0, c=10.0, d=10.0),
+    "MFGaussian": MFGaussian(mean=5.0, sigma=1.0),
+    "MFGeneralizedBell": MFGeneralizedBell(width=2.0, slope=4.0, center=5.0),
+    "MFBimodalGaussian (plateau)": MFBimodalGaussian(left_mean=3.0, left_sigma=1.0, right_mean=7.0, right_sigma=1.0),
+    "MFBimodalGaussian (product)": MFBimodalGaussian(left_mean=7.0, left_sigma=1.0, right_mean=3.0, right_sigma=1.0),
+}
+
+INPUTS = [0.5 * i for i in range(21)]
+
+
+def per_call_ns(fn, number: int = 2_000) -> float:
+    """Best-of-five time per single evaluation in nanoseconds."""
+    best = min(timeit.repeat(lambda: [fn(x) for x in INPUTS], number=number, repeat=5))
+    return best / (number * len(INPUTS)) * 1e9
+
+
+def main() -> None:
+    """Print the per-call timings and speedups for every membership function class."""
+    print(f"{'membership function':<30} {'validated [ns]':>15} {'trusted [ns]':>13} {'speedup':>8}")
+    for name, mf in CASES.items():
+        validated = per_call_ns(mf)
+        trusted = per_call_ns(mf.trusted)
+        print(f"{name:<30} {validated:>15.0f} {trusted:>13.0f} {validated / trusted:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bounded LRU memo cache for the fuzzification of repeating crisp values."""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from ._tracking import current_revision
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a fuzzification cache, in the spirit of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    maxsize: int
+    currsize: int
+    quantum: float | None
+
+
+class FuzzifyCache:
+    """Bounded LRU cache of fuzzification results keyed by the (optionally quantized) crisp value.
+
+    With a `quantum`, every value is snapped to the nearest multiple of `quantum` before evaluation, so all
+    values of a bucket share one entry and one result. Whenever the global revision moves on, i.e. after a change
+    to any tracked model, the cache compares a snapshot of the state of its owner and empties itself only if that
+    changed, so it never serves degrees of outdated parameters yet survives changes to unrelated models.
+    """
+
+    __slots__ = ("_entries", "_revision", "_state", "hits", "invalidations", "maxsize", "misses", "quantum")
+
+    def __init__(self, maxsize: int, quantum: float | None) -> None:
+        """Create an empty cache."""
+        self.maxsize, self.quantum = maxsize, quantum
+        self.hits = self.misses = self.invalidations = 0
+        self._entries: OrderedDict[float | int, Any] = OrderedDict()
+        # Taken on the first lookup
+        self._revision, self._state = -1, None
+
+    def lookup(self, x: float, compute: Callable[[float], Any], state: Callable[[], object]) -> Any:
+        """Return the cached result for `x`, computing it with `compute` on a miss.
+
+        `compute` receives `x` itself, or its nearest multiple of `quantum`. `state` returns a comparable snapshot
+        of everything the results depend on; it is only called after the global revision moved on.
+        """
+        entries = self._entries
+        if self._revision != current_revision():
+            snapshot = state()
+            if snapshot != self._state:
+                if entries:
+                    self.invalidations += 1
+                    entries.clear()
+                self._state = snapshot
+            self._revision = current_revision()
+
+        key = x if self.quantum is None else round(x / self.quantum)
+        value = entries.get(key)
+        if value is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = compute(x if self.quantum is None else key * self.quantum)
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and invalidation counts and the current size."""
+        return CacheInfo(self.hits, self.misses, self.invalidations, self.maxsize, len(self._entries), self.quantum)
+
+    def empty_copy(self) -> "FuzzifyCache":
+        """Return an empty cache with the same configuration."""
+        return FuzzifyCache(self.maxsize, self.quantum)
+
+    def __getstate__(self) -> tuple[int, float | None]:
+        """Pickle the configuration only; entries and statistics belong to the process."""
+        return self.maxsize, self.quantum
+
+    def __setstate__(self, state: tuple[int, float | None]) -> None:
+        """Restore an empty cache."""
+        self.__init__(*state)
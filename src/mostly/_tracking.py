@@ -0,0 +1,182 @@
+"""Change tracking for structures derived from mutable models.
+
+The pydantic models of this package are mutable, yet several of them precompute derived structures (term banks,
+compiled rule programs, sampled tables). Every structural change to a tracked model - reassigning one of its fields
+or mutating one of its tracked containers - bumps a single process-wide revision counter. Derived structures
+remember the revision they were built at and are rebuilt lazily once it has moved on.
+
+Mutations are rare compared to evaluations, so one global counter keeps the staleness check down to a single
+integer comparison, at the price of occasionally rebuilding a structure that was not affected by a change.
+"""
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Self, SupportsIndex
+
+from pydantic import BaseModel, PrivateAttr
+
+_revision = 0
+
+
+def current_revision() -> int:
+    """Return the current global revision."""
+    return _revision
+
+
+def bump_revision() -> None:
+    """Invalidate every derived structure built so far."""
+    global _revision
+    _revision += 1
+
+
+class TrackedDict[K, V](dict[K, V]):
+    """A dict that bumps the global revision whenever it is mutated."""
+
+    def __setitem__(self, key: K, value: V) -> None:
+        super().__setitem__(key, value)
+        bump_revision()
+
+    def __delitem__(self, key: K) -> None:
+        super().__delitem__(key)
+        bump_revision()
+
+    def __ior__(self, other: Any) -> Self:
+        super().__ior__(other)
+        bump_revision()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        bump_revision()
+
+    def pop(self, *args: Any) -> V:
+        value = super().pop(*args)
+        bump_revision()
+        return value
+
+    def popitem(self) -> tuple[K, V]:
+        item = super().popitem()
+        bump_revision()
+        return item
+
+    def setdefault(self, key: K, default: Any = None) -> V:
+        value = super().setdefault(key, default)
+        bump_revision()
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        bump_revision()
+
+
+class TrackedList[T](list[T]):
+    """A list that bumps the global revision whenever it is mutated."""
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        bump_revision()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        bump_revision()
+
+    def __iadd__(self, other: Iterable[T]) -> Self:
+        super().__iadd__(other)
+        bump_revision()
+        return self
+
+    def __imul__(self, n: SupportsIndex) -> Self:
+        super().__imul__(n)
+        bump_revision()
+        return self
+
+    def append(self, value: T) -> None:
+        super().append(value)
+        bump_revision()
+
+    def extend(self, values: Iterable[T]) -> None:
+        super().extend(values)
+        bump_revision()
+
+    def insert(self, index: SupportsIndex, value: T) -> None:
+        super().insert(index, value)
+        bump_revision()
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        value = super().pop(index)
+        bump_revision()
+        return value
+
+    def remove(self, value: T) -> None:
+        super().remove(value)
+        bump_revision()
+
+    def clear(self) -> None:
+        super().clear()
+        bump_revision()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        bump_revision()
+
+    def reverse(self) -> None:
+        super().reverse()
+        bump_revision()
+
+
+class TrackedModel(BaseModel):
+    """Base model whose field assignments invalidate derived structures.
+
+    Derived structures are cached per instance through `_derived_value` and are never part of equality,
+    copies or pickles.
+    """
+
+    _derived: dict[str, tuple[int, Hashable, Any]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign an attribute, bumping the revision for model fields."""
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            bump_revision()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare models by type and fields, ignoring derived state."""
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __copy__(self) -> Self:
+        """Shallow copy without sharing derived structures."""
+        copied = super().__copy__()
+        copied._derived = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Deep copy without sharing derived structures."""
+        copied = super().__deepcopy__(memo)
+        copied._derived = {}
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Drop derived structures from the pickled state."""
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__") or {}
+        state["__pydantic_private__"] = {k: v for k, v in private.items() if k != "_derived"}
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore the pickled state with empty derived structures."""
+        super().__setstate__(state)
+        self._derived = {}
+
+    def _derived_value[R](self, key: str, build: Callable[[], R], params: Hashable = None) -> R:
+        """Return the derived structure `key` built for `params`, rebuilding it if anything changed since it was built.
+
+        One entry is kept per key: a structure that depends on parameters, e.g. a resolution, is rebuilt when they
+        change instead of being cached once per value.
+        """
+        derived = self.__pydantic_private__["_derived"]  # direct lookup, bypassing the slow private `__getattr__`
+        entry = derived.get(key)
+        if entry is None or entry[0] != _revision or entry[1] != params:
+            entry = (_revision, params, build())
+            derived[key] = entry
+        return entry[2]
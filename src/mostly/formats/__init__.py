@@ -0,0 +1,6 @@
+"""Reading and writing rule bases in the file formats of other fuzzy logic tools."""
+
+from .fcl import read_fcl, write_fcl
+from .matlab import read_fis, write_fis
+
+__all__ = ["read_fcl", "read_fis", "write_fcl", "write_fis"]
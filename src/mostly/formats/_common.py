@@ -0,0 +1,68 @@
+"""Helpers shared by the readers and writers of rule base files."""
+
+import math
+import os
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import TextIO
+
+from ..fuzzy_rules.fuzzy_rule import FuzzyRule
+from ..inference.mamdani import MamdaniFIS
+from ..membership_functions import MFTrapezoidal, MFTriangular
+from ..membership_functions.base import Interval
+
+type TextFile = str | os.PathLike[str] | TextIO
+
+
+@contextmanager
+def open_text(file: TextFile, mode: str) -> Iterator[TextIO]:
+    """Open a path as a UTF-8 text file, or pass an open text stream through without closing it."""
+    if isinstance(file, str | os.PathLike):
+        with open(file, mode, encoding="utf-8") as stream:
+            yield stream
+    else:
+        yield file
+
+
+def number(value: float) -> str:
+    """Format a number so it reads back exactly."""
+    return repr(float(value))
+
+
+def linear_shape(feet: Sequence[float], uod: Interval) -> MFTriangular | MFTrapezoidal:
+    """Build a triangle from 3 or a trapezoid from 4 points of a shape that is zero outside its outer feet.
+
+    `MFTriangular` and `MFTrapezoidal` extend a vertical edge (e.g. `a == b`) into a shoulder up to ±inf. The
+    shapes agree within the UOD as long as such an edge lies on or beyond its bounds.
+
+    Raises
+    ------
+    ValueError
+        If the points are invalid, or a vertical edge lies within the UOD.
+
+    """
+    if len(feet) == 3:
+        mf = MFTriangular(a=feet[0], b=feet[1], c=feet[2])
+    else:
+        mf = MFTrapezoidal(a=feet[0], b=feet[1], c=feet[2], d=feet[3])
+    left, right = mf.support()
+    if (left == -math.inf and feet[0] > uod[0]) or (right == math.inf and feet[-1] < uod[1]):
+        raise ValueError(
+            f"The shape {list(feet)} has a vertical edge within the range {uod}, where it would become a shoulder."
+        )
+    return mf
+
+
+def system_rules(fis: MamdaniFIS) -> Iterator[FuzzyRule]:
+    """Yield the fuzzy rules of a FIS, followed by the rules of its rule tables."""
+    yield from fis.fuzzy_rules
+    for table in fis.rule_tables:
+        yield from table.to_rules(
+            {concept: list(fis.input_variables[concept].fuzzy_sets) for concept in table.inputs},
+            list(fis.output_variables[table.output].fuzzy_sets),
+        )
+
+
+def count_rules(fis: MamdaniFIS) -> int:
+    """Return the number of rules `system_rules` yields."""
+    return len(fis.fuzzy_rules) + sum(int((table.consequents >= 0).sum()) for table in fis.rule_tables)
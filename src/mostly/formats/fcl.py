@@ -0,0 +1,466 @@
+"""Reading and writing Fuzzy Control Language (IEC 61131-7) rule bases.
+
+A Mamdani system is one FCL function block: its `VAR_INPUT` and `VAR_OUTPUT` variables, a `FUZZIFY` block with
+the terms of every input, a `DEFUZZIFY` block with the terms of every output, and rule blocks::
+
+    FUNCTION_BLOCK tipper
+    VAR_INPUT
+        service : REAL;
+    END_VAR
+    VAR_OUTPUT
+        tip : REAL;
+    END_VAR
+    FUZZIFY service
+        TERM poor := (0, 1) (4, 0);
+        TERM good := (1, 0) (4, 1) (6, 1) (9, 0);
+        RANGE := (0 .. 10);
+    END_FUZZIFY
+    DEFUZZIFY tip
+        TERM cheap := (0, 0) (5, 1) (10, 0);
+        TERM generous := gauss 20 4;
+        METHOD : COG;
+        RANGE := (0 .. 30);
+    END_DEFUZZIFY
+    RULEBLOCK tipping
+        AND : MIN;
+        ACT : MIN;
+        ACCU : MAX;
+        RULE 1 : IF service IS poor THEN tip IS cheap;
+        RULE 2 : IF service IS NOT poor THEN tip IS generous WITH 0.5;
+    END_RULEBLOCK
+    END_FUNCTION_BLOCK
+
+Terms are lists of points, read as `MFPiecewiseLinear`, or one of the common extensions `TRIAN a b c`,
+`TRAPE a b c d`, `GAUSS mean sigma` and `GBELL width slope center`. `RANGE` may be left out, in which case it
+spans the terms. The operators map onto `InferenceConfig`: `AND : MIN` and `OR : MAX` (the only ones `And` and
+`Or` implement), `ACT : MIN | PROD` (clip or scale), `ACCU : MAX | SUM | PROBOR` and `METHOD : COG`. `DEFAULT`
+and `LOCK` are ignored; a FIS infers zero where no rule fires. Singleton terms and hedges are not supported.
+"""
+
+import math
+import re
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TextIO
+
+from ..fuzzy_rules.fuzzy_rule import FuzzyRule
+from ..fuzzy_rules.logical_operators import And, Is, Not, Or, construct_node, snake
+from ..fuzzy_rules.parser import parse_fcl_rule
+from ..inference.mamdani import InferenceConfig, MamdaniFIS
+from ..linguistic_variable import LinguisticVariable
+from ..membership_functions import MembershipFunction, MFGaussian, MFGeneralizedBell, MFPiecewiseLinear
+from ..membership_functions.base import Interval
+from ._common import TextFile, linear_shape, number, open_text, system_rules
+
+_TOKEN = re.compile(r":=|\.\.|[-+]?(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][-+]?\d+)?|\w+|\S")
+_COMMENT = re.compile(r"\(\*|/\*|//|#")
+_CLOSING = {"(*": "*)", "/*": "*/"}
+_RULE = re.compile(r"\s*RULE\s+\w+\s*:(.*)", re.IGNORECASE | re.DOTALL)
+# Conjunctions of plain conditions, e.g. the rules of generated rule grids, skip the general rule parser
+_CONJUNCTIVE = re.compile(
+    r"\s*IF\s+(\w+\s+IS\s+\w+(?:\s+AND\s+\w+\s+IS\s+\w+)*)\s+THEN\s+(\w+\s+IS\s+\w+(?:\s*,\s*\w+\s+IS\s+\w+)*)"
+    r"(?:\s+WITH\s+(\S+))?\s*",
+    re.IGNORECASE,
+)
+_CONDITION = re.compile(r"(\w+)\s+IS\s+(\w+)", re.IGNORECASE)
+# Block keywords end their statement without a semicolon, after the name of the block if they take one
+_BLOCKS = {
+    "FUNCTION_BLOCK": 2,
+    "END_FUNCTION_BLOCK": 1,
+    "VAR_INPUT": 1,
+    "VAR_OUTPUT": 1,
+    "END_VAR": 1,
+    "FUZZIFY": 2,
+    "END_FUZZIFY": 1,
+    "DEFUZZIFY": 2,
+    "END_DEFUZZIFY": 1,
+    "RULEBLOCK": 2,
+    "END_RULEBLOCK": 1,
+}
+_OPERATORS = {
+    "AND": {"MIN": "min"},
+    "OR": {"MAX": "max"},
+    "ACT": {"MIN": "clip", "PROD": "scale"},
+    "ACCU": {"MAX": "max", "SUM": "sum", "PROBOR": "probor", "ASUM": "probor"},
+    "METHOD": {"COG": "centroid"},
+}
+_SHAPES = {"TRIAN": 3, "TRAPE": 4, "GAUSS": 2, "GBELL": 3}
+
+
+class _Variable:
+    """Declaration and terms of one variable, as read so far."""
+
+    __slots__ = ("line", "output", "terms", "uod")
+
+    def __init__(self, line: int, output: bool) -> None:
+        self.line = line
+        self.output = output
+        self.terms: dict[str, tuple[int, list[str]]] = {}
+        self.uod: Interval | None = None
+
+
+def _uncomment(line: str, closing: str | None) -> tuple[str, str | None]:
+    """Remove the comments from a line, given the closing delimiter of a comment left open by earlier lines.
+
+    Returns the code of the line and the closing delimiter of a comment it leaves open, if any.
+    """
+    code = []
+    while True:
+        if closing is not None:
+            end = line.find(closing)
+            if end < 0:
+                return " ".join(code), closing
+            line, closing = line[end + 2 :], None
+        comment = _COMMENT.search(line)
+        if comment is None:
+            code.append(line)
+            return " ".join(code), None
+        code.append(line[: comment.start()])
+        if comment[0] in ("//", "#"):
+            return " ".join(code), None
+        line, closing = line[comment.end() :], _CLOSING[comment[0]]
+
+
+def _statements(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Yield the first line number and the text of every statement, reading one line at a time.
+
+    Statements end with a semicolon, except for block keywords, which end after the name of the block if they
+    take one. Comments are removed.
+    """
+    pending, start, closing = "", 0, None
+    for at, line in enumerate(lines, 1):
+        if closing is not None or _COMMENT.search(line):
+            line, closing = _uncomment(line, closing)
+        while line:
+            if not pending:
+                head = line.split(None, 1)
+                if not head:
+                    break
+                size = _BLOCKS.get(head[0].upper())
+                if size is not None:
+                    words = line.split(None, size)
+                    yield at, " ".join(words[:size])
+                    line = words[size] if len(words) > size else ""
+                    continue
+                start = at
+            statement, semicolon, line = line.partition(";")
+            if not semicolon:
+                pending += statement + " "
+                break
+            yield start, pending + statement
+            pending = ""
+    if pending.strip():
+        yield start, pending
+
+
+def _floats(tokens: list[str]) -> list[float]:
+    try:
+        return [float(token) for token in tokens]
+    except ValueError:
+        raise ValueError(f"expected numbers, got {' '.join(tokens)!r}.") from None
+
+
+def _term(tokens: list[str], uod: Interval | None) -> MembershipFunction:
+    """Build the membership function of the tokens after `:=` of a TERM statement."""
+    shape = tokens[0].upper()
+    if shape in _SHAPES:
+        params = _floats(tokens[1:])
+        if len(params) != _SHAPES[shape]:
+            raise ValueError(f"{shape} takes {_SHAPES[shape]} parameters, got {len(params)}.")
+        match shape:
+            case "GAUSS":
+                return MFGaussian(mean=params[0], sigma=params[1])
+            case "GBELL":
+                return MFGeneralizedBell(width=params[0], slope=params[1], center=params[2])
+            case _:
+                return linear_shape(params, uod or (min(params), max(params)))
+    if tokens[0] != "(":
+        raise ValueError(f"expected a list of points or a shape, got {' '.join(tokens)!r}.")
+    # (x, y) (x, y) ...
+    points = [token for token in tokens if token not in ("(", ")", ",")]
+    if len(tokens) != 5 * (len(points) // 2) or len(points) % 2:
+        raise ValueError(f"expected points '(x, y)', got {' '.join(tokens)!r}.")
+    values = _floats(points)
+    return MFPiecewiseLinear(xs=values[::2], ys=values[1::2])
+
+
+def _hull(mfs: Iterable[MembershipFunction]) -> Interval:
+    """Return the range spanned by the knots of linear terms and the 1% support of the other terms."""
+    lo, hi = float("inf"), float("-inf")
+    for mf in mfs:
+        knots = mf._knots()
+        left, right = (knots[0][0], knots[0][-1]) if knots is not None else mf.support(0.01)
+        lo, hi = min(lo, left), max(hi, right)
+    return lo, hi
+
+
+def _check_names(line: int, node: Is | And | Or | Not, variables: Mapping[str, _Variable]) -> None:
+    match node:
+        case Is(concept=concept, term=term):
+            variable = variables.get(concept)
+            if variable is None or variable.output:
+                raise ValueError(f"Line {line}: unknown input variable '{concept}'.")
+            if term not in variable.terms:
+                raise ValueError(f"Line {line}: unknown term '{term}' of '{concept}'.")
+        case Not(child=child):
+            _check_names(line, child, variables)
+        case And(children=children) | Or(children=children):
+            for child in children:
+                _check_names(line, child, variables)
+
+
+def _conjunctive_rule(
+    line: int,
+    rule: re.Match[str],
+    variables: Mapping[str, _Variable],
+    names: dict[tuple[str, str], Is | tuple[str, str]],
+) -> FuzzyRule:
+    """Build a rule matched by `_CONJUNCTIVE`, checking and building every distinct condition once."""
+    cells = []
+    for part, output in ((rule[1], False), (rule[2], True)):
+        for pair in _CONDITION.findall(part):
+            cell = names.get(pair)
+            if cell is None:
+                concept, term = sys.intern(snake(pair[0])), sys.intern(snake(pair[1]))
+                variable = variables.get(concept)
+                if variable is None or variable.output != output or term not in variable.terms:
+                    kind = "output" if output else "input"
+                    raise ValueError(f"Line {line}: unknown {kind} term '{term}' of '{concept}'.")
+                cell = names[pair] = (concept, term) if output else construct_node(Is, concept, term)
+            cells.append(cell)
+    conditions = [cell for cell in cells if type(cell) is Is]
+    consequences = dict(cell for cell in cells if type(cell) is tuple)
+    if len(consequences) != len(cells) - len(conditions):
+        raise ValueError(f"Line {line}: a consequence concept is repeated.")
+    try:
+        weight = 1.0 if rule[3] is None else float(rule[3])
+    except ValueError:
+        weight = math.nan
+    if not math.isfinite(weight):
+        raise ValueError(f"Line {line}: expected a finite weight, got {rule[3]!r}.")
+    antecedent = conditions[0] if len(conditions) == 1 else construct_node(And, tuple(conditions))
+    return FuzzyRule._construct(antecedent, consequences, weight)
+
+
+def _parsed_rule(line: int, text: str, variables: Mapping[str, _Variable]) -> FuzzyRule:
+    """Build a rule with the general rule parser, checking every name."""
+    try:
+        antecedent, consequences, weight = parse_fcl_rule(text.strip())
+    except ValueError as error:
+        raise ValueError(f"Line {line}: {error}") from None
+    _check_names(line, antecedent, variables)
+    for concept, term in consequences:
+        variable = variables.get(concept)
+        if variable is None or not variable.output or term not in variable.terms:
+            raise ValueError(f"Line {line}: unknown output term '{term}' of '{concept}'.")
+    return FuzzyRule._construct(antecedent, dict(consequences), weight)
+
+
+def read_fcl(file: TextFile) -> MamdaniFIS:
+    """Read a Mamdani FIS from the first function block of a Fuzzy Control Language file.
+
+    The file is read one line at a time and each rule is built as soon as its statement ends, so rule bases with
+    hundreds of thousands of rules load without holding the text in memory. Rules are built in bulk, without
+    validating the nodes: conjunctions of plain conditions, such as the rules of generated rule grids, like
+    `FuzzyRule.from_records`, with every distinct condition checked and built once and shared between rules; all
+    other rules like `FuzzyRule.parse`, with repeated rule texts sharing one parse.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | TextIO
+        Path of the file, or an open text stream.
+
+    Returns
+    -------
+    MamdaniFIS
+        The inference system, named after the function block in its `meta_fields`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not valid FCL, uses an unsupported feature, or its terms do not make valid linguistic
+        variables; the message names the line.
+
+    """
+    variables: dict[str, _Variable] = {}
+    settings: dict[str, tuple[int, str]] = {}
+    rules: list[FuzzyRule] = []
+    # Every distinct condition and consequence of the conjunctive rules, checked once and shared
+    names: dict[tuple[str, str], Is | tuple[str, str]] = {}
+    name, block, current = None, None, None
+    with open_text(file, "r") as stream:
+        for line, text in _statements(stream):
+            rule = _RULE.match(text) if block == "RULEBLOCK" else None
+            if rule is not None:
+                conjunctive = _CONJUNCTIVE.fullmatch(rule[1])
+                if conjunctive is not None:
+                    rules.append(_conjunctive_rule(line, conjunctive, variables, names))
+                else:
+                    rules.append(_parsed_rule(line, rule[1], variables))
+                continue
+            statement = _TOKEN.findall(text)
+            if not statement:
+                continue
+            keyword = statement[0].upper()
+            match keyword:
+                case "FUNCTION_BLOCK":
+                    name = statement[1] if len(statement) > 1 else None
+                case "END_FUNCTION_BLOCK":
+                    break
+                case "VAR_INPUT" | "VAR_OUTPUT" | "RULEBLOCK":
+                    block = keyword
+                case "FUZZIFY" | "DEFUZZIFY":
+                    current = variables.get(snake(statement[1])) if len(statement) > 1 else None
+                    if current is None or current.output != (keyword == "DEFUZZIFY"):
+                        kind = "output" if keyword == "DEFUZZIFY" else "input"
+                        raise ValueError(f"Line {line}: {text.strip()!r} does not name a declared {kind} variable.")
+                    block = keyword
+                case "END_VAR" | "END_FUZZIFY" | "END_DEFUZZIFY" | "END_RULEBLOCK":
+                    block = None
+                case _ if block in ("VAR_INPUT", "VAR_OUTPUT"):
+                    if len(statement) < 3 or statement[1] != ":":
+                        raise ValueError(f"Line {line}: expected a declaration 'name : REAL'.")
+                    variables[snake(statement[0])] = _Variable(line, block == "VAR_OUTPUT")
+                case "TERM" if block in ("FUZZIFY", "DEFUZZIFY"):
+                    if len(statement) < 4 or statement[2] != ":=":
+                        raise ValueError(f"Line {line}: expected a term 'TERM name := ...'.")
+                    current.terms[snake(statement[1])] = (line, statement[3:])
+                case "RANGE" if block in ("FUZZIFY", "DEFUZZIFY"):
+                    bounds = [token for token in statement[2:] if token not in ("(", "..", ")")]
+                    if len(bounds) != 2:
+                        raise ValueError(f"Line {line}: expected a range 'RANGE := (min .. max)'.")
+                    try:
+                        current.uod = tuple(_floats(bounds))
+                    except ValueError as error:
+                        raise ValueError(f"Line {line}: {error}") from None
+                case "DEFAULT" | "LOCK" if block in ("FUZZIFY", "DEFUZZIFY"):
+                    pass
+                case _ if keyword in _OPERATORS and block in ("RULEBLOCK", "DEFUZZIFY"):
+                    method = statement[-1].upper()
+                    if len(statement) != 3 or method not in _OPERATORS[keyword]:
+                        raise ValueError(
+                            f"Line {line}: unsupported {keyword} method {' '.join(statement[2:])!r}; "
+                            f"supported are {list(_OPERATORS[keyword])}."
+                        )
+                    previous = settings.setdefault(keyword, (line, method))
+                    if previous[1] != method:
+                        raise ValueError(
+                            f"Line {line}: {keyword} : {method} conflicts with {keyword} : {previous[1]} on line "
+                            f"{previous[0]}; a FIS uses one method for all rules."
+                        )
+                case _:
+                    raise ValueError(f"Line {line}: unexpected statement {' '.join(statement)!r}.")
+
+    inputs, outputs = {}, {}
+    for concept, variable in variables.items():
+        if not variable.terms:
+            raise ValueError(f"Line {variable.line}: variable '{concept}' has no terms.")
+        fuzzy_sets = {}
+        for term, (at, tokens) in variable.terms.items():
+            try:
+                fuzzy_sets[term] = _term(tokens, variable.uod)
+            except ValueError as error:
+                raise ValueError(f"Line {at}: invalid term '{term}' of '{concept}': {error}") from None
+        try:
+            lv = LinguisticVariable(
+                concept=concept, uod=variable.uod or _hull(fuzzy_sets.values()), fuzzy_sets=fuzzy_sets
+            )
+        except ValueError as error:
+            raise ValueError(f"Line {variable.line}: invalid variable '{concept}': {error}") from None
+        (outputs if variable.output else inputs)[concept] = lv
+    config = {
+        field: _OPERATORS[keyword][settings[keyword][1]]
+        for keyword, field in (("ACT", "implication"), ("ACCU", "aggregation"), ("METHOD", "defuzzification"))
+        if keyword in settings
+    }
+    return MamdaniFIS(
+        input_variables=inputs,
+        output_variables=outputs,
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(**config),
+        meta_fields={"name": name} if name is not None else {},
+    )
+
+
+def _condition(node: Is | And | Or | Not) -> str:
+    """Return the FCL text of an antecedent, with parentheses only around nested `And` and `Or`."""
+    match node:
+        case Is(concept=concept, term=term):
+            return f"{concept} IS {term}"
+        case Not(child=Is(concept=concept, term=term)):
+            return f"{concept} IS NOT {term}"
+        case Not(child=child):
+            return f"NOT ({_condition(child)})"
+    operator = " AND " if isinstance(node, And) else " OR "
+    return operator.join(
+        f"({_condition(child)})" if isinstance(child, And | Or) else _condition(child) for child in node.children
+    )
+
+
+def _points(mf: MembershipFunction) -> str:
+    """Return the FCL definition of a term."""
+    knots = mf._knots()
+    if knots is not None:
+        return " ".join(f"({number(x)}, {number(y)})" for x, y in zip(*knots, strict=True))
+    match mf:
+        case MFGaussian():
+            return f"GAUSS {number(mf.mean)} {number(mf.sigma)}"
+        case MFGeneralizedBell():
+            return f"GBELL {number(mf.width)} {number(mf.slope)} {number(mf.center)}"
+    raise ValueError(f"{type(mf).__name__} has no FCL equivalent.")
+
+
+def _write_variable(stream: TextIO, lv: LinguisticVariable, output: bool) -> None:
+    block = "DEFUZZIFY" if output else "FUZZIFY"
+    stream.write(f"{block} {lv.concept}\n")
+    for term, mf in lv.fuzzy_sets.items():
+        try:
+            stream.write(f"    TERM {term} := {_points(mf)};\n")
+        except ValueError as error:
+            raise ValueError(f"Term '{term}' of '{lv.concept}': {error}") from None
+    if output:
+        stream.write("    METHOD : COG;\n    DEFAULT := 0;\n")
+    stream.write(f"    RANGE := ({number(lv.uod[0])} .. {number(lv.uod[1])});\nEND_{block}\n\n")
+
+
+def write_fcl(fis: MamdaniFIS, file: TextFile) -> None:
+    """Write a Mamdani FIS as a Fuzzy Control Language function block.
+
+    Linear terms are written as lists of points, Gaussian and bell terms as `GAUSS` and `GBELL`; rule tables are
+    written as their rules. The rules are written one line at a time, with parentheses only around nested
+    conjunctions and disjunctions, so `read_fcl` reads back an equivalent FIS.
+
+    Parameters
+    ----------
+    fis : MamdaniFIS
+        The inference system; its `meta_fields` "name" names the function block.
+    file : str | os.PathLike | TextIO
+        Path of the file, or an open text stream.
+
+    Raises
+    ------
+    ValueError
+        If a term has no FCL equivalent, or a rule table combines its inputs by product.
+
+    """
+    config = fis.inference_config
+    activation = {"clip": "MIN", "scale": "PROD"}[config.implication]
+    accumulation = {"max": "MAX", "sum": "SUM", "probor": "PROBOR"}[config.aggregation]
+    with open_text(file, "w") as stream:
+        stream.write(f"FUNCTION_BLOCK {fis.meta_fields.get('name', 'fis')}\n\n")
+        for block, variables in (("VAR_INPUT", fis.input_variables), ("VAR_OUTPUT", fis.output_variables)):
+            stream.write(f"{block}\n")
+            stream.writelines(f"    {concept} : REAL;\n" for concept in variables)
+            stream.write("END_VAR\n\n")
+        for lv in fis.input_variables.values():
+            _write_variable(stream, lv, output=False)
+        for lv in fis.output_variables.values():
+            _write_variable(stream, lv, output=True)
+        stream.write(
+            f"RULEBLOCK rules\n    AND : MIN;\n    OR : MAX;\n    ACT : {activation};\n    ACCU : {accumulation};\n"
+        )
+        for i, rule in enumerate(system_rules(fis), 1):
+            consequences = ", ".join(f"{concept} IS {term}" for concept, term in rule.consequences.items())
+            weight = f" WITH {number(rule.weight)}" if rule.weight != 1.0 else ""
+            stream.write(f"    RULE {i} : IF {_condition(rule.antecedent)} THEN {consequences}{weight};\n")
+        stream.write("END_RULEBLOCK\n\nEND_FUNCTION_BLOCK\n")
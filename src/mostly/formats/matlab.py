@@ -0,0 +1,416 @@
+"""Reading and writing MATLAB Fuzzy Logic Toolbox `.fis` rule bases.
+
+A `.fis` file is a sequence of sections of `key=value` lines::
+
+    [System]
+    Name='tipper'
+    Type='mamdani'
+    NumInputs=1
+    NumOutputs=1
+    AndMethod='min'
+    OrMethod='max'
+    ImpMethod='min'
+    AggMethod='max'
+    DefuzzMethod='centroid'
+
+    [Input1]
+    Name='service'
+    Range=[0 10]
+    NumMFs=2
+    MF1='poor':'gaussmf',[1.5 0]
+    MF2='good':'trimf',[2 6 10]
+
+    [Output1]
+    Name='tip'
+    Range=[0 30]
+    NumMFs=2
+    MF1='cheap':'trimf',[0 5 10]
+    MF2='generous':'trapmf',[15 20 30 30]
+
+    [Rules]
+    1, 1 (1) : 1
+    -1, 2 (0.5) : 1
+
+Every rule line lists the (1-based) term index of each input, 0 for inputs the rule does not use and negative for
+negated conditions, then the term index of each output, the weight and the connective (1 for AND, 2 for OR).
+
+The membership functions `trimf`, `trapmf`, `gaussmf`, `gbellmf` and `gauss2mf` map onto `MFTriangular`,
+`MFTrapezoidal`, `MFGaussian`, `MFGeneralizedBell` and `MFBimodalGaussian`. The methods map onto
+`InferenceConfig`: `AndMethod='min'` and `OrMethod='max'` (the only ones `And` and `Or` implement),
+`ImpMethod='min' | 'prod'` (clip or scale), `AggMethod='max' | 'sum' | 'probor'` and `DefuzzMethod='centroid'`.
+"""
+
+import math
+import re
+from collections.abc import Mapping
+from typing import TextIO
+
+from ..fuzzy_rules.fuzzy_rule import FuzzyRule
+from ..fuzzy_rules.logical_operators import And, Is, Not, Or, construct_node, snake
+from ..inference.mamdani import InferenceConfig, MamdaniFIS
+from ..linguistic_variable import LinguisticVariable
+from ..membership_functions import MembershipFunction, MFBimodalGaussian, MFGaussian, MFGeneralizedBell
+from ..membership_functions.base import Interval
+from ._common import TextFile, count_rules, linear_shape, number, open_text, system_rules
+
+_SECTION = re.compile(r"\[(System|Input(\d+)|Output(\d+)|Rules)\]")
+_MF = re.compile(r"'(?P<name>[^']*)'\s*:\s*'(?P<kind>[^']*)'\s*,\s*\[(?P<params>[^\]]*)\]")
+_RULE = re.compile(r"(?P<inputs>[^,]*),(?P<outputs>[^(]*)\((?P<weight>[^)]*)\)\s*:\s*(?P<connective>\d+)")
+_PARAMS = {"trimf": 3, "trapmf": 4, "gaussmf": 2, "gbellmf": 3, "gauss2mf": 4}
+# `And` and `Or` always take the minimum and the maximum
+_CONNECTIVES = {"AndMethod": "min", "OrMethod": "max"}
+_METHODS = {
+    "ImpMethod": ("implication", {"min": "clip", "prod": "scale"}),
+    "AggMethod": ("aggregation", {"max": "max", "sum": "sum", "probor": "probor"}),
+    "DefuzzMethod": ("defuzzification", {"centroid": "centroid"}),
+}
+
+
+class _Variable:
+    """Name, range and terms of one `[InputN]` or `[OutputN]` section, as read so far."""
+
+    __slots__ = ("line", "name", "section", "terms", "uod")
+
+    def __init__(self, line: int, section: str) -> None:
+        self.line = line
+        self.section = section
+        self.name: str | None = None
+        self.uod: Interval | None = None
+        self.terms: dict[str, tuple[int, str, list[float]]] = {}
+
+    def build(self) -> LinguisticVariable:
+        """Build the linguistic variable, with the term names normalised like `SnakedStr`."""
+        if self.name is None or self.uod is None:
+            raise ValueError(f"Line {self.line}: [{self.section}] needs a Name and a Range.")
+        fuzzy_sets = {}
+        for term, (line, kind, params) in self.terms.items():
+            try:
+                fuzzy_sets[term] = _membership_function(kind, params, self.uod)
+            except ValueError as error:
+                raise ValueError(f"Line {line}: invalid term '{term}' of '{self.name}': {error}") from None
+        try:
+            return LinguisticVariable(concept=self.name, uod=self.uod, fuzzy_sets=fuzzy_sets)
+        except ValueError as error:
+            raise ValueError(f"Line {self.line}: invalid variable '{self.name}': {error}") from None
+
+
+def _unquote(value: str) -> str:
+    return value.strip().strip("'")
+
+
+def _vector(value: str) -> list[float]:
+    return [float(item) for item in value.strip().strip("[]").replace(",", " ").split()]
+
+
+def _membership_function(kind: str, params: list[float], uod: Interval) -> MembershipFunction:
+    if kind not in _PARAMS:
+        raise ValueError(f"unsupported membership function '{kind}'; supported are {list(_PARAMS)}.")
+    if len(params) != _PARAMS[kind]:
+        raise ValueError(f"{kind} takes {_PARAMS[kind]} parameters, got {len(params)}.")
+    match kind:
+        case "gaussmf":
+            return MFGaussian(sigma=params[0], mean=params[1])
+        case "gbellmf":
+            return MFGeneralizedBell(width=params[0], slope=params[1], center=params[2])
+        case "gauss2mf":
+            return MFBimodalGaussian(
+                left_sigma=params[0], left_mean=params[1], right_sigma=params[2], right_mean=params[3]
+            )
+        case _:
+            return linear_shape(params, uod)
+
+
+def read_fis(file: TextFile) -> MamdaniFIS:
+    """Read a Mamdani FIS from a MATLAB Fuzzy Logic Toolbox `.fis` file.
+
+    The file is read one line at a time and each rule is built as soon as its line is read, so rule bases with
+    hundreds of thousands of rules load without holding the text in memory. Rules are built in bulk like
+    `FuzzyRule.from_records`: the term indices are checked against the variables, and every distinct condition
+    is built once and shared between rules, without validating the nodes.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | TextIO
+        Path of the file, or an open text stream.
+
+    Returns
+    -------
+    MamdaniFIS
+        The inference system, named after its `Name` in its `meta_fields`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid Mamdani `.fis` file, uses an unsupported method or membership function, or its
+        terms do not make valid linguistic variables; the message names the line.
+
+    """
+    system: dict[str, str] = {}
+    # Variables by (is output, section number)
+    sections: dict[tuple[bool, int], _Variable] = {}
+    rules: list[FuzzyRule] = []
+    section, current = None, None
+    inputs: list[LinguisticVariable] = []
+    outputs: list[LinguisticVariable] = []
+    terms: tuple[list[list[str]], list[list[str]]] = ([], [])
+    # Every distinct (input, term index) condition, shared by all rules using it
+    conditions: dict[tuple[int, int], Is | Not] = {}
+    with open_text(file, "r") as stream:
+        for line, raw in enumerate(stream, 1):
+            text = raw.strip()
+            if not text:
+                continue
+            header = _SECTION.fullmatch(text)
+            if header is not None:
+                if section == "Rules":
+                    raise ValueError(f"Line {line}: [Rules] must be the last section.")
+                section = header[1]
+                if section == "Rules":
+                    inputs, outputs = _variables(sections)
+                    terms = [list(lv.fuzzy_sets) for lv in inputs], [list(lv.fuzzy_sets) for lv in outputs]
+                elif section != "System":
+                    position = (header[3] is not None, int(header[2] or header[3]))
+                    current = sections.setdefault(position, _Variable(line, section))
+                continue
+            if section == "Rules":
+                rules.append(_rule(line, text, inputs, outputs, terms, conditions))
+                continue
+            key, _, value = text.partition("=")
+            key = key.strip()
+            try:
+                if section == "System":
+                    system[key] = _unquote(value)
+                elif section is None:
+                    raise ValueError("expected a section such as [System].")
+                elif key == "Name":
+                    current.name = _unquote(value)
+                elif key == "Range":
+                    bounds = _vector(value)
+                    if len(bounds) != 2:
+                        raise ValueError(f"expected a range [min max], got {value.strip()!r}.")
+                    current.uod = (bounds[0], bounds[1])
+                elif re.fullmatch(r"MF\d+", key):
+                    mf = _MF.fullmatch(value.strip())
+                    if mf is None:
+                        raise ValueError(f"expected 'name':'type',[parameters], got {value.strip()!r}.")
+                    current.terms[snake(mf["name"])] = (line, mf["kind"], _vector(mf["params"]))
+            except ValueError as error:
+                raise ValueError(f"Line {line}: {error}") from None
+    if section != "Rules":
+        inputs, outputs = _variables(sections)
+
+    if system.get("Type", "mamdani").lower() != "mamdani":
+        raise ValueError(f"Only Mamdani systems are supported, got Type='{system['Type']}'.")
+    for key, method in _CONNECTIVES.items():
+        if system.get(key, method).lower() != method:
+            raise ValueError(f"Unsupported {key}='{system[key]}'; only '{method}' is supported.")
+    config = {}
+    for key, (field, methods) in _METHODS.items():
+        method = system.get(key, "").lower()
+        if key in system and method not in methods:
+            raise ValueError(f"Unsupported {key}='{system[key]}'; supported are {list(methods)}.")
+        if method:
+            config[field] = methods[method]
+    return MamdaniFIS(
+        input_variables={lv.concept: lv for lv in inputs},
+        output_variables={lv.concept: lv for lv in outputs},
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(**config),
+        meta_fields={"name": system["Name"]} if "Name" in system else {},
+    )
+
+
+def _variables(
+    sections: Mapping[tuple[bool, int], _Variable],
+) -> tuple[list[LinguisticVariable], list[LinguisticVariable]]:
+    """Build the input and the output variables, in the order of their section numbers."""
+    ordered = sorted(sections.items())
+    inputs = [variable.build() for (output, _), variable in ordered if not output]
+    outputs = [variable.build() for (output, _), variable in ordered if output]
+    return inputs, outputs
+
+
+def _indices(line: int, values: str, expected: int, kind: str) -> list[int]:
+    items = values.split()
+    try:
+        indices = [int(item) for item in items]
+    except ValueError:
+        # Indices written as floats, e.g. "1.0"; others are dropped and fail the count below
+        try:
+            indices = [int(n) for n in map(float, items) if n.is_integer()]
+        except ValueError:
+            indices = []
+    if len(items) != expected or len(indices) != expected:
+        raise ValueError(f"Line {line}: expected {expected} {kind} term indices, got {values.strip()!r}.")
+    return indices
+
+
+def _rule(
+    line: int,
+    text: str,
+    inputs: list[LinguisticVariable],
+    outputs: list[LinguisticVariable],
+    terms: tuple[list[list[str]], list[list[str]]],
+    conditions: dict[tuple[int, int], Is | Not],
+) -> FuzzyRule:
+    """Build the rule of one line of the [Rules] section, given the terms of the inputs and the outputs."""
+    match = _RULE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Line {line}: expected a rule 'inputs, outputs (weight) : connective', got {text!r}.")
+    antecedent = []
+    for i, index in enumerate(_indices(line, match["inputs"], len(inputs), "input")):
+        if index == 0:
+            continue
+        condition = conditions.get((i, index))
+        if condition is None:
+            if abs(index) > len(terms[0][i]):
+                raise ValueError(f"Line {line}: '{inputs[i].concept}' has no term {abs(index)}.")
+            condition = construct_node(Is, inputs[i].concept, terms[0][i][abs(index) - 1])
+            if index < 0:
+                condition = construct_node(Not, condition)
+            conditions[i, index] = condition
+        antecedent.append(condition)
+    consequences = {}
+    for j, index in enumerate(_indices(line, match["outputs"], len(outputs), "output")):
+        if index < 0:
+            raise ValueError(f"Line {line}: negated consequences are not supported.")
+        if index > len(terms[1][j]):
+            raise ValueError(f"Line {line}: '{outputs[j].concept}' has no term {index}.")
+        if index:
+            consequences[outputs[j].concept] = terms[1][j][index - 1]
+    if not antecedent or not consequences:
+        raise ValueError(f"Line {line}: a rule needs at least one input term and one output term.")
+    try:
+        weight = float(match["weight"])
+    except ValueError:
+        weight = math.nan
+    if not math.isfinite(weight):
+        raise ValueError(f"Line {line}: expected a finite weight, got {match['weight']!r}.")
+    connective = {"1": And, "2": Or}.get(match["connective"])
+    if connective is None:
+        raise ValueError(f"Line {line}: the connective must be 1 (AND) or 2 (OR), got {match['connective']}.")
+    node = antecedent[0] if len(antecedent) == 1 else construct_node(connective, tuple(antecedent))
+    return FuzzyRule._construct(node, consequences, weight)
+
+
+def _mf_line(mf: MembershipFunction, uod: Interval) -> str:
+    """Return the type and parameters of a term."""
+    match mf:
+        case MFGaussian():
+            return f"'gaussmf',[{number(mf.sigma)} {number(mf.mean)}]"
+        case MFGeneralizedBell():
+            return f"'gbellmf',[{number(mf.width)} {number(mf.slope)} {number(mf.center)}]"
+        case MFBimodalGaussian():
+            params = (mf.left_sigma, mf.left_mean, mf.right_sigma, mf.right_mean)
+            return f"'gauss2mf',[{' '.join(map(number, params))}]"
+    knots = mf._knots()
+    feet = None
+    if knots is not None:
+        xs, ys = knots
+        match ys:
+            case [0.0, 1.0, 0.0]:
+                feet = xs
+            case [0.0, 1.0, 1.0, 0.0]:
+                feet = xs
+            # Shoulders become trapezoids with a vertical edge on or beyond the range
+            case [1.0, 0.0]:
+                feet = [min(uod[0], xs[0]), min(uod[0], xs[0]), *xs]
+            case [0.0, 1.0]:
+                feet = [*xs, max(uod[1], xs[1]), max(uod[1], xs[1])]
+    if feet is None:
+        raise ValueError(f"{type(mf).__name__} has no MATLAB equivalent.")
+    if len(feet) == 4 and feet[1] == feet[2]:
+        feet = [feet[0], feet[1], feet[3]]
+    return f"'{'trimf' if len(feet) == 3 else 'trapmf'}',[{' '.join(map(number, feet))}]"
+
+
+def _write_variable(stream: TextIO, section: str, lv: LinguisticVariable) -> None:
+    stream.write(f"[{section}]\nName='{lv.concept}'\nRange=[{number(lv.uod[0])} {number(lv.uod[1])}]\n")
+    stream.write(f"NumMFs={len(lv.fuzzy_sets)}\n")
+    for j, (term, mf) in enumerate(lv.fuzzy_sets.items(), 1):
+        try:
+            stream.write(f"MF{j}='{term}':{_mf_line(mf, lv.uod)}\n")
+        except ValueError as error:
+            raise ValueError(f"Term '{term}' of '{lv.concept}': {error}") from None
+    stream.write("\n")
+
+
+def _leaves(node: Is | And | Or | Not) -> tuple[type, list[Is | Not]]:
+    """Return the connective and the conditions of an antecedent a MATLAB rule can express."""
+    if isinstance(node, Is | Not):
+        return And, [node]
+    leaves = []
+    for child in node.children:
+        if type(child) is type(node):
+            leaves.extend(_leaves(child)[1])
+        else:
+            leaves.append(child)
+    return type(node), leaves
+
+
+def write_fis(fis: MamdaniFIS, file: TextFile) -> None:
+    """Write a Mamdani FIS as a MATLAB Fuzzy Logic Toolbox `.fis` file.
+
+    Every rule must be a single AND or OR of conditions, each possibly negated, with at most one condition per
+    input; rule tables are written as their rules. Shoulders are written as trapezoids with a vertical edge on the
+    bound of the range, which agree with them within the range. The rules are written one line at a time.
+
+    Parameters
+    ----------
+    fis : MamdaniFIS
+        The inference system; its `meta_fields` "name" names the system.
+    file : str | os.PathLike | TextIO
+        Path of the file, or an open text stream.
+
+    Raises
+    ------
+    ValueError
+        If a term has no MATLAB equivalent, a rule cannot be expressed as a MATLAB rule, or a rule table combines
+        its inputs by product.
+
+    """
+    config = fis.inference_config
+    # Concepts mapped to their position and the 1-based indices of their terms
+    inputs = {
+        concept: (i, {term: j for j, term in enumerate(lv.fuzzy_sets, 1)})
+        for i, (concept, lv) in enumerate(fis.input_variables.items())
+    }
+    outputs = {
+        concept: (i, {term: j for j, term in enumerate(lv.fuzzy_sets, 1)})
+        for i, (concept, lv) in enumerate(fis.output_variables.items())
+    }
+    with open_text(file, "w") as stream:
+        stream.write(
+            f"[System]\nName='{fis.meta_fields.get('name', 'fis')}'\nType='mamdani'\nVersion=2.0\n"
+            f"NumInputs={len(inputs)}\nNumOutputs={len(outputs)}\nNumRules={count_rules(fis)}\n"
+            f"AndMethod='min'\nOrMethod='max'\nImpMethod='{'min' if config.implication == 'clip' else 'prod'}'\n"
+            f"AggMethod='{config.aggregation}'\nDefuzzMethod='{config.defuzzification}'\n\n"
+        )
+        for i, lv in enumerate(fis.input_variables.values(), 1):
+            _write_variable(stream, f"Input{i}", lv)
+        for i, lv in enumerate(fis.output_variables.values(), 1):
+            _write_variable(stream, f"Output{i}", lv)
+        stream.write("[Rules]\n")
+        for r, rule in enumerate(system_rules(fis)):
+            connective, leaves = _leaves(rule.antecedent)
+            antecedent = [0] * len(inputs)
+            for leaf in leaves:
+                condition = leaf.child if isinstance(leaf, Not) else leaf
+                if not isinstance(condition, Is):
+                    raise ValueError(f"Rule {r}: only a single AND or OR of conditions can be written to MATLAB.")
+                i, terms = inputs.get(condition.concept, (None, {}))
+                if condition.term not in terms:
+                    raise ValueError(f"Rule {r}: unknown input term '{condition.term}' of '{condition.concept}'.")
+                if antecedent[i]:
+                    raise ValueError(f"Rule {r}: '{condition.concept}' appears twice, which MATLAB cannot express.")
+                antecedent[i] = -terms[condition.term] if leaf is not condition else terms[condition.term]
+            consequent = [0] * len(outputs)
+            for concept, term in rule.consequences.items():
+                j, terms = outputs.get(concept, (None, {}))
+                if term not in terms:
+                    raise ValueError(f"Rule {r}: unknown output term '{term}' of '{concept}'.")
+                consequent[j] = terms[term]
+            stream.write(
+                f"{' '.join(map(str, antecedent))}, {' '.join(map(str, consequent))} "
+                f"({number(rule.weight)}) : {1 if connective is And else 2}\n"
+            )
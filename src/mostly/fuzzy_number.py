@@ -0,0 +1,299 @@
+from collections.abc import Callable, Sequence
+from typing import Annotated, Any, Self
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator, validate_call
+
+from .membership_functions import MembershipFunction, MFPiecewiseLinear
+
+type Operand = FuzzyNumber | npt.ArrayLike
+
+
+class FuzzyNumber(BaseModel):
+    """A fuzzy number, or an array of fuzzy numbers, represented by its alpha-cuts at fixed levels.
+
+    Each alpha-cut is a closed interval `[lower, upper]`; the cuts are nested, shrinking as the level rises.
+    Arithmetic follows the extension principle, which for continuous operations amounts to interval arithmetic
+    level by level, so every operation is a handful of array operations over all levels (and all numbers of a
+    batch) at once. Crisp numbers and arrays mix in as degenerate intervals and broadcast like NumPy arrays.
+
+    Attributes
+    ----------
+    levels : np.ndarray
+        Strictly increasing alpha levels in [0, 1], shape `(n_levels,)`. Level 0 stands for the support.
+    lower : np.ndarray
+        Lower ends of the alpha-cuts, shape `batch_shape + (n_levels,)`.
+    upper : np.ndarray
+        Upper ends of the alpha-cuts, same shape as `lower`.
+
+    Methods
+    -------
+    from_membership_function(mf, levels)
+        Build a fuzzy number from the closed-form alpha-cuts of a bounded, normal membership function.
+    crisp(value, levels)
+        Build the degenerate fuzzy number(s) of crisp value(s).
+    stack(numbers)
+        Stack fuzzy numbers with the same levels into one batch.
+    +, -, *, /, minimum, maximum
+        Arithmetic by the extension principle, element-wise over batches.
+    alpha_cut(alpha)
+        Interval(s) at any level, interpolated linearly between the stored levels.
+    to_membership_function()
+        Convert a single fuzzy number into a piecewise-linear membership function.
+
+    Raises
+    ------
+    ValueError
+        If the levels or cuts are malformed, if operands have different levels, or on division by a fuzzy
+        number whose support contains zero.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Make NumPy defer to the reflected operators instead of broadcasting over a fuzzy number as an object
+    __array_ufunc__ = None
+
+    levels: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+    @field_validator("levels", "lower", "upper", mode="before")
+    @classmethod
+    def as_float_array(cls, value: Any) -> np.ndarray:
+        """Convert array-likes into float arrays."""
+        return np.array(value, dtype=float)
+
+    @field_validator("levels")
+    @classmethod
+    def increasing_levels(cls, levels: np.ndarray) -> np.ndarray:
+        """Validate that the levels are strictly increasing within [0, 1] and end at full membership."""
+        if levels.ndim != 1 or levels.size < 1:
+            raise ValueError("Levels must be a non-empty one-dimensional array")
+        if np.any(np.diff(levels) <= 0.0) or levels[0] < 0.0 or levels[-1] != 1.0:
+            raise ValueError(f"Levels must be strictly increasing within [0, 1] and end at 1, got {levels}")
+        return levels
+
+    @field_validator("lower", "upper")
+    @classmethod
+    def finite_cuts(cls, ends: np.ndarray, info: ValidationInfo) -> np.ndarray:
+        """Validate that the ends of the alpha-cuts are finite and have one entry per level."""
+        if not np.all(np.isfinite(ends)):
+            raise ValueError(f"Alpha-cuts must be finite, got {info.field_name}={ends}")
+        if "levels" in info.data and ends.shape[-1:] != info.data["levels"].shape:
+            raise ValueError(f"Alpha-cuts must have one entry per level along their last axis, got {ends.shape}")
+        return ends
+
+    @model_validator(mode="after")
+    def nested_cuts(self) -> "FuzzyNumber":
+        """Validate that the alpha-cuts are non-empty and shrink as the level rises."""
+        if self.lower.shape != self.upper.shape:
+            raise ValueError(
+                f"Lower and upper ends must have the same shape, got {self.lower.shape} and {self.upper.shape}"
+            )
+        if np.any(self.lower > self.upper):
+            raise ValueError("Alpha-cuts must satisfy lower ≤ upper")
+        if np.any(np.diff(self.lower, axis=-1) < 0.0) or np.any(np.diff(self.upper, axis=-1) > 0.0):
+            raise ValueError("Alpha-cuts must be nested, shrinking as the level rises")
+        return self
+
+    @classmethod
+    @validate_call
+    def from_membership_function(cls, mf: MembershipFunction, levels: Annotated[int, Field(ge=2)] = 11) -> Self:
+        """Build a fuzzy number from the alpha-cuts of a membership function at equally spaced levels in [0, 1].
+
+        Level 0 takes the support, where Gaussian-shaped tails are truncated where they underflow to zero.
+
+        Raises
+        ------
+        ValueError
+            If the membership function is subnormal or its support is unbounded (e.g. a shoulder).
+
+        """
+        alphas = np.linspace(0.0, 1.0, levels)
+        if mf.core() is None:
+            raise ValueError(f"{mf.__class__.__name__} is not normal, so it is not a fuzzy number")
+        cuts = np.array([mf.support(), *(mf.alpha_cut(alpha) for alpha in alphas[1:])])
+        if not np.all(np.isfinite(cuts)):
+            raise ValueError(f"{mf.__class__.__name__} has an unbounded support, so it is not a fuzzy number")
+        return cls(levels=alphas, lower=cuts[:, 0], upper=cuts[:, 1])
+
+    @classmethod
+    def crisp(cls, value: npt.ArrayLike, levels: npt.ArrayLike) -> Self:
+        """Build the degenerate fuzzy number(s) whose alpha-cuts are all the crisp `value`."""
+        levels = np.asarray(levels, dtype=float)
+        ends = np.broadcast_to(np.asarray(value, dtype=float)[..., np.newaxis], np.shape(value) + levels.shape)
+        return cls(levels=levels, lower=ends, upper=ends)
+
+    @classmethod
+    def stack(cls, numbers: Sequence["FuzzyNumber"]) -> Self:
+        """Stack fuzzy numbers (or batches of equal shape) with the same levels into a batch along a new first axis."""
+        if not numbers:
+            raise ValueError("At least one fuzzy number is required")
+        levels = numbers[0].levels
+        for number in numbers[1:]:
+            number._check_levels(levels)
+        return cls.model_construct(
+            levels=levels,
+            lower=np.stack([number.lower for number in numbers]),
+            upper=np.stack([number.upper for number in numbers]),
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the batch; `()` for a single fuzzy number."""
+        return self.lower.shape[:-1]
+
+    def __len__(self) -> int:
+        """Return the length of the first batch axis."""
+        if not self.shape:
+            raise TypeError("A single fuzzy number has no length")
+        return self.shape[0]
+
+    def __getitem__(self, index: Any) -> Self:
+        """Select fuzzy numbers of the batch with NumPy indexing."""
+        if not self.shape:
+            raise TypeError("A single fuzzy number cannot be indexed")
+        index = index if isinstance(index, tuple) else (index,)
+        return self._with(self.lower[*index, :], self.upper[*index, :])
+
+    def __eq__(self, other: object) -> bool:
+        """Compare levels and alpha-cuts."""
+        if not isinstance(other, FuzzyNumber):
+            return NotImplemented
+        return all(np.array_equal(a, b) for a, b in zip(self._arrays(), other._arrays(), strict=True))
+
+    __hash__ = None  # mutable arrays
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.levels, self.lower, self.upper
+
+    def _with(self, lower: np.ndarray, upper: np.ndarray) -> Self:
+        """Return a fuzzy number with the same levels; the operations preserve validity, so validation is skipped."""
+        return type(self).model_construct(levels=self.levels, lower=lower, upper=upper)
+
+    def _check_levels(self, levels: np.ndarray) -> None:
+        if not np.array_equal(self.levels, levels):
+            raise ValueError(f"Fuzzy numbers must share the same levels, got {self.levels} and {levels}")
+
+    def _ends(self, other: Operand) -> tuple[np.ndarray, np.ndarray]:
+        """Return the cuts of `other`, where crisp values are degenerate intervals."""
+        if isinstance(other, FuzzyNumber):
+            other._check_levels(self.levels)
+            return other.lower, other.upper
+        ends = np.asarray(other, dtype=float)[..., np.newaxis]
+        return ends, ends
+
+    def _binary(self, other: Operand, operation: Callable[..., tuple[np.ndarray, np.ndarray]], reflected: bool) -> Self:
+        lower, upper = self._ends(other)
+        if reflected:
+            return self._with(*operation(lower, upper, self.lower, self.upper))
+        return self._with(*operation(self.lower, self.upper, lower, upper))
+
+    def __add__(self, other: Operand) -> Self:
+        """Add by the extension principle: `[a + c, b + d]`."""
+        return self._binary(other, _add, reflected=False)
+
+    def __radd__(self, other: Operand) -> Self:
+        """Add to a crisp value."""
+        return self._binary(other, _add, reflected=True)
+
+    def __sub__(self, other: Operand) -> Self:
+        """Subtract by the extension principle: `[a - d, b - c]`."""
+        return self._binary(other, _subtract, reflected=False)
+
+    def __rsub__(self, other: Operand) -> Self:
+        """Subtract from a crisp value."""
+        return self._binary(other, _subtract, reflected=True)
+
+    def __mul__(self, other: Operand) -> Self:
+        """Multiply by the extension principle: the hull of the four products of the ends."""
+        return self._binary(other, _multiply, reflected=False)
+
+    def __rmul__(self, other: Operand) -> Self:
+        """Multiply a crisp value."""
+        return self._binary(other, _multiply, reflected=True)
+
+    def __truediv__(self, other: Operand) -> Self:
+        """Divide by the extension principle, multiplying with the reciprocal interval `[1 / d, 1 / c]`."""
+        return self._binary(other, _divide, reflected=False)
+
+    def __rtruediv__(self, other: Operand) -> Self:
+        """Divide a crisp value."""
+        return self._binary(other, _divide, reflected=True)
+
+    def __neg__(self) -> Self:
+        """Negate, mirroring the alpha-cuts: `[-b, -a]`."""
+        return self._with(-self.upper, -self.lower)
+
+    def minimum(self, other: Operand) -> Self:
+        """Return the fuzzy minimum, element-wise over batches."""
+        return self._binary(other, _minimum, reflected=False)
+
+    def maximum(self, other: Operand) -> Self:
+        """Return the fuzzy maximum, element-wise over batches."""
+        return self._binary(other, _maximum, reflected=False)
+
+    @validate_call
+    def alpha_cut(self, alpha: Annotated[float, Field(ge=0.0, le=1.0)]) -> tuple[np.ndarray, np.ndarray]:
+        """Return the lower and upper ends of the alpha-cut(s) at `alpha`, interpolated linearly between levels.
+
+        Levels below the lowest stored one take its cut. The ends have the shape of the batch.
+        """
+        position = np.interp(alpha, self.levels, np.arange(self.levels.size))
+        index = min(int(position), self.levels.size - 2) if self.levels.size > 1 else 0
+        fraction = position - index
+
+        def interpolate(ends: np.ndarray) -> np.ndarray:
+            if self.levels.size == 1:
+                return ends[..., 0]
+            return (1.0 - fraction) * ends[..., index] + fraction * ends[..., index + 1]
+
+        return interpolate(self.lower), interpolate(self.upper)
+
+    def to_membership_function(self) -> MFPiecewiseLinear:
+        """Convert a single fuzzy number into the piecewise-linear membership function through its alpha-cuts.
+
+        Raises
+        ------
+        ValueError
+            If this is a batch, or a crisp number (which has no piecewise-linear membership function).
+
+        """
+        if self.shape:
+            raise ValueError(f"Only a single fuzzy number converts to a membership function, got shape {self.shape}")
+        xs = np.concatenate([self.lower, self.upper[::-1]])
+        ys = np.concatenate([self.levels, self.levels[::-1]])
+        # Vertical edges and a single-point core repeat positions; keep the highest degree at each
+        keep = np.concatenate([np.diff(xs) > 0.0, [True]])
+        for i in np.flatnonzero(~keep):
+            ys[i + 1] = max(ys[i], ys[i + 1])
+        return MFPiecewiseLinear(xs=tuple(xs[keep].tolist()), ys=tuple(ys[keep].tolist()))
+
+
+def _add(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return a + c, b + d
+
+
+def _subtract(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return a - d, b - c
+
+
+def _multiply(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    products = np.stack(np.broadcast_arrays(a * c, a * d, b * c, b * d))
+    return products.min(axis=0), products.max(axis=0)
+
+
+def _divide(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # The support (widest cut) of the divisor decides whether any cut contains zero
+    if np.any((c <= 0.0) & (d >= 0.0)):
+        raise ValueError("Division by a fuzzy number whose support contains zero")
+    return _multiply(a, b, 1.0 / d, 1.0 / c)
+
+
+def _minimum(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return np.minimum(a, c), np.minimum(b, d)
+
+
+def _maximum(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return np.maximum(a, c), np.maximum(b, d)
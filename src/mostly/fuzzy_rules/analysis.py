@@ -0,0 +1,255 @@
+"""Static analysis of a rule base for rules that never change the output of an inference.
+
+Every rule is checked against the terms of the input variables, without evaluating any input:
+
+- rules with zero weight have zero strength;
+- rules whose antecedent can never be positive within the UOD never fire. A condition `x IS t` is positive only on
+  the support of `t`, so a condition on an unknown variable or term, or on a term that is zero within the UOD, is
+  always zero. For crisp inputs, so is a conjunction of conditions on one variable whose supports do not overlap;
+  a membership-function input (non-singleton fuzzification) can overlap both supports at once, so such rules are
+  only pruned for crisp inputs;
+- duplicate rules have the same consequences and equal antecedents, up to the order and nesting of `And`/`Or`;
+- a rule is subsumed by a rule with the same consequences whose antecedent is a subset of its conjuncts, and
+  therefore weaker, with at least its weight: its strength never exceeds the strength of the subsuming rule.
+
+Non-firing rules add nothing under any aggregation, duplicate and subsumed rules only under max aggregation, where
+the stronger of two rules with the same consequences hides the weaker one under both clip and scale implication.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import combinations
+from typing import Literal, NamedTuple
+
+from ..linguistic_variable import LinguisticVariable
+from ..membership_functions.base import Interval
+from .fuzzy_rule import FuzzyRule
+from .logical_operators import And, Is, Not, Or
+
+# Antecedents with more conjuncts are not checked for subsumption, as the subsets to look up grow exponentially
+_MAX_CONJUNCTS = 12
+
+
+class RuleAnalysis(NamedTuple):
+    """Findings of `analyze_rules`, as indices into the analyzed rules.
+
+    Attributes
+    ----------
+    zero_weight : list[int]
+        Rules with zero weight.
+    never_firing : list[int]
+        Rules with a non-zero weight whose antecedent is zero for every input within the UODs, crisp unless
+        analyzed with `crisp=False`.
+    duplicates : dict[int, int]
+        Each duplicate rule mapped to the rule it duplicates, the first one with the largest weight.
+    subsumed : dict[int, int]
+        Each subsumed rule mapped to a rule with the same consequences, a subset of its conjuncts and at least its
+        weight.
+    kept : list[int]
+        The rules of the reduced rule base, in their original order.
+
+    """
+
+    zero_weight: list[int]
+    never_firing: list[int]
+    duplicates: dict[int, int]
+    subsumed: dict[int, int]
+    kept: list[int]
+
+
+class _Analyzer:
+    """Canonical forms and positive regions of the nodes of one rule base, memoized per node.
+
+    Every distinct canonical form is numbered, so conjunct sets are sets of integers, which hash far faster than
+    the nodes themselves.
+    """
+
+    __slots__ = ("variables", "crisp", "forms", "keys", "conjunct_sets", "regions")
+
+    def __init__(self, variables: Mapping[str, LinguisticVariable], crisp: bool) -> None:
+        self.variables = variables
+        # Whether all conjuncts on one variable see the same input point
+        self.crisp = crisp
+        self.forms: dict[object, int] = {}
+        # Memos keyed by node identity, as the nodes outlive the analysis
+        self.keys: dict[int, int] = {}
+        self.conjunct_sets: dict[int, frozenset[int]] = {}
+        self.regions: dict[int, tuple[str, list[Interval]] | None] = {}
+
+    def key(self, node: Is | And | Or | Not) -> int:
+        """Return the number of the canonical form of `node`, equal for antecedents up to order and nesting."""
+        key = self.keys.get(id(node))
+        if key is None:
+            match node:
+                case Is(concept=concept, term=term):
+                    form = (concept, term)
+                case Not(child=child):
+                    form = ("not", self.key(child))
+                case And() | Or():
+                    operands = self.operands(node)
+                    form = next(iter(operands)) if len(operands) == 1 else (type(node).__name__, operands)
+            key = form if isinstance(form, int) else self.forms.setdefault(form, len(self.forms))
+            self.keys[id(node)] = key
+        return key
+
+    def operands(self, node: And | Or) -> frozenset[int]:
+        """Return the canonical forms of the operands of `node`, with nested nodes of the same type spliced in."""
+        operands = self.conjunct_sets.get(id(node))
+        if operands is None:
+            flat: set[int] = set()
+            for child in node.children:
+                # min and max are idempotent, so repeated operands collapse
+                flat.update(self.operands(child) if type(child) is type(node) else (self.key(child),))
+            operands = self.conjunct_sets[id(node)] = frozenset(flat)
+        return operands
+
+    def conjuncts(self, node: Is | And | Or | Not) -> frozenset[int]:
+        """Return the canonical forms of the conjuncts of `node`."""
+        return self.operands(node) if isinstance(node, And) else frozenset((self.key(node),))
+
+    def region(self, node: Is | And | Or | Not) -> tuple[str, list[Interval]] | None:
+        """Return the variable of `node` and the open intervals within its UOD outside of which `node` is zero.
+
+        Returns None if the region is not known, because `node` depends on several variables or is a negation.
+        """
+        if id(node) in self.regions:
+            return self.regions[id(node)]
+        region = None
+        match node:
+            case Is(concept=concept, term=term):
+                lv = self.variables.get(concept)
+                if lv is None or term not in lv.fuzzy_sets:
+                    region = (concept, [])
+                else:
+                    intervals = lv.fuzzy_sets[term]._positive_set()
+                    region = (concept, _clip(intervals if intervals is not None else [lv.uod], lv.uod))
+            case And(children=children) | Or(children=children) if self.crisp or isinstance(node, Or):
+                parts = [self.region(child) for child in children]
+                if all(part is not None for part in parts) and len({concept for concept, _ in parts}) == 1:
+                    intervals = parts[0][1]
+                    for _, other in parts[1:]:
+                        intervals = _intersect(intervals, other) if isinstance(node, And) else intervals + other
+                    region = (parts[0][0], intervals)
+        self.regions[id(node)] = region
+        return region
+
+    def can_fire(self, node: Is | And | Or | Not) -> bool:
+        """Return False if `node` is zero for every input within the UODs; True if it may be positive."""
+        region = self.region(node)
+        if region is not None:
+            return bool(region[1])
+        match node:
+            case Or(children=children):
+                return any(self.can_fire(child) for child in children)
+            case And() if not self.crisp:
+                return all(self.can_fire(child) for child in _conjunct_nodes(node))
+            case And():
+                # The conjuncts on one variable must be positive at the same point
+                regions: dict[str, list[Interval]] = {}
+                for child in _conjunct_nodes(node):
+                    part = self.region(child)
+                    if part is None:
+                        if not self.can_fire(child):
+                            return False
+                        continue
+                    concept, intervals = part
+                    if concept in regions:
+                        intervals = _intersect(regions[concept], intervals)
+                    if not intervals:
+                        return False
+                    regions[concept] = intervals
+                return True
+        # A negation is positive wherever its child is below one, which supports do not bound
+        return True
+
+
+def _conjunct_nodes(node: And) -> Iterator[Is | Or | Not]:
+    for child in node.children:
+        if isinstance(child, And):
+            yield from _conjunct_nodes(child)
+        else:
+            yield child
+
+
+def _clip(intervals: list[Interval], bounds: Interval) -> list[Interval]:
+    lo, hi = bounds
+    return [(max(start, lo), min(end, hi)) for start, end in intervals if max(start, lo) < min(end, hi)]
+
+
+def _intersect(first: list[Interval], second: list[Interval]) -> list[Interval]:
+    return [(max(a, c), min(b, d)) for a, b in first for c, d in second if max(a, c) < min(b, d)]
+
+
+def analyze_rules(
+    rules: Sequence[FuzzyRule],
+    variables: Mapping[str, LinguisticVariable],
+    aggregation: Literal["max", "sum", "probor"] = "max",
+    crisp: bool = True,
+) -> RuleAnalysis:
+    """Find the rules of a rule base that never change the output of an inference.
+
+    Zero-weight and never-firing rules are always left out of the reduced rule base; duplicate and subsumed rules
+    only under max aggregation, as they add to the output under sum and probabilistic-or aggregation.
+
+    Parameters
+    ----------
+    rules : Sequence[FuzzyRule]
+        The rule base.
+    variables : Mapping[str, LinguisticVariable]
+        The input variables, whose term supports bound where the conditions can be positive.
+    aggregation : Literal["max", "sum", "probor"], Default: "max"
+        The aggregation method the rule base is used with.
+    crisp : bool, Default: True
+        Whether the rule base is only inferred with crisp inputs. If False, conjunctions of conditions on one
+        variable whose supports do not overlap are not flagged as never firing, as a membership-function input may
+        overlap both supports.
+
+    Returns
+    -------
+    RuleAnalysis
+        The findings and the indices of the rules of the reduced, equivalent rule base.
+
+    """
+    analyzer = _Analyzer(variables, crisp)
+    zero_weight, never_firing = [], []
+    live = []
+    for i, rule in enumerate(rules):
+        if rule.weight == 0.0:
+            zero_weight.append(i)
+        elif not analyzer.can_fire(rule.antecedent):
+            never_firing.append(i)
+        else:
+            live.append(i)
+
+    # The strongest rule of every (conjuncts, consequences), which all others duplicate
+    keys = {i: (analyzer.conjuncts(rules[i].antecedent), frozenset(rules[i].consequences.items())) for i in live}
+    strongest: dict[tuple[frozenset[int], frozenset], int] = {}
+    fewest: dict[frozenset, int] = {}
+    for i, key in keys.items():
+        best = strongest.setdefault(key, i)
+        if rules[i].weight > rules[best].weight:
+            strongest[key] = i
+        fewest[key[1]] = min(fewest.get(key[1], len(key[0])), len(key[0]))
+    duplicates = {i: strongest[key] for i, key in keys.items() if strongest[key] != i}
+
+    subsumed = {}
+    for i, (conjuncts, consequences) in keys.items():
+        if i in duplicates or len(conjuncts) > _MAX_CONJUNCTS:
+            continue
+        # Only subsets as large as the smallest antecedent with the same consequences can match
+        for size in range(fewest[consequences], len(conjuncts)):
+            weaker = next(
+                (
+                    j
+                    for subset in combinations(conjuncts, size)
+                    if (j := strongest.get((frozenset(subset), consequences))) is not None
+                    and rules[j].weight >= rules[i].weight
+                ),
+                None,
+            )
+            if weaker is not None:
+                subsumed[i] = weaker
+                break
+
+    redundant = duplicates.keys() | subsumed.keys() if aggregation == "max" else set()
+    kept = [i for i in live if i not in redundant]
+    return RuleAnalysis(zero_weight, never_firing, duplicates, subsumed, kept)
@@ -1,10 +1,17 @@
 # %%
-from pydantic import BaseModel, ConfigDict, FiniteFloat
+import math
+import sys
+from collections.abc import Collection, Iterable, Mapping
+from typing import Any
 
-from .logical_operators import And, Is, Not, Or, SnakedStr
+from pydantic import ConfigDict, FiniteFloat, field_validator
 
+from .._tracking import TrackedDict, TrackedModel
+from .logical_operators import And, Is, Not, Or, SnakedStr, construct_node, snake
+from .parser import parse_rule
 
-class FuzzyRule(BaseModel):
+
+class FuzzyRule(TrackedModel):
     """A single fuzzy rule with an antecedent and consequences.
 
     Attributes:
@@ -37,12 +44,139 @@ class FuzzyRule(BaseModel):
 
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, str_to_lower=True)
+    # Re-validate on assignment, so reassigned consequences are tracked for changes
+    model_config = ConfigDict(str_strip_whitespace=True, str_to_lower=True, validate_assignment=True)
 
     antecedent: Is | And | Or | Not
     consequences: dict[SnakedStr, SnakedStr]
     weight: FiniteFloat = 1.0
 
+    @field_validator("consequences", mode="after")
+    @classmethod
+    def track_consequences(cls, consequences: dict[str, str]) -> TrackedDict[str, str]:
+        """Track in-place changes of the consequences so compiled rule bases are rebuilt."""
+        return TrackedDict(consequences)
+
+    @classmethod
+    def _construct(cls, antecedent: Is | And | Or | Not, consequences: dict[str, str], weight: float) -> "FuzzyRule":
+        """Build a rule from already validated parts, skipping pydantic validation."""
+        # Equivalent to `model_construct` with all fields set, without its per-field default handling
+        rule = object.__new__(cls)
+        object.__setattr__(
+            rule,
+            "__dict__",
+            {"antecedent": antecedent, "consequences": TrackedDict(consequences), "weight": weight},
+        )
+        object.__setattr__(rule, "__pydantic_fields_set__", {"antecedent", "consequences", "weight"})
+        object.__setattr__(rule, "__pydantic_extra__", None)
+        object.__setattr__(rule, "__pydantic_private__", {"_derived": {}})
+        return rule
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        inputs: Mapping[str, Collection[str]],
+        outputs: Mapping[str, Collection[str]],
+    ) -> list["FuzzyRule"]:
+        """Build conjunctive rules in bulk from records of terms, validating every distinct name once.
+
+        Each record maps input concepts to terms, which are joined by AND into the antecedent, output concepts
+        to terms, which are the consequences, and optionally "weight" to the rule weight (1.0 by default, also
+        when it is None or NaN). Missing, None or NaN terms leave the concept out of the rule. Every distinct
+        key and term is normalised and checked against `inputs` and `outputs` once; the rules are then built
+        without per-node validation, with equal conditions shared between rules.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+            One mapping per rule, e.g. {"food": "poor", "service": "good", "tip": "low", "weight": 0.5}, such as
+            the rows of `pandas.DataFrame.to_dict("records")`.
+        inputs : Mapping[str, Collection[str]]
+            The terms of each input concept, e.g. the fuzzy sets of the input variables.
+        outputs : Mapping[str, Collection[str]]
+            The terms of each output concept.
+
+        Returns
+        -------
+        list[FuzzyRule]
+            One rule per record, in order.
+
+        Raises
+        ------
+        ValueError
+            If a record has an unknown concept or term, no input or output terms, or a weight that is not finite.
+
+        """
+        kinds = {snake(concept): True for concept in inputs} | {snake(concept): False for concept in outputs}
+        valid = {snake(concept): {snake(term) for term in terms} for concept, terms in {**inputs, **outputs}.items()}
+        # Each distinct (key, term) cell is validated once, into a shared leaf for inputs or a term for outputs
+        cells: dict[tuple[str, str], tuple[str, Is | str]] = {}
+        rules = []
+        for i, record in enumerate(records):
+            conditions, consequences, weight = [], {}, 1.0
+            for key, value in record.items():
+                if key == "weight":
+                    if value is None or value != value:  # unset, e.g. in a DataFrame where only some rows weigh
+                        continue
+                    weight = float(value)
+                    if not math.isfinite(weight):
+                        raise ValueError(f"Record {i}: the weight must be finite, got {value}.")
+                    continue
+                cell = cells.get((key, value))
+                if cell is None:
+                    if value is None or value != value:  # missing, or NaN from an empty DataFrame cell
+                        continue
+                    concept = sys.intern(snake(key))
+                    if concept not in kinds:
+                        raise ValueError(
+                            f"Record {i}: unknown concept '{key}'. Valid concepts are: {list(kinds)} and 'weight'."
+                        )
+                    if not isinstance(value, str) or snake(value) not in valid[concept]:
+                        raise ValueError(
+                            f"Record {i}: unknown term {value!r} of '{concept}'. "
+                            f"Valid terms are: {sorted(valid[concept])}."
+                        )
+                    term = sys.intern(snake(value))
+                    cell = cells[key, value] = (concept, construct_node(Is, concept, term) if kinds[concept] else term)
+                concept, target = cell
+                if type(target) is Is:
+                    conditions.append(target)
+                else:
+                    consequences[concept] = target
+            if not conditions or not consequences:
+                raise ValueError(f"Record {i}: a rule needs at least one input term and one output term.")
+            antecedent = conditions[0] if len(conditions) == 1 else construct_node(And, tuple(conditions))
+            rules.append(cls._construct(antecedent, consequences, weight))
+        return rules
+
+    @classmethod
+    def parse(cls, text: str) -> "FuzzyRule":
+        """Parse a rule from the text written by `pretty`.
+
+        Parse results are cached by text, so each distinct rule text is parsed once; every call still returns a new
+        rule, sharing the antecedent nodes of earlier parses of the same text.
+
+        Parameters
+        ----------
+        text : str
+            A rule such as "IF ((food IS poor) OR (service IS poor)) THEN (tip IS low) [weight: 1.0]", with
+            keywords in any case; the weight is optional.
+
+        Returns
+        -------
+        FuzzyRule
+            The parsed rule.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a valid rule.
+
+        """
+        antecedent, consequences, weight = parse_rule(text)
+        return cls._construct(antecedent, dict(consequences), weight)
+
     def eval(self, fuzzified_input: dict[str, dict[str, float]]) -> FiniteFloat:
         """Evaluate the rule against a fuzzified input."""
         return self.weight * self.antecedent.eval(fuzzified_input)
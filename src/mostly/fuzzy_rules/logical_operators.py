@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import AfterValidator, StringConstraints
 from pydantic.dataclasses import dataclass
@@ -10,6 +10,11 @@ SnakedStr = Annotated[
 ]
 
 
+def snake(name: str) -> str:
+    """Normalise a name the way `SnakedStr` does: stripped, lower-cased, with spaces replaced by underscores."""
+    return name.strip().lower().replace(" ", "_")
+
+
 @dataclass(frozen=True)
 class Is:
     """Represents a fuzzy condition.
@@ -54,7 +59,7 @@ class Is:
 class And:
     """Represents a conjunction of fuzzy conditions."""
 
-    children: list["Is | And | Or | Not"]
+    children: tuple["Is | And | Or | Not", ...]
 
     def eval(self, fuzzified: dict[str, dict[str, float]]) -> float:
         """Evaluate the conjunction against fuzzified input."""
@@ -73,7 +78,7 @@ class And:
 class Or:
     """Represents a disjunction of fuzzy conditions."""
 
-    children: list["Is | And | Or | Not"]
+    children: tuple["Is | And | Or | Not", ...]
 
     def eval(self, fuzzified: dict[str, dict[str, float]]) -> float:
         """Evaluate the disjunction against fuzzified input."""
@@ -105,3 +110,48 @@ class Not:
     def pretty(self) -> str:
         """Return a human-readable string representation of the negation."""
         return f"NOT {self.child.pretty()}"
+
+
+def intern_node(node: "Is | And | Or | Not", table: dict) -> "Is | And | Or | Not":
+    """Return the shared instance of a node equal to `node`, interning its sub-expressions first.
+
+    Nodes are frozen and hashable, so `table` maps every distinct sub-expression to one instance of it; interning
+    all antecedents of a rule base with one table turns them into a DAG in which repeated leaves and sub-trees are
+    stored once.
+
+    Attributes:
+        node : Is | And | Or | Not
+            The (root of the) expression to intern.
+        table : dict
+            The shared instances so far, updated in place.
+
+    """
+    match node:
+        case Not(child=child):
+            shared = intern_node(child, table)
+            if shared is not child:
+                node = Not(shared)
+        case And(children=children) | Or(children=children):
+            shared_children = tuple(intern_node(child, table) for child in children)
+            if any(shared is not child for shared, child in zip(shared_children, children, strict=True)):
+                node = type(node)(shared_children)
+    return table.setdefault(node, node)
+
+
+def construct_node[N](cls: type[N], *values: Any) -> N:
+    """Build a node from already validated field values, skipping pydantic validation.
+
+    Validating every node dominates the construction of large generated rule bases; callers that have checked
+    the names once (see `FuzzyRule.from_records`) build the nodes in this trusted mode instead.
+
+    Attributes:
+        cls : type[Is | And | Or | Not]
+            The node type.
+        *values : Any
+            The field values in declaration order: normalised names for `Is`, a tuple of children for `And`/`Or`.
+
+    """
+    node = object.__new__(cls)
+    for name, value in zip(cls.__dataclass_fields__, values, strict=True):
+        object.__setattr__(node, name, value)
+    return node
@@ -0,0 +1,198 @@
+"""Parser for the rule text emitted by `FuzzyRule.pretty`.
+
+The grammar is the one `pretty` writes, with keywords in any case and parentheses optional where precedence
+(`NOT` over `AND` over `OR`) makes them redundant::
+
+    rule        := "IF" disjunction "THEN" disjunction ["[" "weight" ":" number "]"]
+    disjunction := conjunction ("OR" conjunction)*
+    conjunction := primary ("AND" primary)*
+    primary     := "NOT" primary | "(" disjunction ")" | name "IS" ["NOT"] name
+
+The consequent must be a conjunction of `IS` conditions. Names are normalised like `SnakedStr` and interned, and
+parse results are cached by text, so rule bases with many repeated rules or names parse each distinct rule once.
+
+`parse_fcl_rule` reads the rules of IEC 61131-7 Fuzzy Control Language rule blocks with the same antecedent
+grammar; their consequences are separated by commas and the weight follows `WITH`::
+
+    fcl_rule    := "IF" disjunction "THEN" conclusion ("," conclusion)* ["WITH" number]
+    conclusion  := name "IS" name | "(" conclusion ")"
+"""
+
+import math
+import re
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+
+from .logical_operators import And, Is, Not, Or, construct_node
+
+_TOKEN = re.compile(r"[()\[\]:]|[^\s()\[\]:]+")
+_FCL_TOKEN = re.compile(r"[(),]|[^\s(),]+")
+_PUNCTUATION = frozenset("()[]:,")
+_KEYWORDS = frozenset({"IF", "THEN", "AND", "OR", "NOT", "IS"})
+
+
+class _Parser:
+    """Recursive descent over the tokens of one rule."""
+
+    __slots__ = ("text", "tokens", "keys", "position")
+
+    def __init__(self, text: str, pattern: re.Pattern[str] = _TOKEN) -> None:
+        self.text = text
+        # An empty token marks the end of the text
+        self.tokens = [*pattern.findall(text), ""]
+        self.keys = [token.upper() for token in self.tokens]
+        self.position = 0
+
+    def error(self, expected: str) -> ValueError:
+        found = repr(self.tokens[self.position]) if self.tokens[self.position] else "end of text"
+        return ValueError(f"Invalid rule {self.text!r}: expected {expected} at token {self.position}, got {found}.")
+
+    def accept(self, keyword: str) -> bool:
+        if self.keys[self.position] == keyword:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, keyword: str) -> None:
+        if not self.accept(keyword):
+            raise self.error(repr(keyword))
+
+    def name(self) -> str:
+        token = self.tokens[self.position]
+        if not token or token in _PUNCTUATION or self.keys[self.position] in _KEYWORDS:
+            raise self.error("a name")
+        self.position += 1
+        return sys.intern(token.lower())
+
+    def disjunction(self) -> Is | And | Or | Not:
+        children = [self.conjunction()]
+        while self.accept("OR"):
+            children.append(self.conjunction())
+        return children[0] if len(children) == 1 else construct_node(Or, tuple(children))
+
+    def conjunction(self) -> Is | And | Or | Not:
+        children = [self.primary()]
+        while self.accept("AND"):
+            children.append(self.primary())
+        return children[0] if len(children) == 1 else construct_node(And, tuple(children))
+
+    def primary(self) -> Is | And | Or | Not:
+        if self.accept("NOT"):
+            child = self.primary()
+            # `Not` cannot hold a `Not`, and a double negation is the condition itself
+            return child.child if isinstance(child, Not) else construct_node(Not, child)
+        if self.accept("("):
+            node = self.disjunction()
+            self.expect(")")
+            return node
+        concept = self.name()
+        self.expect("IS")
+        if self.accept("NOT"):
+            return construct_node(Not, construct_node(Is, concept, self.name()))
+        return construct_node(Is, concept, self.name())
+
+    def conclusion(self) -> tuple[str, str]:
+        if self.accept("("):
+            conclusion = self.conclusion()
+            self.expect(")")
+            return conclusion
+        concept = self.name()
+        self.expect("IS")
+        return concept, self.name()
+
+    def end(self) -> None:
+        if self.tokens[self.position]:
+            raise self.error("end of text")
+
+    def weight(self) -> float:
+        if not self.accept("["):
+            return 1.0
+        self.expect("WEIGHT")
+        self.expect(":")
+        weight = self.number()
+        self.expect("]")
+        return weight
+
+    def number(self) -> float:
+        try:
+            weight = float(self.tokens[self.position])
+        except ValueError:
+            weight = math.nan
+        if not math.isfinite(weight):
+            raise self.error("a finite weight")
+        self.position += 1
+        return weight
+
+
+@lru_cache(maxsize=1 << 14)
+def parse_rule(text: str) -> tuple[Is | And | Or | Not, tuple[tuple[str, str], ...], float]:
+    """Parse the text of a rule into its antecedent, consequences and weight.
+
+    Attributes:
+        text : str
+            A rule as written by `FuzzyRule.pretty`, e.g.
+            "IF ((food IS poor) OR (service IS poor)) THEN (tip IS low) [weight: 1.0]". The weight is optional.
+
+    Returns:
+        tuple[Is | And | Or | Not, tuple[tuple[str, str], ...], float]
+            The antecedent, the `(concept, term)` consequences and the weight. The antecedent nodes are shared by
+            every parse of the same text.
+
+    Raises:
+        ValueError
+            If the text does not follow the rule grammar, or a consequence concept is repeated.
+
+    """
+    parser = _Parser(text)
+    parser.expect("IF")
+    antecedent = parser.disjunction()
+    parser.expect("THEN")
+    start = parser.position
+    consequent = parser.disjunction()
+    conditions = consequent.children if isinstance(consequent, And) else (consequent,)
+    if not all(isinstance(condition, Is) for condition in conditions):
+        parser.position = start
+        raise parser.error("a conjunction of IS conditions as consequent")
+    consequences = tuple((condition.concept, condition.term) for condition in conditions)
+    _check_consequences(text, consequences)
+    weight = parser.weight()
+    parser.end()
+    return antecedent, consequences, weight
+
+
+@lru_cache(maxsize=1 << 14)
+def parse_fcl_rule(text: str) -> tuple[Is | And | Or | Not, tuple[tuple[str, str], ...], float]:
+    """Parse the text of a Fuzzy Control Language rule into its antecedent, consequences and weight.
+
+    Attributes:
+        text : str
+            A rule of an FCL rule block without its `RULE n :` label and closing semicolon, e.g.
+            "IF service IS poor OR food IS NOT good THEN tip IS cheap, mood IS bad WITH 0.5". The weight is
+            optional.
+
+    Returns:
+        tuple[Is | And | Or | Not, tuple[tuple[str, str], ...], float]
+            The antecedent, the `(concept, term)` consequences and the weight, as `parse_rule` returns them.
+
+    Raises:
+        ValueError
+            If the text does not follow the FCL rule grammar, or a consequence concept is repeated.
+
+    """
+    parser = _Parser(text, _FCL_TOKEN)
+    parser.expect("IF")
+    antecedent = parser.disjunction()
+    parser.expect("THEN")
+    consequences = [parser.conclusion()]
+    while parser.accept(","):
+        consequences.append(parser.conclusion())
+    _check_consequences(text, consequences)
+    weight = parser.number() if parser.accept("WITH") else 1.0
+    parser.end()
+    return antecedent, tuple(consequences), weight
+
+
+def _check_consequences(text: str, consequences: Sequence[tuple[str, str]]) -> None:
+    if len({concept for concept, _ in consequences}) != len(consequences):
+        raise ValueError(f"Invalid rule {text!r}: a consequence concept is repeated.")
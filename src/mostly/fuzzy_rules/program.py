@@ -0,0 +1,367 @@
+"""Compilation of rule antecedents into a flat, index-based evaluation program.
+
+The antecedent trees are lowered once into a list of instructions over a register file. The first registers hold
+the dense membership vector, one slot per `(concept, term)` of the input variables plus a constant zero slot for
+unknown leaves; every instruction reads a few registers by index and appends its result as a new register. Nested
+`And`/`Or` nodes are flattened into one n-ary instruction and double negations cancel, so evaluating all rules is a
+single loop without recursion, dictionary lookups or string hashing.
+
+Instructions are hash-consed: an instruction with the same operation and operands as an earlier one (the operands
+of `And`/`Or` taken in sorted order, as min and max commute) is not emitted again but shares its register. Each
+distinct sub-expression of the rule base is therefore evaluated once, however many rules repeat it.
+
+For single samples with large rule bases, an inverted index from every slot to the rules that require it (the
+rules whose antecedent is zero whenever that slot is) narrows the rule base down to the rules that can fire before
+anything is evaluated; the remaining rules have strength zero.
+
+For batches, every register is a row of samples instead, so each instruction is one `np.minimum`/`np.maximum`
+reduction (or `1 - x`) over whole columns of the membership matrix.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .fuzzy_rule import FuzzyRule
+from .logical_operators import And, Is, Not, Or
+
+# Upper bound on the elements of the register block of a batch; larger batches are evaluated in chunks
+_BLOCK_SIZE = 1 << 22
+
+
+def _complement(degree: float) -> float:
+    return 1.0 - degree
+
+
+class RuleProgram:
+    """Antecedents of a rule base lowered into a flat instruction list over a dense membership vector.
+
+    Parameters
+    ----------
+    rules : Sequence[FuzzyRule]
+        The rules, in the order of the returned strengths.
+    variables : Mapping[str, Sequence[str]]
+        The terms of each input concept, in the order their degrees are fuzzified.
+
+    Attributes
+    ----------
+    slots : dict[tuple[str, str], int]
+        Index of each `(concept, term)` in the membership vector.
+    size : int
+        Length of the membership vector, including the trailing zero slot for leaves of unknown terms.
+    instructions : list[tuple[str, tuple[int, ...]]]
+        The lowered program as distinct `(operation, operand registers)`, with operations `"and"`, `"or"` and
+        `"not"`; instruction `i` writes register `size + i`.
+    outputs : list[int]
+        Register holding the antecedent degree of each rule.
+    required : list[frozenset[int]]
+        Slots required by each rule: if the degree of any of them is zero, so is the antecedent degree.
+
+    Methods
+    -------
+    load(fuzzified)
+        Scatter fuzzified inputs into a membership vector.
+    evaluate(memberships)
+        Weighted firing strength of every rule.
+    evaluate_sparse(memberships)
+        Weighted firing strengths of the rules that can fire, found through the inverted index.
+    load_batch(memberships)
+        Stack the membership matrices of the input concepts into one matrix.
+    evaluate_batch(memberships)
+        Weighted firing strengths of every rule for every sample, as an `(n_samples, n_rules)` array.
+
+    """
+
+    __slots__ = (
+        "_layout",
+        "_operations",
+        "_outputs",
+        "_narrowing",
+        "_registers",
+        "_seeds",
+        "_unchecked",
+        "_weight_array",
+        "_weights",
+        "instructions",
+        "outputs",
+        "required",
+        "size",
+        "slots",
+    )
+
+    def __init__(self, rules: Sequence[FuzzyRule], variables: Mapping[str, Sequence[str]]) -> None:
+        """Resolve the leaves to slots and lower every antecedent."""
+        self.slots: dict[tuple[str, str], int] = {}
+        self._layout: dict[str, tuple[int, tuple[str, ...], dict[str, int]]] = {}
+        for concept, terms in variables.items():
+            start = len(self.slots)
+            self._layout[concept] = (start, tuple(terms), {term: i for i, term in enumerate(terms)})
+            self.slots.update({(concept, term): start + i for i, term in enumerate(terms)})
+        self.size = len(self.slots) + 1
+
+        self.instructions: list[tuple[str, tuple[int, ...]]] = []
+        self._registers: dict[tuple[str, tuple[int, ...]], int] = {}
+        self.outputs = [self._lower(rule.antecedent) for rule in rules]
+        self._weights = [rule.weight for rule in rules]
+        self._weight_array = np.array(self._weights, dtype=float)
+
+        applies: dict[str, Callable[[Any], float]] = {"and": min, "or": max, "not": _complement}
+        self._operations = [(applies[operation], itemgetter(*operands)) for operation, operands in self.instructions]
+        self._outputs = _getter(self.outputs)
+        self._index_rules()
+
+    def _index_rules(self) -> None:
+        """Derive the slots each rule requires and index the rules by them, one concept at a time.
+
+        An `And` requires the slots of all its operands, an `Or` the slots required by every one of its operands,
+        and a `Not` none. For every concept, each of its slots lists the rules requiring it, and the rules
+        requiring none of its slots are free; a rule can fire only if, for every concept, it is free or one of
+        its required slots is non-zero. Concepts are ordered by their number of free rules, so the first yields
+        few candidates and the others only narrow them down.
+        """
+        required = [frozenset((slot,)) for slot in range(self.size)]
+        for operation, operands in self.instructions:
+            if operation == "and":
+                required.append(frozenset().union(*(required[operand] for operand in operands)))
+            elif operation == "or":
+                required.append(frozenset.intersection(*(required[operand] for operand in operands)))
+            else:
+                required.append(frozenset())
+        self.required = [required[output] for output in self.outputs]
+
+        # The zero slot forms a group of its own, so rules requiring it never fire
+        groups = [range(start, start + len(terms)) for start, terms, _ in self._layout.values()]
+        groups.append(range(self.size - 1, self.size))
+        dependents: list[set[int]] = [set() for _ in range(self.size)]
+        for r, slots in enumerate(self.required):
+            for slot in slots:
+                dependents[slot].add(r)
+
+        rules = frozenset(range(len(self.outputs)))
+        indexed = []
+        self._unchecked: set[int] = set()
+        for slots in groups:
+            postings = [(slot, frozenset(dependents[slot])) for slot in slots if dependents[slot]]
+            constrained = frozenset().union(*(posting for _, posting in postings))
+            indexed.append((postings, rules - constrained))
+            # Rules requiring several slots of one concept are only known to have one of them non-zero
+            self._unchecked.update(r for r in constrained if len(self.required[r].intersection(slots)) > 1)
+        indexed.sort(key=lambda group: len(group[1]))
+        self._seeds, self._narrowing = indexed[0], [group for group in indexed[1:] if group[0]]
+
+    def _candidates(self, memberships: Sequence[float]) -> set[int]:
+        """Return the rules whose required slots all have a non-zero degree in `memberships`."""
+        postings, free = self._seeds
+        candidates = set(free)
+        for slot, posting in postings:
+            if memberships[slot]:
+                candidates |= posting
+        for postings, free in self._narrowing:
+            if not candidates:
+                break
+            narrowed = candidates & free
+            for slot, posting in postings:
+                if memberships[slot]:
+                    narrowed |= candidates & posting
+            candidates = narrowed
+        for r in candidates & self._unchecked:
+            if not all(memberships[slot] for slot in self.required[r]):
+                candidates.discard(r)
+        return candidates
+
+    def _lower(self, node: Is | And | Or | Not, negated: bool = False) -> int:
+        """Emit the instructions of `node`, or of its negation, and return the register holding its degree."""
+        match node:
+            case Is(concept=concept, term=term):
+                register = self.slots.get((concept, term), self.size - 1)
+            case Not(child=child):
+                # Negations are pushed down to the operand they apply to, so double negations cancel
+                return self._lower(child, not negated)
+            case And() | Or():
+                children = _flatten(node)
+                if not children:
+                    raise ValueError(f"Cannot compile an empty {type(node).__name__} in a rule antecedent.")
+                if len(children) == 1:
+                    return self._lower(children[0], negated)
+                operands = tuple(sorted({self._lower(child) for child in children}))
+                register = operands[0] if len(operands) == 1 else self._emit(type(node).__name__.lower(), operands)
+            case _:
+                raise TypeError(f"Unknown antecedent node: {node!r}")
+        return self._emit("not", (register,)) if negated else register
+
+    def _emit(self, operation: str, operands: tuple[int, ...]) -> int:
+        """Return the register of the instruction, appending it unless an identical one was emitted before."""
+        instruction = (operation, operands)
+        register = self._registers.get(instruction)
+        if register is None:
+            register = self._registers[instruction] = self.size + len(self.instructions)
+            self.instructions.append(instruction)
+        return register
+
+    def load(self, fuzzified: Mapping[str, Mapping[str, float]]) -> list[float]:
+        """Scatter fuzzified inputs, e.g. `{'temperature': {'hot': 0.8}}`, into a membership vector.
+
+        Degrees of concepts and terms missing from `fuzzified` are zero, and so are unknown concepts and terms.
+        """
+        memberships = [0.0] * self.size
+        for concept, degrees in fuzzified.items():
+            layout = self._layout.get(concept)
+            if layout is None:
+                continue
+            start, terms, index = layout
+            if tuple(degrees) == terms:
+                memberships[start : start + len(terms)] = degrees.values()
+                continue
+            for term, degree in degrees.items():
+                if term in index:
+                    memberships[start + index[term]] = degree
+        return memberships
+
+    def evaluate(self, memberships: list[float]) -> list[float]:
+        """Return the weighted firing strength of every rule for a membership vector from `load`.
+
+        The registers are appended to `memberships`, which is therefore consumed.
+        """
+        for apply, operands in self._operations:
+            memberships.append(apply(operands(memberships)))
+        return [weight * degree for weight, degree in zip(self._weights, self._outputs(memberships), strict=True)]
+
+    def evaluate_sparse(self, memberships: list[float]) -> dict[int, float]:
+        """Return the weighted firing strengths of the rules that can fire, for a membership vector from `load`.
+
+        Only the rules whose required slots all have a non-zero degree are evaluated, with the cost scaling with
+        their number rather than with the size of the rule base; every other rule has strength zero. The
+        instructions these rules read are marked first, then run in program order like `evaluate`, so shared
+        sub-expressions are evaluated once. The strengths equal those of `evaluate`.
+
+        Returns
+        -------
+        dict[int, float]
+            The evaluated rules, by index in increasing order, mapped to their strengths.
+
+        """
+        size, instructions, outputs = self.size, self.instructions, self.outputs
+        candidates = sorted(self._candidates(memberships))
+        # Mark the instructions the candidates read, walking the operands with an explicit stack
+        needed: set[int] = set()
+        pending = [outputs[r] for r in candidates if outputs[r] >= size]
+        while pending:
+            register = pending.pop()
+            if register not in needed:
+                needed.add(register)
+                pending.extend(operand for operand in instructions[register - size][1] if operand >= size)
+        # Operands precede their instruction, so the marked instructions run in register order
+        registers = dict(enumerate(memberships))
+        operations = self._operations
+        for register in sorted(needed):
+            apply, operands = operations[register - size]
+            registers[register] = apply(operands(registers))
+        weights = self._weights
+        return {r: weights[r] * registers[outputs[r]] for r in candidates}
+
+    def load_batch(self, memberships: Mapping[str, npt.ArrayLike]) -> np.ndarray:
+        """Stack the `(n_samples, n_terms)` membership matrices of the input concepts into one matrix.
+
+        The columns of each matrix follow the terms of its concept, as returned by
+        `LinguisticVariable.fuzzify_batch`. Concepts missing from `memberships` have zero degrees.
+
+        Returns
+        -------
+        np.ndarray
+            Membership matrix of shape `(n_samples, size)`, with the columns in slot order.
+
+        Raises
+        ------
+        ValueError
+            If a concept is unknown, or the matrices do not agree with the terms or with each other in shape.
+
+        """
+        matrices = {concept: np.asarray(matrix, dtype=float) for concept, matrix in memberships.items()}
+        if not matrices:
+            raise ValueError("At least one membership matrix is required to determine the number of samples.")
+        n_samples = next(iter(matrices.values())).shape[0]
+
+        stacked = np.zeros((n_samples, self.size))
+        for concept, matrix in matrices.items():
+            if concept not in self._layout:
+                raise ValueError(f"Unknown input concept '{concept}'. Valid concepts are: {list(self._layout)}.")
+            start, terms, _ = self._layout[concept]
+            if matrix.shape != (n_samples, len(terms)):
+                raise ValueError(
+                    f"Membership matrix of '{concept}' must have shape ({n_samples}, {len(terms)}), "
+                    f"one column per term, got {matrix.shape}."
+                )
+            stacked[:, start : start + len(terms)] = matrix
+        return stacked
+
+    def evaluate_batch(self, memberships: npt.ArrayLike) -> np.ndarray:
+        """Return the weighted firing strengths of every rule for a membership matrix from `load_batch`.
+
+        Each instruction is a pairwise `np.minimum`/`np.maximum` reduction or a complement over rows of samples,
+        written in place; samples are processed in chunks to bound the memory of the intermediate registers.
+
+        Parameters
+        ----------
+        memberships : ArrayLike
+            Membership matrix of shape `(n_samples, size)`; the last column is the zero slot.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `(n_samples, n_rules)`, equal row by row to `evaluate`.
+
+        Raises
+        ------
+        ValueError
+            If the matrix does not have one column per slot.
+
+        """
+        memberships = np.asarray(memberships, dtype=float)
+        if memberships.ndim != 2 or memberships.shape[1] != self.size:
+            raise ValueError(
+                f"Membership matrix must have shape (n_samples, {self.size}), one column per slot, "
+                f"got {memberships.shape}."
+            )
+        n_samples = memberships.shape[0]
+        strengths = np.empty((n_samples, len(self.outputs)))
+        n_registers = self.size + len(self.instructions)
+        block = max(1, _BLOCK_SIZE // n_registers)
+        for start in range(0, n_samples, block):
+            chunk = memberships[start : start + block]
+            registers = np.empty((n_registers, chunk.shape[0]))
+            registers[: self.size] = chunk.T
+            for target, (operation, operands) in enumerate(self.instructions, self.size):
+                out = registers[target]
+                if operation == "not":
+                    np.subtract(1.0, registers[operands[0]], out=out)
+                    continue
+                reduce = np.minimum if operation == "and" else np.maximum
+                reduce(registers[operands[0]], registers[operands[1]], out=out)
+                for operand in operands[2:]:
+                    reduce(out, registers[operand], out=out)
+            np.multiply(registers[self.outputs].T, self._weight_array, out=strengths[start : start + block])
+        return strengths
+
+
+def _flatten(node: And | Or) -> list[Is | And | Or | Not]:
+    """Return the children of `node`, splicing in the children of nested nodes of the same kind."""
+    children = []
+    for child in node.children:
+        if type(child) is type(node):
+            children.extend(_flatten(child))
+        else:
+            children.append(child)
+    return children
+
+
+def _getter(indices: list[int]) -> Callable[[list[float]], tuple[float, ...]]:
+    """Return a function picking `indices` from a list as a tuple, also for fewer than two indices."""
+    if len(indices) == 1:
+        (index,) = indices
+        return lambda values: (values[index],)
+    if not indices:
+        return lambda values: ()
+    return itemgetter(*indices)
@@ -0,0 +1,387 @@
+"""Dense rule tables for full cartesian grids of rules.
+
+A rule base that maps every combination of input terms to an output term is an N-dimensional lookup table: one
+axis per input variable, indexed by term, each cell holding the index of the consequent term. Storing the grid as
+an integer array instead of one `FuzzyRule` per cell keeps large grids compact, and firing all cells is an outer
+minimum (or product) of the membership vectors of the inputs.
+
+Crisp inputs give few non-zero degrees per variable, so only the sub-grid spanned by the active terms is gathered
+and evaluated; the inactive cells have strength zero.
+"""
+
+from collections.abc import Mapping, Sequence
+from functools import reduce
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from .fuzzy_rule import FuzzyRule
+from .logical_operators import And, Is, SnakedStr
+
+
+class RuleTable(BaseModel):
+    """A full grid of fuzzy rules over the terms of its input variables.
+
+    The cell `(i, j)` of a table over the inputs `("temperature", "humidity")` is the rule
+    `IF (temperature IS <term i>) AND (humidity IS <term j>) THEN (<output> IS <term consequents[i, j]>)`, with the
+    terms of every variable taken in the order of its fuzzy sets. The arrays are read-only.
+
+    Attributes
+    ----------
+    inputs : tuple[str, ...]
+        The input concepts, one per axis of the table.
+    output : str
+        The output concept.
+    consequents : np.ndarray
+        Integer array with one axis per input concept, as long as its number of terms. Each cell holds the index of
+        the consequent output term, or -1 where the grid has no rule.
+    weights : np.ndarray, optional
+        Rule weights of the same shape as `consequents`; all ones by default.
+    conjunction : Literal["min", "product"], Default: "min"
+        How the degrees of the input terms of a cell combine: their minimum, as `And`, or their product.
+
+    Examples
+    --------
+    >>> table = RuleTable(
+    ...     inputs=("temperature", "humidity"),
+    ...     output="fan_speed",
+    ...     consequents=[[0, 0], [1, 2]],
+    ... )
+    >>> table.shape
+    (2, 2)
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, str_strip_whitespace=True, str_to_lower=True)
+
+    inputs: tuple[SnakedStr, ...] = Field(min_length=1)
+    output: SnakedStr
+    consequents: np.ndarray
+    weights: np.ndarray | None = None
+    conjunction: Literal["min", "product"] = "min"
+
+    @field_validator("consequents", mode="before")
+    @classmethod
+    def validate_consequents(cls, consequents: npt.ArrayLike) -> np.ndarray:
+        """Convert the consequents to a read-only integer array of term indices.
+
+        Raises
+        ------
+        ValueError
+            If the consequents are not integers, or an index is below -1.
+
+        """
+        consequents = np.array(consequents)
+        if consequents.size and not np.issubdtype(consequents.dtype, np.integer):
+            raise ValueError(f"Consequents must be integer term indices, got dtype {consequents.dtype}.")
+        consequents = consequents.astype(np.intp)
+        if (consequents < -1).any():
+            raise ValueError("Consequents must be term indices, or -1 for cells without a rule.")
+        consequents.setflags(write=False)
+        return consequents
+
+    @field_validator("weights", mode="before")
+    @classmethod
+    def validate_weights(cls, weights: npt.ArrayLike | None) -> np.ndarray | None:
+        """Convert the weights to a read-only float array.
+
+        Raises
+        ------
+        ValueError
+            If a weight is not finite.
+
+        """
+        if weights is None:
+            return None
+        weights = np.array(weights, dtype=np.float64)
+        if not np.isfinite(weights).all():
+            raise ValueError("Weights must be finite.")
+        weights.setflags(write=False)
+        return weights
+
+    @model_validator(mode="after")
+    def validate_shape(self) -> "RuleTable":
+        """Validate that the table has one axis per input and weights of its shape, defaulting them to ones.
+
+        Raises
+        ------
+        ValueError
+            If the number of axes does not match the inputs, an input is repeated, or the weights do not match
+            the shape of the consequents.
+
+        """
+        if self.consequents.ndim != len(self.inputs):
+            raise ValueError(
+                f"Consequents must have one axis per input concept ({len(self.inputs)}), "
+                f"got {self.consequents.ndim} axes."
+            )
+        if len(set(self.inputs)) != len(self.inputs):
+            raise ValueError(f"Input concepts must be distinct, got {self.inputs}.")
+        if self.weights is None:
+            weights = np.ones(self.consequents.shape)
+            weights.setflags(write=False)
+            # The model is frozen, so the default is set directly
+            self.__dict__["weights"] = weights
+        elif self.weights.shape != self.consequents.shape:
+            raise ValueError(
+                f"Weights must have the shape of the consequents {self.consequents.shape}, got {self.weights.shape}."
+            )
+        return self
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Number of terms of each input, in the order of `inputs`."""
+        return self.consequents.shape
+
+    def __eq__(self, other: object) -> bool:
+        """Compare tables by their inputs, output, arrays and conjunction."""
+        return (
+            type(self) is type(other)
+            and (self.inputs, self.output, self.conjunction) == (other.inputs, other.output, other.conjunction)
+            and np.array_equal(self.consequents, other.consequents)
+            and np.array_equal(self.weights, other.weights)
+        )
+
+    __hash__ = None
+
+    def _combine(self, vectors: Sequence[np.ndarray]) -> np.ndarray:
+        outer = np.minimum.outer if self.conjunction == "min" else np.multiply.outer
+        return reduce(outer, vectors) if len(vectors) > 1 else vectors[0]
+
+    def _vectors(self, degrees: Sequence[npt.ArrayLike]) -> list[np.ndarray]:
+        if len(degrees) != len(self.inputs):
+            raise ValueError(f"Expected one degree vector per input concept ({len(self.inputs)}), got {len(degrees)}.")
+        vectors = [np.asarray(vector, dtype=np.float64) for vector in degrees]
+        for concept, vector, n_terms in zip(self.inputs, vectors, self.shape, strict=True):
+            if vector.shape != (n_terms,):
+                raise ValueError(
+                    f"Degrees of '{concept}' must have shape ({n_terms},), one per term, got {vector.shape}."
+                )
+        return vectors
+
+    def strengths(self, degrees: Sequence[npt.ArrayLike]) -> np.ndarray:
+        """Calculate the weighted firing strength of every cell.
+
+        Parameters
+        ----------
+        degrees : Sequence[ArrayLike]
+            The membership vector of each input concept, in the order of `inputs` and with the degrees in term
+            order.
+
+        Returns
+        -------
+        np.ndarray
+            Array of the shape of the table; cells without a rule hold their strength all the same.
+
+        Raises
+        ------
+        ValueError
+            If there is not one vector per input, or a vector does not have one degree per term.
+
+        """
+        return self._combine(self._vectors(degrees)) * self.weights
+
+    def _matrices(self, degrees: Sequence[npt.ArrayLike]) -> list[np.ndarray]:
+        if len(degrees) != len(self.inputs):
+            raise ValueError(
+                f"Expected one membership matrix per input concept ({len(self.inputs)}), got {len(degrees)}."
+            )
+        matrices = [np.asarray(matrix, dtype=np.float64) for matrix in degrees]
+        n_samples = matrices[0].shape[0] if matrices[0].ndim else 0
+        for concept, matrix, n_terms in zip(self.inputs, matrices, self.shape, strict=True):
+            if matrix.shape != (n_samples, n_terms):
+                raise ValueError(
+                    f"Membership matrix of '{concept}' must have shape ({n_samples}, {n_terms}), one column per term, "
+                    f"got {matrix.shape}."
+                )
+        return matrices
+
+    @staticmethod
+    def _grid_axes(matrices: Sequence[np.ndarray]) -> list[np.ndarray]:
+        """Reshape the `(n_samples, k)` matrix of each input to broadcast along its own axis of a grid."""
+        axes = []
+        for axis, matrix in enumerate(matrices):
+            shape = [len(matrix)] + [1] * len(matrices)
+            shape[axis + 1] = matrix.shape[1]
+            axes.append(matrix.reshape(shape))
+        return axes
+
+    def strengths_batch(self, degrees: Sequence[npt.ArrayLike]) -> np.ndarray:
+        """Calculate the weighted firing strength of every cell for a batch of samples.
+
+        Parameters
+        ----------
+        degrees : Sequence[ArrayLike]
+            The `(n_samples, n_terms)` membership matrix of each input concept, in the order of `inputs` and with
+            the columns in term order.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `(n_samples, *shape)`, equal sample by sample to `strengths`.
+
+        Raises
+        ------
+        ValueError
+            If there is not one matrix per input, or the matrices do not have one column per term and the same
+            number of rows.
+
+        """
+        combine = np.minimum if self.conjunction == "min" else np.multiply
+        return reduce(combine, self._grid_axes(self._matrices(degrees))) * self.weights
+
+    def fire_batch(self, degrees: Sequence[npt.ArrayLike]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate the consequent terms and strengths of the rules that fire, for a batch of samples.
+
+        As in `fire`, only the sub-grid spanned by the terms with a non-zero degree is evaluated: for each input,
+        the active terms of every sample are gathered into `(n_samples, k)` matrices, `k` being the largest number
+        of active terms of any sample, so a batch costs `n_samples * k_1 * k_2 * ...` cells instead of
+        `n_samples * size` when few terms are active at once, e.g. for partitions of overlapping terms.
+
+        Parameters
+        ----------
+        degrees : Sequence[ArrayLike]
+            The `(n_samples, n_terms)` membership matrix of each input concept, in the order of `inputs` and with
+            the columns in term order.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The sample, the consequent term index and the strength of every firing rule, ordered by sample.
+
+        Raises
+        ------
+        ValueError
+            If there is not one matrix per input, or the matrices do not have one column per term and the same
+            number of rows.
+
+        """
+        matrices = self._matrices(degrees)
+        n_samples = len(matrices[0])
+        combine = np.minimum if self.conjunction == "min" else np.multiply
+        active = [np.count_nonzero(matrix, axis=1).max(initial=0) for matrix in matrices]
+        if np.prod(active, dtype=np.float64) * 2 < self.consequents.size:
+            # The active terms of each sample, in term order and padded with zero degrees of the first term
+            columns, gathered = [], []
+            for matrix, k in zip(matrices, active, strict=True):
+                samples, terms = np.nonzero(matrix)
+                position = np.arange(len(samples)) - np.searchsorted(samples, samples)
+                index, values = np.zeros((n_samples, k), dtype=np.intp), np.zeros((n_samples, k))
+                index[samples, position], values[samples, position] = terms, matrix[samples, terms]
+                columns.append(index)
+                gathered.append(values)
+            strides = np.cumprod((1, *self.shape[:0:-1]))[::-1]
+            cells = reduce(
+                np.add, self._grid_axes([index * stride for index, stride in zip(columns, strides, strict=True)])
+            )
+            cells = cells.reshape(n_samples, -1)
+            strengths = reduce(combine, self._grid_axes(gathered)).reshape(n_samples, -1)
+        else:
+            cells = None
+            strengths = reduce(combine, self._grid_axes(matrices)).reshape(n_samples, -1)
+        flat = np.flatnonzero(strengths > 0.0)
+        samples = flat // strengths.shape[1]
+        cells = flat % strengths.shape[1] if cells is None else cells.reshape(-1)[flat]
+        strengths = strengths.reshape(-1)[flat] * self.weights.reshape(-1)[cells]
+        consequents = self.consequents.reshape(-1)[cells]
+        fired = (consequents >= 0) & (strengths != 0.0)
+        return samples[fired], consequents[fired], strengths[fired]
+
+    def fire(self, degrees: Sequence[npt.ArrayLike]) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the consequent terms and strengths of the rules that fire.
+
+        Only the sub-grid spanned by the terms with a non-zero degree is gathered, as every other cell has a zero
+        antecedent; when all terms are active the whole table is evaluated without gathering.
+
+        Parameters
+        ----------
+        degrees : Sequence[ArrayLike]
+            The membership vector of each input concept, in the order of `inputs` and with the degrees in term
+            order.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The consequent term indices and the strengths of the firing rules, in row-major order of their cells.
+
+        Raises
+        ------
+        ValueError
+            If there is not one vector per input, or a vector does not have one degree per term.
+
+        """
+        vectors = self._vectors(degrees)
+        active = [np.flatnonzero(vector) for vector in vectors]
+        if all(len(index) == len(vector) for index, vector in zip(active, vectors, strict=True)):
+            consequents, weights = self.consequents, self.weights
+        else:
+            grid = np.ix_(*active)
+            consequents, weights = self.consequents[grid], self.weights[grid]
+            vectors = [vector[index] for vector, index in zip(vectors, active, strict=True)]
+        strengths = self._combine(vectors) * weights
+        fired = (consequents >= 0) & (strengths != 0.0)
+        return consequents[fired], strengths[fired]
+
+    def term_strengths(self, degrees: Sequence[npt.ArrayLike], n_terms: int) -> np.ndarray:
+        """Calculate the strongest firing of each output term.
+
+        Under max aggregation, with clip or scale implication, the rules sharing a consequent term contribute only
+        through their strongest firing, so a whole table reduces to one strength per output term.
+
+        Parameters
+        ----------
+        degrees : Sequence[ArrayLike]
+            The membership vector of each input concept, in the order of `inputs` and with the degrees in term
+            order.
+        n_terms : int
+            The number of terms of the output variable.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `(n_terms,)`, zero for terms that no rule fires.
+
+        """
+        terms, strengths = self.fire(degrees)
+        reduced = np.zeros(n_terms)
+        np.maximum.at(reduced, terms, strengths)
+        return reduced
+
+    def to_rules(self, input_terms: Mapping[str, Sequence[str]], output_terms: Sequence[str]) -> list[FuzzyRule]:
+        """Expand the table into one `FuzzyRule` per cell with a rule.
+
+        Parameters
+        ----------
+        input_terms : Mapping[str, Sequence[str]]
+            The terms of each input concept, in the order of the axes.
+        output_terms : Sequence[str]
+            The terms of the output concept, in the order of the consequent indices.
+
+        Returns
+        -------
+        list[FuzzyRule]
+            The rules in row-major order of their cells.
+
+        Raises
+        ------
+        ValueError
+            If the table combines its inputs by product, which `And` cannot express.
+
+        """
+        if self.conjunction != "min":
+            raise ValueError("Only tables with the 'min' conjunction can be expanded into rules.")
+        rules = []
+        for cell in zip(*np.nonzero(self.consequents >= 0), strict=True):
+            leaves = [
+                Is(concept=concept, term=input_terms[concept][i]) for concept, i in zip(self.inputs, cell, strict=True)
+            ]
+            rules.append(
+                FuzzyRule(
+                    antecedent=And(children=leaves) if len(leaves) > 1 else leaves[0],
+                    consequences={self.output: output_terms[self.consequents[cell]]},
+                    weight=float(self.weights[cell]),
+                )
+            )
+        return rules
@@ -0,0 +1,214 @@
+"""Aggregation and centroid defuzzification of the output sets of a batch of inferences.
+
+The centroid of an aggregated output set is the ratio of two sums over the output grid, `Σ x·μ(x)` and `Σ μ(x)`.
+Sum aggregation is linear, so both sums split into one term per firing, and the sums of a membership curve clipped
+at height `s`, `Σ min(s, m(x))` and `Σ x·min(s, m(x))`, are piecewise linear in `s`: they are read off the sorted
+curve with cumulative sums. Max aggregation of clipped sets expands by inclusion-exclusion into the clipped sums of
+the pointwise minima of the overlapping terms. These closed forms avoid materializing one output set per sample;
+the other combinations aggregate `(n_samples, resolution)` output sets.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from ..linguistic_variable import LinguisticVariable
+
+# Upper bound on the overlapping subsets of terms expanded by inclusion-exclusion; beyond it, e.g. for many
+# Gaussian terms that all overlap, max aggregation of clipped sets falls back to the output sets
+_MAX_OVERLAPS = 256
+# Number of grid values of the output sets of one block of samples aggregated over the grid
+_GRID_BLOCK = 1 << 16
+
+
+class ClippedSums:
+    """The grid sums `Σ min(s, m(x))` and `Σ x·min(s, m(x))` of a membership curve `m`, for any height `s`."""
+
+    __slots__ = ("_heights", "_mass", "_moment", "_count", "_tail")
+
+    def __init__(self, grid: np.ndarray, curve: np.ndarray) -> None:
+        """Sort the curve and accumulate the sums below and the grid above every height."""
+        order = np.argsort(curve, kind="stable")
+        self._heights = curve[order]
+        xs = grid[order]
+        # Below the clipping height the curve counts as is; above it, each grid point counts `s` times
+        self._mass = np.concatenate(([0.0], np.cumsum(self._heights)))
+        self._moment = np.concatenate(([0.0], np.cumsum(xs * self._heights)))
+        self._count = np.arange(len(curve), -1, -1, dtype=np.float64)
+        self._tail = np.concatenate((np.cumsum(xs[::-1])[::-1], [0.0]))
+
+    def __call__(self, heights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the mass and the first moment of the curve clipped at each of `heights`."""
+        below = np.searchsorted(self._heights, heights)
+        return (
+            self._mass[below] + heights * self._count[below],
+            self._moment[below] + heights * self._tail[below],
+        )
+
+
+class OutputSets:
+    """The terms of an output variable sampled once over its grid, with the sums of their clipped curves.
+
+    Attributes
+    ----------
+    grid : np.ndarray
+        The `resolution` points of the output grid over the UOD, read-only.
+    index : dict[str, int]
+        The terms mapped to their row of `memberships`.
+    memberships : np.ndarray
+        Read-only array of shape `(n_terms, resolution)` of the degrees of the terms, in the order of `fuzzy_sets`.
+
+    """
+
+    __slots__ = ("_overlaps", "_sums", "grid", "index", "memberships")
+
+    def __init__(self, lv: LinguisticVariable, resolution: int) -> None:
+        """Evaluate the terms of `lv` over `resolution` grid points."""
+        self.grid = np.linspace(*lv.uod, resolution)
+        self.index = {term: t for t, term in enumerate(lv.fuzzy_sets)}
+        self.memberships = np.stack([mf.evaluate(self.grid) for mf in lv.fuzzy_sets.values()])
+        # Shared by every inference until the variable changes
+        self.grid.flags.writeable = self.memberships.flags.writeable = False
+        self._sums = [ClippedSums(self.grid, curve) for curve in self.memberships]
+
+    @property
+    def overlaps(self) -> list[tuple[np.ndarray, float, ClippedSums]] | None:
+        """The subsets of terms with a common non-zero degree, expanded on first use.
+
+        Each comes with its inclusion-exclusion sign and the clipped sums of the pointwise minimum of its terms;
+        None if there are more than `_MAX_OVERLAPS` subsets.
+        """
+        try:
+            return self._overlaps
+        except AttributeError:
+            pass
+        overlaps: list[tuple[np.ndarray, float, ClippedSums]] = []
+        # Depth-first over subsets in term order, extending only those whose pointwise minimum is non-zero
+        stack = [((t,), curve) for t, curve in reversed(list(enumerate(self.memberships)))]
+        while stack and len(overlaps) <= _MAX_OVERLAPS:
+            terms, curve = stack.pop()
+            if not curve.any():
+                continue
+            sums = self._sums[terms[0]] if len(terms) == 1 else ClippedSums(self.grid, curve)
+            overlaps.append((np.array(terms, dtype=np.intp), 1.0 if len(terms) % 2 else -1.0, sums))
+            for t in range(len(self.memberships) - 1, terms[-1], -1):
+                stack.append(((*terms, t), np.minimum(curve, self.memberships[t])))
+        self._overlaps = overlaps if len(overlaps) <= _MAX_OVERLAPS else None
+        return self._overlaps
+
+    def centroids(
+        self,
+        n_samples: int,
+        firings: tuple[np.ndarray, np.ndarray, np.ndarray],
+        aggregation: Literal["max", "sum", "probor"],
+        implication: Literal["clip", "scale"],
+    ) -> np.ndarray:
+        """Aggregate the implied output sets of a batch and return their centroids.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of samples of the batch.
+        firings : tuple[np.ndarray, np.ndarray, np.ndarray]
+            The sample, the output term index and the (non-zero) strength of every firing.
+        aggregation : Literal["max", "sum", "probor"]
+            The method to use for aggregating rule outputs.
+        implication : Literal["clip", "scale"]
+            The method to use for applying rule strengths to output membership functions.
+
+        Returns
+        -------
+        np.ndarray
+            The centroid of each aggregated output set, zero where no rule fires.
+
+        """
+        rows, terms, values = firings
+        numerator, denominator = np.zeros(n_samples), np.zeros(n_samples)
+        if aggregation == "sum" and implication == "scale":
+            mass, moment = self.memberships.sum(axis=1), self.memberships @ self.grid
+            denominator += np.bincount(rows, values * mass[terms], minlength=n_samples)
+            numerator += np.bincount(rows, values * moment[terms], minlength=n_samples)
+        elif aggregation == "sum":
+            for t in np.unique(terms):
+                selected = terms == t
+                mass, moment = self._sums[t](values[selected])
+                denominator += np.bincount(rows[selected], mass, minlength=n_samples)
+                numerator += np.bincount(rows[selected], moment, minlength=n_samples)
+        elif aggregation == "max":
+            # Under max aggregation only the strongest firing of each term matters, for clip and scale alike
+            reduced = np.zeros((n_samples, len(self.memberships)))
+            np.maximum.at(reduced, (rows, terms), values)
+            overlaps = self.overlaps if implication == "clip" else None
+            if overlaps is None:
+                rows, terms = np.nonzero(reduced)
+                return self._grid_centroids(n_samples, (rows, terms, reduced[rows, terms]), aggregation, implication)
+            for subset, sign, sums in overlaps:
+                heights = reduced[:, subset[0]] if len(subset) == 1 else reduced[:, subset].min(axis=1)
+                # Curves clipped at zero have zero sums
+                clipped = np.flatnonzero(heights)
+                mass, moment = sums(heights[clipped])
+                denominator[clipped] += sign * mass
+                numerator[clipped] += sign * moment
+        else:
+            return self._grid_centroids(n_samples, firings, aggregation, implication)
+        return np.divide(numerator, denominator, out=np.zeros(n_samples), where=denominator != 0.0)
+
+    def _grid_centroids(
+        self,
+        n_samples: int,
+        firings: tuple[np.ndarray, np.ndarray, np.ndarray],
+        aggregation: Literal["max", "sum", "probor"],
+        implication: Literal["clip", "scale"],
+    ) -> np.ndarray:
+        """Aggregate the output sets over the grid, term by term as `MamdaniFIS.infer` does firing by firing.
+
+        Samples are processed in blocks small enough for their output sets to stay in cache. The k-th firings of
+        each term of the samples of a block form a dense `(block, n_terms)` strength matrix, whose zeros leave the
+        aggregate unchanged, so every term is implied and aggregated for the whole block in place.
+        """
+        n_terms = len(self.memberships)
+        keys = firings[0] * n_terms + firings[1]
+        order = np.argsort(keys, kind="stable")
+        keys, rows, terms, values = keys[order], firings[0][order], firings[1][order], firings[2][order]
+        # Position of each firing among the firings of the same term for the same sample
+        rank = np.arange(len(keys)) - np.searchsorted(keys, keys)
+
+        imply = np.minimum if implication == "clip" else np.multiply
+        centroids = np.zeros(n_samples)
+        block = max(1, _GRID_BLOCK // len(self.grid))
+        for start in range(0, n_samples, block):
+            stop = min(start + block, n_samples)
+            low, high = np.searchsorted(rows, (start, stop))
+            aggregated = np.zeros((stop - start, len(self.grid)))
+            implied, scratch = np.empty_like(aggregated), np.empty_like(aggregated)
+            for k in range(rank[low:high].max() + 1 if high > low else 0):
+                selected = np.flatnonzero(rank[low:high] == k) + low
+                strengths = np.zeros((stop - start, n_terms))
+                strengths[rows[selected] - start, terms[selected]] = values[selected]
+                for t in np.flatnonzero(strengths.any(axis=0)):
+                    imply(strengths[:, t, None], self.memberships[t], out=implied)
+                    match aggregation:
+                        case "max":
+                            np.maximum(aggregated, implied, out=aggregated)
+                        case "sum":
+                            aggregated += implied
+                        case "probor":
+                            # a + b - a·b = a + b·(1 - a)
+                            np.subtract(1.0, aggregated, out=scratch)
+                            scratch *= implied
+                            aggregated += scratch
+            numerator, denominator = aggregated @ self.grid, aggregated.sum(axis=1)
+            np.divide(numerator, denominator, out=centroids[start:stop], where=denominator != 0.0)
+        return centroids
+
+
+def firings(strengths: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the sample, the column and the value of every non-zero entry of a `(n_samples, n)` matrix.
+
+    Rules with a negative weight have negative strengths, which lower the aggregate under sum and probabilistic-or
+    aggregation as in `MamdaniFIS.infer`.
+    """
+    # Counting a boolean mask is much faster than `np.nonzero` on floats
+    flat = np.flatnonzero(strengths != 0.0)
+    rows, columns = np.divmod(flat, strengths.shape[1])
+    return rows, columns, strengths.reshape(-1)[flat]
@@ -0,0 +1,153 @@
+"""Per-rule firing statistics accumulated over inferences in preallocated counter arrays."""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..fuzzy_rules.fuzzy_rule import FuzzyRule
+
+
+class RuleStats:
+    """Counters of how often, and how strongly, each rule of a rule base fires.
+
+    Every inference, or batch of inferences, updates a few NumPy arrays indexed by rule position with the strengths
+    of the rules that were evaluated. Recording is vectorized over the rules, but it scans an array of all rules
+    once per output concept to find the decisive rules, so its cost grows with the number of rules and of output
+    concepts. The counters restart when rules are replaced, added, removed or reordered; edits within a rule keep
+    them, and the consequences are re-read whenever the rules change. Copies and pickles carry the counters over.
+
+    Attributes
+    ----------
+    bins : int
+        Number of equal-width bins of the firing strengths over (0, 1]; larger strengths count in the last bin.
+    inferences : int
+        Number of recorded inferences.
+    fired : np.ndarray
+        Number of inferences in which each rule had a positive strength.
+    strength_sum : np.ndarray
+        Sum of the positive strengths of each rule.
+    histogram : np.ndarray
+        Array of shape `(n_rules, bins)` counting the positive strengths of each rule per bin.
+    decisive : np.ndarray
+        Number of inferences in which each rule was the strongest of the rules concluding one of its output
+        concepts, i.e. set the height of the max aggregate (counted once per concept).
+
+    """
+
+    __slots__ = ("_groups", "_rules", "bins", "decisive", "fired", "histogram", "inferences", "source", "strength_sum")
+
+    def __init__(self, bins: int) -> None:
+        """Create empty statistics for a rule base of unknown size."""
+        self.bins = bins
+        self.source: object = None
+        self._rules: tuple[FuzzyRule, ...] = ()
+        self._groups: list[np.ndarray] = []
+        self._reset(0)
+
+    def _reset(self, n_rules: int) -> None:
+        self.inferences = 0
+        self.fired = np.zeros(n_rules, dtype=np.int64)
+        self.strength_sum = np.zeros(n_rules)
+        self.histogram = np.zeros((n_rules, self.bins), dtype=np.int64)
+        self.decisive = np.zeros(n_rules, dtype=np.int64)
+
+    def bind(self, rules: Sequence[FuzzyRule], source: object) -> None:
+        """Follow the rules of a rule base, restarting the counters unless they are the same rules in order.
+
+        `source` identifies the current state of the rules, e.g. their compiled program; the statistics need
+        binding again once it changes.
+        """
+        # Rules edited in place are still the same objects; any other change moves counters to other rules
+        if len(rules) != len(self._rules) or any(new is not old for new, old in zip(rules, self._rules, strict=True)):
+            self._reset(len(rules))
+        groups: dict[str, list[int]] = {}
+        for r, rule in enumerate(rules):
+            for concept in rule.consequences:
+                groups.setdefault(concept, []).append(r)
+        self._groups = [np.array(group, dtype=np.intp) for group in groups.values()]
+        self._rules, self.source = tuple(rules), source
+
+    def record(self, strengths: Mapping[int, float]) -> None:
+        """Add one inference, given the strengths of the evaluated rules by rule position."""
+        self.inferences += 1
+        indices = np.fromiter(strengths.keys(), np.intp, len(strengths))
+        values = np.fromiter(strengths.values(), np.float64, len(strengths))
+        positive = values > 0.0
+        indices, values = indices[positive], values[positive]
+        if not len(indices):
+            return
+        # Rule positions are unique, so fancy-indexed increments do not collide
+        self.fired[indices] += 1
+        self.strength_sum[indices] += values
+        bins = np.clip(np.ceil(values * self.bins).astype(np.intp) - 1, 0, self.bins - 1)
+        self.histogram[indices, bins] += 1
+
+        dense = np.zeros(len(self.fired))
+        dense[indices] = values
+        for group in self._groups:
+            candidates = dense[group]
+            strongest = candidates.argmax()
+            if candidates[strongest] > 0.0:
+                self.decisive[group[strongest]] += 1
+
+    def record_batch(self, strengths: np.ndarray) -> None:
+        """Add a batch of inferences, given the `(n_samples, n_rules)` strengths of all rules."""
+        self.inferences += strengths.shape[0]
+        positive = strengths > 0.0
+        # Counting a boolean mask is much faster than `np.nonzero` on floats
+        flat = np.flatnonzero(positive)
+        rules, values = flat % strengths.shape[1], strengths.reshape(-1)[flat]
+        self.fired += positive.sum(axis=0)
+        self.strength_sum += np.bincount(rules, values, minlength=len(self.fired))
+        bins = np.clip(np.ceil(values * self.bins).astype(np.intp) - 1, 0, self.bins - 1)
+        # A rule falls in one bin in several samples, so the increments are counted rather than fancy-indexed
+        self.histogram += np.bincount(rules * self.bins + bins, minlength=self.histogram.size).reshape(
+            self.histogram.shape
+        )
+
+        samples = np.arange(strengths.shape[0])
+        for group in self._groups:
+            candidates = strengths[:, group]
+            strongest = candidates.argmax(axis=1)
+            decided = candidates[samples, strongest] > 0.0
+            self.decisive += np.bincount(group[strongest[decided]], minlength=len(self.decisive))
+
+    def __copy__(self) -> "RuleStats":
+        """Copy the counters, sharing the bound rules."""
+        copied = RuleStats.__new__(RuleStats)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            setattr(copied, name, value.copy() if isinstance(value, np.ndarray) else value)
+        return copied
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the counters without the bound rule base state, which is re-bound on the next use."""
+        return {name: getattr(self, name) for name in self.__slots__ if name != "source"}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore the pickled counters."""
+        self.source = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return one row per rule with its text, counters and strength histogram."""
+        rules = self._rules
+        edges = np.linspace(0.0, 1.0, self.bins + 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_strength = self.strength_sum / self.fired
+            fire_rate = self.fired / self.inferences if self.inferences else np.zeros(len(self.fired))
+        frame = pd.DataFrame(
+            {
+                "rule": [rule.pretty() for rule in rules],
+                "fired": self.fired,
+                "fire_rate": fire_rate,
+                "mean_strength": mean_strength,
+                "decisive": self.decisive,
+            }
+        )
+        histogram = pd.DataFrame(
+            self.histogram, columns=[f"({lo:g}, {hi:g}]" for lo, hi in zip(edges[:-1], edges[1:], strict=True)]
+        )
+        return pd.concat([frame, histogram], axis=1).rename_axis("rule_index")
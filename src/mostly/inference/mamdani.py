@@ -1,11 +1,31 @@
-from typing import Any, Literal
+import copy
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Annotated, Any, Literal, Self
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, FiniteFloat, validate_call
-
+import numpy.typing as npt
+import pandas as pd
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FiniteFloat,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+    validate_call,
+)
+
+from .._tracking import TrackedDict, TrackedList, TrackedModel
+from ..fuzzy_rules.analysis import RuleAnalysis, analyze_rules
 from ..fuzzy_rules.fuzzy_rule import FuzzyRule
+from ..fuzzy_rules.logical_operators import intern_node
+from ..fuzzy_rules.program import RuleProgram
+from ..fuzzy_rules.rule_table import RuleTable
 from ..linguistic_variable import LinguisticVariable
-from ..membership_functions import MembershipFunction
+from ..membership_functions import MembershipFunction, SparseMemberships
+from ._batch import OutputSets, firings
+from ._telemetry import RuleStats
 
 
 class InferenceConfig(BaseModel):
@@ -33,7 +53,7 @@ class InferenceConfig(BaseModel):
     defuzzification: Literal["centroid"] = "centroid"
 
 
-class MamdaniFIS(BaseModel):
+class MamdaniFIS(TrackedModel):
     """A Mamdani Fuzzy Inference System (FIS).
 
     Attributes
@@ -44,29 +64,196 @@ class MamdaniFIS(BaseModel):
     output_variables : dict[str, LinguisticVariable]
         Concepts mapped to their linguistic variables to be used as output variables.
 
-    fuzzy_rules : list[FuzzyRule]
+    fuzzy_rules : list[FuzzyRule], optional
         A list of fuzzy rules defining the inference logic.
 
+    rule_tables : list[RuleTable], optional
+        Full grids of rules over the terms of some input variables, stored as dense arrays of consequent term
+        indices; they fire alongside `fuzzy_rules`.
+
     meta_fields : dict[str, Any], optional
         Additional metadata fields for the FIS.
 
+    rule_program : RuleProgram
+        The rule antecedents compiled into a flat instruction list; rebuilt after any change to the rules or the
+        input variables.
+
+    Methods
+    -------
+    infer(crisp_inputs)
+        Perform fuzzy inference on crisp or fuzzy inputs.
+    infer_batch(inputs, columns, memory_budget)
+        Perform fuzzy inference on arrays or DataFrames of crisp inputs, vectorized over the samples.
+    enable_rule_stats(bins)
+        Accumulate per-rule firing statistics over inferences, exported by `rule_stats`.
+    analyze_rules(crisp)
+        Find the fuzzy rules that never change the output of an inference; `reduce_rules` drops them.
+
     """
 
     input_variables: dict[str, LinguisticVariable]
     output_variables: dict[str, LinguisticVariable]
-    fuzzy_rules: list[FuzzyRule]
+    fuzzy_rules: list[FuzzyRule] = Field(default_factory=list)
+    rule_tables: list[RuleTable] = Field(default_factory=list)
     inference_config: InferenceConfig = Field(default_factory=InferenceConfig)
     meta_fields: dict[str, Any] = Field(default_factory=dict)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Re-validate on assignment, so reassigned rules and variables are tracked for changes
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
+
+    _rule_stats: RuleStats | None = PrivateAttr(default=None)
+
+    @field_validator("input_variables", "output_variables", mode="after")
+    @classmethod
+    def track_variables(cls, variables: dict[str, LinguisticVariable]) -> TrackedDict[str, LinguisticVariable]:
+        """Track in-place changes of the variables so compiled structures are rebuilt."""
+        return TrackedDict(variables)
+
+    @field_validator("fuzzy_rules", mode="after")
+    @classmethod
+    def track_fuzzy_rules(cls, fuzzy_rules: list[FuzzyRule]) -> TrackedList[FuzzyRule]:
+        """Share repeated sub-expressions of the antecedents, and track in-place changes of the rules.
+
+        The antecedents are hash-consed into a DAG: equal leaves and sub-trees across rules become one shared
+        (frozen) node, so large generated rule bases store each distinct sub-expression once. The rules passed in
+        are left untouched; a rule whose antecedent repeats nodes of earlier rules is replaced by a copy that
+        shares them.
+        """
+        table: dict = {}
+        interned = []
+        for rule in fuzzy_rules:
+            antecedent = intern_node(rule.antecedent, table)
+            if antecedent is not rule.antecedent:
+                rule = type(rule)._construct(antecedent, dict(rule.consequences), rule.weight)
+            interned.append(rule)
+        return TrackedList(interned)
+
+    @field_validator("rule_tables", mode="after")
+    @classmethod
+    def track_rule_tables(cls, rule_tables: list[RuleTable]) -> TrackedList[RuleTable]:
+        """Track in-place changes of the rule tables."""
+        return TrackedList(rule_tables)
+
+    @model_validator(mode="after")
+    def validate_rule_tables(self) -> "MamdaniFIS":
+        """Validate that every rule table matches the terms of its input and output variables.
+
+        Raises
+        ------
+        ValueError
+            If a table refers to an unknown variable, an axis does not have one entry per term of its input, or a
+            consequent index is not a term of the output.
+
+        """
+        for table in self.rule_tables:
+            self._check_rule_table(table)
+        return self
+
+    @classmethod
+    def from_rule_table(
+        cls,
+        input_variables: dict[str, LinguisticVariable],
+        output_variables: dict[str, LinguisticVariable],
+        rules: pd.DataFrame | Iterable[Mapping[str, Any]],
+        **fields: Any,
+    ) -> "MamdaniFIS":
+        """Build a FIS from a table of conjunctive rules, with one row per rule and one column per variable.
+
+        The rules are built in bulk by `FuzzyRule.from_records`, which checks every distinct name against the
+        terms of the variables once instead of validating each rule, so generated rule bases with tens of
+        thousands of rules load quickly. For full grids of rules see `RuleTable`.
+
+        Parameters
+        ----------
+        input_variables : dict[str, LinguisticVariable]
+            Concepts mapped to their linguistic variables to be used as input variables.
+        output_variables : dict[str, LinguisticVariable]
+            Concepts mapped to their linguistic variables to be used as output variables.
+        rules : pd.DataFrame | Iterable[Mapping[str, Any]]
+            A DataFrame or records with a column per concept holding the term of each rule, empty where a rule
+            does not use the concept, and an optional "weight" column, where empty cells weigh 1.0; input terms are
+            joined by AND.
+        **fields : Any
+            Further fields of the FIS, e.g. `inference_config`.
+
+        Returns
+        -------
+        MamdaniFIS
+            The inference system.
+
+        Raises
+        ------
+        ValueError
+            If a row has an unknown concept or term, no input or output terms, or a weight that is not finite.
+
+        """
+        records = rules.to_dict("records") if isinstance(rules, pd.DataFrame) else rules
+        fuzzy_rules = FuzzyRule.from_records(
+            records,
+            {concept: lv.fuzzy_sets for concept, lv in input_variables.items()},
+            {concept: lv.fuzzy_sets for concept, lv in output_variables.items()},
+        )
+        return cls(
+            input_variables=input_variables, output_variables=output_variables, fuzzy_rules=fuzzy_rules, **fields
+        )
 
-    def _fuzzification(self, crisp_inputs: dict[str, FiniteFloat]) -> dict[str, dict[str, FiniteFloat]]:
+    def _check_rule_table(self, table: RuleTable) -> None:
+        for concept in table.inputs:
+            if concept not in self.input_variables:
+                raise ValueError(
+                    f"Rule table input '{concept}' not defined in FIS. "
+                    f"Valid concepts are: {list(self.input_variables.keys())}."
+                )
+        if table.output not in self.output_variables:
+            raise ValueError(
+                f"Rule table output '{table.output}' not defined in FIS. "
+                f"Valid concepts are: {list(self.output_variables.keys())}."
+            )
+        shape = tuple(len(self.input_variables[concept].fuzzy_sets) for concept in table.inputs)
+        if table.shape != shape:
+            raise ValueError(
+                f"Rule table over {table.inputs} must have shape {shape}, one cell per term, got {table.shape}."
+            )
+        n_terms = len(self.output_variables[table.output].fuzzy_sets)
+        if table.consequents.size and table.consequents.max() >= n_terms:
+            raise ValueError(
+                f"Rule table consequents must index the {n_terms} terms of '{table.output}', "
+                f"got {table.consequents.max()}."
+            )
+
+    def _check_rule_tables(self) -> None:
+        """Re-check every rule table, as variables and tables may have changed in place since validation.
+
+        The outcome is cached, so the tables are only checked again after a change.
+        """
+
+        def check() -> bool:
+            for table in self.rule_tables:
+                self._check_rule_table(table)
+            return True
+
+        self._derived_value("rule_tables_checked", check)
+
+    @property
+    def rule_program(self) -> RuleProgram:
+        """Rule antecedents compiled into a flat instruction list over a dense membership vector."""
+        return self._derived_value(
+            "rule_program",
+            lambda: RuleProgram(
+                self.fuzzy_rules, {concept: tuple(lv.fuzzy_sets) for concept, lv in self.input_variables.items()}
+            ),
+        )
+
+    def _fuzzification(
+        self, crisp_inputs: dict[str, FiniteFloat | MembershipFunction]
+    ) -> dict[str, dict[str, FiniteFloat]]:
         """Fuzzify crisp inputs based on the linguistic variables membership functions.
 
         Parameters
         ----------
-        crisp_inputs : dict[str, FiniteFloat]
-            A dictionary mapping input concept names to their crisp values, e.g. {'temperature': 25.0}.
+        crisp_inputs : dict[str, FiniteFloat | MembershipFunction]
+            A dictionary mapping input concept names to their crisp values, e.g. {'temperature': 25.0}, or to
+            fuzzy inputs, e.g. {'temperature': MFGaussian(mean=25.0, sigma=0.5)}, fuzzified by sup-min.
 
         Returns
         -------
@@ -83,37 +270,133 @@ class MamdaniFIS(BaseModel):
                     f"Valid concepts are: {list(self.input_variables.keys())}."
                 )
             lv = self.input_variables[concept]
-            fuzzified[concept] = lv.fuzzify(value)
+            if isinstance(value, MembershipFunction):
+                fuzzified[concept] = lv.fuzzify_nonsingleton(value)
+            else:
+                fuzzified[concept] = lv.fuzzify(value)
         return fuzzified
 
-    def _rule_evaluation(self, fuzzified: dict[str, dict[str, FiniteFloat]]) -> list[tuple[FuzzyRule, FiniteFloat]]:
+    def _rule_evaluation(
+        self, fuzzified: dict[str, dict[str, FiniteFloat]], record: bool = False
+    ) -> list[tuple[FuzzyRule, FiniteFloat]]:
         """Calculate the strength of each rule based on the fuzzified inputs.
 
+        The rules are evaluated through the compiled `rule_program`, with the same results as `FuzzyRule.eval`.
+        Only rules whose required terms all have a non-zero degree are evaluated, found through its inverted index;
+        all other rules have strength zero. With `record`, the strengths are added to the rule statistics, if
+        enabled.
+
         Returns
         -------
         list[tuple[FuzzyRule, FiniteFloat]]
             A list of tuples containing each rule and its corresponding firing strength.
 
         """
-        strengths = []
-        for rule in self.fuzzy_rules:
-            strength: FiniteFloat = rule.eval(fuzzified)
-            strengths.append((rule, strength))
-        return strengths
+        program = self.rule_program
+        evaluated = program.evaluate_sparse(program.load(fuzzified))
+        stats = self._bound_rule_stats() if record else None
+        if stats is not None:
+            stats.record(evaluated)
+        strengths = [0.0] * len(self.fuzzy_rules)
+        for r, strength in evaluated.items():
+            strengths[r] = strength
+        return list(zip(self.fuzzy_rules, strengths, strict=True))
+
+    def _bound_rule_stats(self) -> RuleStats | None:
+        """Return the rule statistics bound to the current rules, or None if they are disabled."""
+        stats = self.__pydantic_private__["_rule_stats"]
+        if stats is not None:
+            program = self.rule_program
+            if stats.source is not program:
+                stats.bind(self.fuzzy_rules, program)
+        return stats
+
+    def _table_evaluation(
+        self, fuzzified: dict[str, dict[str, FiniteFloat]], aggregation: Literal["max", "sum", "probor"] = "max"
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Fire the rule tables based on the fuzzified inputs.
+
+        Under max aggregation the firings of each table are reduced to the strongest one per output term, which
+        aggregates to the same output; otherwise every firing cell is kept.
+
+        Returns
+        -------
+        dict[str, tuple[np.ndarray, np.ndarray]]
+            Output concepts mapped to the consequent term indices and the strengths of their firing table rules.
+
+        """
+        self._check_rule_tables()
+        firings: dict[str, list[tuple[np.ndarray, np.ndarray]]] = {}
+        for table in self.rule_tables:
+            degrees = []
+            for concept in table.inputs:
+                terms, values = fuzzified.get(concept, {}), self.input_variables[concept].fuzzy_sets
+                degrees.append(np.fromiter((terms.get(term, 0.0) for term in values), np.float64, len(values)))
+            if aggregation == "max":
+                strengths = table.term_strengths(degrees, len(self.output_variables[table.output].fuzzy_sets))
+                fired = np.flatnonzero(strengths)
+                firings.setdefault(table.output, []).append((fired, strengths[fired]))
+            else:
+                firings.setdefault(table.output, []).append(table.fire(degrees))
+        return {
+            concept: (np.concatenate([t for t, _ in parts]), np.concatenate([s for _, s in parts]))
+            for concept, parts in firings.items()
+        }
+
+    def rule_strengths_batch(self, memberships: dict[str, npt.ArrayLike | SparseMemberships]) -> np.ndarray:
+        """Calculate the weighted firing strength of every rule for a batch of fuzzified samples.
+
+        The compiled `rule_program` runs once over the whole batch: each And/Or/Not node is a single
+        `np.minimum`/`np.maximum`/`1 - x` over columns of samples instead of one tree walk per sample.
+
+        Parameters
+        ----------
+        memberships : dict[str, ArrayLike | SparseMemberships]
+            Input concepts mapped to their `(n_samples, n_terms)` membership matrices, e.g. from
+            `LinguisticVariable.fuzzify_batch`, with the columns in term order. Missing concepts have zero degrees.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `(n_samples, n_rules)`, with the columns in the order of `fuzzy_rules`.
+
+        Raises
+        ------
+        ValueError
+            If a concept is not an input variable, or the matrices do not match the terms or each other in shape.
+
+        """
+        program = self.rule_program
+        dense = {
+            concept: matrix.toarray() if isinstance(matrix, SparseMemberships) else matrix
+            for concept, matrix in memberships.items()
+        }
+        return program.evaluate_batch(program.load_batch(dense))
+
+    def _output_sets(self, resolution: int) -> dict[str, OutputSets]:
+        """Output concepts mapped to their terms sampled over `resolution` grid points.
+
+        The `(n_terms, resolution)` tables are sampled once and reused by every inference until the output
+        variables, the resolution, or anything else, change.
+        """
+        return self._derived_value(
+            "output_sets",
+            lambda: {concept: OutputSets(lv, resolution) for concept, lv in self.output_variables.items()},
+            resolution,
+        )
 
     def _implication(
         self,
-        mf: MembershipFunction,
+        curve: np.ndarray,
         strength: FiniteFloat,
-        x_vals: np.ndarray,
         implication: Literal["clip", "scale"] = "clip",
     ) -> np.ndarray:
-        """Apply the implication method to modify the membership function."""
+        """Apply the implication method to the sampled membership curve of an output term."""
         match implication:
             case "clip":
-                return np.array([min(mf(x), strength) for x in x_vals])
+                return np.minimum(curve, strength)
             case "scale":
-                return np.array([mf(x) * strength for x in x_vals])
+                return curve * strength
             case _:
                 raise ValueError(f"Unknown implication method: {implication}")
 
@@ -123,9 +406,14 @@ class MamdaniFIS(BaseModel):
         resolution: int = 500,
         aggregation: Literal["max", "sum", "probor"] = "max",
         implication: Literal["clip", "scale"] = "clip",
+        table_firings: dict[str, tuple[np.ndarray, np.ndarray]] | None = None,
     ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
         """Aggregate the outputs of the rules based on the specified method.
 
+        The firings of the rule tables, as returned by `_table_evaluation`, are aggregated after the rules. The
+        implied sets are rows of the cached membership tables of `_output_sets`, clipped or scaled. The consequence
+        terms of all rules are checked through `_consequent_terms`, whether they fire or not.
+
         Returns
         -------
         dict[str, tuple[np.ndarray, np.ndarray]]
@@ -134,23 +422,29 @@ class MamdaniFIS(BaseModel):
 
         """
         output_aggregation = {}
+        # Raises for rules concluding unknown terms
+        self._consequent_terms()
 
-        for concept, lv in self.output_variables.items():
-            x_min, x_max = lv.uod
-            x_vals = np.linspace(x_min, x_max, resolution)
+        for concept, output_sets in self._output_sets(resolution).items():
+            x_vals, memberships = output_sets.grid, output_sets.memberships
             agg_vals = np.zeros_like(x_vals)
 
+            firings = []
             for rule, strength in consequences:
-                if concept not in rule.consequences:
+                # Rules that do not fire add nothing under any aggregation
+                if strength == 0.0 or concept not in rule.consequences:
                     continue
+                firings.append((output_sets.index[rule.consequences[concept]], strength))
+            if table_firings and concept in table_firings:
+                firings.extend(zip(*table_firings[concept], strict=True))
 
-                mf: MembershipFunction = lv.get_fuzzy_set(rule.consequences[concept])
-                clipped_vals = self._implication(mf, strength, x_vals, implication)
+            for t, strength in firings:
+                clipped_vals = self._implication(memberships[t], strength, implication)
 
                 # Apply the aggregation method using match-case
                 match aggregation:
                     case "max":
-                        agg_vals = np.maximum(agg_vals, clipped_vals)
+                        np.maximum(agg_vals, clipped_vals, out=agg_vals)
                     case "sum":
                         agg_vals += clipped_vals
                     case "probor":
@@ -194,17 +488,131 @@ class MamdaniFIS(BaseModel):
 
         return defuzzified
 
+    @validate_call
+    def similarity(
+        self, measure: Literal["jaccard", "overlap"] = "jaccard", resolution: Annotated[int, Field(ge=2)] = 1001
+    ) -> dict[str, pd.DataFrame]:
+        """Compute the pairwise similarity of the fuzzy sets of every input and output variable.
+
+        Fuzzy sets of different variables live on different universes of discourse, so there is one matrix per
+        variable; see `LinguisticVariable.similarity`. Near-duplicate terms are candidates for merging.
+
+        Parameters
+        ----------
+        measure : Literal["jaccard", "overlap"], Default: "jaccard"
+            The similarity measure.
+        resolution : int, Default: 1001
+            Number of grid points for pairs of fuzzy sets without a closed form.
+
+        Returns
+        -------
+        dict[str, pd.DataFrame]
+            Concepts of the input variables, then of the output variables, mapped to their similarity matrices.
+
+        """
+        variables = {**self.input_variables, **self.output_variables}
+        return {concept: lv.similarity(measure, resolution) for concept, lv in variables.items()}
+
+    @validate_call
+    def enable_rule_stats(self, bins: Annotated[int, Field(gt=0)] = 10) -> None:
+        """Accumulate per-rule firing statistics over the following calls of `infer` and `infer_batch`.
+
+        Each inference adds to preallocated counter arrays: how often each fuzzy rule fires, the distribution of
+        its firing strengths, and how often it is the strongest rule of an output concept, which sets the height
+        of the max aggregate. Rarely firing or never decisive rules are candidates for pruning. Rule tables are
+        not counted. The counters restart when rules are replaced, added, removed or reordered; enabling again
+        resets them.
+
+        Parameters
+        ----------
+        bins : int, Default: 10
+            Number of equal-width bins of the firing strengths over (0, 1].
+
+        """
+        self._rule_stats = RuleStats(bins)
+
+    def disable_rule_stats(self) -> None:
+        """Stop collecting rule statistics and drop them."""
+        self._rule_stats = None
+
+    def rule_stats(self) -> pd.DataFrame | None:
+        """Return the rule statistics collected since `enable_rule_stats`, or None if they are disabled.
+
+        Returns
+        -------
+        pd.DataFrame | None
+            One row per fuzzy rule, indexed by its position, with the rule text, the number of inferences it
+            fired in (`fired`) and their share (`fire_rate`), its mean positive strength (`mean_strength`, NaN if
+            it never fired), how often it was decisive (`decisive`), and one count column per strength bin.
+
+        """
+        stats = self._bound_rule_stats()
+        return None if stats is None else stats.to_frame()
+
+    def __copy__(self) -> Self:
+        """Shallow copy with its own copy of the rule statistics, as in deep copies and pickles."""
+        copied = super().__copy__()
+        copied._rule_stats = copy.copy(self._rule_stats)
+        return copied
+
+    @validate_call
+    def analyze_rules(self, crisp: bool = True) -> RuleAnalysis:
+        """Find the fuzzy rules that never change the output of an inference.
+
+        Flags rules with zero weight, rules whose antecedent can never fire given the supports of the input terms,
+        duplicate rules, and rules subsumed by a rule with the same consequences, a weaker antecedent and at least
+        the same weight; see `mostly.fuzzy_rules.analysis`. Rule tables are not analyzed.
+
+        Parameters
+        ----------
+        crisp : bool, Default: True
+            Whether the FIS is only inferred with crisp inputs. Conjunctions of conditions on one variable whose
+            supports do not overlap never fire for crisp inputs, but may for membership-function inputs, so pass
+            False if `infer` is given membership functions.
+
+        Returns
+        -------
+        RuleAnalysis
+            The findings, as indices into `fuzzy_rules`, and the rules kept by `reduce_rules`.
+
+        """
+        return analyze_rules(self.fuzzy_rules, self.input_variables, self.inference_config.aggregation, crisp)
+
+    def reduce_rules(self, crisp: bool = True) -> "MamdaniFIS":
+        """Return an equivalent FIS without the fuzzy rules that never change the output of an inference.
+
+        Zero-weight and never-firing rules are dropped; duplicate and subsumed rules only under max aggregation.
+        The new FIS shares its variables and remaining rules with this one. By default it is equivalent for crisp
+        inputs only; see `analyze_rules`.
+
+        Parameters
+        ----------
+        crisp : bool, Default: True
+            Whether the FIS is only inferred with crisp inputs, or also with membership functions.
+
+        Returns
+        -------
+        MamdaniFIS
+            The FIS with the rules kept by `analyze_rules`, in their original order.
+
+        """
+        kept = self.analyze_rules(crisp).kept
+        return type(self)(**{**dict(self), "fuzzy_rules": [self.fuzzy_rules[i] for i in kept]})
+
     @validate_call
     def infer(
         self,
-        crisp_inputs: dict[str, float],
+        crisp_inputs: dict[str, float | MembershipFunction],
     ) -> dict[str, float]:
         """Perform fuzzy inference on the given inputs.
 
         Parameters
         ----------
-        crisp_inputs : dict[str, float]
+        crisp_inputs : dict[str, float | MembershipFunction]
             A dictionary mapping input concept names to their crisp values, e.g. {'temperature': 25.0}.
+            Noisy inputs may be given as fuzzy sets around the measurement instead, e.g.
+            {'temperature': MFGaussian(mean=25.0, sigma=0.5)}; their degree of membership to each term is the
+            sup-min of the input and the term (non-singleton fuzzification).
         resolution: int
             The number of points to use for output aggregation.
         aggregation: Literal["max", "sum", "probor"]
@@ -221,11 +629,185 @@ class MamdaniFIS(BaseModel):
 
         """
         fuzzified_inputs = self._fuzzification(crisp_inputs)
-        rule_strengths = self._rule_evaluation(fuzzified_inputs)
+        rule_strengths = self._rule_evaluation(fuzzified_inputs, record=True)
+        table_firings = self._table_evaluation(fuzzified_inputs, self.inference_config.aggregation)
         aggregated_outputs = self._aggregation(
             rule_strengths,
             self.inference_config.resolution,
             self.inference_config.aggregation,
             self.inference_config.implication,
+            table_firings,
         )
         return self._defuzzification(aggregated_outputs, self.inference_config.defuzzification)
+
+    def _batch_inputs(
+        self,
+        inputs: Mapping[str, npt.ArrayLike] | npt.ArrayLike | pd.DataFrame,
+        columns: Sequence[str] | Mapping[str, int] | None,
+    ) -> dict[str, np.ndarray]:
+        """Split the inputs of `infer_batch` into one array of values per input concept."""
+        if isinstance(inputs, pd.DataFrame):
+            if columns is not None:
+                raise ValueError("Columns are only given for 2-D arrays; DataFrame columns are named by concept.")
+            samples = {str(concept): inputs[concept].to_numpy(dtype=float) for concept in inputs.columns}
+        elif isinstance(inputs, Mapping):
+            if columns is not None:
+                raise ValueError("Columns are only given for 2-D arrays; the keys of a mapping name the concepts.")
+            samples = {concept: np.asarray(values, dtype=float) for concept, values in inputs.items()}
+        else:
+            matrix = np.asarray(inputs, dtype=float)
+            if matrix.ndim != 2:
+                raise ValueError(f"Array inputs must be two-dimensional, got shape {matrix.shape}.")
+            if columns is None:
+                raise ValueError("The input concepts of the columns of a 2-D array must be given as `columns`.")
+            if not isinstance(columns, Mapping):
+                if len(columns) != matrix.shape[1]:
+                    raise ValueError(
+                        f"Expected one concept per column ({matrix.shape[1]}), got {len(columns)} columns."
+                    )
+                columns = {concept: column for column, concept in enumerate(columns)}
+            samples = {concept: matrix[:, column] for concept, column in columns.items()}
+
+        if not samples:
+            raise ValueError("At least one input concept is required to determine the number of samples.")
+        for concept in samples:
+            if concept not in self.input_variables:
+                raise ValueError(
+                    f"Input variable '{concept}' not defined in FIS. "
+                    f"Valid concepts are: {list(self.input_variables.keys())}."
+                )
+        if len({values.shape for values in samples.values()}) > 1 or next(iter(samples.values())).ndim != 1:
+            raise ValueError(
+                f"Inputs must be one-dimensional with the same number of samples, got shapes "
+                f"{ {concept: values.shape for concept, values in samples.items()} }."
+            )
+        return samples
+
+    def _consequent_terms(self) -> dict[str, np.ndarray]:
+        """Output concepts mapped to the term index each fuzzy rule concludes, -1 for rules not concluding them.
+
+        Built once per change of the rules or variables, this also checks the consequence terms of every rule for
+        `infer` and `infer_batch` alike.
+        """
+
+        def build() -> dict[str, np.ndarray]:
+            consequents = {}
+            for concept, lv in self.output_variables.items():
+                indices = {term: t for t, term in enumerate(lv.fuzzy_sets)}
+                terms = np.full(len(self.fuzzy_rules), -1, dtype=np.intp)
+                for r, rule in enumerate(self.fuzzy_rules):
+                    term = rule.consequences.get(concept)
+                    if term is None:
+                        continue
+                    if term not in indices:
+                        raise ValueError(f"Rule {r} concludes the unknown term '{term}' of '{concept}'.")
+                    terms[r] = indices[term]
+                consequents[concept] = terms
+            return consequents
+
+        return self._derived_value("batch_consequents", build)
+
+    def infer_batch(
+        self,
+        inputs: Mapping[str, npt.ArrayLike] | npt.ArrayLike | pd.DataFrame,
+        columns: Sequence[str] | Mapping[str, int] | None = None,
+        memory_budget: int = 1 << 28,
+    ) -> dict[str, np.ndarray]:
+        """Perform fuzzy inference on a batch of crisp inputs.
+
+        Every step runs once per chunk of samples instead of once per sample: fuzzification through
+        `LinguisticVariable.fuzzify_batch`, the rules through `rule_strengths_batch`, the rule tables as outer
+        minima (or products) across the batch, and implication, aggregation and defuzzification as array
+        operations over `(n_samples, resolution)` output sets. The results equal those of `infer` sample by
+        sample, up to rounding. Samples are processed in chunks sized so the intermediate arrays stay within
+        `memory_budget`; rule statistics, if enabled, are recorded for every sample.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, ArrayLike] | ArrayLike | pd.DataFrame
+            Input concepts mapped to one-dimensional arrays of crisp values, a DataFrame with one column per input
+            concept, or a two-dimensional array of shape `(n_samples, n_columns)` whose columns are named by
+            `columns`. Input concepts left out have zero degrees, as in `infer`.
+        columns : Sequence[str] | Mapping[str, int], optional
+            For a two-dimensional array only: the input concept of each column, in order, or input concepts
+            mapped to their column index.
+        memory_budget : int, Default: 2**28
+            Approximate upper bound, in bytes, on the memory of the intermediate arrays of a chunk, including the
+            registers of the rule program and the output sets aggregated over the grid.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Output concepts mapped to arrays of their crisp values, one per sample, e.g.
+            {'fan_speed': array([22.5, 31.0])}.
+
+        Raises
+        ------
+        ValueError
+            If a concept is not an input variable, the inputs are not one-dimensional with the same number of
+            samples, a value is outside the UOD of its variable or not finite, or `memory_budget` is not positive.
+
+        """
+        if memory_budget <= 0:
+            raise ValueError(f"The memory budget must be a positive number of bytes, got {memory_budget}.")
+        samples = self._batch_inputs(inputs, columns)
+        n_samples = next(iter(samples.values())).shape[0]
+        config = self.inference_config
+
+        output_sets = self._output_sets(config.resolution)
+        consequents = self._consequent_terms()
+        self._check_rule_tables()
+        stats = self._bound_rule_stats()
+
+        # Bytes per sample of the membership matrices, the registers of the rule program, the strengths and their
+        # non-zero entries, and the aggregated, implied and scratch output sets over the grid
+        program = self.rule_program
+        per_sample = 8 * (
+            sum(len(lv.fuzzy_sets) for lv in self.input_variables.values())
+            + program.size
+            + len(program.instructions)
+            + 2 * len(self.fuzzy_rules)
+            + 2 * sum(table.consequents.size for table in self.rule_tables)
+            + sum(len(lv.fuzzy_sets) for lv in self.output_variables.values())
+            + 3 * config.resolution
+        )
+        chunk = max(1, memory_budget // per_sample)
+
+        outputs = {concept: np.zeros(n_samples) for concept in self.output_variables}
+        for start in range(0, n_samples, chunk):
+            n_chunk = min(chunk, n_samples - start)
+            degrees = {
+                concept: self.input_variables[concept].fuzzify_batch(values[start : start + n_chunk])
+                for concept, values in samples.items()
+            }
+            # Every firing as (sample, term, strength) per output concept, from the rules and then the tables
+            parts: dict[str, list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = {c: [] for c in self.output_variables}
+            strengths = self.rule_strengths_batch(degrees)
+            if stats is not None:
+                stats.record_batch(strengths)
+            rows, rules, values = firings(strengths)
+            for concept, terms in consequents.items():
+                fired = terms[rules]
+                concluding = fired >= 0
+                parts[concept].append((rows[concluding], fired[concluding], values[concluding]))
+            for table in self.rule_tables:
+                matrices = [
+                    degrees[concept]
+                    if concept in degrees
+                    else np.zeros((n_chunk, len(self.input_variables[concept].fuzzy_sets)))
+                    for concept in table.inputs
+                ]
+                parts[table.output].append(table.fire_batch(matrices))
+
+            for concept, concept_parts in parts.items():
+                match config.defuzzification:
+                    case "centroid":
+                        outputs[concept][start : start + n_chunk] = output_sets[concept].centroids(
+                            n_chunk,
+                            tuple(np.concatenate(arrays) for arrays in zip(*concept_parts, strict=True)),
+                            config.aggregation,
+                            config.implication,
+                        )
+                    case _:
+                        raise ValueError(f"Unknown defuzzification method: {config.defuzzification}")
+        return outputs
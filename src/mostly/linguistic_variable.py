@@ -1,9 +1,28 @@
-from typing import Annotated
+from typing import Annotated, Literal, Self
 
 import numpy as np
-from pydantic import AfterValidator, BaseModel, FiniteFloat, StringConstraints, model_validator, validate_call
-
-from .membership_functions import MembershipFunction
+import numpy.typing as npt
+import pandas as pd
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    Field,
+    FiniteFloat,
+    PositiveFloat,
+    PrivateAttr,
+    StringConstraints,
+    field_validator,
+    model_validator,
+    validate_call,
+)
+
+from ._cache import CacheInfo, FuzzifyCache
+from ._tracking import TrackedDict, TrackedModel
+from .membership_functions import IntervalIndex, MembershipFunction, MFTabulated, SparseMemberships, TermBank
+from .membership_functions._nonsingleton import sup_min_matrix
+from .membership_functions._shapes import uncovered_intervals
+from .membership_functions._similarity import similarity_matrix
+from .membership_functions.base import Epsilon, Interval
 
 SnakedStr = Annotated[
     str,
@@ -12,7 +31,7 @@ SnakedStr = Annotated[
 ]
 
 
-class LinguisticVariable(BaseModel):
+class LinguisticVariable(TrackedModel):
     """A concept (e.g. 'temperature') described by fuzzy terms (e.g. 'hot', 'cold').
 
     Attributes
@@ -24,20 +43,46 @@ class LinguisticVariable(BaseModel):
         The range of accepted values, known as *Universe of Discourse (UOD)*, e.g. (0.0, 100.0).
     fuzzy_sets : dict[Term, MembershipFunction]
         A mapping of *terms* (e.g. 'hot', 'cold') to their corresponding *membership functions* - *Fuzzy Set*.
+    term_bank : TermBank
+        Struct-of-arrays view of the fuzzy sets evaluating every term in one pass; rebuilt after any change.
 
     Methods
     -------
     fuzzify(x)
         Fuzzify a *crisp finite float* into *degrees of membership* to each *term*.
+    enable_fuzzify_cache(maxsize, quantum)
+        Memoize `fuzzify` in a bounded LRU cache, for inputs that repeat (e.g. from quantized sensors).
+    fuzzify_sparse(x, epsilon)
+        Fuzzify a *crisp finite float* into the non-zero *degrees of membership*, evaluating only the active *terms*.
+    fuzzify_nonsingleton(x, resolution)
+        Fuzzify a *fuzzy input* (e.g. a noisy measurement) into its sup-min *degrees of membership* to each *term*.
+    fuzzify_batch(x, sparse, noise, resolution)
+        Fuzzify an array of *crisp values*, or of noisy measurements, into a matrix of *degrees of membership*,
+        one column per *term*.
     get_fuzzy_set(term)
         Retrieve the *membership function* corresponding to a given *term*.
+    tabulated(size, terms)
+        Copy the variable with (some of) its *membership functions* replaced by lookup tables over the UOD.
+    similarity(measure, resolution)
+        Pairwise similarity of the *fuzzy sets* within the UOD, e.g. to find near-duplicate *terms*.
 
     """
 
+    # Re-validate on assignment, so reassigned fuzzy sets are checked for coverage and tracked for changes
+    model_config = ConfigDict(validate_assignment=True)
+
     concept: SnakedStr
     uod: tuple[FiniteFloat, FiniteFloat]
     fuzzy_sets: dict[SnakedStr, MembershipFunction]
 
+    _fuzzify_cache: FuzzifyCache | None = PrivateAttr(default=None)
+
+    @field_validator("fuzzy_sets", mode="after")
+    @classmethod
+    def track_fuzzy_sets(cls, fuzzy_sets: dict[str, MembershipFunction]) -> TrackedDict[str, MembershipFunction]:
+        """Track in-place changes of the fuzzy sets so derived structures are rebuilt."""
+        return TrackedDict(fuzzy_sets)
+
     @model_validator(mode="after")
     def validate_uod_bounds(self) -> "LinguisticVariable":
         """Validate that UOD bounds are properly ordered.
@@ -63,54 +108,30 @@ class LinguisticVariable(BaseModel):
         1. No membership function returns NaN (critical - breaks inference)
         2. Every point in the UOD has non-zero membership to at least one term (prevents gaps)
 
+        Closed-form shapes are checked by interval arithmetic on the open intervals where they are positive,
+        so uncovered ranges are reported with their exact bounds. Only shapes without a closed form are sampled,
+        in one vectorized pass over the UOD, which also checks them for NaN.
+
         Raises
         ------
         ValueError
             If any membership function returns NaN, or if any point in the UOD has zero membership to all terms.
 
         """
-        # Sample UOD with adaptive resolution: scale with UOD distance, bounded [50, 1000]
-        # This ensures consistent coverage detection across different UOD scales
-        uod_distance = self.uod[1] - self.uod[0]
-        num_samples = max(50, min(int(np.ceil(uod_distance)) + 1, 1000))
-        sample_points = np.linspace(self.uod[0], self.uod[1], num=num_samples)
-        uncovered_points = []
-
-        for x in sample_points:
-            memberships = []
-            for term, fs in self.fuzzy_sets.items():
-                membership_value = fs(float(x))
-
-                # Priority 1: Check for NaN (critical failure)
-                if np.isnan(membership_value):
-                    raise ValueError(
-                        f"Membership function for term '{term}' in linguistic variable '{self.concept}' "
-                        f"returns NaN at x={x}. This indicates a broken membership function that will "
-                        f"corrupt inference calculations."
-                    )
-
-                memberships.append(membership_value)
-
-            # Priority 2: Check for coverage gaps
-            if max(memberships) == 0.0:
-                uncovered_points.append(x)
-
-        # Report uncovered ranges if any exist
-        if uncovered_points:
-            # Group consecutive points into ranges for clearer error message
-            ranges = []
-            start = uncovered_points[0]
-            prev = uncovered_points[0]
-
-            for point in uncovered_points[1:]:
-                if not np.isclose(point - prev, sample_points[1] - sample_points[0], rtol=1e-9):
-                    # Gap detected, close current range
-                    ranges.append((start, prev))
-                    start = point
-                prev = point
-            ranges.append((start, prev))
-
-            range_strs = [f"[{r[0]:.2f}, {r[1]:.2f}]" for r in ranges]
+        positive, sampled = [], []
+        for term, mf in self.fuzzy_sets.items():
+            intervals = mf._positive_set()
+            if intervals is None:
+                sampled.append(term)
+            else:
+                positive.extend(intervals)
+        uncovered = uncovered_intervals(positive, self.uod)
+
+        if sampled:
+            uncovered = self._sample_coverage(uncovered, sampled)
+
+        if uncovered:
+            range_strs = [f"[{lo:.2f}, {hi:.2f}]" for lo, hi in uncovered]
             raise ValueError(
                 f"Incomplete coverage in linguistic variable '{self.concept}': "
                 f"the following ranges in the UOD have zero membership to all terms: {', '.join(range_strs)}. "
@@ -120,6 +141,46 @@ class LinguisticVariable(BaseModel):
 
         return self
 
+    def _sample_coverage(self, ranges: list[Interval], terms: list[str]) -> list[Interval]:
+        """Check the membership functions of `terms` for NaN and narrow down the uncovered `ranges` with them.
+
+        The UOD is sampled with adaptive resolution: scaled with its width, bounded to [50, 1000] points, plus
+        the ends of the `ranges`. Runs of samples within a range without membership to any of `terms` remain
+        uncovered.
+        """
+        uod_distance = self.uod[1] - self.uod[0]
+        num_samples = max(50, min(int(np.ceil(uod_distance)) + 1, 1000))
+        sample_points = np.unique(np.concatenate([np.linspace(self.uod[0], self.uod[1], num=num_samples), *ranges]))
+        memberships = np.stack([self.fuzzy_sets[term].evaluate(sample_points) for term in terms], axis=1)
+
+        # Priority 1: Check for NaN (critical failure)
+        nan_mask = np.isnan(memberships)
+        if nan_mask.any():
+            point, column = np.argwhere(nan_mask)[0]
+            self._raise_nan(terms[column], sample_points[point])
+
+        # Priority 2: Group consecutive uncovered samples within each range
+        uncovered = []
+        zero = memberships.max(axis=1) == 0.0
+        for lo, hi in ranges:
+            inside = (lo <= sample_points) & (sample_points <= hi)
+            points, range_zero = sample_points[inside], zero[inside]
+            edges = np.flatnonzero(np.diff(np.concatenate([[0], range_zero.astype(int), [0]])))
+            uncovered.extend((points[i], points[j - 1]) for i, j in zip(edges[::2], edges[1::2], strict=True))
+        return uncovered
+
+    def _raise_nan(self, term: str, x: float) -> None:
+        """Raise the error for a membership function returning NaN at `x`."""
+        raise ValueError(
+            f"Membership function for term '{term}' in linguistic variable '{self.concept}' returns NaN at x={x}. "
+            f"This indicates a broken membership function that will corrupt inference calculations."
+        )
+
+    @property
+    def term_bank(self) -> TermBank:
+        """Struct-of-arrays view of the fuzzy sets, rebuilt after any change to the variable or its terms."""
+        return self._derived_value("term_bank", lambda: TermBank(self.fuzzy_sets))
+
     @validate_call
     def fuzzify(self, x: FiniteFloat) -> dict[SnakedStr, FiniteFloat]:
         """Fuzzify a given input value into a dictionary of *terms* and their *degree of membership*.
@@ -148,7 +209,231 @@ class LinguisticVariable(BaseModel):
                 f"for linguistic variable '{self.concept}'."
             )
 
-        return {term: fs(x) for term, fs in self.fuzzy_sets.items()}
+        cache = self.__pydantic_private__["_fuzzify_cache"]
+        if cache is not None:
+            return dict(cache.lookup(x, self._evaluate_terms, self._terms_state))
+        return self._evaluate_terms(x)
+
+    def _terms_state(self) -> tuple[object, ...]:
+        """Return a snapshot of the UOD and the parameters of every term, which `fuzzify` depends on."""
+        return self.uod, tuple((term, type(fs), fs.model_dump()) for term, fs in self.fuzzy_sets.items())
+
+    def _evaluate_terms(self, x: float) -> dict[str, float]:
+        """Evaluate every term at `x`, clamped into the UOD (quantized inputs may fall just outside)."""
+        x = min(max(x, self.uod[0]), self.uod[1])
+        return {term: fs.trusted(x) for term, fs in self.fuzzy_sets.items()}
+
+    @validate_call
+    def enable_fuzzify_cache(
+        self, maxsize: Annotated[int, Field(gt=0)] = 1024, quantum: PositiveFloat | None = None
+    ) -> None:
+        """Memoize `fuzzify` in a bounded least-recently-used cache.
+
+        Worthwhile when the same inputs repeat, e.g. readings of quantized sensors. The cache empties itself
+        after any change to the variable or its membership functions, so it never returns outdated degrees, and
+        keeps its entries through changes to other models.
+        Enabling it again replaces the cache, resetting its statistics.
+
+        Parameters
+        ----------
+        maxsize : int, Default: 1024
+            Number of inputs to remember; the least recently used entry is evicted beyond it.
+        quantum : float, optional
+            Snap inputs to the nearest multiple of `quantum` (clamped into the UOD) before fuzzifying, so all
+            inputs within half a `quantum` share one entry. Inputs are cached exactly if None.
+
+        """
+        self._fuzzify_cache = FuzzifyCache(maxsize, quantum)
+
+    def disable_fuzzify_cache(self) -> None:
+        """Stop memoizing `fuzzify` and drop the cache."""
+        self._fuzzify_cache = None
+
+    def fuzzify_cache_info(self) -> CacheInfo | None:
+        """Return the hit, miss and invalidation counts of the `fuzzify` cache, or None if it is disabled."""
+        cache = self._fuzzify_cache
+        return None if cache is None else cache.info()
+
+    def __copy__(self) -> Self:
+        """Shallow copy with its own, empty `fuzzify` cache."""
+        copied = super().__copy__()
+        if self._fuzzify_cache is not None:
+            copied._fuzzify_cache = self._fuzzify_cache.empty_copy()
+        return copied
+
+    @validate_call
+    def fuzzify_sparse(self, x: FiniteFloat, epsilon: Epsilon = 0.0) -> dict[SnakedStr, FiniteFloat]:
+        """Fuzzify a given input value into the *terms* with a *degree of membership* above `epsilon`.
+
+        Only the terms active at `x` are evaluated, found by binary search in an interval index over the term
+        supports. The index is built once per `epsilon` and rebuilt automatically after any change to the
+        variable or its terms.
+
+        Parameters
+        ----------
+        x : FiniteFloat
+            The input value to be fuzzified. Must be within the UOD bounds.
+        epsilon : float, Default: 0.0
+            Degrees up to `epsilon` are left out, cutting Gaussian-shaped tails off where they fall to `epsilon`.
+
+        Returns
+        -------
+        dict[Term, FiniteFloat]
+            The terms with a degree above `epsilon` and their degrees, in term order, e.g. `{'cold': 0.8}`.
+            Left-out terms have a degree of at most `epsilon`.
+
+        Raises
+        ------
+        ValueError
+            If the input value is outside the UOD bounds.
+
+        """
+        if not (self.uod[0] <= x <= self.uod[1]):
+            raise ValueError(
+                f"Input value {x} is outside the UOD bounds [{self.uod[0]}, {self.uod[1]}] "
+                f"for linguistic variable '{self.concept}'."
+            )
+        return self.interval_index(epsilon).fuzzify(x)
+
+    def interval_index(self, epsilon: float = 0.0) -> IntervalIndex:
+        """Interval index of the terms by where their degree exceeds `epsilon`, rebuilt after any change."""
+        return self._derived_value("interval_index", lambda: IntervalIndex(self.fuzzy_sets, epsilon), epsilon)
+
+    def fuzzify_batch(
+        self,
+        x: npt.ArrayLike,
+        sparse: bool = False,
+        noise: MembershipFunction | None = None,
+        resolution: int = 1001,
+    ) -> np.ndarray | SparseMemberships:
+        """Fuzzify an array of input values into a matrix of degrees of membership.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            One-dimensional array of input values, all within the UOD bounds.
+        sparse : bool, Default: False
+            Return only the non-zero degrees, in compressed sparse row layout. Each term is then evaluated only
+            for inputs where it is positive, which pays off for variables with many terms.
+        noise : MembershipFunction, optional
+            Noise shape around zero, e.g. `MFGaussian(mean=0.0, sigma=0.5)`. Each input value is then the fuzzy
+            set of the noise translated to it, fuzzified by sup-min as in `fuzzify_nonsingleton`, for all input
+            values at once. Input values are crisp (singletons) if None.
+        resolution : int, Default: 1001
+            Number of grid points over the UOD for pairs of noise and terms without a closed form.
+
+        Returns
+        -------
+        np.ndarray | SparseMemberships
+            Matrix of shape `(n_samples, n_terms)`, with columns in the order of `term_bank.terms` (the order of
+            `fuzzy_sets`); `term_bank.index` maps terms to columns.
+
+        Raises
+        ------
+        ValueError
+            If `x` is not one-dimensional, any input value is outside the UOD bounds or not finite, or `resolution`
+            is less than 2.
+
+        """
+        if resolution < 2:
+            raise ValueError(f"The resolution must be at least 2 grid points, got {resolution}.")
+        x = np.asarray(x, dtype=float)
+        if x.ndim != 1:
+            raise ValueError(
+                f"Inputs for linguistic variable '{self.concept}' must be one-dimensional, got shape {x.shape}."
+            )
+        # NaN fails both comparisons, so it counts as outside
+        outside = ~((self.uod[0] <= x) & (x <= self.uod[1]))
+        if outside.any():
+            raise ValueError(
+                f"{np.count_nonzero(outside)} input values are outside the UOD bounds [{self.uod[0]}, {self.uod[1]}] "
+                f"for linguistic variable '{self.concept}', the first being {x[np.argmax(outside)]} "
+                f"at index {np.argmax(outside)}."
+            )
+        if noise is not None:
+            degrees = sup_min_matrix(noise, x, self.fuzzy_sets, self.uod, resolution)
+            return SparseMemberships.from_dense(degrees, self.term_bank.terms) if sparse else degrees
+        return self.term_bank.evaluate_sparse(x) if sparse else self.term_bank.evaluate(x)
+
+    @validate_call
+    def fuzzify_nonsingleton(
+        self, x: MembershipFunction, resolution: Annotated[int, Field(ge=2)] = 1001
+    ) -> dict[SnakedStr, FiniteFloat]:
+        """Fuzzify a fuzzy input, e.g. a measurement with its noise, into its *degree of membership* to each *term*.
+
+        The degree is the sup-min compatibility `max_t min(x(t), term(t))` over the UOD, the height of the
+        intersection of the input and the term. Piecewise-linear inputs and terms (triangles, trapezoids,
+        piecewise-linear and tabulated functions) and Gaussian inputs and terms are matched in closed form; all
+        other pairs are sampled on `resolution` points of the UOD. A crisp input is the limit of a narrowing
+        fuzzy input; `fuzzify_batch` with `noise` fuzzifies many measurements with the same noise at once.
+
+        Parameters
+        ----------
+        x : MembershipFunction
+            The fuzzy input, e.g. `MFGaussian(mean=21.5, sigma=0.5)` for a reading of 21.5 with Gaussian noise.
+        resolution : int, Default: 1001
+            Number of grid points over the UOD for pairs without a closed form.
+
+        Returns
+        -------
+        dict[Term, FiniteFloat]
+            A dictionary where the keys are terms and the values are their degrees of membership.
+
+        """
+        degrees = sup_min_matrix(x, np.zeros(1), self.fuzzy_sets, self.uod, resolution)[0]
+        return dict(zip(self.fuzzy_sets, degrees.tolist(), strict=True))
+
+    @validate_call
+    def tabulated(self, size: Annotated[int, Field(ge=2)] = 1001, terms: list[SnakedStr] | None = None) -> Self:
+        """Copy the variable with its membership functions replaced by tabulated lookups over the UOD.
+
+        Parameters
+        ----------
+        size : int, Default: 1001
+            Number of samples in each table.
+        terms : list[str], optional
+            Terms to tabulate, e.g. those with costly custom membership functions; all terms if None.
+
+        Returns
+        -------
+        LinguisticVariable
+            A new linguistic variable; the original keeps its membership functions.
+
+        """
+        fuzzy_sets = dict(self.fuzzy_sets)
+        for term in fuzzy_sets if terms is None else terms:
+            mf = self.get_fuzzy_set(term)
+            if not isinstance(mf, MFTabulated):
+                fuzzy_sets[term] = MFTabulated(mf=mf, uod=self.uod, size=size)
+        return type(self)(concept=self.concept, uod=self.uod, fuzzy_sets=fuzzy_sets)
+
+    @validate_call
+    def similarity(
+        self, measure: Literal["jaccard", "overlap"] = "jaccard", resolution: Annotated[int, Field(ge=2)] = 1001
+    ) -> pd.DataFrame:
+        """Compute the pairwise similarity of all fuzzy sets within the UOD.
+
+        Pairs of piecewise-linear shapes (triangles, trapezoids, piecewise-linear and tabulated functions) and
+        pairs of Gaussians are integrated in closed form; all other pairs are integrated numerically on one
+        shared grid of `resolution` points, evaluating every term once.
+
+        Parameters
+        ----------
+        measure : Literal["jaccard", "overlap"], Default: "jaccard"
+            `"jaccard"` divides the area of the intersection by the area of the union, `"overlap"` by the area
+            of the smaller fuzzy set, so a term contained in another has an overlap of 1.
+        resolution : int, Default: 1001
+            Number of grid points for pairs without a closed form.
+
+        Returns
+        -------
+        pd.DataFrame
+            Symmetric matrix with the terms as index and columns, with values in [0, 1] and ones on the diagonal.
+
+        """
+        matrix = similarity_matrix(self.fuzzy_sets, self.uod, measure, resolution)
+        terms = list(self.fuzzy_sets)
+        return pd.DataFrame(matrix, index=terms, columns=terms)
 
     def get_fuzzy_set(self, term: SnakedStr) -> MembershipFunction:
         """Retrieve the fuzzy set associated with a given term.
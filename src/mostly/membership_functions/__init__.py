@@ -4,14 +4,23 @@ from .base import MembershipFunction
 from .bimodal_gaussian import MFBimodalGaussian
 from .gaussian import MFGaussian
 from .generalized_bell import MFGeneralizedBell
+from .interval_index import IntervalIndex
+from .piecewise_linear import MFPiecewiseLinear
+from .tabulated import MFTabulated
+from .term_bank import SparseMemberships, TermBank
 from .trapezoidal import MFTrapezoidal
 from .triangle import MFTriangular
 
 __all__ = [
+    "IntervalIndex",
     "MFBimodalGaussian",
     "MFGaussian",
     "MFGeneralizedBell",
+    "MFPiecewiseLinear",
+    "MFTabulated",
     "MFTrapezoidal",
     "MFTriangular",
     "MembershipFunction",
+    "SparseMemberships",
+    "TermBank",
 ]
@@ -0,0 +1,98 @@
+"""Non-singleton fuzzification: degrees of fuzzy inputs in the terms of a linguistic variable.
+
+A measurement `x` with noise is the fuzzy set `noise(t - x)`, the noise shape translated to the measurement.
+Its degree in a term is the sup-min compatibility `sup_t min(noise(t - x), term(t))` over the universe of
+discourse. Pairs of piecewise-linear shapes and pairs of Gaussians have a closed form, evaluated for all
+measurements at once; all other pairs are sampled on one shared grid over the universe of discourse.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from .base import MembershipFunction
+from .gaussian import MFGaussian
+
+# Upper bound on the elements of the (measurements, grid points) blocks of sampled pairs
+_BLOCK_SIZE = 1 << 22
+
+
+def sup_min_matrix(
+    noise: MembershipFunction,
+    x: np.ndarray,
+    fuzzy_sets: Mapping[str, MembershipFunction],
+    uod: tuple[float, float],
+    resolution: int,
+) -> np.ndarray:
+    """Return the `(len(x), len(fuzzy_sets))` sup-min degrees of `noise` translated to every `x` in each term.
+
+    The supremum is taken within `uod`; sampled pairs use `resolution` evenly spaced points of `uod`.
+    """
+    degrees = np.empty((x.size, len(fuzzy_sets)))
+    noise_knots = noise._knots()
+    noise_gaussian = type(noise) is MFGaussian
+
+    sampled = []
+    for j, mf in enumerate(fuzzy_sets.values()):
+        knots = mf._knots()
+        if noise_knots is not None and knots is not None:
+            degrees[:, j] = _linear_sup_min(noise_knots, x, knots, uod)
+        elif noise_gaussian and type(mf) is MFGaussian:
+            degrees[:, j] = _gaussian_sup_min(noise, x, mf, uod)
+        else:
+            sampled.append(j)
+
+    if sampled:
+        mfs = list(fuzzy_sets.values())
+        grid = np.linspace(*uod, resolution)
+        terms = np.stack([mfs[j].evaluate(grid) for j in sampled])
+        block = max(1, _BLOCK_SIZE // resolution)
+        for start in range(0, x.size, block):
+            inputs = noise.evaluate(grid - x[start : start + block, np.newaxis])
+            for j, term in zip(sampled, terms, strict=True):
+                degrees[start : start + block, j] = np.minimum(inputs, term).max(axis=1)
+    return degrees
+
+
+def _linear_sup_min(
+    noise_knots: tuple[list[float], list[float]],
+    x: np.ndarray,
+    knots: tuple[list[float], list[float]],
+    uod: tuple[float, float],
+) -> np.ndarray:
+    """Exact sup-min of translated piecewise-linear noise and a piecewise-linear term.
+
+    Between the merged knots of both shapes (and the UOD bounds) both are linear, so the minimum peaks at a
+    knot or where the two cross within a segment.
+    """
+    noise_xs, noise_ys = noise_knots
+    lo, hi = uod
+    points = np.concatenate(
+        [
+            np.add.outer(x, noise_xs),
+            np.broadcast_to([*knots[0], lo, hi], (x.size, len(knots[0]) + 2)),
+        ],
+        axis=1,
+    )
+    points = np.sort(np.clip(points, lo, hi), axis=1)
+    first = np.interp(points - x[:, np.newaxis], noise_xs, noise_ys)
+    second = np.interp(points, *knots)
+
+    difference = first - second
+    d0, d1 = difference[:, :-1], difference[:, 1:]
+    crossing = d0 * d1 < 0.0
+    t = np.divide(d0, d0 - d1, out=np.zeros_like(d0), where=crossing)
+    meet = np.where(crossing, first[:, :-1] + t * (first[:, 1:] - first[:, :-1]), 0.0)
+    return np.maximum(np.minimum(first, second).max(axis=1), meet.max(axis=1, initial=0.0))
+
+
+def _gaussian_sup_min(noise: MFGaussian, x: np.ndarray, term: MFGaussian, uod: tuple[float, float]) -> np.ndarray:
+    """Exact sup-min of translated Gaussian noise and a Gaussian term.
+
+    The minimum of two Gaussians is unimodal and peaks where they cross between their means, so within the
+    UOD it peaks at that crossing clamped into the UOD.
+    """
+    means, sigma = x + noise.mean, noise.sigma
+    peak = np.clip((means * term.sigma + term.mean * sigma) / (sigma + term.sigma), *uod)
+    z1, z2 = (peak - means) / sigma, (peak - term.mean) / term.sigma
+    return np.exp(-0.5 * np.maximum(z1 * z1, z2 * z2))
@@ -0,0 +1,181 @@
+"""Closed-form building blocks shared by the membership functions.
+
+Level sets of Gaussian-shaped functions, and exact integrals of implied (clipped or scaled) membership
+functions. The latter are described as a list of pieces, each a linear segment or a scaled Gaussian over an
+interval, so their area and first moment follow from closed-form antiderivatives.
+"""
+
+import math
+from typing import Literal, NamedTuple
+
+import numpy as np
+
+type Implication = Literal["clip", "scale"]
+
+# Exponents below this underflow `np.exp` to exactly zero; the margin keeps truncated supports on the safe side.
+_LOG_UNDERFLOW = float(np.log(np.finfo(float).smallest_subnormal)) - 1.0
+
+
+def gaussian_half_width(level: float, log_height: float = 0.0) -> float:
+    """Distance from the mean, in standard deviations, at which a Gaussian of height `exp(log_height)` falls to `level`.
+
+    `level == 0` gives the distance at which the evaluation underflows to zero.
+    """
+    log_level = math.log(level) if level > 0.0 else _LOG_UNDERFLOW
+    return math.sqrt(max(2.0 * (log_height - log_level), 0.0))
+
+
+class LinearPiece(NamedTuple):
+    """Linear segment from `(x0, y0)` to `(x1, y1)`; infinite ends require `y0 == y1`."""
+
+    x0: float
+    x1: float
+    y0: float
+    y1: float
+
+    def integrals(self, lo: float, hi: float) -> tuple[float, float]:
+        """Return the area and first moment of the segment within `[lo, hi]`."""
+        x0, x1 = max(self.x0, lo), min(self.x1, hi)
+        if x0 >= x1 or self.y0 == self.y1 == 0.0:
+            return 0.0, 0.0
+        if math.isinf(x0) or math.isinf(x1):
+            return math.inf, (-math.inf if math.isinf(x0) else 0.0) + (math.inf if math.isinf(x1) else 0.0)
+        y0, y1 = self(x0), self(x1)
+        width = x1 - x0
+        return width * (y0 + y1) / 2.0, width * (x0 * (2.0 * y0 + y1) + x1 * (y0 + 2.0 * y1)) / 6.0
+
+    def __call__(self, x: float) -> float:
+        """Evaluate the segment at `x`, which must lie within it."""
+        if self.y0 == self.y1:
+            return self.y0
+        return self.y0 + (x - self.x0) * (self.y1 - self.y0) / (self.x1 - self.x0)
+
+
+class GaussianPiece(NamedTuple):
+    """Gaussian `height * exp(-0.5 * ((x - mean) / sigma) ** 2)` restricted to `[x0, x1]`."""
+
+    x0: float
+    x1: float
+    height: float
+    mean: float
+    sigma: float
+
+    def integrals(self, lo: float, hi: float) -> tuple[float, float]:
+        """Return the area and first moment of the Gaussian within `[lo, hi]`."""
+        x0, x1 = max(self.x0, lo), min(self.x1, hi)
+        if x0 >= x1 or self.height == 0.0:
+            return 0.0, 0.0
+        z0, z1 = (x0 - self.mean) / self.sigma, (x1 - self.mean) / self.sigma
+        # Difference of erf values, taken on the far side of the mean through erfc to avoid cancellation in the tails
+        if z0 > 0.0:
+            mass = math.erfc(z0 / math.sqrt(2.0)) - math.erfc(z1 / math.sqrt(2.0))
+        elif z1 < 0.0:
+            mass = math.erfc(-z1 / math.sqrt(2.0)) - math.erfc(-z0 / math.sqrt(2.0))
+        else:
+            mass = math.erf(z1 / math.sqrt(2.0)) - math.erf(z0 / math.sqrt(2.0))
+        area = self.height * self.sigma * math.sqrt(math.pi / 2.0) * mass
+        spread = self.height * self.sigma**2 * (math.exp(-0.5 * z0 * z0) - math.exp(-0.5 * z1 * z1))
+        return area, self.mean * area + spread
+
+
+type Piece = LinearPiece | GaussianPiece
+
+
+def integrate_pieces(pieces: list[Piece], bounds: tuple[float, float] | None) -> tuple[float, float]:
+    """Sum the area and first moment of `pieces` within `bounds` (the whole real line if None)."""
+    lo, hi = bounds if bounds is not None else (-math.inf, math.inf)
+    area = moment = 0.0
+    for piece in pieces:
+        piece_area, piece_moment = piece.integrals(lo, hi)
+        area += piece_area
+        moment += piece_moment
+    return area, moment
+
+
+def linear_pieces(xs: list[float], ys: list[float], alpha: float, implication: Implication) -> list[Piece]:
+    """Pieces of an implied piecewise-linear function given by its knots.
+
+    The function is constant at `ys[0]` left of the first knot and at `ys[-1]` right of the last one. Clipping
+    inserts a knot wherever a segment crosses `alpha`, so every resulting piece stays linear.
+    """
+    if implication == "scale":
+        xs, ys = list(xs), [alpha * y for y in ys]
+    else:
+        clipped_xs, clipped_ys = [xs[0]], [min(ys[0], alpha)]
+        for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:], strict=False):
+            if (y0 - alpha) * (y1 - alpha) < 0.0:
+                clipped_xs.append(x0 + (alpha - y0) / (y1 - y0) * (x1 - x0))
+                clipped_ys.append(alpha)
+            clipped_xs.append(x1)
+            clipped_ys.append(min(y1, alpha))
+        xs, ys = clipped_xs, clipped_ys
+
+    pieces: list[Piece] = [LinearPiece(-math.inf, xs[0], ys[0], ys[0])]
+    pieces.extend(LinearPiece(*segment) for segment in zip(xs, xs[1:], ys, ys[1:], strict=False))
+    pieces.append(LinearPiece(xs[-1], math.inf, ys[-1], ys[-1]))
+    return pieces
+
+
+def positive_intervals(xs: list[float], ys: list[float]) -> list[tuple[float, float]]:
+    """Sorted, disjoint open intervals where a piecewise-linear function given by its knots is positive.
+
+    A segment is positive in its interior unless both of its ends are zero, and the function is constant
+    beyond the first and last knot, so the intervals end at knots with a degree of zero.
+    """
+    intervals, start = [], -math.inf if ys[0] > 0.0 else None
+    for i, (x, y) in enumerate(zip(xs, ys, strict=True)):
+        if y == 0.0 and start is not None:
+            intervals.append((start, x))
+            start = None
+        if start is None and i + 1 < len(ys) and ys[i + 1] > 0.0:
+            start = x
+    if start is not None:
+        intervals.append((start, math.inf))
+    return intervals
+
+
+def uncovered_intervals(positive: list[tuple[float, float]], bounds: tuple[float, float]) -> list[tuple[float, float]]:
+    """Return the closed intervals within `bounds` not covered by any of the open intervals `positive`."""
+    lo, hi = bounds
+    uncovered, reach = [], lo  # every point left of `reach` is covered, `reach` itself not yet
+    for start, end in sorted(positive):
+        if end <= reach:
+            continue
+        if start >= reach:
+            uncovered.append((reach, min(start, hi)))
+        reach = end
+        if reach > hi:
+            break
+    if reach <= hi:
+        uncovered.append((reach, hi))
+    return [(start, end) for start, end in uncovered if start <= end]
+
+
+def bell_curve_pieces(
+    left: tuple[float, float],
+    right: tuple[float, float],
+    log_height: float,
+    alpha: float,
+    implication: Implication,
+) -> list[Piece]:
+    """Pieces of an implied curve made of a left Gaussian tail, a flat top and a right Gaussian tail.
+
+    `left` and `right` are the (mean, sigma) of the tails, with the top spanning the two means at height
+    `exp(log_height)`. A single Gaussian has coinciding tails; clipping below the top widens the flat part to
+    the alpha cut.
+    """
+    (left_mean, left_sigma), (right_mean, right_sigma) = left, right
+    height = math.exp(log_height)
+    if implication == "scale" or alpha >= height:
+        top = alpha * height if implication == "scale" else height
+        start, end = left_mean, right_mean
+    else:
+        top = alpha
+        half_width = gaussian_half_width(alpha, log_height)
+        start, end = left_mean - left_sigma * half_width, right_mean + right_sigma * half_width
+    tail_height = top if implication == "scale" else height
+    return [
+        GaussianPiece(-math.inf, start, tail_height, left_mean, left_sigma),
+        LinearPiece(start, end, top, top),
+        GaussianPiece(end, math.inf, tail_height, right_mean, right_sigma),
+    ]
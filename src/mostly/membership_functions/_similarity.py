@@ -0,0 +1,120 @@
+"""Pairwise similarity of the fuzzy sets of one universe of discourse.
+
+The similarity of two fuzzy sets is derived from the area of their intersection (pointwise minimum) within the
+universe of discourse. Pairs of piecewise-linear shapes and pairs of Gaussians are integrated in closed form,
+all other pairs on one shared grid in a single batched evaluation.
+"""
+
+import math
+from collections.abc import Mapping
+from itertools import combinations
+from typing import Literal
+
+import numpy as np
+
+from ._shapes import GaussianPiece
+from .base import MembershipFunction
+from .gaussian import MFGaussian
+from .term_bank import TermBank
+
+type Similarity = Literal["jaccard", "overlap"]
+
+
+def similarity_matrix(
+    fuzzy_sets: Mapping[str, MembershipFunction], uod: tuple[float, float], measure: Similarity, resolution: int
+) -> np.ndarray:
+    """Return the symmetric (k, k) similarity matrix of `fuzzy_sets` within `uod`, in their iteration order.
+
+    Jaccard similarity is `|A ∩ B| / |A ∪ B|`, overlap similarity is `|A ∩ B| / min(|A|, |B|)`, where `|·|` is
+    the area within `uod`. Sets without area within `uod` are similar to nothing but themselves.
+    """
+    mfs = list(fuzzy_sets.values())
+    k = len(mfs)
+    pairs = np.array(list(combinations(range(k), 2)), dtype=np.intp).reshape(-1, 2)
+    intersections, areas = np.zeros(len(pairs)), np.zeros((len(pairs), 2))
+
+    knots = [mf._knots() for mf in mfs]
+    is_linear = np.array([shape is not None for shape in knots], dtype=bool)
+    is_gaussian = np.array([type(mf) is MFGaussian for mf in mfs], dtype=bool)
+    linear = is_linear[pairs].all(axis=1)
+    gaussian = is_gaussian[pairs].all(axis=1)
+    sampled = ~(linear | gaussian)
+
+    closed = is_linear | is_gaussian
+    exact_areas = np.array(
+        [mf.area(bounds=uod) if has_closed_form else 0.0 for mf, has_closed_form in zip(mfs, closed, strict=True)]
+    )
+    if linear.any():
+        intersections[linear] = _linear_intersections(knots, pairs[linear], uod)
+    for p in np.flatnonzero(gaussian):
+        i, j = pairs[p]
+        intersections[p] = _gaussian_intersection(mfs[i], mfs[j], uod)
+    areas[~sampled] = exact_areas[pairs[~sampled]]
+    if sampled.any():
+        intersections[sampled], areas[sampled] = _sampled_intersections(mfs, pairs[sampled], uod, resolution)
+
+    denominators = areas.sum(axis=1) - intersections if measure == "jaccard" else areas.min(axis=1)
+    similarities = np.divide(intersections, denominators, out=np.zeros_like(intersections), where=denominators > 0.0)
+
+    matrix = np.eye(k)
+    matrix[pairs[:, 0], pairs[:, 1]] = matrix[pairs[:, 1], pairs[:, 0]] = np.clip(similarities, 0.0, 1.0)
+    return matrix
+
+
+def _linear_intersections(
+    knots: list[tuple[list[float], list[float]] | None], pairs: np.ndarray, uod: tuple[float, float]
+) -> np.ndarray:
+    """Exact intersection areas of piecewise-linear pairs.
+
+    On the union of all knots every shape is linear per segment, so the minimum of a pair is linear too,
+    except for a kink where the two cross; such segments are split at the crossing.
+    """
+    lo, hi = uod
+    terms = np.unique(pairs)
+    grid = np.unique(np.concatenate([[lo, hi], *(np.clip(knots[t][0], lo, hi) for t in terms)]))
+    values = np.zeros((grid.size, int(terms.max()) + 1))
+    for t in terms:
+        values[:, t] = np.interp(grid, *knots[t])
+
+    first, second = values[:, pairs[:, 0]], values[:, pairs[:, 1]]
+    lower = np.minimum(first, second)
+    difference = first - second
+    d0, d1 = difference[:-1], difference[1:]
+    width = np.diff(grid)[:, np.newaxis]
+    crossing = d0 * d1 < 0.0
+    # Relative position of the crossing within the segment, and the common degree there
+    t = np.divide(d0, d0 - d1, out=np.zeros_like(d0), where=crossing)
+    meet = first[:-1] + t * (first[1:] - first[:-1])
+    straight = width * (lower[:-1] + lower[1:]) / 2.0
+    kinked = width * (t * (lower[:-1] + meet) + (1.0 - t) * (meet + lower[1:])) / 2.0
+    return np.where(crossing, kinked, straight).sum(axis=0)
+
+
+def _gaussian_intersection(first: MFGaussian, second: MFGaussian, uod: tuple[float, float]) -> float:
+    """Exact intersection area of two Gaussians, integrating the lower one between their crossings."""
+    (m1, s1), (m2, s2) = (first.mean, first.sigma), (second.mean, second.sigma)
+    # Equal degrees where (x - m1) / s1 = ±(x - m2) / s2
+    crossings = [(m1 / s1 + m2 / s2) / (1.0 / s1 + 1.0 / s2)]
+    if s1 != s2:
+        crossings.append((m1 / s1 - m2 / s2) / (1.0 / s1 - 1.0 / s2))
+    edges = [-math.inf, *sorted(crossings), math.inf]
+
+    area = 0.0
+    for x0, x1 in zip(edges, edges[1:], strict=False):
+        probe = x1 - 1.0 if math.isinf(x0) else x0 + 1.0 if math.isinf(x1) else (x0 + x1) / 2.0
+        lower = first if abs(probe - m1) / s1 > abs(probe - m2) / s2 else second
+        area += GaussianPiece(x0, x1, 1.0, lower.mean, lower.sigma).integrals(*uod)[0]
+    return area
+
+
+def _sampled_intersections(
+    mfs: list[MembershipFunction], pairs: np.ndarray, uod: tuple[float, float], resolution: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Intersection areas and areas of the remaining pairs by the trapezoid rule on one shared grid."""
+    terms = np.unique(pairs)
+    x = np.linspace(*uod, resolution)
+    values = np.zeros((resolution, len(mfs)))
+    values[:, terms] = TermBank({str(t): mfs[t] for t in terms}).evaluate(x)
+    areas = np.trapezoid(values, x, axis=0)
+    intersections = np.trapezoid(np.minimum(values[:, pairs[:, 0]], values[:, pairs[:, 1]]), x, axis=0)
+    return intersections, areas[pairs]
@@ -1,12 +1,236 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Annotated, Any, Literal, Self
 
-from pydantic import BaseModel, FiniteFloat
+import numpy as np
+import numpy.typing as npt
+from pydantic import Field, FiniteFloat, PrivateAttr, validate_call
 
+from .._tracking import TrackedModel
+from ._shapes import Implication, Piece, integrate_pieces
 
-class MembershipFunction(BaseModel, ABC):
+# Methods whose built-in implementations are derived from the closed-form shape of a membership function.
+# A subclass that replaces `__call__` without also providing its own array kernel inherits them from a
+# shape that no longer describes it, so they are reset to the generic fallbacks of the base class.
+_SHAPE_METHODS = ("evaluate", "_compile_trusted", "height", "_level_interval", "_pieces", "_knots", "_positive_set")
+
+AlphaLevel = Annotated[float, Field(gt=0.0, le=1.0)]
+Epsilon = Annotated[float, Field(ge=0.0, lt=1.0)]
+type Interval = tuple[float, float]
+
+# Numeric integration of shapes without closed-form pieces: 16-point Gauss-Legendre panels over the range where
+# the degree of membership exceeds `_QUADRATURE_EPSILON`, graded geometrically away from the peak.
+_GAUSS_LEGENDRE = np.polynomial.legendre.leggauss(16)
+_QUADRATURE_EPSILON = 1e-12
+
+
+class MembershipFunction(TrackedModel, ABC):
     """Abstract Base Class for Membership Functions."""
 
+    _trusted: Callable[[float], float] = PrivateAttr()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Fall back to the generic implementations when `__call__` is overridden without a kernel."""
+        super().__pydantic_init_subclass__(**kwargs)
+        if "__call__" in cls.__dict__ and "evaluate" not in cls.__dict__:
+            for name in _SHAPE_METHODS:
+                if name not in cls.__dict__:
+                    setattr(cls, name, getattr(MembershipFunction, name))
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Compile the trusted evaluator once the parameters are validated."""
+        self._trusted = self._compile_trusted()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Recompile the trusted evaluator whenever a parameter is reassigned."""
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._trusted = self._compile_trusted()
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the membership function, recompiling the trusted evaluator for updated parameters."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._trusted = copied._compile_trusted()
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Drop the compiled evaluator from the pickled state; closures are not picklable."""
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__") or {}
+        state["__pydantic_private__"] = {k: v for k, v in private.items() if k != "_trusted"}
+        return state
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore the pickled state and recompile the trusted evaluator."""
+        super().__setstate__(state)
+        self._trusted = self._compile_trusted()
+
+    @property
+    def trusted(self) -> Callable[[float], float]:
+        """Scalar evaluator without per-call validation.
+
+        Parameters are validated once at construction, so the evaluator is compiled into a plain float
+        function specialised to the shape of the membership function. It returns exactly what `__call__`
+        returns but skips input validation: callers must pass finite floats, as `LinguisticVariable.fuzzify`
+        does after validating its input.
+        """
+        return self.__pydantic_private__["_trusted"]  # direct lookup, bypassing the slow private `__getattr__`
+
     @abstractmethod
     def __call__(self, x: FiniteFloat) -> FiniteFloat:
         """Calculate Degree of Membership for a given input `x`."""
         raise NotImplementedError(f"{self.__class__.__name__} must implement __call__ method")  # pragma: no cover
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate Degrees of Membership for an array of inputs `x`.
+
+        The built-in membership functions override this with a NumPy kernel returning exactly what
+        `__call__` returns element-wise. The generic fallback calls `__call__` once per element.
+        Inputs are not validated; use `__call__` for checked scalar evaluation.
+        """
+        x = np.asarray(x, dtype=float)
+        return np.fromiter(map(self, x.ravel().tolist()), dtype=float, count=x.size).reshape(x.shape)
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build the trusted scalar evaluator; the generic fallback is the validated `__call__`."""
+        return self.__call__
+
+    @validate_call
+    def support(self, epsilon: Epsilon = 0.0) -> Interval | None:
+        """Return the closed interval outside of which the degree of membership is at most `epsilon`.
+
+        With the default `epsilon=0` this is the support of the membership function. Shapes with unbounded
+        tails (Gaussian, bell) are truncated where their evaluation underflows to zero; a positive `epsilon`
+        truncates them earlier. Open shoulders extend to ±inf. Returns None if no degree exceeds `epsilon`.
+        """
+        if epsilon >= self.height():
+            return None
+        return self._level_interval(epsilon)
+
+    @validate_call
+    def alpha_cut(self, alpha: AlphaLevel) -> Interval | None:
+        """Return the closed interval of inputs with a degree of membership of at least `alpha`, or None if empty."""
+        if alpha > self.height():
+            return None
+        return self._level_interval(alpha)
+
+    def core(self) -> Interval | None:
+        """Return the closed interval of inputs with full membership, or None for subnormal membership functions."""
+        return self.alpha_cut(1.0)
+
+    def height(self) -> float:
+        """Return the largest degree of membership; the generic fallback assumes a normal membership function."""
+        return 1.0
+
+    def _level_interval(self, level: float) -> Interval:
+        """Return the interval `{x: mu(x) >= level}` for `0 < level <= height`, or the support for `level == 0`.
+
+        The generic fallback knows nothing about the shape and returns the unbounded interval, a safe
+        superset of every level set.
+        """
+        return (-np.inf, np.inf)
+
+    @validate_call
+    def area(
+        self,
+        alpha: AlphaLevel = 1.0,
+        implication: Literal["clip", "scale"] = "clip",
+        bounds: tuple[FiniteFloat, FiniteFloat] | None = None,
+    ) -> float:
+        """Return the exact area under the membership function implied by a rule of strength `alpha`.
+
+        Parameters
+        ----------
+        alpha : float, Default: 1.0
+            Rule strength in (0, 1]; `alpha=1` gives the area of the membership function itself.
+        implication : Literal["clip", "scale"], Default: "clip"
+            Whether the membership function is clipped at `alpha` or scaled by it.
+        bounds : tuple[float, float], optional
+            Integration range, typically the universe of discourse; the whole real line if None.
+
+        Returns
+        -------
+        float
+            The area, infinite for an open shoulder without `bounds`.
+
+        """
+        return self._integrals(alpha, implication, bounds)[0]
+
+    @validate_call
+    def moment(
+        self,
+        alpha: AlphaLevel = 1.0,
+        implication: Literal["clip", "scale"] = "clip",
+        bounds: tuple[FiniteFloat, FiniteFloat] | None = None,
+    ) -> float:
+        """Return the exact first moment of the membership function implied by a rule of strength `alpha`.
+
+        Takes the same parameters as `area`; `moment(...) / area(...)` is the centroid of the implied set.
+        """
+        return self._integrals(alpha, implication, bounds)[1]
+
+    def _integrals(self, alpha: float, implication: Implication, bounds: Interval | None) -> tuple[float, float]:
+        """Return the area and first moment of the implied membership function within `bounds`."""
+        if bounds is not None and bounds[0] > bounds[1]:
+            raise ValueError(f"Integration bounds must satisfy low ≤ high, got {bounds}")
+        pieces = self._pieces(alpha, implication)
+        if pieces is not None:
+            return integrate_pieces(pieces, bounds)
+        return self._quadrature(alpha, implication, bounds)
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece] | None:
+        """Return the implied membership function as closed-form pieces, or None if there is no closed form."""
+        return None
+
+    def _knots(self) -> tuple[list[float], list[float]] | None:
+        """Return the knots `(xs, ys)` of a piecewise-linear shape, or None for other shapes.
+
+        Between knots the degree is linear, beyond them it stays at `ys[0]` and `ys[-1]` respectively.
+        """
+        return None
+
+    def _positive_set(self) -> list[Interval] | None:
+        """Return the sorted, disjoint open intervals where the degree of membership is positive.
+
+        Closed-form shapes with a single peak are positive exactly on the interior of their support. Returns
+        None for shapes without a closed form.
+        """
+        if type(self)._level_interval is MembershipFunction._level_interval:
+            return None
+        return [self._level_interval(0.0)] if self.height() > 0.0 else []
+
+    def _quadrature(self, alpha: float, implication: Implication, bounds: Interval | None) -> tuple[float, float]:
+        """Integrate the implied membership function numerically, for shapes without closed-form pieces."""
+        lo, hi = self._level_interval(_QUADRATURE_EPSILON)
+        if bounds is not None:
+            lo, hi = max(lo, bounds[0]), min(hi, bounds[1])
+        if lo >= hi:
+            return 0.0, 0.0
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            raise ValueError(
+                f"{self.__class__.__name__} has no closed-form integral and an unbounded support; "
+                "pass finite `bounds` to integrate it numerically."
+            )
+
+        height = self.height()
+        peak, half = self._level_interval(height), self._level_interval(0.5 * height)
+        scale = (half[1] - half[0]) / 2.0
+        if np.isfinite(scale) and scale > 0.0:
+            anchor = min(max((peak[0] + peak[1]) / 2.0, lo), hi)
+            doublings = int(np.ceil(np.log2(max(hi - anchor, anchor - lo) / scale))) + 1
+            steps = scale * 2.0 ** np.arange(-4, max(doublings, -4) + 1)
+            edges = np.concatenate([anchor - steps, [anchor, lo, hi], anchor + steps])
+        else:
+            edges = np.linspace(lo, hi, 65)
+        if implication == "clip" and alpha < height:
+            edges = np.append(edges, self._level_interval(alpha))
+        edges = np.unique(np.clip(edges, lo, hi))
+
+        nodes, weights = _GAUSS_LEGENDRE
+        centers, half_widths = (edges[1:] + edges[:-1]) / 2.0, (edges[1:] - edges[:-1]) / 2.0
+        x = centers[:, np.newaxis] + half_widths[:, np.newaxis] * nodes
+        mu = self.evaluate(x)
+        mu = np.minimum(mu, alpha) if implication == "clip" else alpha * mu
+        weighted = half_widths[:, np.newaxis] * weights * mu
+        return float(weighted.sum()), float((weighted * x).sum())
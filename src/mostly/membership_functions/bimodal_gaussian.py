@@ -1,8 +1,12 @@
-from math import exp
+import math
+from collections.abc import Callable
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import Field, FiniteFloat, validate_call
 
-from .base import MembershipFunction
+from ._shapes import Implication, Piece, bell_curve_pieces, gaussian_half_width
+from .base import Interval, MembershipFunction
 
 
 class MFBimodalGaussian(MembershipFunction):
@@ -33,6 +37,13 @@ class MFBimodalGaussian(MembershipFunction):
     -------
     __call__
         Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x`.
+    support, core, alpha_cut
+        Closed-form intervals; the support is truncated where the degree underflows to zero (or `epsilon`).
+        In the inverted case the product is a scaled Gaussian of height below 1.0, so `core` is None.
+    area, moment
+        Exact area and first moment of the clipped or scaled function (erf-based).
 
     """
 
@@ -46,10 +57,10 @@ class MFBimodalGaussian(MembershipFunction):
         """Calculate degree of membership for a given input `x`."""
         # Calculate individual Gaussian values
         z_left = (x - self.left_mean) / self.left_sigma
-        gauss_left = exp(-0.5 * z_left * z_left)
+        gauss_left = float(np.exp(-0.5 * z_left * z_left))
 
         z_right = (x - self.right_mean) / self.right_sigma
-        gauss_right = exp(-0.5 * z_right * z_right)
+        gauss_right = float(np.exp(-0.5 * z_right * z_right))
 
         # Piecewise logic based on mean ordering
         if self.left_mean <= self.right_mean:
@@ -63,3 +74,76 @@ class MFBimodalGaussian(MembershipFunction):
         else:
             # Inverted case: product of Gaussians (max < 1.0)
             return gauss_left * gauss_right
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        x = np.asarray(x, dtype=float)
+        z_left = (x - self.left_mean) / self.left_sigma
+        gauss_left = np.exp(-0.5 * z_left * z_left)
+
+        z_right = (x - self.right_mean) / self.right_sigma
+        gauss_right = np.exp(-0.5 * z_right * z_right)
+
+        if self.left_mean <= self.right_mean:
+            # Ordered case: plateau at 1.0 between means
+            return np.where(x < self.left_mean, gauss_left, np.where(x > self.right_mean, gauss_right, 1.0))
+        # Inverted case: product of Gaussians (max < 1.0)
+        return gauss_left * gauss_right
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a scalar evaluator specialised to the plateau or product case."""
+        left_mean, left_sigma = self.left_mean, self.left_sigma
+        right_mean, right_sigma = self.right_mean, self.right_sigma
+        exp = np.exp
+
+        if left_mean <= right_mean:
+
+            def trusted(x: float) -> float:
+                if x < left_mean:
+                    z = (x - left_mean) / left_sigma
+                    return float(exp(-0.5 * z * z))
+                if x > right_mean:
+                    z = (x - right_mean) / right_sigma
+                    return float(exp(-0.5 * z * z))
+                return 1.0
+
+        else:
+
+            def trusted(x: float) -> float:
+                z_left = (x - left_mean) / left_sigma
+                z_right = (x - right_mean) / right_sigma
+                return float(exp(-0.5 * z_left * z_left)) * float(exp(-0.5 * z_right * z_right))
+
+        return trusted
+
+    @property
+    def _product_gaussian(self) -> tuple[float, float, float]:
+        """Mean, sigma and log-height of the scaled Gaussian equal to the product of both Gaussians."""
+        left_var, right_var = self.left_sigma**2, self.right_sigma**2
+        mean = (self.left_mean * right_var + self.right_mean * left_var) / (left_var + right_var)
+        sigma = math.sqrt(left_var * right_var / (left_var + right_var))
+        log_height = -0.5 * (self.left_mean - self.right_mean) ** 2 / (left_var + right_var)
+        return mean, sigma, log_height
+
+    def height(self) -> float:
+        """Return the largest degree of membership; below 1.0 in the inverted case."""
+        if self.left_mean <= self.right_mean:
+            return 1.0
+        return math.exp(self._product_gaussian[2])
+
+    def _level_interval(self, level: float) -> Interval:
+        """Closed-form level set of the plateau or the product Gaussian."""
+        if self.left_mean <= self.right_mean:
+            half_width = gaussian_half_width(level)
+            return (self.left_mean - self.left_sigma * half_width, self.right_mean + self.right_sigma * half_width)
+        mean, sigma, log_height = self._product_gaussian
+        half_width = sigma * gaussian_half_width(level, log_height)
+        return (mean - half_width, mean + half_width)
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied plateau or product Gaussian as Gaussian tails around a flat top."""
+        if self.left_mean <= self.right_mean:
+            left, right = (self.left_mean, self.left_sigma), (self.right_mean, self.right_sigma)
+            return bell_curve_pieces(left, right, 0.0, alpha, implication)
+        mean, sigma, log_height = self._product_gaussian
+        return bell_curve_pieces((mean, sigma), (mean, sigma), log_height, alpha, implication)
@@ -1,8 +1,11 @@
-from math import exp
+from collections.abc import Callable
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import Field, FiniteFloat, validate_call
 
-from .base import MembershipFunction
+from ._shapes import Implication, Piece, bell_curve_pieces, gaussian_half_width
+from .base import Interval, MembershipFunction
 
 
 class MFGaussian(MembershipFunction):
@@ -21,6 +24,12 @@ class MFGaussian(MembershipFunction):
     -------
     __call__
         Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x`.
+    support, core, alpha_cut
+        Closed-form intervals; the support is truncated where the degree underflows to zero (or `epsilon`).
+    area, moment
+        Exact area and first moment of the clipped or scaled Gaussian (erf-based).
 
     """
 
@@ -31,4 +40,28 @@ class MFGaussian(MembershipFunction):
     def __call__(self, x: FiniteFloat) -> FiniteFloat:
         """Calculate degree of Membership for a given input `x`."""
         z = (x - self.mean) / self.sigma
-        return exp(-0.5 * z * z)
+        return float(np.exp(-0.5 * z * z))
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        z = (np.asarray(x, dtype=float) - self.mean) / self.sigma
+        return np.exp(-0.5 * z * z)
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a scalar evaluator bound to the current parameters."""
+        mean, sigma, exp = self.mean, self.sigma, np.exp
+
+        def trusted(x: float) -> float:
+            z = (x - mean) / sigma
+            return float(exp(-0.5 * z * z))
+
+        return trusted
+
+    def _level_interval(self, level: float) -> Interval:
+        """Closed-form level set, symmetric around the mean."""
+        half_width = self.sigma * gaussian_half_width(level)
+        return (self.mean - half_width, self.mean + half_width)
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied Gaussian as Gaussian tails around a flat top at the clipping level."""
+        return bell_curve_pieces((self.mean, self.sigma), (self.mean, self.sigma), 0.0, alpha, implication)
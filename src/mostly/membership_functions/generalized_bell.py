@@ -1,6 +1,10 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
 from pydantic import Field, FiniteFloat, validate_call
 
-from .base import MembershipFunction
+from .base import Interval, MembershipFunction
 
 
 class MFGeneralizedBell(MembershipFunction):
@@ -21,6 +25,12 @@ class MFGeneralizedBell(MembershipFunction):
     -------
     __call__
         Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x`.
+    support, core, alpha_cut
+        Closed-form intervals; the support is truncated where the power term overflows (or at `epsilon`).
+    area, moment
+        Area and first moment of the clipped or scaled bell, by Gauss-Legendre quadrature.
 
     Notes
     -----
@@ -35,4 +45,27 @@ class MFGeneralizedBell(MembershipFunction):
     @validate_call
     def __call__(self, x: FiniteFloat) -> FiniteFloat:
         """Calculate degree of Membership for a given input `x`."""
-        return 1.0 / (1.0 + abs((x - self.center) / self.width) ** (2.0 * self.slope))
+        return 1.0 / (1.0 + float(np.power(abs((x - self.center) / self.width), 2.0 * self.slope)))
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        u = np.abs((np.asarray(x, dtype=float) - self.center) / self.width)
+        with np.errstate(over="ignore"):  # far tails overflow to inf, i.e. a degree of exactly zero
+            return 1.0 / (1.0 + np.power(u, 2.0 * self.slope))
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a scalar evaluator with the exponent precomputed."""
+        center, width, exponent, power = self.center, self.width, 2.0 * self.slope, np.power
+
+        def trusted(x: float) -> float:
+            return 1.0 / (1.0 + float(power(abs((x - center) / width), exponent)))
+
+        return trusted
+
+    def _level_interval(self, level: float) -> Interval:
+        """Closed-form level set, symmetric around the center."""
+        # mu >= level  <=>  |u| ** (2 * slope) <= 1 / level - 1; at level 0 the degree only vanishes on overflow
+        ratio = 1.0 / level - 1.0 if level > 0.0 else np.finfo(float).max
+        with np.errstate(over="ignore"):
+            half_width = self.width * float(np.power(ratio, 1.0 / (2.0 * self.slope)))
+        return (self.center - half_width, self.center + half_width)
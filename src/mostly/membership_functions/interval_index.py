@@ -0,0 +1,85 @@
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Mapping
+
+from .base import Interval, MembershipFunction
+
+type _Entry = tuple[str, Callable[[float], float]]
+
+
+class IntervalIndex:
+    """Index of the terms of a linguistic variable by the intervals where their degree exceeds `epsilon`.
+
+    The finite ends of all these intervals are sorted into breakpoints, and the terms active on every
+    segment between two breakpoints (and at every breakpoint) are precomputed. A lookup is then a single
+    binary search followed by the evaluation of the few active terms only. Terms without a closed-form shape
+    are active everywhere.
+
+    Parameters
+    ----------
+    fuzzy_sets : Mapping[str, MembershipFunction]
+        The terms and their membership functions.
+    epsilon : float
+        Degrees of membership up to `epsilon` count as zero, so Gaussian-shaped tails are cut off where they
+        fall to `epsilon` instead of where they underflow.
+
+    Attributes
+    ----------
+    breakpoints : list[float]
+        Sorted finite ends of the active intervals.
+
+    Methods
+    -------
+    active(x)
+        The terms that may have a degree above `epsilon` at `x`.
+    fuzzify(x)
+        The degrees above `epsilon` at `x`, evaluating the active terms only.
+
+    """
+
+    __slots__ = ("_points", "_segments", "breakpoints", "epsilon")
+
+    def __init__(self, fuzzy_sets: Mapping[str, MembershipFunction], epsilon: float) -> None:
+        """Collect the active intervals of every term and distribute the terms over the segments."""
+        self.epsilon = epsilon
+        intervals: list[tuple[_Entry, list[Interval]]] = []
+        for term, mf in fuzzy_sets.items():
+            if epsilon == 0.0:
+                positive = mf._positive_set()
+                active = [(-math.inf, math.inf)] if positive is None else positive
+            else:
+                support = mf.support(epsilon)
+                active = [] if support is None else [support]
+            intervals.append(((term, mf.trusted), active))
+
+        self.breakpoints = sorted(
+            {end for _, active in intervals for interval in active for end in interval if math.isfinite(end)}
+        )
+        # Segment j lies between breakpoints j - 1 and j; both the segments and the points keep the term order.
+        # Intervals count as closed, so a degree rounded above `epsilon` at an end is not missed.
+        self._segments: list[list[_Entry]] = [[] for _ in range(len(self.breakpoints) + 1)]
+        self._points: list[list[_Entry]] = [[] for _ in self.breakpoints]
+        for entry, active in intervals:
+            for lo, hi in active:
+                for segment in self._segments[
+                    bisect_right(self.breakpoints, lo) : bisect_left(self.breakpoints, hi) + 1
+                ]:
+                    segment.append(entry)
+                for point in self._points[bisect_left(self.breakpoints, lo) : bisect_right(self.breakpoints, hi)]:
+                    point.append(entry)
+
+    def active(self, x: float) -> list[_Entry]:
+        """Return the terms, with their trusted evaluators, that may have a degree above `epsilon` at `x`."""
+        j = bisect_left(self.breakpoints, x)
+        if j < len(self.breakpoints) and self.breakpoints[j] == x:
+            return self._points[j]
+        return self._segments[j]
+
+    def fuzzify(self, x: float) -> dict[str, float]:
+        """Return the degrees of membership above `epsilon` at `x`, keyed by term in term order."""
+        degrees = {}
+        for term, trusted in self.active(x):
+            degree = trusted(x)
+            if degree > self.epsilon:
+                degrees[term] = degree
+        return degrees
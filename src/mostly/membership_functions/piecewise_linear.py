@@ -0,0 +1,233 @@
+from bisect import bisect_right
+from collections.abc import Callable
+from typing import Annotated, Self
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import Field, FiniteFloat, ValidationInfo, field_validator, validate_call
+
+from ._shapes import Implication, Piece, linear_pieces, positive_intervals
+from .base import Interval, MembershipFunction
+
+# Interior probes per segment while refining, and per segment when measuring the achieved error
+_REFINE_PROBES = np.linspace(0.0, 1.0, 17)[1:-1]
+_VERIFY_PROBES = np.linspace(0.0, 1.0, 65)[1:-1]
+_MAX_KNOTS = 100_000
+
+
+class MFPiecewiseLinear(MembershipFunction):
+    """Piecewise-Linear Membership Function.
+
+    A fuzzy membership function interpolating linearly between knots `(xs[i], ys[i])`, constant at `ys[0]` left
+    of the first knot and at `ys[-1]` right of the last one. Triangles and trapezoids are special cases;
+    `approximate` converts any membership function into one within a given maximum error.
+
+    Parameters
+    ----------
+    xs : tuple[FiniteFloat, ...]
+        Strictly increasing knot positions.
+    ys : tuple[float, ...]
+        Degrees of membership at the knots, in [0, 1].
+
+    Methods
+    -------
+    __call__
+        Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x` with `np.interp`.
+    approximate
+        Converts a membership function into a piecewise-linear one, reporting the achieved error.
+    support, core, alpha_cut
+        Closed-form intervals; for knots describing several peaks these are the hull of the level set.
+    area, moment
+        Exact area and first moment of the clipped or scaled function (piecewise polynomials).
+
+    Raises
+    ------
+    ValueError
+        If the knots are fewer than two, of different lengths, or not strictly increasing.
+
+    """
+
+    xs: tuple[FiniteFloat, ...]
+    ys: tuple[Annotated[float, Field(ge=0.0, le=1.0)], ...]
+
+    @field_validator("xs")
+    @classmethod
+    def increasing_knots(cls, xs: tuple[float, ...]) -> tuple[float, ...]:
+        """Validate that there are at least two strictly increasing knot positions."""
+        if len(xs) < 2:
+            raise ValueError("At least two knots are required")
+        if any(x0 >= x1 for x0, x1 in zip(xs, xs[1:], strict=False)):
+            raise ValueError("Knot positions must be strictly increasing")
+        return xs
+
+    @field_validator("ys")
+    @classmethod
+    def matching_degrees(cls, ys: tuple[float, ...], info: ValidationInfo) -> tuple[float, ...]:
+        """Validate that every knot position has a degree of membership."""
+        if "xs" in info.data and len(ys) != len(info.data["xs"]):
+            raise ValueError(f"Knots must have as many degrees as positions, got {len(ys)} and {len(info.data['xs'])}")
+        return ys
+
+    @validate_call
+    def __call__(self, x: FiniteFloat) -> FiniteFloat:
+        """Calculate degree of Membership for a given input `x`."""
+        return float(np.interp(x, self.xs, self.ys))
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        xs, ys = self._derived_value("knots", lambda: (np.asarray(self.xs), np.asarray(self.ys)))
+        return np.interp(np.asarray(x, dtype=float), xs, ys)
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a bisection-based scalar evaluator with precomputed slopes, matching `np.interp` exactly."""
+        xs, ys = list(self.xs), list(self.ys)
+        slopes = [(y1 - y0) / (x1 - x0) for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:], strict=False)]
+        first_x, last_x, first_y, last_y = xs[0], xs[-1], ys[0], ys[-1]
+
+        def trusted(x: float) -> float:
+            if x <= first_x:
+                return first_y
+            if x >= last_x:
+                return last_y
+            j = bisect_right(xs, x) - 1
+            if xs[j] == x:
+                return ys[j]
+            return slopes[j] * (x - xs[j]) + ys[j]
+
+        return trusted
+
+    def height(self) -> float:
+        """Return the largest degree of membership."""
+        return max(self.ys)
+
+    def _level_interval(self, level: float) -> Interval:
+        """Hull of the level set, with edges interpolated on the segments crossing `level`."""
+        ys = np.asarray(self.ys)
+        inside = np.flatnonzero(ys > 0.0 if level == 0.0 else ys >= level)
+        first, last = inside[0], inside[-1]
+
+        def crossing(i: int, j: int) -> float:
+            return self.xs[i] + (level - self.ys[i]) / (self.ys[j] - self.ys[i]) * (self.xs[j] - self.xs[i])
+
+        left = -np.inf if first == 0 else crossing(first - 1, first)
+        right = np.inf if last == len(ys) - 1 else crossing(last + 1, last)
+        return (left, right)
+
+    def _knots(self) -> tuple[list[float], list[float]]:
+        """Return the knots."""
+        return list(self.xs), list(self.ys)
+
+    def _positive_set(self) -> list[Interval]:
+        """Return the open intervals between the knots with a degree of zero."""
+        return positive_intervals(*self._knots())
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied function as linear pieces."""
+        return linear_pieces(*self._knots(), alpha, implication)
+
+    @classmethod
+    @validate_call
+    def approximate(
+        cls,
+        mf: MembershipFunction,
+        max_error: Annotated[float, Field(gt=0.0, lt=1.0)] = 1e-3,
+        bounds: tuple[FiniteFloat, FiniteFloat] | None = None,
+    ) -> tuple[Self, float]:
+        """Approximate a membership function by a piecewise-linear one with adaptively placed knots.
+
+        Starting from a few knots at the kinks of `mf` (its core and half-height edges), every segment
+        whose linear interpolation deviates from `mf` by more than `max_error` at any of its probe points
+        is split in two, until all segments are within the bound. The knots span the support of `mf`
+        (where Gaussian-shaped tails underflow to zero), so the constant extensions beyond them are exact.
+        Segments are not split below a few units of float resolution, so a jump of `mf` ends up between two
+        close knots, and the achieved error reports it.
+
+        Parameters
+        ----------
+        mf : MembershipFunction
+            The membership function to approximate.
+        max_error : float, Default: 1e-3
+            Largest tolerated absolute difference in the degree of membership.
+        bounds : tuple[float, float], optional
+            Range the approximation must hold on, typically the universe of discourse. Required for
+            membership functions without a closed-form support.
+
+        Returns
+        -------
+        tuple[MFPiecewiseLinear, float]
+            The approximation and its achieved maximum error, measured on a grid four times finer than
+            the refinement probes.
+
+        Raises
+        ------
+        ValueError
+            If the range to approximate is unbounded, `mf` is zero everywhere and `bounds` is not given, or `mf`
+            needs more than 100,000 knots.
+
+        """
+        support = mf.support()
+        if support is None:
+            # Zero everywhere, which any knots over the bounds reproduce exactly
+            if bounds is None:
+                raise ValueError(
+                    f"Cannot approximate {mf.__class__.__name__} with zero membership everywhere; pass `bounds`."
+                )
+            support, cuts = bounds, []
+        else:
+            cuts = [mf.alpha_cut(mf.height()), mf.alpha_cut(0.5 * mf.height())]
+        lo, hi = support
+        # An open side of a shoulder stays at full height beyond the core, which the constant extension reproduces
+        core = cuts[0] if cuts else None
+        if lo == -np.inf and core is not None and core[0] == -np.inf:
+            lo = core[1]
+        if hi == np.inf and core is not None and core[1] == np.inf:
+            hi = core[0]
+        if bounds is not None:
+            if bounds[0] > bounds[1]:
+                raise ValueError(f"Approximation bounds must satisfy low ≤ high, got {bounds}")
+            lo, hi = max(lo, bounds[0]), min(hi, bounds[1])
+            if lo >= hi:
+                lo, hi = bounds
+        if not np.isfinite(hi - lo):
+            raise ValueError(f"Cannot approximate {mf.__class__.__name__} over an unbounded range; pass `bounds`.")
+
+        knots = np.linspace(lo, hi, 9)
+        for interval in cuts:
+            if interval is not None:
+                knots = np.append(knots, [edge for edge in interval if lo < edge < hi])
+        knots = np.unique(knots)
+        values = mf.evaluate(knots)
+        # Narrower segments are not split, as their midpoints would round to their ends, e.g. at a jump
+        min_width = 16 * np.spacing(max(abs(lo), abs(hi)))
+        pending = np.ones(knots.size - 1, dtype=bool)
+
+        while pending.any():
+            x0, x1 = knots[:-1][pending], knots[1:][pending]
+            y0, y1 = values[:-1][pending], values[1:][pending]
+            errors = _segment_errors(mf, x0, x1, y0, y1, _REFINE_PROBES)
+            split = (errors > max_error) & (x1 - x0 > min_width)
+            if knots.size + split.sum() > _MAX_KNOTS:
+                raise ValueError(f"{mf.__class__.__name__} needs more than {_MAX_KNOTS} knots for {max_error=}")
+            midpoints = (x0[split] + x1[split]) / 2.0
+            knots = np.concatenate([knots, midpoints])
+            values = np.concatenate([values, mf.evaluate(midpoints)])
+            order = np.argsort(knots)
+            knots, values = knots[order], values[order]
+            # Only the halves of split segments still need checking
+            is_new = np.isin(knots, midpoints)
+            pending = is_new[:-1] | is_new[1:]
+
+        errors = _segment_errors(mf, knots[:-1], knots[1:], values[:-1], values[1:], _VERIFY_PROBES)
+        approximation = cls(xs=tuple(knots.tolist()), ys=tuple(np.clip(values, 0.0, 1.0).tolist()))
+        return approximation, float(errors.max(initial=0.0))
+
+
+def _segment_errors(
+    mf: MembershipFunction, x0: np.ndarray, x1: np.ndarray, y0: np.ndarray, y1: np.ndarray, probes: np.ndarray
+) -> np.ndarray:
+    """Largest deviation of `mf` from the chords `(x0, y0)-(x1, y1)` at the relative `probes` of each segment."""
+    x = x0[:, np.newaxis] + (x1 - x0)[:, np.newaxis] * probes
+    chords = y0[:, np.newaxis] + (y1 - y0)[:, np.newaxis] * probes
+    return np.abs(mf.evaluate(x) - chords).max(axis=1, initial=0.0)
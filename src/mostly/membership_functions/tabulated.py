@@ -0,0 +1,142 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import Field, FiniteFloat, model_validator, validate_call
+
+from .._tracking import current_revision
+from ._shapes import Implication, Piece, positive_intervals
+from .base import Interval, MembershipFunction
+from .piecewise_linear import MFPiecewiseLinear
+
+
+class MFTabulated(MembershipFunction):
+    """Tabulated Membership Function.
+
+    Wraps a membership function with a lookup table sampled once at `size` equally spaced points over `uod`.
+    Evaluation computes the table index arithmetically and interpolates linearly between the two neighbouring
+    samples, so its cost is independent of the wrapped function; inputs outside `uod` take the value at the
+    nearest end. The table is resampled automatically after any change to the wrapped function.
+
+    Parameters
+    ----------
+    mf : MembershipFunction
+        The membership function to tabulate, typically one with a costly Python body.
+    uod : tuple[FiniteFloat, FiniteFloat]
+        Range to sample, typically the universe of discourse of the linguistic variable.
+    size : int, Default: 1001
+        Number of samples in the table.
+
+    Methods
+    -------
+    __call__
+        Calculates the degree of membership for the input `x` by table lookup.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x` by table lookup.
+    interpolation_error
+        Estimates the largest deviation of the lookup from the wrapped function.
+    as_piecewise_linear
+        Returns the table as an equivalent `MFPiecewiseLinear`.
+    support, core, alpha_cut, area, moment
+        Closed-form results of the table, which is exactly piecewise linear.
+
+    Raises
+    ------
+    ValueError
+        If the sampling range is empty.
+
+    """
+
+    mf: MembershipFunction
+    uod: tuple[FiniteFloat, FiniteFloat]
+    size: int = Field(default=1001, ge=2)
+
+    @model_validator(mode="after")
+    def compliance(self) -> "MFTabulated":
+        """Validate model for a non-empty sampling range."""
+        if self.uod[0] >= self.uod[1]:
+            raise ValueError(f"Tabulation range must satisfy low < high, got {self.uod}")
+        return self
+
+    def _lookup_table(self) -> tuple[float, float, list[float], np.ndarray]:
+        """Return the lower bound, the inverse sample spacing and the table (as list and array)."""
+
+        def sample() -> tuple[float, float, list[float], np.ndarray]:
+            lo, hi = self.uod
+            table = np.asarray(self.mf.evaluate(np.linspace(lo, hi, self.size)), dtype=float)
+            return lo, (self.size - 1) / (hi - lo), table.tolist(), table
+
+        return self._derived_value("table", sample)
+
+    @validate_call
+    def __call__(self, x: FiniteFloat) -> FiniteFloat:
+        """Calculate degree of Membership for a given input `x`."""
+        return float(self.evaluate(x))
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        lo, inverse_step, _, table = self._lookup_table()
+        position = (np.clip(np.asarray(x, dtype=float), lo, self.uod[1]) - lo) * inverse_step
+        index = np.minimum(position.astype(np.intp), self.size - 2)
+        fraction = position - index
+        return (1.0 - fraction) * table[index] + fraction * table[index + 1]
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a scalar lookup performing the same arithmetic as `evaluate`."""
+        hi, last = self.uod[1], self.size - 2
+        # The table is cached in the closure and refreshed like any derived structure, without the model lookup
+        cache: list = [None, None]
+
+        def trusted(x: float) -> float:
+            if cache[0] != current_revision():
+                cache[:] = current_revision(), self._lookup_table()
+            lo, inverse_step, table, _ = cache[1]
+            position = ((lo if x < lo else hi if x > hi else x) - lo) * inverse_step
+            index = min(int(position), last)
+            fraction = position - index
+            return (1.0 - fraction) * table[index] + fraction * table[index + 1]
+
+        return trusted
+
+    def interpolation_error(self) -> float:
+        """Estimate the largest absolute deviation of the table lookup from the wrapped membership function.
+
+        The wrapped function is evaluated at three points between every pair of neighbouring samples, where
+        linear interpolation deviates most.
+        """
+        lo, hi = self.uod
+        probes = np.linspace(lo, hi, 4 * (self.size - 1) + 1)
+        return float(np.abs(self.evaluate(probes) - self.mf.evaluate(probes)).max())
+
+    def as_piecewise_linear(self) -> MFPiecewiseLinear:
+        """Return the table as a piecewise-linear membership function with one knot per sample."""
+
+        def build() -> MFPiecewiseLinear:
+            lo, hi = self.uod
+            table = np.clip(self._lookup_table()[3], 0.0, 1.0)
+            return MFPiecewiseLinear(xs=tuple(np.linspace(lo, hi, self.size).tolist()), ys=tuple(table.tolist()))
+
+        return self._derived_value("piecewise_linear", build)
+
+    def height(self) -> float:
+        """Return the largest degree of membership in the table."""
+        return self.as_piecewise_linear().height()
+
+    def _level_interval(self, level: float) -> Interval:
+        """Level set of the table, which is exactly piecewise linear."""
+        return self.as_piecewise_linear()._level_interval(level)
+
+    def _knots(self) -> tuple[list[float], list[float]]:
+        """Return the samples of the table as knots."""
+        return self.as_piecewise_linear()._knots()
+
+    def _positive_set(self) -> list[Interval] | None:
+        """Return the open intervals between samples of zero, or None if the wrapped function returned NaN."""
+        table = self._lookup_table()[3]
+        if np.isnan(table).any():
+            return None
+        return positive_intervals(np.linspace(*self.uod, self.size).tolist(), table.tolist())
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied table as linear pieces."""
+        return self.as_piecewise_linear()._pieces(alpha, implication)
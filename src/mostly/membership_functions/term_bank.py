@@ -0,0 +1,306 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .base import MembershipFunction
+from .bimodal_gaussian import MFBimodalGaussian
+from .gaussian import MFGaussian
+from .generalized_bell import MFGeneralizedBell
+from .trapezoidal import MFTrapezoidal
+from .triangle import MFTriangular
+
+
+def _prepare_linear(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Pack triangles and trapezoids given as (a, b, c, d) rows.
+
+    A missing edge (shoulder) gets an infinite foot, so its ramp evaluates to +inf and drops out of the minimum.
+    """
+    a, b, c, d = params.T
+    has_rise, has_fall = b > a, d > c
+    return (
+        np.where(has_rise, a, -np.inf),
+        np.where(has_rise, b - a, 1.0),
+        np.where(has_fall, d, np.inf),
+        np.where(has_fall, d - c, 1.0),
+    )
+
+
+def _linear_kernel(x: np.ndarray, a: np.ndarray, rise: np.ndarray, d: np.ndarray, fall: np.ndarray) -> np.ndarray:
+    """Evaluate packed triangles and trapezoids."""
+    mu = np.minimum((x - a) / rise, (d - x) / fall)
+    np.minimum(mu, 1.0, out=mu)
+    return np.maximum(mu, 0.0, out=mu)
+
+
+def _prepare_gaussian(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Pack Gaussians given as (mean, sigma) rows."""
+    return tuple(params.T)
+
+
+def _gaussian_kernel(x: np.ndarray, mean: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """Evaluate packed Gaussians."""
+    z = (x - mean) / sigma
+    return np.exp(-0.5 * z * z)
+
+
+def _prepare_bell(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Pack generalized bells given as (center, width, exponent) rows, grouping columns by exponent."""
+    center, width, exponent = params.T
+    # NumPy specialises scalar exponents such as 2.0 or 0.5, so evaluate per exponent to match `__call__` exactly
+    return center, width, tuple((value, exponent == value) for value in np.unique(exponent))
+
+
+def _bell_kernel(
+    x: np.ndarray, center: np.ndarray, width: np.ndarray, exponents: tuple[tuple[float, np.ndarray], ...]
+) -> np.ndarray:
+    """Evaluate packed generalized bells."""
+    u = np.abs((x - center) / width)
+    with np.errstate(over="ignore"):  # far tails overflow to inf, i.e. a degree of exactly zero
+        for value, columns in exponents:
+            u[..., columns] = 1.0 / (1.0 + u[..., columns] ** value)
+    return u
+
+
+def _prepare_bimodal(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Pack bimodal Gaussians given as (left_mean, left_sigma, right_mean, right_sigma) rows."""
+    left_mean, left_sigma, right_mean, right_sigma = params.T
+    return left_mean, left_sigma, right_mean, right_sigma, left_mean <= right_mean
+
+
+def _bimodal_kernel(
+    x: np.ndarray,
+    left_mean: np.ndarray,
+    left_sigma: np.ndarray,
+    right_mean: np.ndarray,
+    right_sigma: np.ndarray,
+    ordered: np.ndarray,
+) -> np.ndarray:
+    """Evaluate packed bimodal Gaussians."""
+    z_left = (x - left_mean) / left_sigma
+    gauss_left = np.exp(-0.5 * z_left * z_left)
+    z_right = (x - right_mean) / right_sigma
+    gauss_right = np.exp(-0.5 * z_right * z_right)
+    plateau = np.where(x < left_mean, gauss_left, np.where(x > right_mean, gauss_right, 1.0))
+    return np.where(ordered, plateau, gauss_left * gauss_right)
+
+
+type _Packer = Callable[[MembershipFunction], tuple[float, ...]]
+type _Preparer = Callable[[np.ndarray], tuple[Any, ...]]
+type _Kernel = Callable[..., np.ndarray]
+
+# Exact membership function types that share a struct-of-arrays kernel; subclasses fall back to `evaluate`.
+_KERNELS: dict[type[MembershipFunction], tuple[str, _Packer, _Preparer, _Kernel]] = {
+    MFTriangular: ("linear", lambda mf: (mf.a, mf.b, mf.b, mf.c), _prepare_linear, _linear_kernel),
+    MFTrapezoidal: ("linear", lambda mf: (mf.a, mf.b, mf.c, mf.d), _prepare_linear, _linear_kernel),
+    MFGaussian: ("gaussian", lambda mf: (mf.mean, mf.sigma), _prepare_gaussian, _gaussian_kernel),
+    MFGeneralizedBell: ("bell", lambda mf: (mf.center, mf.width, 2.0 * mf.slope), _prepare_bell, _bell_kernel),
+    MFBimodalGaussian: (
+        "bimodal",
+        lambda mf: (mf.left_mean, mf.left_sigma, mf.right_mean, mf.right_sigma),
+        _prepare_bimodal,
+        _bimodal_kernel,
+    ),
+}
+
+
+class TermBank:
+    """Struct-of-arrays view of the fuzzy sets of a linguistic variable.
+
+    Terms sharing a kernel are packed into one parameter array (e.g. all triangles and trapezoids into
+    `a`/`b`/`c`/`d` columns, all Gaussians into `mean`/`sigma` columns), so a single NumPy expression per
+    kernel yields the membership of every input in every term of that kernel. Terms without a kernel are
+    evaluated through their own `evaluate`.
+
+    Attributes
+    ----------
+    terms : tuple[str, ...]
+        The terms in column order of `evaluate`.
+    index : dict[str, int]
+        Column of each term.
+
+    Methods
+    -------
+    evaluate(x)
+        Calculate the degrees of membership of `x` in every term.
+    evaluate_sparse(x)
+        Calculate the non-zero degrees of membership of `x`, evaluating each term only where it is positive.
+
+    """
+
+    __slots__ = ("_fallback", "_groups", "_mfs", "_positive", "index", "terms")
+
+    def __init__(self, fuzzy_sets: Mapping[str, MembershipFunction]) -> None:
+        """Pack the membership functions of `fuzzy_sets` by kernel."""
+        self.terms: tuple[str, ...] = tuple(fuzzy_sets)
+        self.index: dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+        self._mfs: tuple[MembershipFunction, ...] = tuple(fuzzy_sets.values())
+        self._positive: list[list[tuple[float, float]] | None] | None = None
+
+        packed: dict[str, tuple[_Preparer, _Kernel, list[int], list[tuple[float, ...]]]] = {}
+        self._fallback: list[tuple[int, MembershipFunction]] = []
+        for i, mf in enumerate(fuzzy_sets.values()):
+            if type(mf) not in _KERNELS:
+                self._fallback.append((i, mf))
+                continue
+            name, pack, prepare, kernel = _KERNELS[type(mf)]
+            columns, rows = packed.setdefault(name, (prepare, kernel, [], []))[2:]
+            columns.append(i)
+            rows.append(pack(mf))
+
+        self._groups: list[tuple[_Kernel, np.ndarray | slice, tuple[Any, ...]]] = []
+        for prepare, kernel, columns, rows in packed.values():
+            # Contiguous columns (the common single-kernel case) are written through a view instead of a scatter
+            contiguous = columns == list(range(columns[0], columns[-1] + 1))
+            index = slice(columns[0], columns[-1] + 1) if contiguous else np.array(columns, dtype=np.intp)
+            self._groups.append((kernel, index, prepare(np.array(rows, dtype=float))))
+
+    def __len__(self) -> int:
+        """Return the number of terms."""
+        return len(self.terms)
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate the degrees of membership of `x` in every term at once.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            Input values of any shape. Inputs are not validated.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `x.shape + (len(terms),)`; the last axis follows `terms`.
+
+        """
+        x = np.asarray(x, dtype=float)
+        column = x[..., np.newaxis]
+        if len(self._groups) == 1 and not self._fallback:
+            kernel, _, params = self._groups[0]
+            return kernel(column, *params)
+
+        out = np.empty(x.shape + (len(self.terms),))
+        for kernel, columns, params in self._groups:
+            out[..., columns] = kernel(column, *params)
+        for i, mf in self._fallback:
+            out[..., i] = mf.evaluate(x)
+        return out
+
+    def evaluate_sparse(self, x: npt.ArrayLike) -> "SparseMemberships":
+        """Calculate the non-zero degrees of membership of a one-dimensional array `x` in every term.
+
+        The inputs are sorted once; every term with a closed-form shape is then evaluated only on the inputs
+        within the open intervals where it is positive, found by binary search. Terms without a closed form
+        are evaluated on all inputs. The degrees equal those of `evaluate`.
+
+        Parameters
+        ----------
+        x : ArrayLike
+            One-dimensional input values. Inputs are not validated.
+
+        Returns
+        -------
+        SparseMemberships
+            The non-zero degrees in compressed sparse row layout, one row per input.
+
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim != 1:
+            raise ValueError(f"Sparse evaluation requires a one-dimensional input, got shape {x.shape}")
+        if self._positive is None:
+            self._positive = [mf._positive_set() for mf in self._mfs]
+        order = np.argsort(x, kind="stable")
+        ordered = x[order]
+
+        rows, values = [], []
+        for mf, intervals in zip(self._mfs, self._positive, strict=True):
+            if intervals is None:
+                candidates = np.arange(x.size)
+            else:
+                starts = np.searchsorted(ordered, [lo for lo, _ in intervals], side="right")
+                ends = np.searchsorted(ordered, [hi for _, hi in intervals], side="left")
+                candidates = np.concatenate(
+                    [order[start:end] for start, end in zip(starts, ends, strict=True)] or [order[:0]]
+                )
+            degrees = mf.evaluate(x[candidates])
+            nonzero = degrees != 0.0
+            rows.append(candidates[nonzero])
+            values.append(degrees[nonzero])
+
+        # Scatter the entries column by column, so the columns within each row come out in increasing order
+        indptr = np.zeros(x.size + 1, dtype=np.intp)
+        np.cumsum(np.bincount(np.concatenate(rows), minlength=x.size), out=indptr[1:])
+        data, indices = np.empty(indptr[-1]), np.empty(indptr[-1], dtype=np.intp)
+        fill = indptr[:-1].copy()
+        for column, (column_rows, column_values) in enumerate(zip(rows, values, strict=True)):
+            positions = fill[column_rows]
+            data[positions], indices[positions] = column_values, column
+            fill[column_rows] += 1
+        return SparseMemberships(data, indices, indptr, self.terms)
+
+
+class SparseMemberships:
+    """Degrees of membership of many inputs in the terms of a linguistic variable, in compressed sparse row layout.
+
+    Row `i` holds the non-zero degrees of input `i` in `data[indptr[i]:indptr[i + 1]]`, with the columns of the
+    corresponding terms in `indices[indptr[i]:indptr[i + 1]]`, in increasing order. The layout is that of
+    `scipy.sparse.csr_array((data, indices, indptr), shape=shape)`.
+
+    Attributes
+    ----------
+    data : np.ndarray
+        The non-zero degrees of membership.
+    indices : np.ndarray
+        Column (term index) of each degree.
+    indptr : np.ndarray
+        Start of each row in `data` and `indices`, plus the total count at the end.
+    terms : tuple[str, ...]
+        The terms in column order.
+
+    Methods
+    -------
+    toarray()
+        Expand into the dense `(n_samples, n_terms)` matrix.
+    row(i)
+        The non-zero degrees of input `i` as a mapping of terms to degrees.
+
+    """
+
+    __slots__ = ("data", "indices", "indptr", "terms")
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, terms: tuple[str, ...]) -> None:
+        """Wrap the compressed sparse row arrays."""
+        self.data, self.indices, self.indptr, self.terms = data, indices, indptr, terms
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray, terms: tuple[str, ...]) -> "SparseMemberships":
+        """Compress the non-zero entries of a dense `(n_samples, n_terms)` matrix."""
+        rows, indices = np.nonzero(matrix)
+        indptr = np.zeros(matrix.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=matrix.shape[0]), out=indptr[1:])
+        return cls(matrix[rows, indices], indices, indptr, terms)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape `(n_samples, n_terms)` of the dense matrix."""
+        return (self.indptr.size - 1, len(self.terms))
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (non-zero) degrees."""
+        return self.data.size
+
+    def toarray(self) -> np.ndarray:
+        """Expand into the dense `(n_samples, n_terms)` matrix."""
+        dense = np.zeros(self.shape)
+        dense[np.repeat(np.arange(self.shape[0]), np.diff(self.indptr)), self.indices] = self.data
+        return dense
+
+    def row(self, i: int) -> dict[str, float]:
+        """Return the non-zero degrees of input `i`, keyed by term."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return {
+            self.terms[j]: degree
+            for j, degree in zip(self.indices[start:end].tolist(), self.data[start:end].tolist(), strict=True)
+        }
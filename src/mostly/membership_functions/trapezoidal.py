@@ -1,8 +1,12 @@
+from collections.abc import Callable
 from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import Field, FiniteFloat, computed_field, model_validator, validate_call
 
-from .base import MembershipFunction
+from ._shapes import Implication, Piece, linear_pieces
+from .base import Interval, MembershipFunction
 
 
 class MFTrapezoidal(MembershipFunction):
@@ -26,6 +30,12 @@ class MFTrapezoidal(MembershipFunction):
     -------
     __call__
         Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x`.
+    support, core, alpha_cut
+        Closed-form intervals of the trapezoid; shoulders extend to ±inf.
+    area, moment
+        Exact area and first moment of the clipped or scaled trapezoid (piecewise polynomials).
 
     Raises
     ------
@@ -81,3 +91,81 @@ class MFTrapezoidal(MembershipFunction):
                 return max(min((x - self.a) / (self.b - self.a), 1.0, (self.d - x) / (self.d - self.c)), 0.0)
             case _:  # pragma: no cover
                 raise RuntimeError(f"Unexpected trapezoid shape: {self.shape}")
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        x = np.asarray(x, dtype=float)
+        match self.shape:
+            case "left":
+                falling = np.maximum(np.minimum((self.d - x) / (self.d - self.c), 1.0), 0.0)
+                return np.where(x <= self.a, 1.0, falling)
+            case "right":
+                rising = np.maximum(np.minimum((x - self.a) / (self.b - self.a), 1.0), 0.0)
+                return np.where(x >= self.d, 1.0, rising)
+            case "regular":
+                rising = (x - self.a) / (self.b - self.a)
+                falling = (self.d - x) / (self.d - self.c)
+                inner = np.maximum(np.minimum(np.minimum(rising, 1.0), falling), 0.0)
+                return np.where((x <= self.a) | (x >= self.d), 0.0, inner)
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected trapezoid shape: {self.shape}")
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a shape-specialised scalar evaluator with precomputed edge widths."""
+        a, b, c, d = self.a, self.b, self.c, self.d
+        match self.shape:
+            case "left":
+                fall = d - c
+
+                def trusted(x: float) -> float:
+                    if x <= a:
+                        return 1.0
+                    mu = (d - x) / fall
+                    return 1.0 if mu >= 1.0 else mu if mu > 0.0 else 0.0
+
+            case "right":
+                rise = b - a
+
+                def trusted(x: float) -> float:
+                    if x >= d:
+                        return 1.0
+                    mu = (x - a) / rise
+                    return 1.0 if mu >= 1.0 else mu if mu > 0.0 else 0.0
+
+            case "regular":
+                rise, fall = b - a, d - c
+
+                def trusted(x: float) -> float:
+                    if x <= a or x >= d:
+                        return 0.0
+                    if x < b:
+                        return (x - a) / rise
+                    if x > c:
+                        return (d - x) / fall
+                    return 1.0
+
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected trapezoid shape: {self.shape}")
+        return trusted
+
+    def _level_interval(self, level: float) -> Interval:
+        """Closed-form level set; the feet move linearly towards the plateau with `level`."""
+        left = -np.inf if self.shape == "left" else self.a + level * (self.b - self.a)
+        right = np.inf if self.shape == "right" else self.d - level * (self.d - self.c)
+        return (left, right)
+
+    def _knots(self) -> tuple[list[float], list[float]]:
+        """Return the knots of the trapezoid; a shoulder is the constant extension of its first or last knot."""
+        match self.shape:
+            case "left":
+                return [self.c, self.d], [1.0, 0.0]
+            case "right":
+                return [self.a, self.b], [0.0, 1.0]
+            case "regular":
+                return [self.a, self.b, self.c, self.d], [0.0, 1.0, 1.0, 0.0]
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected trapezoid shape: {self.shape}")
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied trapezoid as linear pieces."""
+        return linear_pieces(*self._knots(), alpha, implication)
@@ -1,8 +1,12 @@
+from collections.abc import Callable
 from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import Field, FiniteFloat, computed_field, model_validator, validate_call
 
-from .base import MembershipFunction
+from ._shapes import Implication, Piece, linear_pieces
+from .base import Interval, MembershipFunction
 
 
 class MFTriangular(MembershipFunction):
@@ -26,6 +30,12 @@ class MFTriangular(MembershipFunction):
     -------
     __call__
         Calculates the degree of membership for the input `x`.
+    evaluate
+        Calculates the degrees of membership for an array of inputs `x`.
+    support, core, alpha_cut
+        Closed-form intervals of the triangle; shoulders extend to ±inf.
+    area, moment
+        Exact area and first moment of the clipped or scaled triangle (piecewise polynomials).
 
     Raises
     ------
@@ -71,3 +81,74 @@ class MFTriangular(MembershipFunction):
                 return max(min((x - self.a) / (self.c - self.a), 1), 0)
             case _:  # pragma: no cover
                 raise RuntimeError(f"Unexpected triangle shape: {self.shape}")
+
+    def evaluate(self, x: npt.ArrayLike) -> np.ndarray:
+        """Calculate degrees of Membership for an array of inputs `x`."""
+        x = np.asarray(x, dtype=float)
+        match self.shape:
+            case "regular":
+                return np.maximum(np.minimum((x - self.a) / (self.b - self.a), (self.c - x) / (self.c - self.b)), 0.0)
+            case "left":
+                return np.maximum(np.minimum((self.c - x) / (self.c - self.a), 1.0), 0.0)
+            case "right":
+                return np.maximum(np.minimum((x - self.a) / (self.c - self.a), 1.0), 0.0)
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected triangle shape: {self.shape}")
+
+    def _compile_trusted(self) -> Callable[[float], float]:
+        """Build a shape-specialised scalar evaluator with precomputed edge widths."""
+        a, b, c = self.a, self.b, self.c
+        match self.shape:
+            case "regular":
+                rise, fall = b - a, c - b
+
+                def trusted(x: float) -> float:
+                    up, down = (x - a) / rise, (c - x) / fall
+                    mu = up if up < down else down
+                    return mu if mu > 0.0 else 0.0
+
+            case "left":
+                width = c - a
+
+                def trusted(x: float) -> float:
+                    mu = (c - x) / width
+                    return 1.0 if mu >= 1.0 else mu if mu > 0.0 else 0.0
+
+            case "right":
+                width = c - a
+
+                def trusted(x: float) -> float:
+                    mu = (x - a) / width
+                    return 1.0 if mu >= 1.0 else mu if mu > 0.0 else 0.0
+
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected triangle shape: {self.shape}")
+        return trusted
+
+    def _level_interval(self, level: float) -> Interval:
+        """Closed-form level set; the feet move inwards linearly with `level`."""
+        match self.shape:
+            case "regular":
+                return (self.a + level * (self.b - self.a), self.c - level * (self.c - self.b))
+            case "left":
+                return (-np.inf, self.c - level * (self.c - self.a))
+            case "right":
+                return (self.a + level * (self.c - self.a), np.inf)
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected triangle shape: {self.shape}")
+
+    def _knots(self) -> tuple[list[float], list[float]]:
+        """Return the knots of the triangle; a shoulder is the constant extension of its first or last knot."""
+        match self.shape:
+            case "regular":
+                return [self.a, self.b, self.c], [0.0, 1.0, 0.0]
+            case "left":
+                return [self.a, self.c], [1.0, 0.0]
+            case "right":
+                return [self.a, self.c], [0.0, 1.0]
+            case _:  # pragma: no cover
+                raise RuntimeError(f"Unexpected triangle shape: {self.shape}")
+
+    def _pieces(self, alpha: float, implication: Implication) -> list[Piece]:
+        """Return the implied triangle as linear pieces."""
+        return linear_pieces(*self._knots(), alpha, implication)
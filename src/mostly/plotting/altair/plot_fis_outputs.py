@@ -11,11 +11,13 @@ def plot_inference_outputs(
     """Plot the aggregated outputs of the fuzzy inference system."""
     fuzzified_inputs = fis._fuzzification(crisp_inputs)
     rule_strengths = fis._rule_evaluation(fuzzified_inputs)
+    table_firings = fis._table_evaluation(fuzzified_inputs, fis.inference_config.aggregation)
     aggregated_outputs = fis._aggregation(
         rule_strengths,
         fis.inference_config.resolution,
         fis.inference_config.aggregation,
         fis.inference_config.implication,
+        table_firings,
     )
     defuzzified_outputs = fis._defuzzification(
         aggregated_outputs,
@@ -24,7 +24,11 @@ def plot_fuzzy_set(
 
     """
     x_vals = np.linspace(*uod, resolution)
-    y_vals = [mf(x) for x in x_vals]
+    # Only the support needs evaluating; the membership is zero everywhere else
+    y_vals = np.zeros_like(x_vals)
+    if (support := mf.support()) is not None:
+        active = (x_vals >= support[0]) & (x_vals <= support[1])
+        y_vals[active] = mf.evaluate(x_vals[active])
     plot_data = pd.DataFrame(
         {
             "x": x_vals,
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.mostly.linguistic_variable import LinguisticVariable
@@ -105,6 +107,27 @@ def regular_generalized_bell_mf() -> "MFGeneralizedBell":
     return MFGeneralizedBell(width=2.0, slope=4.0, center=5.0)
 
 
+# region FIXTURES ALL MF
+@pytest.fixture(
+    params=[
+        "regular_triangular_mf",
+        "left_triangular_mf",
+        "right_triangular_mf",
+        "regular_trapezoidal_mf",
+        "triangular_trapezoidal_mf",
+        "left_trapezoidal_triangular_mf",
+        "right_trapezoidal_triangular_mf",
+        "regular_gaussian_mf",
+        "regular_bimodal_gaussian_mf",
+        "inverted_bimodal_gaussian_mf",
+        "regular_generalized_bell_mf",
+    ]
+)
+def mf(request: pytest.FixtureRequest) -> MembershipFunction:
+    """Fixture that returns each of the membership function fixtures above in turn."""
+    return request.getfixturevalue(request.param)
+
+
 # region FIXTURES LINGUISTIC VARIABLE
 @pytest.fixture
 def simple_linguistic_variable() -> "LinguisticVariable":
@@ -119,3 +142,24 @@ def simple_linguistic_variable() -> "LinguisticVariable":
         },
     )
     return lv
+
+
+@pytest.fixture
+def make_level_variable() -> Callable[..., LinguisticVariable]:
+    """Fixture that returns a factory of variables with the terms low, mid and high over (0, 10).
+
+    The terms are triangles, or with `mixed` a triangle, a gaussian and a trapezoid.
+    """
+
+    def make(concept: str, mixed: bool = False) -> LinguisticVariable:
+        return LinguisticVariable(
+            concept=concept,
+            uod=(0.0, 10.0),
+            fuzzy_sets={
+                "low": MFTriangular(a=0.0, b=0.0, c=5.0),
+                "mid": MFGaussian(mean=5.0, sigma=1.5) if mixed else MFTriangular(a=0.0, b=5.0, c=10.0),
+                "high": MFTrapezoidal(a=5.0, b=8.0, c=10.0, d=10.0) if mixed else MFTriangular(a=5.0, b=10.0, c=10.0),
+            },
+        )
+
+    return make
@@ -0,0 +1,182 @@
+import io
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.mostly.formats import read_fcl, write_fcl
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is, Not, Or
+from src.mostly.fuzzy_rules.rule_table import RuleTable
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions import (
+    MFBimodalGaussian,
+    MFGaussian,
+    MFPiecewiseLinear,
+    MFTrapezoidal,
+)
+
+TIPPER = """\
+(* The classic tipping problem *)
+FUNCTION_BLOCK tipper
+VAR_INPUT
+    service : REAL;  // quality of the service
+    food : REAL;
+END_VAR
+VAR_OUTPUT
+    tip : REAL;
+END_VAR
+FUZZIFY service
+    TERM poor := (0, 1) (4, 0);
+    TERM good := TRAPE 2 6 10 10;
+    RANGE := (0 .. 10);
+END_FUZZIFY
+FUZZIFY food
+    TERM rancid := (0, 1) (1, 1) (3, 0);
+    TERM delicious := (2, 0) (9, 1) (10, 1);
+END_FUZZIFY
+DEFUZZIFY tip
+    TERM cheap := (0, 0) (5, 1) (10, 0);
+    TERM generous := GAUSS 20 4;
+    METHOD : COG;
+    DEFAULT := 0;
+    RANGE := (0 .. 30);
+END_DEFUZZIFY
+RULEBLOCK tipping
+    AND : MIN;
+    OR : MAX;
+    ACT : PROD;
+    ACCU : SUM;
+    RULE 1 : IF service IS poor OR food IS rancid THEN tip IS cheap;
+    RULE 2 : IF service IS NOT poor
+             AND food IS delicious (* spans two lines *)
+             THEN tip IS generous WITH 0.5;
+END_RULEBLOCK
+END_FUNCTION_BLOCK
+"""
+
+
+@pytest.fixture
+def fis(make_level_variable: Callable[..., LinguisticVariable]) -> MamdaniFIS:
+    """Fixture that returns a FIS with negated, disjunctive and weighted rules."""
+    rules = [
+        FuzzyRule.parse(text)
+        for text in [
+            "IF (x IS low) AND NOT (y IS mid) THEN (z IS high)",
+            "IF (x IS high) OR ((x IS mid) AND (y IS low)) THEN (z IS low) [weight: 0.5]",
+            "IF NOT ((x IS mid) OR (y IS high)) THEN (z IS mid)",
+        ]
+    ]
+    return MamdaniFIS(
+        input_variables={"x": make_level_variable("x", mixed=True), "y": make_level_variable("y", mixed=True)},
+        output_variables={"z": make_level_variable("z", mixed=True)},
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(implication="scale", aggregation="sum"),
+        meta_fields={"name": "demo"},
+    )
+
+
+def round_trip(fis: MamdaniFIS) -> MamdaniFIS:
+    """Write a FIS to FCL text and read it back."""
+    stream = io.StringIO()
+    write_fcl(fis, stream)
+    return read_fcl(io.StringIO(stream.getvalue()))
+
+
+# region POSITIVE TESTS
+
+
+def test_read_fcl() -> None:
+    """Test that comments, multi-line rules, negations, weights, shapes, operators and a missing range are read."""
+    fis = read_fcl(io.StringIO(TIPPER))
+
+    assert fis.meta_fields == {"name": "tipper"}
+    assert fis.inference_config == InferenceConfig(implication="scale", aggregation="sum")
+    assert fis.input_variables["service"].fuzzy_sets["good"] == MFTrapezoidal(a=2.0, b=6.0, c=10.0, d=10.0)
+    assert isinstance(fis.input_variables["service"].fuzzy_sets["poor"], MFPiecewiseLinear)
+    assert fis.input_variables["food"].uod == (0.0, 10.0)
+    assert fis.output_variables["tip"].fuzzy_sets["generous"] == MFGaussian(mean=20.0, sigma=4.0)
+    assert fis.fuzzy_rules[0].antecedent == Or(
+        children=[Is(concept="service", term="poor"), Is(concept="food", term="rancid")]
+    )
+    assert fis.fuzzy_rules[1].antecedent == And(
+        children=[Not(Is(concept="service", term="poor")), Is(concept="food", term="delicious")]
+    )
+    assert fis.fuzzy_rules[1].consequences == {"tip": "generous"}
+    assert fis.fuzzy_rules[1].weight == 0.5
+
+
+def test_read_fcl_from_path(tmp_path) -> None:
+    """Test that paths are read as UTF-8 files."""
+    path = tmp_path / "tipper.fcl"
+    path.write_text(TIPPER, encoding="utf-8")
+
+    assert len(read_fcl(path).fuzzy_rules) == 2
+    assert len(read_fcl(str(path)).fuzzy_rules) == 2
+
+
+def test_fcl_round_trip(fis: MamdaniFIS) -> None:
+    """Test that a written FIS reads back with the same rules, configuration and inferences."""
+    back = round_trip(fis)
+
+    assert back.fuzzy_rules == fis.fuzzy_rules
+    assert back.inference_config == fis.inference_config
+    assert back.meta_fields == fis.meta_fields
+    for x in np.linspace(0.0, 10.0, 7):
+        for y in np.linspace(0.0, 10.0, 7):
+            assert back.infer({"x": x, "y": y})["z"] == pytest.approx(fis.infer({"x": x, "y": y})["z"])
+
+
+def test_fcl_shares_conditions_of_conjunctive_rules() -> None:
+    """Test that plain conjunctive rules share one node per distinct condition."""
+    text = TIPPER.replace(
+        "END_RULEBLOCK",
+        "RULE 3 : IF service IS good AND food IS rancid THEN tip IS cheap;\n"
+        "RULE 4 : IF service IS good AND food IS delicious THEN tip IS generous;\nEND_RULEBLOCK",
+    )
+    rules = read_fcl(io.StringIO(text)).fuzzy_rules
+
+    assert rules[2].antecedent.children[0] is rules[3].antecedent.children[0]
+    assert rules[3].antecedent == And(
+        children=[Is(concept="service", term="good"), Is(concept="food", term="delicious")]
+    )
+
+
+def test_write_fcl_rule_tables(fis: MamdaniFIS) -> None:
+    """Test that the rules of rule tables are written after the fuzzy rules."""
+    fis.rule_tables.append(RuleTable(inputs=("y",), output="z", consequents=[2, -1, 0]))
+
+    assert len(round_trip(fis).fuzzy_rules) == len(fis.fuzzy_rules) + 2
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "old, new, match",
+    [
+        ("food IS rancid THEN", "food IS stale THEN", "Line 31: unknown term 'stale' of 'food'"),
+        ("tip IS cheap;", "tip IS free;", "Line 31: unknown output term 'free' of 'tip'"),
+        ("ACCU : SUM;", "ACCU : BSUM;", "Line 30: unsupported ACCU method 'BSUM'"),
+        ("AND : MIN;", "AND : PROD;", "Line 27: unsupported AND method 'PROD'"),
+        ("TRAPE 2 6 10 10", "TRIAN 2 6", "Line 12: invalid term 'good' of 'service': TRIAN takes 3"),
+        ("(0 .. 10);\nEND_FUZZIFY\nFUZZIFY food", "(0 .. 12);\nEND_FUZZIFY\nFUZZIFY food", "Line 12: .*vertical edge"),
+        ("    food : REAL;\n", "    food : REAL;\n    drink : REAL;\n", "variable 'drink' has no terms"),
+    ],
+)
+def test_invalid_fcl_raises(old: str, new: str, match: str) -> None:
+    """Test that unknown names, unsupported operators and invalid terms or variables are reported by line."""
+    assert old in TIPPER
+    with pytest.raises(ValueError, match=match):
+        read_fcl(io.StringIO(TIPPER.replace(old, new, 1)))
+
+
+def test_write_fcl_unsupported_shape_raises(fis: MamdaniFIS) -> None:
+    """Test that terms without an FCL equivalent are rejected."""
+    fis.output_variables["z"].fuzzy_sets["mid"] = MFBimodalGaussian(
+        left_mean=4.0, left_sigma=1.0, right_mean=6.0, right_sigma=1.0
+    )
+
+    with pytest.raises(ValueError, match="MFBimodalGaussian has no FCL equivalent"):
+        write_fcl(fis, io.StringIO())
@@ -0,0 +1,192 @@
+import io
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.mostly.formats import read_fis, write_fis
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is, Not, Or
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions import (
+    MFBimodalGaussian,
+    MFGaussian,
+    MFGeneralizedBell,
+    MFPiecewiseLinear,
+    MFTrapezoidal,
+    MFTriangular,
+)
+
+TIPPER = """\
+[System]
+Name='tipper'
+Type='mamdani'
+Version=2.0
+NumInputs=2
+NumOutputs=1
+NumRules=3
+AndMethod='min'
+OrMethod='max'
+ImpMethod='prod'
+AggMethod='probor'
+DefuzzMethod='centroid'
+
+[Input1]
+Name='service'
+Range=[0 10]
+NumMFs=2
+MF1='poor':'gaussmf',[1.5 0]
+MF2='good':'trapmf',[2 6 10 10]
+
+[Input2]
+Name='food'
+Range=[0 10]
+NumMFs=2
+MF1='rancid':'trimf',[0 0 6]
+MF2='delicious':'gbellmf',[3 2 10]
+
+[Output1]
+Name='tip'
+Range=[0 30]
+NumMFs=2
+MF1='cheap':'trimf',[0 5 10]
+MF2='generous':'gauss2mf',[3 15 3 25]
+
+[Rules]
+1 1, 1 (1) : 2
+-1 2, 2 (0.5) : 1
+0 2, 2 (1) : 1
+"""
+
+
+@pytest.fixture
+def fis(make_level_variable: Callable[..., LinguisticVariable]) -> MamdaniFIS:
+    """Fixture that returns a FIS with negated, disjunctive and weighted rules."""
+    rules = [
+        FuzzyRule.parse(text)
+        for text in [
+            "IF (x IS low) AND NOT (y IS mid) THEN (z IS high)",
+            "IF (x IS high) OR (y IS low) THEN (z IS low) [weight: 0.5]",
+            "IF (y IS mid) THEN (z IS mid) AND (w IS low)",
+        ]
+    ]
+    return MamdaniFIS(
+        input_variables={"x": make_level_variable("x", mixed=True), "y": make_level_variable("y", mixed=True)},
+        output_variables={"z": make_level_variable("z", mixed=True), "w": make_level_variable("w", mixed=True)},
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(implication="scale", aggregation="sum"),
+        meta_fields={"name": "demo"},
+    )
+
+
+def round_trip(fis: MamdaniFIS) -> MamdaniFIS:
+    """Write a FIS to `.fis` text and read it back."""
+    stream = io.StringIO()
+    write_fis(fis, stream)
+    return read_fis(io.StringIO(stream.getvalue()))
+
+
+# region POSITIVE TESTS
+
+
+def test_read_fis() -> None:
+    """Test that variables, membership functions, methods and signed, disjunctive and weighted rules are read."""
+    fis = read_fis(io.StringIO(TIPPER))
+
+    assert fis.meta_fields == {"name": "tipper"}
+    assert fis.inference_config == InferenceConfig(implication="scale", aggregation="probor")
+    service, food = fis.input_variables["service"], fis.input_variables["food"]
+    assert service.fuzzy_sets["poor"] == MFGaussian(mean=0.0, sigma=1.5)
+    assert service.fuzzy_sets["good"] == MFTrapezoidal(a=2.0, b=6.0, c=10.0, d=10.0)
+    assert food.fuzzy_sets["delicious"] == MFGeneralizedBell(width=3.0, slope=2.0, center=10.0)
+    assert fis.output_variables["tip"].fuzzy_sets["generous"] == MFBimodalGaussian(
+        left_mean=15.0, left_sigma=3.0, right_mean=25.0, right_sigma=3.0
+    )
+    assert fis.fuzzy_rules[0].antecedent == Or(
+        children=[Is(concept="service", term="poor"), Is(concept="food", term="rancid")]
+    )
+    assert fis.fuzzy_rules[1].antecedent == And(
+        children=[Not(Is(concept="service", term="poor")), Is(concept="food", term="delicious")]
+    )
+    assert fis.fuzzy_rules[1].weight == 0.5
+    assert fis.fuzzy_rules[2].antecedent == Is(concept="food", term="delicious")
+    assert fis.fuzzy_rules[2].consequences == {"tip": "generous"}
+
+
+def test_read_fis_shares_conditions() -> None:
+    """Test that rules share one node per distinct condition."""
+    rules = read_fis(io.StringIO(TIPPER)).fuzzy_rules
+
+    assert rules[1].antecedent.children[1] is rules[2].antecedent
+
+
+def test_fis_round_trip(fis: MamdaniFIS) -> None:
+    """Test that a written FIS reads back with the same rules, configuration and inferences."""
+    back = round_trip(fis)
+
+    assert back.fuzzy_rules == fis.fuzzy_rules
+    assert back.inference_config == fis.inference_config
+    assert back.meta_fields == fis.meta_fields
+    for x in np.linspace(0.0, 10.0, 7):
+        for y in np.linspace(0.0, 10.0, 7):
+            expected = fis.infer({"x": x, "y": y})
+            for concept, value in back.infer({"x": x, "y": y}).items():
+                assert value == pytest.approx(expected[concept])
+
+
+def test_write_fis_shoulders_and_piecewise_shapes(fis: MamdaniFIS) -> None:
+    """Test that shoulders become trapezoids up to the range and piecewise triangles become triangles."""
+    fis.input_variables["x"].fuzzy_sets["low"] = MFPiecewiseLinear(xs=(0.0, 2.0, 5.0), ys=(0.0, 1.0, 0.0))
+    fis.input_variables["x"].fuzzy_sets["high"] = MFTriangular(a=5.0, b=10.0, c=10.0)
+
+    back = round_trip(fis)
+
+    assert back.input_variables["x"].fuzzy_sets["low"] == MFTriangular(a=0.0, b=2.0, c=5.0)
+    assert back.input_variables["x"].fuzzy_sets["high"] == MFTriangular(a=5.0, b=10.0, c=10.0)
+    assert back.input_variables["y"].fuzzy_sets["low"] == MFTriangular(a=0.0, b=0.0, c=5.0)
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "old, new, match",
+    [
+        ("Type='mamdani'", "Type='sugeno'", "Only Mamdani systems are supported"),
+        ("AndMethod='min'", "AndMethod='prod'", "Unsupported AndMethod='prod'"),
+        ("DefuzzMethod='centroid'", "DefuzzMethod='bisector'", "Unsupported DefuzzMethod='bisector'"),
+        ("'gbellmf',[3 2 10]", "'sigmf',[3 2]", "Line 26: invalid term 'delicious' of 'food': unsupported"),
+        ("'trimf',[0 0 6]", "'trimf',[0 6]", "Line 25: .*trimf takes 3 parameters"),
+        ("Range=[0 10]", "Range=[0 ten]", "Line 16"),
+        ("-1 2, 2 (0.5) : 1", "-1 3, 2 (0.5) : 1", "Line 37: 'food' has no term 3"),
+        ("-1 2, 2 (0.5) : 1", "-1 2, -2 (0.5) : 1", "Line 37: negated consequences"),
+        ("-1 2, 2 (0.5) : 1", "-1 2, 2 (0.5) : 3", "Line 37: the connective must be"),
+        ("-1 2, 2 (0.5) : 1", "-1, 2 (0.5) : 1", "Line 37: expected 2 input term indices"),
+        ("-1 2, 2 (0.5) : 1", "-1 2, 2 (nan) : 1", "Line 37: expected a finite weight, got 'nan'"),
+        ("-1 2, 2 (0.5) : 1", "-1 2, 2 (inf) : 1", "Line 37: expected a finite weight, got 'inf'"),
+        ("-1 2, 2 (0.5) : 1", "-1 2, 2 (half) : 1", "Line 37: expected a finite weight, got 'half'"),
+        ("[Rules]", "[Rules]\n1 1, 1 (1) : 1\n[Input3]", "must be the last section"),
+    ],
+)
+def test_invalid_fis_raises(old: str, new: str, match: str) -> None:
+    """Test that unsupported systems, methods and membership functions and invalid rules are reported."""
+    assert old in TIPPER
+    with pytest.raises(ValueError, match=match):
+        read_fis(io.StringIO(TIPPER.replace(old, new, 1)))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "IF ((x IS low) AND (y IS mid)) OR (x IS high) THEN (z IS high)",
+        "IF (x IS low) AND (x IS mid) THEN (z IS high)",
+        "IF NOT ((x IS low) AND (y IS mid)) THEN (z IS high)",
+    ],
+)
+def test_write_fis_inexpressible_rule_raises(fis: MamdaniFIS, text: str) -> None:
+    """Test that rules that are not a flat conjunction or disjunction of distinct concepts are rejected."""
+    fis.fuzzy_rules.append(FuzzyRule.parse(text))
+
+    with pytest.raises(ValueError, match="Rule 3"):
+        write_fis(fis, io.StringIO())
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.fuzzy_number import FuzzyNumber
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+@pytest.fixture
+def about_two() -> FuzzyNumber:
+    """Fixture that returns the triangular fuzzy number (1, 2, 3)."""
+    return FuzzyNumber.from_membership_function(MFTriangular(a=1.0, b=2.0, c=3.0), levels=5)
+
+
+@pytest.fixture
+def about_four() -> FuzzyNumber:
+    """Fixture that returns the triangular fuzzy number (2, 4, 5)."""
+    return FuzzyNumber.from_membership_function(MFTriangular(a=2.0, b=4.0, c=5.0), levels=5)
+
+
+def sampled_extension(first: MFTriangular, second: MFTriangular, operation, alpha: float) -> tuple[float, float]:
+    """Apply the extension principle by brute force: the operation over a grid of both alpha-cuts."""
+    x = np.linspace(*first.alpha_cut(alpha), 401)[:, np.newaxis]
+    y = np.linspace(*second.alpha_cut(alpha), 401)[np.newaxis, :]
+    values = operation(x, y)
+    return float(values.min()), float(values.max())
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        pytest.param(lambda x, y: x + y, id="add"),
+        pytest.param(lambda x, y: x - y, id="subtract"),
+        pytest.param(lambda x, y: x * y, id="multiply"),
+        pytest.param(lambda x, y: x / y, id="divide"),
+        pytest.param(np.minimum, id="minimum"),
+        pytest.param(np.maximum, id="maximum"),
+    ],
+)
+def test_operations_follow_extension_principle(operation) -> None:
+    """Test every operation against a brute-force extension principle, including cuts with negative ends."""
+    first, second = MFTriangular(a=-2.0, b=1.0, c=3.0), MFTriangular(a=1.0, b=2.0, c=5.0)
+    x, y = FuzzyNumber.from_membership_function(first), FuzzyNumber.from_membership_function(second)
+    method = {np.minimum: x.minimum, np.maximum: x.maximum}.get(operation)
+
+    result = method(y) if method else operation(x, y)
+
+    for i, alpha in enumerate(x.levels[1:], start=1):
+        expected = sampled_extension(first, second, operation, alpha)
+        assert (result.lower[i], result.upper[i]) == pytest.approx(expected)
+
+
+def test_addition_of_triangles_is_triangle(about_two: FuzzyNumber, about_four: FuzzyNumber) -> None:
+    """Test that the sum of triangular fuzzy numbers is the triangle of the summed parameters."""
+    total = (about_two + about_four).to_membership_function()
+
+    assert total.xs == pytest.approx((3.0, 3.75, 4.5, 5.25, 6.0, 6.5, 7.0, 7.5, 8.0))
+    assert total.support() == (3.0, 8.0)
+    assert total.core() == (6.0, 6.0)
+
+
+def test_crisp_operands_broadcast(about_two: FuzzyNumber) -> None:
+    """Test that crisp scalars and arrays act as degenerate fuzzy numbers on either side."""
+    assert 2.0 * about_two == about_two + about_two
+    assert 1.0 - about_two == -(about_two - 1.0)
+    assert about_two / 2.0 == about_two * 0.5
+
+    shifted = np.array([0.0, 10.0, 20.0]) + about_two
+
+    assert shifted.shape == (3,)
+    assert shifted[1] == about_two + 10.0
+    assert FuzzyNumber.crisp([0.0, 10.0, 20.0], about_two.levels) + about_two == shifted
+
+
+def test_batches_are_element_wise(about_two: FuzzyNumber, about_four: FuzzyNumber) -> None:
+    """Test that operations on stacked batches equal the operations on their members."""
+    batch = FuzzyNumber.stack([about_two, about_four, -about_two])
+
+    product = batch * batch[::-1]
+
+    assert len(product) == 3
+    assert product[0] == about_two * -about_two
+    assert product[1] == about_four * about_four
+    np.testing.assert_array_equal(product.alpha_cut(1.0)[0], [-4.0, 16.0, -4.0])
+
+
+def test_alpha_cut_interpolates(about_two: FuzzyNumber) -> None:
+    """Test that cuts between the stored levels are interpolated."""
+    lower, upper = about_two.alpha_cut(0.3)
+
+    assert (lower, upper) == pytest.approx((1.3, 2.7))
+    assert about_two.alpha_cut(0.0) == (1.0, 3.0)
+
+
+def test_gaussian_fuzzy_number() -> None:
+    """Test that Gaussian-shaped numbers take their underflow-truncated support at level 0."""
+    number = FuzzyNumber.from_membership_function(MFGaussian(mean=1.0, sigma=2.0))
+
+    assert (number.lower[0], number.upper[0]) == MFGaussian(mean=1.0, sigma=2.0).support()
+    assert number.alpha_cut(1.0) == (1.0, 1.0)
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "levels, lower, upper",
+    [
+        ([0.0, 0.5], [0.0, 1.0], [2.0, 1.0]),
+        ([0.5, 0.0, 1.0], [0.0, 0.5, 1.0], [2.0, 1.5, 1.0]),
+        ([0.0, 1.0], [0.0, 1.0, 1.0], [2.0, 1.0, 1.0]),
+        ([0.0, 1.0], [0.0, 1.0], [0.5, 0.5]),
+        ([0.0, 0.5, 1.0], [0.0, -0.5, 1.0], [2.0, 1.5, 1.0]),
+        ([0.0, 1.0], [-np.inf, 1.0], [2.0, 1.0]),
+    ],
+    ids=["not normal", "unordered levels", "wrong length", "empty cut", "not nested", "infinite"],
+)
+def test_malformed_cuts_raise(levels, lower, upper) -> None:
+    """Test that malformed levels and alpha-cuts are rejected."""
+    with pytest.raises(ValidationError):
+        FuzzyNumber(levels=levels, lower=lower, upper=upper)
+
+
+def test_shoulder_is_not_a_fuzzy_number() -> None:
+    """Test that membership functions with an unbounded support are rejected."""
+    with pytest.raises(ValueError, match="unbounded"):
+        FuzzyNumber.from_membership_function(MFTriangular(a=0.0, b=0.0, c=1.0))
+
+
+def test_division_by_zero_raises(about_two: FuzzyNumber) -> None:
+    """Test that dividing by a fuzzy number around zero is rejected."""
+    with pytest.raises(ValueError, match="contains zero"):
+        about_two / (about_two - 2.0)
+
+
+def test_mismatched_levels_raise(about_two: FuzzyNumber) -> None:
+    """Test that fuzzy numbers with different levels cannot be combined."""
+    other = FuzzyNumber.from_membership_function(MFTriangular(a=1.0, b=2.0, c=3.0), levels=3)
+
+    with pytest.raises(ValueError, match="same levels"):
+        about_two + other
@@ -0,0 +1,141 @@
+import itertools
+from collections.abc import Callable
+
+import pytest
+
+from src.mostly.fuzzy_rules.analysis import analyze_rules
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is, Not, Or
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+def cond(concept: str, term: str) -> Is:
+    """Return the condition `concept IS term`."""
+    return Is(concept=concept, term=term)
+
+
+def rule(antecedent, term: str, weight: float = 1.0) -> FuzzyRule:
+    """Return a rule with the given antecedent concluding `z IS term`."""
+    return FuzzyRule(antecedent=antecedent, consequences={"z": term}, weight=weight)
+
+
+@pytest.fixture
+def rules() -> list[FuzzyRule]:
+    """Fixture that returns a rule base with one rule of every kind the analyzer finds."""
+    return [
+        rule(And(children=[cond("x", "low"), cond("y", "mid")]), "low"),  # 0: kept
+        rule(And(children=[cond("y", "mid"), cond("x", "low")]), "low", 0.5),  # 1: duplicate of 0
+        rule(And(children=[cond("x", "low"), cond("x", "high")]), "mid"),  # 2: never fires
+        rule(cond("x", "mid"), "high", 0.0),  # 3: zero weight
+        # 4: subsumed by 0
+        rule(And(children=[cond("x", "low"), And(children=[cond("y", "mid"), cond("y", "low")])]), "low"),
+        rule(cond("x", "mid"), "high"),  # 5: kept
+        rule(And(children=[cond("x", "mid"), cond("y", "high")]), "high", 2.0),  # 6: kept, stronger than 5
+        rule(And(children=[cond("x", "mid"), cond("y", "high")]), "mid", 0.5),  # 7: kept, other consequence
+        rule(Or(children=[cond("x", "low"), cond("w", "low")]), "mid"),  # 8: kept, unknown w is zero
+        rule(And(children=[cond("y", "low"), cond("w", "low")]), "mid"),  # 9: never fires, unknown w
+        rule(Not(cond("x", "low")), "mid"),  # 10: kept
+    ]
+
+
+def infer_grid(fis: MamdaniFIS) -> list[dict[str, float]]:
+    """Infer the outputs of the FIS on a grid over x and y."""
+    values = [0.0, 1.5, 3.0, 4.9, 5.0, 6.5, 8.0, 10.0]
+    return [fis.infer({"x": x, "y": y}) for x, y in itertools.product(values, values)]
+
+
+# region POSITIVE TESTS
+
+
+def test_analysis_finds_every_kind(
+    make_level_variable: Callable[..., LinguisticVariable], rules: list[FuzzyRule]
+) -> None:
+    """Test that zero-weight, never-firing, duplicate and subsumed rules are found."""
+    analysis = analyze_rules(rules, {"x": make_level_variable("x"), "y": make_level_variable("y")})
+
+    assert analysis.zero_weight == [3]
+    assert analysis.never_firing == [2, 9]
+    assert analysis.duplicates == {1: 0}
+    assert analysis.subsumed == {4: 0}
+    assert analysis.kept == [0, 5, 6, 7, 8, 10]
+
+
+@pytest.mark.parametrize("aggregation", ["max", "sum", "probor"])
+@pytest.mark.parametrize("implication", ["clip", "scale"])
+def test_reduced_rule_base_is_equivalent(
+    make_level_variable: Callable[..., LinguisticVariable], rules: list[FuzzyRule], aggregation: str, implication: str
+) -> None:
+    """Test that the reduced FIS infers the same outputs, keeping redundant rules unless aggregating by max."""
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x"), "y": make_level_variable("y")},
+        output_variables={"z": make_level_variable("z")},
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(aggregation=aggregation, implication=implication),
+    )
+
+    reduced = fis.reduce_rules()
+
+    expected = 6 if aggregation == "max" else 8
+    assert len(reduced.fuzzy_rules) == expected
+    assert reduced.inference_config == fis.inference_config
+    assert infer_grid(reduced) == pytest.approx(infer_grid(fis))
+
+
+def test_stronger_duplicate_is_kept(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that the duplicate with the largest weight is kept, and weaker weights do not subsume."""
+    rules = [
+        rule(cond("x", "low"), "low", 0.5),
+        rule(cond("x", "low"), "low", 0.8),
+        rule(And(children=[cond("x", "low"), cond("y", "low")]), "low", 0.9),
+    ]
+
+    analysis = analyze_rules(rules, {"x": make_level_variable("x"), "y": make_level_variable("y")})
+
+    assert analysis.duplicates == {0: 1}
+    assert analysis.subsumed == {}
+    assert analysis.kept == [1, 2]
+
+
+def test_touching_supports_never_fire(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that conditions on one variable with supports touching at a point, or outside the UOD, never fire."""
+    narrow = make_level_variable("x")
+    narrow.fuzzy_sets["outside"] = MFTriangular(a=10.0, b=12.0, c=14.0)
+    rules = [
+        rule(And(children=[cond("x", "low"), Or(children=[cond("x", "high"), cond("x", "outside")])]), "low"),
+        rule(And(children=[cond("x", "low"), Or(children=[cond("x", "mid"), cond("y", "high")])]), "low"),
+        rule(cond("x", "outside"), "low"),
+        rule(cond("x", "unknown"), "low"),
+    ]
+
+    assert analyze_rules(rules, {"x": narrow, "y": make_level_variable("y")}).never_firing == [0, 2, 3]
+
+
+def test_disjoint_conjunctions_fire_for_fuzzy_inputs(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that conjunctions of disjoint terms of one variable are only pruned for crisp inputs."""
+    rules = [rule(And(children=[cond("x", "low"), cond("x", "high")]), "high"), rule(cond("x", "mid"), "low")]
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x")},
+        output_variables={"z": make_level_variable("z")},
+        fuzzy_rules=rules,
+    )
+    noisy = {"x": MFGaussian(mean=5.0, sigma=1.0)}
+
+    crisp, fuzzy = fis.reduce_rules(), fis.reduce_rules(crisp=False)
+
+    assert fis.analyze_rules(crisp=False).never_firing == []
+    assert len(crisp.fuzzy_rules) == 1
+    assert [crisp.infer({"x": x}) for x in range(11)] == [fis.infer({"x": x}) for x in range(11)]
+    assert fuzzy.fuzzy_rules == fis.fuzzy_rules
+    assert fuzzy.infer(noisy) == fis.infer(noisy)
+    assert crisp.infer(noisy)["z"] != pytest.approx(fis.infer(noisy)["z"])
+
+
+# region NEGATIVE TESTS
+
+
+def test_empty_rule_base(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that an empty rule base has nothing to report."""
+    assert analyze_rules([], {"x": make_level_variable("x")}) == ([], [], {}, {}, [])
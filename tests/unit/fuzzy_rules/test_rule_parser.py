@@ -0,0 +1,245 @@
+import math
+from collections.abc import Callable
+
+import pandas as pd
+import pytest
+
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is, Not, Or
+from src.mostly.fuzzy_rules.parser import parse_fcl_rule, parse_rule
+from src.mostly.inference.mamdani import MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+
+
+@pytest.fixture
+def terms() -> dict[str, tuple[str, ...]]:
+    """Fixture that returns the terms of the concepts x, y and z."""
+    return {concept: ("low", "mid", "high") for concept in ("x", "y", "z")}
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        FuzzyRule(antecedent=Is(concept="x", term="low"), consequences={"z": "high"}),
+        FuzzyRule(
+            antecedent=And(
+                children=[
+                    Is(concept="x", term="low"),
+                    Or(children=[Is(concept="y", term="mid"), Not(Is(concept="x", term="high"))]),
+                ]
+            ),
+            consequences={"z": "low", "w": "mid"},
+            weight=0.25,
+        ),
+        FuzzyRule(
+            antecedent=Not(Or(children=[Is(concept="x", term="low"), Is(concept="y", term="low")])),
+            consequences={"z": "mid"},
+            weight=-1e-05,
+        ),
+    ],
+)
+def test_parse_round_trips_pretty(rule: FuzzyRule) -> None:
+    """Test that parsing the text written by `pretty` gives back an equal rule."""
+    parsed = FuzzyRule.parse(rule.pretty())
+
+    assert parsed == rule
+    assert parsed.pretty() == rule.pretty()
+
+
+def test_parse_follows_precedence() -> None:
+    """Test that keywords are case-insensitive, NOT binds before AND before OR, and the weight is optional."""
+    rule = FuzzyRule.parse("if X is Low or not y IS mid and (z is high) then w is LOW")
+
+    assert rule.antecedent == Or(
+        children=[
+            Is(concept="x", term="low"),
+            And(children=[Not(Is(concept="y", term="mid")), Is(concept="z", term="high")]),
+        ]
+    )
+    assert rule.consequences == {"w": "low"}
+    assert rule.weight == 1.0
+
+
+def test_parse_cancels_double_negation() -> None:
+    """Test that a double negation parses to the condition itself."""
+    assert FuzzyRule.parse("IF NOT NOT (x IS low) THEN (z IS high)").antecedent == Is(concept="x", term="low")
+
+
+def test_parse_is_cached_and_interned() -> None:
+    """Test that repeated texts share one parse, while every call returns a new rule with interned names."""
+    text = "IF ((x IS low) AND (y IS high)) THEN (z IS mid) [weight: 0.5]"
+
+    first, second = FuzzyRule.parse(text), FuzzyRule.parse(text)
+
+    assert first is not second
+    assert first.antecedent is second.antecedent
+    assert parse_rule.cache_info().hits >= 1
+    second.consequences["z"] = "low"
+    assert first.consequences == {"z": "mid"}
+    other = FuzzyRule.parse("IF (y IS low) THEN (z IS high)")
+    assert other.antecedent.term is first.antecedent.children[0].term
+
+
+def test_from_records_builds_conjunctions(terms: dict[str, tuple[str, ...]]) -> None:
+    """Test that records become conjunctive rules, skipping missing terms and sharing equal conditions."""
+    records = [
+        {"x": "low", "y": "High", "z": "mid", "weight": 0.5},
+        {"x": "low", "y": None, "z": "high"},
+        {"X": "low", "y": math.nan, "z": "low"},
+    ]
+
+    rules = FuzzyRule.from_records(records, {"x": terms["x"], "y": terms["y"]}, {"z": terms["z"]})
+
+    assert rules == [
+        FuzzyRule(
+            antecedent=And(children=[Is(concept="x", term="low"), Is(concept="y", term="high")]),
+            consequences={"z": "mid"},
+            weight=0.5,
+        ),
+        FuzzyRule(antecedent=Is(concept="x", term="low"), consequences={"z": "high"}),
+        FuzzyRule(antecedent=Is(concept="x", term="low"), consequences={"z": "low"}),
+    ]
+    assert rules[0].antecedent.children[0] is rules[1].antecedent
+
+
+def test_from_records_rules_are_tracked(
+    make_level_variable: Callable[..., LinguisticVariable], terms: dict[str, tuple[str, ...]]
+) -> None:
+    """Test that rules built in bulk still validate assignments and invalidate compiled rule bases."""
+    rule = FuzzyRule.from_records([{"x": "low", "z": "mid"}], {"x": terms["x"]}, {"z": terms["z"]})[0]
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x")},
+        output_variables={"z": make_level_variable("z")},
+        fuzzy_rules=[rule],
+    )
+    program = fis.rule_program
+
+    rule.consequences["z"] = "high"
+    with pytest.raises(ValueError):
+        rule.weight = math.inf
+
+    assert fis.rule_program is not program
+
+
+def test_from_rule_table_matches_validated_rules(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that a FIS built from a DataFrame of rules equals one built from validated rules."""
+    table = pd.DataFrame(
+        {
+            "x": ["low", "mid", "high", None],
+            "y": ["low", None, "high", "mid"],
+            "z": ["high", "mid", "low", "mid"],
+            "weight": [1.0, 0.5, 1.0, 0.8],
+        }
+    )
+    variables = {"x": make_level_variable("x"), "y": make_level_variable("y")}
+
+    fis = MamdaniFIS.from_rule_table(variables, {"z": make_level_variable("z")}, table)
+
+    expected = [
+        FuzzyRule(
+            antecedent=And(children=[Is(concept="x", term="low"), Is(concept="y", term="low")]),
+            consequences={"z": "high"},
+        ),
+        FuzzyRule(antecedent=Is(concept="x", term="mid"), consequences={"z": "mid"}, weight=0.5),
+        FuzzyRule(
+            antecedent=And(children=[Is(concept="x", term="high"), Is(concept="y", term="high")]),
+            consequences={"z": "low"},
+        ),
+        FuzzyRule(antecedent=Is(concept="y", term="mid"), consequences={"z": "mid"}, weight=0.8),
+    ]
+    assert fis.fuzzy_rules == expected
+    reference = MamdaniFIS(
+        input_variables=variables, output_variables={"z": make_level_variable("z")}, fuzzy_rules=expected
+    )
+    assert fis.infer({"x": 3.0, "y": 6.0}) == reference.infer({"x": 3.0, "y": 6.0})
+
+
+def test_from_rule_table_with_partial_weights(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that rows without a weight in a partially filled weight column weigh 1.0."""
+    table = pd.DataFrame({"x": ["low", "mid", "high"], "z": ["high", "mid", "low"], "weight": [0.5, None, math.nan]})
+    records = [{"x": "low", "z": "high", "weight": None}]
+
+    fis = MamdaniFIS.from_rule_table({"x": make_level_variable("x")}, {"z": make_level_variable("z")}, table)
+
+    assert [rule.weight for rule in fis.fuzzy_rules] == [0.5, 1.0, 1.0]
+    assert FuzzyRule.from_records(records, {"x": ("low",)}, {"z": ("high",)})[0].weight == 1.0
+
+
+def test_parse_negated_condition() -> None:
+    """Test that `x IS NOT t` parses to the negation of the condition."""
+    rule = FuzzyRule.parse("IF x IS NOT low AND y IS mid THEN z IS high")
+
+    assert rule.antecedent == And(children=[Not(Is(concept="x", term="low")), Is(concept="y", term="mid")])
+
+
+def test_parse_fcl_rule() -> None:
+    """Test that FCL rules take comma-separated conclusions and an optional `WITH` weight."""
+    antecedent, consequences, weight = parse_fcl_rule(
+        "IF service IS poor OR (food IS NOT good) THEN tip IS cheap, (mood IS bad) WITH 0.5"
+    )
+
+    assert antecedent == Or(children=[Is(concept="service", term="poor"), Not(Is(concept="food", term="good"))])
+    assert consequences == (("tip", "cheap"), ("mood", "bad"))
+    assert weight == 0.5
+    assert parse_fcl_rule("if x is low then z is high")[2] == 1.0
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "text, match",
+    [
+        ("(x IS low) THEN (z IS high)", "expected 'IF'"),
+        ("IF (x IS low THEN (z IS high)", r"expected '\)'"),
+        ("IF (x low) THEN (z IS high)", "expected 'IS'"),
+        ("IF (x IS and) THEN (z IS high)", "expected a name"),
+        ("IF (x IS low) THEN (z IS high) OR (w IS low)", "conjunction of IS conditions"),
+        ("IF (x IS low) THEN (z IS high AND z IS low)", "consequence concept is repeated"),
+        ("IF (x IS low) THEN (z IS high) [weight: nan]", "finite weight"),
+        ("IF (x IS low) THEN (z IS high) [weight: 1.0] extra", "end of text"),
+        ("IF (x IS low)", "expected 'THEN' at token 6, got end of text"),
+    ],
+)
+def test_invalid_rule_text_raises(text: str, match: str) -> None:
+    """Test that malformed rule texts are rejected with the position of the error."""
+    with pytest.raises(ValueError, match=match):
+        FuzzyRule.parse(text)
+
+
+@pytest.mark.parametrize(
+    "record, match",
+    [
+        ({"x": "low", "w": "mid", "z": "high"}, "unknown concept 'w'"),
+        ({"x": "lowest", "z": "high"}, "unknown term 'lowest' of 'x'"),
+        ({"x": 1.0, "z": "high"}, "unknown term 1.0 of 'x'"),
+        ({"x": "low", "z": "high", "weight": math.inf}, "weight must be finite"),
+        ({"x": "low"}, "at least one input term and one output term"),
+        ({"x": None, "z": "high"}, "at least one input term and one output term"),
+    ],
+)
+def test_invalid_records_raise(terms: dict[str, tuple[str, ...]], record: dict, match: str) -> None:
+    """Test that records with unknown names, infinite weights or empty sides are rejected."""
+    with pytest.raises(ValueError, match=match):
+        FuzzyRule.from_records(
+            [{"y": "low", "z": "mid"}, record], {"x": terms["x"], "y": terms["y"]}, {"z": terms["z"]}
+        )
+
+
+@pytest.mark.parametrize(
+    "text, match",
+    [
+        ("IF x IS low THEN z IS high WITH", "finite weight at token 9, got end of text"),
+        ("IF x IS low THEN z IS high WITH inf", "finite weight"),
+        ("IF x IS low THEN z IS high, z IS low", "consequence concept is repeated"),
+        ("IF x IS low THEN z IS NOT high", "expected a name"),
+        ("IF x IS low THEN z IS high WITH 1 extra", "expected end of text"),
+    ],
+)
+def test_invalid_fcl_rule_raises(text: str, match: str) -> None:
+    """Test that malformed FCL rules are rejected."""
+    with pytest.raises(ValueError, match=match):
+        parse_fcl_rule(text)
@@ -0,0 +1,321 @@
+import itertools
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.mostly._tracking import current_revision
+from src.mostly.fuzzy_rules import program as program_module
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is, Not, Or, intern_node
+from src.mostly.fuzzy_rules.program import RuleProgram
+from src.mostly.inference.mamdani import MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.triangle import MFTriangular
+
+VARIABLES = {"temperature": ("cold", "warm", "hot"), "humidity": ("low", "high")}
+
+FUZZIFIED = {"temperature": {"cold": 0.0, "warm": 0.7, "hot": 0.3}, "humidity": {"low": 0.4, "high": 0.6}}
+
+
+@pytest.fixture
+def fis(make_level_variable: Callable[..., LinguisticVariable]) -> MamdaniFIS:
+    """Fixture that returns a small inference system with nested antecedents."""
+    rules = [
+        FuzzyRule(
+            antecedent=And(
+                [Is(concept="x", term="low"), And([Is(concept="y", term="mid"), Is(concept="x", term="mid")])]
+            ),
+            consequences={"z": "low"},
+        ),
+        FuzzyRule(
+            antecedent=Or([Is(concept="x", term="high"), Not(Or([Is(concept="y", term="low")]))]),
+            consequences={"z": "high"},
+            weight=0.5,
+        ),
+        FuzzyRule(antecedent=Is(concept="y", term="mid"), consequences={"z": "mid"}),
+    ]
+    return MamdaniFIS(
+        input_variables={"x": make_level_variable("x"), "y": make_level_variable("y")},
+        output_variables={"z": make_level_variable("z")},
+        fuzzy_rules=rules,
+    )
+
+
+# region POSITIVE TESTS
+
+
+def test_nested_nodes_are_flattened() -> None:
+    """Test that nested And/Or nodes of the same kind become one instruction over membership slots."""
+    rule = FuzzyRule(
+        antecedent=And(
+            [
+                Is(concept="temperature", term="hot"),
+                And([Is(concept="humidity", term="high"), And([Is(concept="temperature", term="warm")])]),
+                Or([Is(concept="humidity", term="low"), Or([Is(concept="temperature", term="cold")])]),
+            ]
+        ),
+        consequences={"fan": "high"},
+    )
+
+    program = RuleProgram([rule], VARIABLES)
+
+    assert program.slots[("humidity", "high")] == 4
+    assert program.instructions == [("or", (0, 3)), ("and", (1, 2, 4, 6))]
+    assert program.outputs == [7]
+    assert program.evaluate(program.load(FUZZIFIED)) == [rule.eval(FUZZIFIED)]
+
+
+def test_double_negations_cancel() -> None:
+    """Test that a negation of a negation compiles to its operand, also through single-child nodes."""
+    rule = FuzzyRule(
+        antecedent=Not(And([Not(Is(concept="humidity", term="low"))])),
+        consequences={"fan": "high"},
+        weight=0.5,
+    )
+
+    program = RuleProgram([rule], VARIABLES)
+
+    assert program.instructions == []
+    assert program.evaluate(program.load(FUZZIFIED)) == [0.5 * 0.4]
+
+
+def test_shared_subexpressions_are_evaluated_once() -> None:
+    """Test that equal sub-expressions of different rules, up to the order of operands, share one instruction."""
+    wet = Or([Is(concept="humidity", term="high"), Not(Is(concept="temperature", term="hot"))])
+    wet_reordered = Or([Not(Is(concept="temperature", term="hot")), Is(concept="humidity", term="high")])
+    rules = [
+        FuzzyRule(antecedent=And([Is(concept="temperature", term="cold"), wet]), consequences={"fan": "low"}),
+        FuzzyRule(antecedent=And([Is(concept="temperature", term="warm"), wet_reordered]), consequences={"fan": "mid"}),
+        FuzzyRule(antecedent=And([wet, Is(concept="temperature", term="cold")]), consequences={"fan": "off"}),
+    ]
+
+    program = RuleProgram(rules, VARIABLES)
+
+    assert program.instructions == [("not", (2,)), ("or", (4, 6)), ("and", (0, 7)), ("and", (1, 7))]
+    assert program.outputs == [8, 9, 8]
+    assert program.evaluate(program.load(FUZZIFIED)) == [rule.eval(FUZZIFIED) for rule in rules]
+
+
+def test_rule_base_is_hash_consed(fis: MamdaniFIS) -> None:
+    """Test that equal nodes of the antecedents are one shared instance once the FIS is built."""
+    x_mid = fis.fuzzy_rules[0].antecedent.children[1].children[1]
+    y_mid = fis.fuzzy_rules[0].antecedent.children[1].children[0]
+
+    assert x_mid == Is(concept="x", term="mid")
+    assert fis.fuzzy_rules[2].antecedent is y_mid
+
+    table = {}
+    first = intern_node(And([Is(concept="x", term="low"), Not(Is(concept="y", term="low"))]), table)
+    second = intern_node(Or([Not(Is(concept="y", term="low")), Is(concept="x", term="low")]), table)
+    assert second.children[0] is first.children[1]
+    assert second.children[1] is first.children[0]
+    assert len(table) == 5
+
+
+def test_hash_consing_leaves_the_given_rules_untouched(fis: MamdaniFIS) -> None:
+    """Test that building a FIS interns antecedents into copies, without changing the caller's rules."""
+    y_mid = Is(concept="y", term="mid")
+    rule = FuzzyRule(antecedent=y_mid, consequences={"z": "mid"})
+    revision = current_revision()
+
+    built = MamdaniFIS(
+        input_variables=fis.input_variables,
+        output_variables=fis.output_variables,
+        fuzzy_rules=[*fis.fuzzy_rules[:2], fis.fuzzy_rules[0].model_copy(), rule],
+    )
+
+    assert rule.antecedent is y_mid
+    assert built.fuzzy_rules[3] is not rule
+    assert built.fuzzy_rules[3] == rule
+    assert built.fuzzy_rules[3].antecedent is fis.fuzzy_rules[0].antecedent.children[1].children[0]
+    assert built.fuzzy_rules[0] is fis.fuzzy_rules[0]
+    assert current_revision() == revision
+
+
+def test_unknown_and_missing_leaves_are_zero() -> None:
+    """Test that leaves of unknown concepts and terms or of missing inputs read zero, as in `FuzzyRule.eval`."""
+    rules = [
+        FuzzyRule(antecedent=Not(Is(concept="pressure", term="low")), consequences={"fan": "high"}),
+        FuzzyRule(antecedent=Is(concept="temperature", term="freezing"), consequences={"fan": "low"}),
+        FuzzyRule(antecedent=Is(concept="humidity", term="high"), consequences={"fan": "low"}),
+    ]
+    fuzzified = {"temperature": {"hot": 0.3, "warm": 0.7}}
+
+    program = RuleProgram(rules, VARIABLES)
+
+    assert program.evaluate(program.load(fuzzified)) == [rule.eval(fuzzified) for rule in rules] == [1.0, 0.0, 0.0]
+
+
+def test_inference_uses_compiled_rules(fis: MamdaniFIS) -> None:
+    """Test that the compiled rule strengths equal those of walking the antecedent trees."""
+    fuzzified = fis._fuzzification({"x": 3.0, "y": 4.0})
+
+    strengths = fis._rule_evaluation(fuzzified)
+
+    assert [rule for rule, _ in strengths] == fis.fuzzy_rules
+    assert [strength for _, strength in strengths] == [rule.eval(fuzzified) for rule in fis.fuzzy_rules]
+
+
+def test_program_follows_changes(fis: MamdaniFIS) -> None:
+    """Test that the program is rebuilt after the rules or the input variables change."""
+    fuzzified = fis._fuzzification({"x": 3.0, "y": 4.0})
+    program = fis.rule_program
+    assert fis.rule_program is program
+
+    fis.fuzzy_rules[2].weight = 0.25
+    assert fis._rule_evaluation(fuzzified)[2][1] == pytest.approx(0.25 * 0.8)
+
+    fis.fuzzy_rules.append(FuzzyRule(antecedent=Is(concept="x", term="mid"), consequences={"z": "mid"}))
+    assert fis._rule_evaluation(fuzzified)[3][1] == pytest.approx(0.6)
+
+    fis.fuzzy_rules = fis.fuzzy_rules[:1]
+    assert len(fis._rule_evaluation(fuzzified)) == 1
+
+    fis.input_variables["x"].fuzzy_sets["extra"] = MFTriangular(a=2.0, b=3.0, c=4.0)
+    assert fis.rule_program.slots[("x", "extra")] == 3
+    assert fis.rule_program is not program
+
+
+def test_required_slots() -> None:
+    """Test that And requires the slots of all operands, Or those of every operand and Not none."""
+    hot, high, low = (
+        Is(concept="temperature", term="hot"),
+        Is(concept="humidity", term="high"),
+        Is(concept="humidity", term="low"),
+    )
+    rules = [
+        FuzzyRule(antecedent=And([hot, Or([And([high, hot]), And([low, hot])])]), consequences={"fan": "high"}),
+        FuzzyRule(antecedent=Or([hot, high]), consequences={"fan": "mid"}),
+        FuzzyRule(antecedent=And([Not(hot), high]), consequences={"fan": "low"}),
+        FuzzyRule(
+            antecedent=Not(And([Not(hot), Not(Is(concept="pressure", term="low"))])), consequences={"fan": "off"}
+        ),
+    ]
+
+    program = RuleProgram(rules, VARIABLES)
+
+    assert program.required == [frozenset({2}), frozenset(), frozenset({4}), frozenset()]
+
+
+def test_sparse_evaluation_skips_rules_that_cannot_fire() -> None:
+    """Test that only rules with all required degrees non-zero are evaluated, and the others are zero anyway."""
+    terms = ("t0", "t1", "t2", "t3")
+    variables = {"a": terms, "b": terms, "c": terms}
+    rules = [
+        FuzzyRule(
+            antecedent=And(
+                [
+                    Is(concept="a", term=i),
+                    Or([Is(concept="b", term=j), Not(Is(concept="c", term=k))]),
+                    And([Is(concept="b", term=j), Is(concept="b", term=k)]) if i == j else Is(concept="c", term=k),
+                ]
+            ),
+            consequences={"y": "t0"},
+        )
+        for i, j, k in itertools.product(terms, repeat=3)
+    ]
+    rules.append(FuzzyRule(antecedent=Is(concept="a", term="unknown"), consequences={"y": "t0"}))
+    rules.append(FuzzyRule(antecedent=Not(Is(concept="a", term="t0")), consequences={"y": "t0"}))
+    program = RuleProgram(rules, variables)
+    rng = np.random.default_rng(0)
+
+    for _ in range(50):
+        # Two adjacent terms of each concept are active, as for a triangular partition
+        fuzzified = {}
+        for concept in variables:
+            degrees = dict.fromkeys(terms, 0.0)
+            first = int(rng.integers(0, 3))
+            degrees[terms[first]], degrees[terms[first + 1]] = rng.uniform(0.0, 1.0, 2).tolist()
+            fuzzified[concept] = degrees
+
+        memberships = program.load(fuzzified)
+        firing = [r for r, slots in enumerate(program.required) if all(memberships[slot] for slot in slots)]
+        dense = program.evaluate(program.load(fuzzified))
+        sparse = program.evaluate_sparse(memberships)
+
+        assert list(sparse) == firing
+        assert len(sparse) <= 2 * 4 * 2 + 1
+        assert 64 not in sparse and 65 in sparse
+        assert dense == [sparse.get(r, 0.0) for r in range(len(rules))]
+
+
+def test_sparse_evaluation_runs_only_the_needed_instructions_in_order() -> None:
+    """Test that sparse evaluation runs the instructions of the candidate rules once each, in program order."""
+    shared = And([Is(concept="temperature", term="warm"), Is(concept="humidity", term="low")])
+    rules = [
+        FuzzyRule(
+            antecedent=And([Is(concept="temperature", term="cold"), Is(concept="humidity", term="high")]),
+            consequences={"z": "low"},
+        ),
+        FuzzyRule(antecedent=shared, consequences={"z": "mid"}),
+        FuzzyRule(antecedent=Or([shared, Not(Is(concept="temperature", term="hot"))]), consequences={"z": "high"}),
+    ]
+    program = RuleProgram(rules, VARIABLES)
+    ran: list[int] = []
+
+    def recording(i: int, apply: Callable) -> Callable:
+        return lambda operands: ran.append(i) or apply(operands)
+
+    program._operations = [(recording(i, apply), operands) for i, (apply, operands) in enumerate(program._operations)]
+    sparse = program.evaluate_sparse(program.load(FUZZIFIED))
+
+    # The cold rule never fires, so its conjunction, the first instruction, is skipped
+    assert list(sparse) == [1, 2]
+    assert ran == [1, 2, 3]
+    assert sparse[2] == pytest.approx(max(min(0.7, 0.4), 1.0 - 0.3))
+
+
+def test_batch_matches_single_evaluation(fis: MamdaniFIS, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every row of the batch equals the strengths of one sample, also across chunks."""
+    monkeypatch.setattr(program_module, "_BLOCK_SIZE", 100)
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0.0, 10.0, 57), rng.uniform(0.0, 10.0, 57)
+
+    strengths = fis.rule_strengths_batch(
+        {"x": fis.input_variables["x"].fuzzify_batch(x), "y": fis.input_variables["y"].fuzzify_batch(y, sparse=True)}
+    )
+
+    assert strengths.shape == (57, 3)
+    for row, x_value, y_value in zip(strengths, x.tolist(), y.tolist(), strict=True):
+        fuzzified = fis._fuzzification({"x": x_value, "y": y_value})
+        assert row.tolist() == [strength for _, strength in fis._rule_evaluation(fuzzified)]
+
+
+def test_batch_of_missing_concept_reads_zero(fis: MamdaniFIS) -> None:
+    """Test that concepts left out of a batch have zero degrees."""
+    strengths = fis.rule_strengths_batch({"x": np.array([[0.0, 0.0, 1.0], [0.5, 0.5, 0.0]])})
+
+    np.testing.assert_array_equal(strengths, [[0.0, 0.5, 0.0], [0.0, 0.5, 0.0]])
+
+
+# region NEGATIVE TESTS
+
+
+def test_empty_conjunction_raises() -> None:
+    """Test that an And without children cannot be compiled."""
+    rule = FuzzyRule(antecedent=And([]), consequences={"fan": "high"})
+
+    with pytest.raises(ValueError, match="empty And"):
+        RuleProgram([rule], VARIABLES)
+
+
+@pytest.mark.parametrize(
+    "memberships, match",
+    [
+        ({}, "At least one"),
+        ({"z": np.zeros((2, 3))}, "Unknown input concept 'z'"),
+        ({"x": np.zeros((2, 2))}, "must have shape \\(2, 3\\)"),
+        ({"x": np.zeros((2, 3)), "y": np.zeros((3, 3))}, "must have shape \\(2, 3\\)"),
+    ],
+)
+def test_invalid_batch_raises(fis: MamdaniFIS, memberships, match: str) -> None:
+    """Test that membership matrices must belong to input concepts and match their terms and each other."""
+    with pytest.raises(ValueError, match=match):
+        fis.rule_strengths_batch(memberships)
+
+
+def test_batch_without_zero_slot_raises(fis: MamdaniFIS) -> None:
+    """Test that a stacked membership matrix needs one column per slot."""
+    with pytest.raises(ValueError, match="one column per slot"):
+        fis.rule_program.evaluate_batch(np.zeros((2, 6)))
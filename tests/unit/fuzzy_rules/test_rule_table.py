@@ -0,0 +1,258 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.fuzzy_rules.logical_operators import And, Is
+from src.mostly.fuzzy_rules.rule_table import RuleTable
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+
+TERMS = ("low", "mid", "high")
+
+
+@pytest.fixture
+def table() -> RuleTable:
+    """Fixture that returns a 3x3 grid over x and y with one empty cell and varying weights."""
+    return RuleTable(
+        inputs=("x", "y"),
+        output="z",
+        consequents=[[0, 0, 1], [0, 1, 2], [1, 2, -1]],
+        weights=[[1.0, 1.0, 1.0], [0.5, 1.0, 1.0], [1.0, 1.0, 0.8]],
+    )
+
+
+@pytest.fixture
+def table_fis(make_level_variable: Callable[..., LinguisticVariable]) -> Callable[..., MamdaniFIS]:
+    """Fixture that returns a factory of FIS over x, y and z that fire only the given table."""
+
+    def make(table: RuleTable, aggregation: str = "max", implication: str = "clip") -> MamdaniFIS:
+        return MamdaniFIS(
+            input_variables={"x": make_level_variable("x"), "y": make_level_variable("y")},
+            output_variables={"z": make_level_variable("z")},
+            rule_tables=[table],
+            inference_config=InferenceConfig(aggregation=aggregation, implication=implication),
+        )
+
+    return make
+
+
+# region POSITIVE TESTS
+
+
+def test_strengths_are_outer_min_or_product(table: RuleTable) -> None:
+    """Test that cell strengths are the weighted outer minimum, or product, of the degree vectors."""
+    x, y = np.array([0.2, 0.8, 0.0]), np.array([0.0, 0.6, 0.4])
+
+    np.testing.assert_array_equal(table.strengths([x, y]), np.minimum.outer(x, y) * table.weights)
+    product = table.model_copy(update={"conjunction": "product"})
+    np.testing.assert_array_equal(product.strengths([x, y]), np.multiply.outer(x, y) * table.weights)
+
+
+def test_fire_gathers_the_active_subgrid(table: RuleTable) -> None:
+    """Test that firing returns the consequents and strengths of the non-zero cells with a rule."""
+    terms, strengths = table.fire([[0.0, 0.3, 0.7], [0.0, 0.6, 0.4]])
+
+    # Cells (1, 1), (1, 2), (2, 1) and (2, 2), the last without a rule
+    assert terms.tolist() == [1, 2, 2]
+    np.testing.assert_allclose(strengths, [0.3, 0.3, 0.6])
+
+
+def test_fire_without_inactive_terms(table: RuleTable) -> None:
+    """Test that a table whose terms are all active fires every cell with a rule."""
+    degrees = [[0.2, 0.5, 0.3], [0.1, 0.6, 0.3]]
+
+    terms, strengths = table.fire(degrees)
+
+    mask = table.consequents >= 0
+    assert terms.tolist() == table.consequents[mask].tolist()
+    np.testing.assert_array_equal(strengths, table.strengths(degrees)[mask])
+    assert table.term_strengths(degrees, 3).tolist() == pytest.approx([0.2, 0.5, 0.3])
+
+
+def test_to_rules_expands_every_cell(table: RuleTable) -> None:
+    """Test that the table expands into one conjunctive rule per cell with a rule, in row-major order."""
+    rules = table.to_rules({"x": TERMS, "y": TERMS}, TERMS)
+
+    assert len(rules) == 8
+    assert rules[3].antecedent == And(children=[Is(concept="x", term="mid"), Is(concept="y", term="low")])
+    assert rules[3].consequences == {"z": "low"}
+    assert rules[3].weight == 0.5
+
+
+@pytest.mark.parametrize("aggregation", ["max", "sum", "probor"])
+@pytest.mark.parametrize("implication", ["clip", "scale"])
+def test_inference_matches_expanded_rules(
+    table_fis: Callable[..., MamdaniFIS], table: RuleTable, aggregation: str, implication: str
+) -> None:
+    """Test that a FIS with a rule table infers the same outputs as with the table expanded into rules."""
+    tabled = table_fis(table, aggregation, implication)
+    expanded = MamdaniFIS(
+        input_variables=tabled.input_variables,
+        output_variables=tabled.output_variables,
+        fuzzy_rules=table.to_rules({"x": TERMS, "y": TERMS}, TERMS),
+        inference_config=tabled.inference_config,
+    )
+
+    for x, y in [(0.0, 0.0), (3.0, 7.5), (6.2, 4.1), (10.0, 9.0)]:
+        assert tabled.infer({"x": x, "y": y}) == pytest.approx(expanded.infer({"x": x, "y": y}))
+
+
+def test_tables_fire_alongside_rules(table_fis: Callable[..., MamdaniFIS], table: RuleTable) -> None:
+    """Test that a table adds its firings to those of the fuzzy rules."""
+    tabled = table_fis(table)
+    expanded = table.to_rules({"x": TERMS, "y": TERMS}, TERMS)
+    # The first four cells with a rule as fuzzy rules, the rest as a table
+    rest = RuleTable(
+        inputs=("x", "y"),
+        output="z",
+        consequents=np.where(np.arange(9).reshape(3, 3) < 4, -1, table.consequents),
+        weights=table.weights,
+    )
+    mixed = MamdaniFIS(
+        input_variables=tabled.input_variables,
+        output_variables=tabled.output_variables,
+        fuzzy_rules=expanded[:4],
+        rule_tables=[rest],
+    )
+
+    assert mixed.infer({"x": 4.0, "y": 6.0}) == pytest.approx(tabled.infer({"x": 4.0, "y": 6.0}))
+
+
+def test_tables_over_some_inputs(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that a one-dimensional table fires on its own input and ignores missing inputs."""
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x"), "y": make_level_variable("y")},
+        output_variables={"z": make_level_variable("z")},
+        rule_tables=[RuleTable(inputs=("y",), output="z", consequents=[2, 1, 0], conjunction="product")],
+    )
+
+    assert fis.infer({"x": 5.0, "y": 0.0}) == pytest.approx(fis.infer({"y": 0.0}))
+    assert fis.infer({"x": 5.0}) == {"z": 0.0}
+
+
+def test_dense_inputs_fire_whole_table(table_fis: Callable[..., MamdaniFIS], table: RuleTable) -> None:
+    """Test that inputs active on every term, such as Gaussian ones, fire the whole table."""
+    gaussian = LinguisticVariable(
+        concept="x",
+        uod=(0.0, 10.0),
+        fuzzy_sets={term: MFGaussian(mean=5.0 * i, sigma=2.0) for i, term in enumerate(TERMS)},
+    )
+    fis = table_fis(table)
+    fis.input_variables = {"x": gaussian, "y": gaussian}
+
+    firings = fis._table_evaluation(fis._fuzzification({"x": 3.0, "y": 6.0}))
+
+    terms, strengths = firings["z"]
+    assert terms.tolist() == [0, 1, 2]
+    assert (strengths > 0).all()
+
+
+@pytest.mark.parametrize("conjunction", ["min", "product"])
+@pytest.mark.parametrize("sigma", [None, 2.0])
+def test_batches_match_single_samples(
+    make_level_variable: Callable[..., LinguisticVariable], table: RuleTable, conjunction: str, sigma: float | None
+) -> None:
+    """Test that batch strengths and firings equal those of each sample, for sparse and dense degrees."""
+    table = table.model_copy(update={"conjunction": conjunction})
+    if sigma is None:
+        variable = make_level_variable("x")
+    else:
+        variable = LinguisticVariable(
+            concept="x",
+            uod=(0.0, 10.0),
+            fuzzy_sets={term: MFGaussian(mean=5.0 * i, sigma=sigma) for i, term in enumerate(TERMS)},
+        )
+    xs, ys = np.linspace(0.0, 10.0, 9), np.linspace(10.0, 3.0, 9)
+    degrees = [variable.fuzzify_batch(xs), variable.fuzzify_batch(ys)]
+
+    strengths = table.strengths_batch(degrees)
+    samples, terms, values = table.fire_batch(degrees)
+
+    for i in range(len(xs)):
+        single = [degrees[0][i], degrees[1][i]]
+        np.testing.assert_allclose(strengths[i], table.strengths(single))
+        expected_terms, expected_strengths = table.fire(single)
+        assert terms[samples == i].tolist() == expected_terms.tolist()
+        np.testing.assert_allclose(values[samples == i], expected_strengths)
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"consequents": [[0, 1], [1, 0]], "inputs": ("x",)}, "one axis per input"),
+        ({"consequents": [[0.5, 1.0], [1.0, 0.0]]}, "integer term indices"),
+        ({"consequents": [[0, 1], [-2, 0]]}, "-1 for cells without a rule"),
+        ({"consequents": [[0, 1], [1, 0]], "weights": [1.0, 1.0]}, "shape of the consequents"),
+        ({"consequents": [[0, 1], [1, 0]], "weights": [[1.0, np.nan], [1.0, 1.0]]}, "finite"),
+        ({"consequents": [[0, 1], [1, 0]], "inputs": ("x", "x")}, "distinct"),
+    ],
+)
+def test_invalid_tables_raise(kwargs: dict, match: str) -> None:
+    """Test that malformed tables are rejected."""
+    with pytest.raises(ValidationError, match=match):
+        RuleTable(**{"inputs": ("x", "y"), "output": "z", **kwargs})
+
+
+def test_tables_are_immutable(table: RuleTable) -> None:
+    """Test that neither the fields nor the arrays of a table can be changed in place."""
+    with pytest.raises(ValidationError):
+        table.output = "y"
+    with pytest.raises(ValueError, match="read-only"):
+        table.consequents[0, 0] = 2
+
+
+@pytest.mark.parametrize(
+    "update, match",
+    [
+        ({"inputs": ("x", "w")}, "input 'w' not defined"),
+        ({"output": "w"}, "output 'w' not defined"),
+        ({"consequents": np.zeros((3, 2), dtype=int), "weights": np.ones((3, 2))}, r"must have shape \(3, 3\)"),
+        ({"consequents": np.full((3, 3), 3)}, "must index the 3 terms"),
+    ],
+)
+def test_tables_mismatching_the_variables_raise(
+    table_fis: Callable[..., MamdaniFIS], table: RuleTable, update: dict, match: str
+) -> None:
+    """Test that a FIS rejects tables that do not match the terms of its variables."""
+    with pytest.raises(ValidationError, match=match):
+        table_fis(RuleTable(**{**dict(table), **update}))
+
+
+def test_tables_are_rechecked_only_after_changes(
+    table_fis: Callable[..., MamdaniFIS], table: RuleTable, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that inferences check the tables once, and again once a variable changed in place."""
+    fis = table_fis(table)
+    checks = []
+    check = MamdaniFIS._check_rule_table
+    monkeypatch.setattr(MamdaniFIS, "_check_rule_table", lambda self, t: checks.append(t) or check(self, t))
+
+    for x in (2.0, 4.0, 6.0):
+        fis.infer({"x": x, "y": 5.0})
+    assert len(checks) == 1
+
+    del fis.input_variables["y"].fuzzy_sets["high"]
+    with pytest.raises(ValueError, match=r"must have shape \(3, 2\)"):
+        fis.infer({"x": 2.0, "y": 5.0})
+
+
+def test_degrees_must_match_the_terms(table: RuleTable) -> None:
+    """Test that firing needs one degree vector per input, with one degree per term."""
+    with pytest.raises(ValueError, match="one degree vector per input"):
+        table.fire([[0.0, 1.0, 0.0]])
+    with pytest.raises(ValueError, match=r"Degrees of 'y' must have shape \(3,\)"):
+        table.fire([[0.0, 1.0, 0.0], [1.0, 0.0]])
+
+
+def test_batch_degrees_must_match_the_terms(table: RuleTable) -> None:
+    """Test that batch firing needs one matrix per input, with one column per term and the same rows."""
+    with pytest.raises(ValueError, match="one membership matrix per input"):
+        table.fire_batch([np.zeros((2, 3))])
+    with pytest.raises(ValueError, match=r"Membership matrix of 'y' must have shape \(2, 3\)"):
+        table.strengths_batch([np.zeros((2, 3)), np.zeros((3, 3))])
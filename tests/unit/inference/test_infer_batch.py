@@ -0,0 +1,237 @@
+import itertools
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.program import RuleProgram
+from src.mostly.fuzzy_rules.rule_table import RuleTable
+from src.mostly.inference._batch import OutputSets
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions import MFGaussian
+
+
+@pytest.fixture
+def make_fis(make_level_variable: Callable[..., LinguisticVariable]) -> Callable[..., MamdaniFIS]:
+    """Fixture that returns a factory of FIS with negated, weighted and multi-output rules and a rule table."""
+
+    def make(aggregation: str = "max", implication: str = "clip") -> MamdaniFIS:
+        rules = [
+            FuzzyRule.parse(text)
+            for text in [
+                "IF (x IS low) AND NOT (y IS mid) THEN (z IS high)",
+                "IF (x IS high) OR (y IS low) THEN (z IS low) AND (w IS mid) [weight: 0.5]",
+                "IF (x IS mid) THEN (z IS mid)",
+                "IF (y IS high) THEN (z IS mid) AND (w IS high)",
+            ]
+        ]
+        table = RuleTable(
+            inputs=("x", "y"), output="w", consequents=[[0, 1, -1], [2, 0, 1], [1, 1, 2]], conjunction="product"
+        )
+        return MamdaniFIS(
+            input_variables={"x": make_level_variable("x", mixed=True), "y": make_level_variable("y", mixed=True)},
+            output_variables={"z": make_level_variable("z", mixed=True), "w": make_level_variable("w", mixed=True)},
+            fuzzy_rules=rules,
+            rule_tables=[table],
+            inference_config=InferenceConfig(aggregation=aggregation, implication=implication),
+        )
+
+    return make
+
+
+SAMPLES = np.random.default_rng(0).uniform(0.0, 10.0, (60, 2))
+
+
+def assert_matches_infer(fis: MamdaniFIS, outputs: dict[str, np.ndarray], samples: list[dict[str, float]]) -> None:
+    """Assert that batch outputs equal those of `infer` sample by sample."""
+    expected = [fis.infer(sample) for sample in samples]
+    assert set(outputs) == set(fis.output_variables)
+    for concept, values in outputs.items():
+        np.testing.assert_allclose(values, [inference[concept] for inference in expected], rtol=1e-9, atol=1e-9)
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "aggregation, implication", list(itertools.product(["max", "sum", "probor"], ["clip", "scale"]))
+)
+def test_infer_batch_matches_infer(make_fis: Callable[..., MamdaniFIS], aggregation: str, implication: str) -> None:
+    """Test that batch inference of rules and tables equals inferring every sample, for every configuration."""
+    fis = make_fis(aggregation, implication)
+
+    outputs = fis.infer_batch({"x": SAMPLES[:, 0], "y": SAMPLES[:, 1]})
+
+    assert_matches_infer(fis, outputs, [{"x": x, "y": y} for x, y in SAMPLES])
+
+
+def test_infer_batch_with_missing_inputs(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that rules and tables over inputs that are not given do not fire, as in `infer`."""
+    fis = make_fis()
+
+    outputs = fis.infer_batch({"y": SAMPLES[:, 1]})
+
+    assert_matches_infer(fis, outputs, [{"y": y} for y in SAMPLES[:, 1]])
+
+
+def test_infer_batch_input_layouts(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that 2-D arrays with columns as a sequence or a mapping and DataFrames equal a mapping of arrays."""
+    fis = make_fis()
+    expected = fis.infer_batch({"x": SAMPLES[:, 0], "y": SAMPLES[:, 1]})
+
+    layouts = [
+        fis.infer_batch(SAMPLES, columns=["x", "y"]),
+        fis.infer_batch(SAMPLES[:, ::-1], columns={"x": 1, "y": 0}),
+        fis.infer_batch(pd.DataFrame(SAMPLES, columns=["x", "y"])),
+    ]
+
+    for outputs in layouts:
+        for concept, values in expected.items():
+            np.testing.assert_array_equal(outputs[concept], values)
+
+
+def test_infer_batch_chunks_under_the_memory_budget(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that a budget of a few samples per chunk gives the same outputs."""
+    fis = make_fis("probor", "scale")
+    expected = fis.infer_batch(SAMPLES, columns=["x", "y"])
+
+    outputs = fis.infer_batch(SAMPLES, columns=["x", "y"], memory_budget=1000)
+
+    for concept, values in expected.items():
+        np.testing.assert_allclose(outputs[concept], values, rtol=1e-12)
+
+
+def test_memory_budget_bounds_registers_and_output_sets(
+    make_fis: Callable[..., MamdaniFIS], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a small budget bounds the register block of the rule program and the output sets over the grid."""
+    fis = make_fis("probor", "scale")
+    budget = 100_000
+    n_registers = fis.rule_program.size + len(fis.rule_program.instructions)
+    blocks: list[int] = []
+    evaluate_batch, grid_centroids = RuleProgram.evaluate_batch, OutputSets._grid_centroids
+
+    def record_registers(program: RuleProgram, memberships: np.ndarray) -> np.ndarray:
+        blocks.append(memberships.shape[0] * n_registers)
+        return evaluate_batch(program, memberships)
+
+    def record_output_sets(sets: OutputSets, n_samples: int, *args: object) -> np.ndarray:
+        blocks.append(3 * n_samples * len(sets.grid))
+        return grid_centroids(sets, n_samples, *args)
+
+    monkeypatch.setattr(RuleProgram, "evaluate_batch", record_registers)
+    monkeypatch.setattr(OutputSets, "_grid_centroids", record_output_sets)
+    fis.infer_batch(SAMPLES, columns=["x", "y"], memory_budget=budget)
+
+    assert len(blocks) > 2 * len(fis.output_variables)
+    assert 8 * max(blocks) <= budget
+
+
+def test_infer_batch_with_many_overlapping_terms(make_level_variable: Callable[..., LinguisticVariable]) -> None:
+    """Test that max aggregation of clipped sets is exact when too many terms overlap to expand them."""
+    gaussians = LinguisticVariable(
+        concept="z",
+        uod=(0.0, 10.0),
+        fuzzy_sets={f"t{i}": MFGaussian(mean=float(i), sigma=3.0) for i in range(11)},
+    )
+    rules = [FuzzyRule.parse(f"IF x IS {term} THEN z IS t{i}") for i, term in enumerate(["low", "mid", "high"] * 3)]
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x", mixed=True)},
+        output_variables={"z": gaussians},
+        fuzzy_rules=rules,
+    )
+
+    outputs = fis.infer_batch({"x": SAMPLES[:, 0]})
+
+    assert_matches_infer(fis, outputs, [{"x": x} for x in SAMPLES[:, 0]])
+
+
+def test_infer_batch_records_rule_stats(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that batch inference accumulates the same rule statistics as inferring every sample."""
+    batch, loop = make_fis(), make_fis()
+    batch.enable_rule_stats(bins=4)
+    loop.enable_rule_stats(bins=4)
+
+    batch.infer_batch(SAMPLES, columns=["x", "y"], memory_budget=1000)
+    for x, y in SAMPLES:
+        loop.infer({"x": x, "y": y})
+
+    pd.testing.assert_frame_equal(batch.rule_stats(), loop.rule_stats())
+
+
+@pytest.mark.parametrize(
+    "aggregation, implication", list(itertools.product(["max", "sum", "probor"], ["clip", "scale"]))
+)
+def test_infer_batch_with_negative_weights(
+    make_level_variable: Callable[..., LinguisticVariable], aggregation: str, implication: str
+) -> None:
+    """Test that rules with a negative weight lower the output of batch inference as they do in `infer`."""
+    rules = [FuzzyRule.parse("IF x IS low THEN z IS low"), FuzzyRule.parse("IF x IS mid THEN z IS high [weight: -0.5]")]
+    fis = MamdaniFIS(
+        input_variables={"x": make_level_variable("x")},
+        output_variables={"z": make_level_variable("z")},
+        fuzzy_rules=rules,
+        inference_config=InferenceConfig(aggregation=aggregation, implication=implication),
+    )
+
+    outputs = fis.infer_batch({"x": SAMPLES[:, 0]})
+
+    assert_matches_infer(fis, outputs, [{"x": x} for x in SAMPLES[:, 0]])
+
+
+def test_infer_batch_without_firing_rules(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that samples that fire no rule have a zero output."""
+    fis = make_fis()
+    fis.rule_tables.clear()
+    fis.fuzzy_rules = [FuzzyRule.parse("IF x IS low THEN w IS low")]
+
+    outputs = fis.infer_batch({"x": [0.0, 8.0]})
+
+    assert outputs["w"][1] == 0.0
+    assert outputs["z"].tolist() == [0.0, 0.0]
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "inputs, columns, match",
+    [
+        ({"v": [1.0]}, None, "Input variable 'v' not defined in FIS"),
+        ({}, None, "At least one input concept is required"),
+        ({"x": [1.0, 2.0], "y": [1.0]}, None, "same number of samples"),
+        ({"x": [[1.0]]}, None, "same number of samples"),
+        ({"x": [1.0]}, ["x"], "keys of a mapping name the concepts"),
+        (SAMPLES, None, "must be given as `columns`"),
+        (SAMPLES, ["x"], r"Expected one concept per column \(2\), got 1"),
+        (SAMPLES[:, 0], ["x"], "must be two-dimensional"),
+        (pd.DataFrame(SAMPLES, columns=["x", "y"]), ["x", "y"], "DataFrame columns are named by concept"),
+        ({"x": [1.0, 11.0]}, None, "1 input values are outside the UOD bounds"),
+    ],
+)
+def test_invalid_batch_inputs_raise(
+    make_fis: Callable[..., MamdaniFIS], inputs: object, columns: list[str] | None, match: str
+) -> None:
+    """Test that unknown concepts, inconsistent shapes and misplaced columns are rejected."""
+    with pytest.raises(ValueError, match=match):
+        make_fis().infer_batch(inputs, columns=columns)
+
+
+def test_non_positive_memory_budget_raises(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that the memory budget must be positive."""
+    with pytest.raises(ValueError, match="memory budget must be a positive number of bytes"):
+        make_fis().infer_batch(SAMPLES, columns=["x", "y"], memory_budget=0)
+
+
+def test_unknown_consequence_term_raises_in_both_paths(make_fis: Callable[..., MamdaniFIS]) -> None:
+    """Test that a misspelled consequence term is reported by `infer` and `infer_batch`, even if it never fires."""
+    fis = make_fis()
+    fis.fuzzy_rules.append(FuzzyRule.parse("IF (x IS low) AND (x IS high) THEN (z IS hgih)"))
+
+    with pytest.raises(ValueError, match="Rule 4 concludes the unknown term 'hgih' of 'z'"):
+        fis.infer({"x": 5.0})
+    with pytest.raises(ValueError, match="Rule 4 concludes the unknown term 'hgih' of 'z'"):
+        fis.infer_batch({"x": [5.0]})
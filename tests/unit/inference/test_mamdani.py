@@ -1,9 +1,11 @@
 import altair as alt
+import pytest
 
 from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
 from src.mostly.fuzzy_rules.logical_operators import Is, Or
 from src.mostly.inference.mamdani import MamdaniFIS
 from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
 from src.mostly.membership_functions.triangle import MFTriangular
 from src.mostly.plotting.altair.plot_fis_inputs import plot_inference_inputs
 from src.mostly.plotting.altair.plot_fis_outputs import plot_inference_outputs
@@ -84,6 +86,20 @@ def test_mamdani_inference():
     )
 
 
+def test_mamdani_inference_with_noisy_inputs():
+    """Test Mamdani inference with fuzzy (non-singleton) inputs next to crisp ones."""
+    crisp = fis.infer(crisp_inputs={"food_quality": 6.5, "service_quality": 9.8})
+    narrow = fis.infer(
+        crisp_inputs={"food_quality": MFTriangular(a=6.499, b=6.5, c=6.501), "service_quality": 9.8},
+    )
+    noisy = fis.infer(
+        crisp_inputs={"food_quality": MFGaussian(mean=6.5, sigma=1.0), "service_quality": 9.8},
+    )
+
+    assert narrow["tip_amount"] == pytest.approx(crisp["tip_amount"], abs=1e-3)
+    assert noisy["tip_amount"] != pytest.approx(crisp["tip_amount"], abs=1e-3)
+
+
 def test_pretty_rules():
     """Test pretty string representation of fuzzy rules."""
     rule = rules[0]
@@ -0,0 +1,93 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.inference.mamdani import InferenceConfig, MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions import MFGaussian, MFTriangular
+
+
+@pytest.fixture
+def fis(make_level_variable: Callable[..., LinguisticVariable]) -> MamdaniFIS:
+    """Fixture that returns a FIS with one rule per term of x."""
+    rules = [FuzzyRule.parse(f"IF x IS {term} THEN z IS {term}") for term in ("low", "mid", "high")]
+    return MamdaniFIS(
+        input_variables={"x": make_level_variable("x", mixed=True)},
+        output_variables={"z": make_level_variable("z", mixed=True)},
+        fuzzy_rules=rules,
+    )
+
+
+# region POSITIVE TESTS
+
+
+def test_output_tables_sample_the_terms(fis: MamdaniFIS) -> None:
+    """Test that every output term is sampled once over the grid of the configured resolution."""
+    sets = fis._output_sets(fis.inference_config.resolution)["z"]
+
+    np.testing.assert_array_equal(sets.grid, np.linspace(0.0, 10.0, 500))
+    assert sets.memberships.shape == (3, 500)
+    np.testing.assert_array_equal(
+        sets.memberships[sets.index["mid"]], MFGaussian(mean=5.0, sigma=1.5).evaluate(sets.grid)
+    )
+    assert not sets.memberships.flags.writeable
+
+
+def test_output_tables_are_cached(fis: MamdaniFIS) -> None:
+    """Test that inferences reuse the tables while nothing changes."""
+    sets = fis._output_sets(500)
+
+    fis.infer({"x": 3.0})
+
+    assert fis._output_sets(500) is sets
+
+
+def test_output_tables_follow_the_resolution(fis: MamdaniFIS) -> None:
+    """Test that a new resolution samples the terms again."""
+    fis.inference_config = InferenceConfig(resolution=101)
+
+    x_vals, _ = fis._aggregation([], 101)["z"]
+
+    assert len(x_vals) == 101
+    assert len(fis._output_sets(101)["z"].grid) == 101
+
+
+def test_output_tables_are_kept_for_the_last_resolution(fis: MamdaniFIS) -> None:
+    """Test that a new resolution replaces the cached tables instead of caching tables per resolution."""
+    for resolution in (101, 201, 101):
+        fis._output_sets(resolution)
+
+    assert [key for key in fis._derived if key.startswith("output_sets")] == ["output_sets"]
+    assert fis._output_sets(101) is fis._output_sets(101)
+
+
+def test_output_tables_follow_the_output_variables(
+    make_level_variable: Callable[..., LinguisticVariable], fis: MamdaniFIS
+) -> None:
+    """Test that changing an output term in place or replacing an output variable invalidates the tables."""
+    before = fis.infer({"x": 3.0})["z"]
+
+    fis.output_variables["z"].fuzzy_sets["low"] = MFTriangular(a=0.0, b=2.0, c=4.0)
+    changed = fis.infer({"x": 3.0})["z"]
+    replacement = make_level_variable("z", mixed=True).model_copy(update={"uod": (0.0, 20.0)})
+    fis.output_variables = {"z": replacement}
+    replaced = fis.infer({"x": 3.0})["z"]
+
+    assert changed != pytest.approx(before)
+    assert fis._output_sets(500)["z"].grid[-1] == 20.0
+    assert replaced != pytest.approx(changed)
+    assert fis.infer_batch({"x": [3.0]})["z"][0] == pytest.approx(replaced)
+
+
+# region NEGATIVE TESTS
+
+
+def test_unknown_output_term_raises(fis: MamdaniFIS) -> None:
+    """Test that a rule concluding a term removed from its output variable is reported."""
+    del fis.output_variables["z"].fuzzy_sets["mid"]
+    fis.output_variables["z"].fuzzy_sets["high"] = MFTriangular(a=0.0, b=10.0, c=10.0)
+
+    with pytest.raises(ValueError, match="Rule 1 concludes the unknown term 'mid' of 'z'"):
+        fis._aggregation([(fis.fuzzy_rules[1], 0.5)])
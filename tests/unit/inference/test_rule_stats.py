@@ -0,0 +1,129 @@
+import copy
+import pickle
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import And, Is
+from src.mostly.inference.mamdani import MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+
+
+@pytest.fixture
+def fis(make_level_variable: Callable[..., LinguisticVariable]) -> MamdaniFIS:
+    """Fixture that returns a FIS with two rules per output concept and a rule that never fires alone."""
+    rules = [
+        FuzzyRule(antecedent=Is(concept="x", term="low"), consequences={"z": "low"}),
+        FuzzyRule(antecedent=Is(concept="x", term="high"), consequences={"z": "high", "w": "high"}),
+        FuzzyRule(antecedent=Is(concept="x", term="mid"), consequences={"w": "mid"}, weight=0.5),
+        FuzzyRule(
+            antecedent=And(children=[Is(concept="x", term="low"), Is(concept="x", term="high")]),
+            consequences={"z": "mid"},
+        ),
+    ]
+    return MamdaniFIS(
+        input_variables={"x": make_level_variable("x")},
+        output_variables={"z": make_level_variable("z"), "w": make_level_variable("w")},
+        fuzzy_rules=rules,
+    )
+
+
+# region POSITIVE TESTS
+
+
+def test_stats_are_disabled_by_default(fis: MamdaniFIS) -> None:
+    """Test that no statistics are collected unless enabled."""
+    fis.infer({"x": 2.0})
+
+    assert fis.rule_stats() is None
+
+
+def test_stats_count_firings(fis: MamdaniFIS) -> None:
+    """Test that fire counts, mean strengths, strength histograms and decisive counts are accumulated."""
+    fis.enable_rule_stats(bins=4)
+
+    for x in (0.0, 2.0, 5.0, 8.0):
+        fis.infer({"x": x})
+
+    stats = fis.rule_stats()
+    # Strengths: low 1.0, 0.6, 0, 0; high 0, 0, 0, 0.6; mid (weight 0.5) 0, 0.2, 0.5, 0.2
+    assert list(stats.index) == [0, 1, 2, 3]
+    assert stats["rule"][0] == fis.fuzzy_rules[0].pretty()
+    assert stats["fired"].tolist() == [2, 1, 3, 0]
+    assert stats["fire_rate"].tolist() == [0.5, 0.25, 0.75, 0.0]
+    np.testing.assert_allclose(stats["mean_strength"][:3], [0.8, 0.6, 0.3])
+    assert np.isnan(stats["mean_strength"][3])
+    # The rule on x high decides w at x=8, where the rule on x mid fires with 0.2
+    assert stats["decisive"].tolist() == [2, 2, 2, 0]
+    assert list(stats.columns[5:]) == ["(0, 0.25]", "(0.25, 0.5]", "(0.5, 0.75]", "(0.75, 1]"]
+    assert stats.iloc[:, 5:].to_numpy().tolist() == [[0, 0, 1, 1], [0, 0, 1, 0], [2, 1, 0, 0], [0, 0, 0, 0]]
+
+
+def test_stats_exclude_plotting_and_reset(fis: MamdaniFIS) -> None:
+    """Test that only `infer` records, that enabling again resets, and that disabling drops the statistics."""
+    fis.enable_rule_stats()
+    fis.infer({"x": 2.0})
+    fis._rule_evaluation(fis._fuzzification({"x": 2.0}))
+
+    assert fis.rule_stats()["fired"].sum() == 2
+    fis.enable_rule_stats()
+    assert fis.rule_stats()["fired"].sum() == 0
+    fis.disable_rule_stats()
+    assert fis.rule_stats() is None
+
+
+def test_stats_follow_rule_changes(fis: MamdaniFIS) -> None:
+    """Test that counters survive edits within the rules, and restart when rules are removed."""
+    fis.enable_rule_stats()
+    fis.infer({"x": 2.0})
+
+    fis.fuzzy_rules[2].consequences = {"z": "mid"}
+    fis.infer({"x": 2.0})
+    stats = fis.rule_stats()
+    assert stats["fired"].tolist() == [2, 0, 2, 0]
+    assert stats["decisive"].tolist() == [2, 0, 1, 0]
+
+    fis.fuzzy_rules.pop()
+    stats = fis.rule_stats()
+    assert len(stats) == 3
+    assert stats["fired"].sum() == 0
+
+
+@pytest.mark.parametrize("change", ["replace", "reorder", "reassign"])
+def test_stats_restart_when_rules_differ(fis: MamdaniFIS, change: str) -> None:
+    """Test that counters restart when the rules differ from the counted ones, even if their number does not."""
+    fis.enable_rule_stats()
+    fis.infer({"x": 2.0})
+
+    if change == "replace":
+        fis.fuzzy_rules[0] = FuzzyRule.parse("IF x IS mid THEN z IS low")
+    elif change == "reorder":
+        fis.fuzzy_rules.reverse()
+    else:
+        fis.fuzzy_rules = [rule.model_copy() for rule in fis.fuzzy_rules]
+
+    assert fis.rule_stats()["fired"].tolist() == [0, 0, 0, 0]
+
+
+def test_stats_of_copies(fis: MamdaniFIS) -> None:
+    """Test that shallow copies, deep copies and pickles all keep their own copy of the counters."""
+    fis.enable_rule_stats()
+    fis.infer({"x": 2.0})
+
+    for restored in (copy.copy(fis), fis.model_copy(), copy.deepcopy(fis), pickle.loads(pickle.dumps(fis))):
+        assert restored.rule_stats()["fired"].tolist() == [1, 0, 1, 0]
+        restored.infer({"x": 8.0})
+        assert restored.rule_stats()["fired"].tolist() == [1, 1, 2, 0]
+    assert fis.rule_stats()["fired"].tolist() == [1, 0, 1, 0]
+
+
+# region NEGATIVE TESTS
+
+
+def test_invalid_bins_raise(fis: MamdaniFIS) -> None:
+    """Test that the strength histogram needs at least one bin."""
+    with pytest.raises(ValidationError):
+        fis.enable_rule_stats(bins=0)
@@ -0,0 +1,36 @@
+import numpy as np
+
+from src.mostly.membership_functions.triangle import MFTriangular
+
+# region POSITIVE TESTS
+
+
+def test_evaluate_matches_scalar_call(mf) -> None:
+    """Test that the array kernel returns exactly what the scalar path returns."""
+    x = np.concatenate([np.linspace(-20.0, 30.0, 501), [0.0, 3.0, 4.0, 5.0, 6.0, 7.0, 10.0]])
+
+    np.testing.assert_array_equal(mf.evaluate(x), [mf(v) for v in x.tolist()])
+
+
+def test_evaluate_preserves_shape(mf) -> None:
+    """Test that the array kernel broadcasts over arbitrary input shapes."""
+    x = np.linspace(0.0, 10.0, 12).reshape(3, 4)
+
+    assert mf.evaluate(x).shape == (3, 4)
+    assert mf.evaluate(5.0).shape == ()
+
+
+def test_generic_fallback(dummy_mf) -> None:
+    """Test that membership functions without a kernel fall back to element-wise calls."""
+    np.testing.assert_array_equal(dummy_mf.evaluate([0.0, 1.0]), [0.5, 1.5])
+
+
+def test_overridden_call_drops_inherited_kernel() -> None:
+    """Test that subclasses overriding `__call__` do not silently inherit a kernel of another shape."""
+
+    class ShiftedMF(MFTriangular):
+        def __call__(self, x: float) -> float:
+            return 0.25
+
+    mf = ShiftedMF(a=0.0, b=5.0, c=10.0)
+    np.testing.assert_array_equal(mf.evaluate([0.0, 5.0]), [0.25, 0.25])
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+class PlateauMF(MFTriangular):
+    """A custom membership function without a closed form."""
+
+    def __call__(self, x: float) -> float:
+        """Return full membership between `a` and `c`."""
+        return 1.0 if self.a <= x <= self.c else 0.0
+
+
+@pytest.fixture
+def many_terms_variable() -> LinguisticVariable:
+    """Fixture that returns a variable with a partition of 21 triangles and a few other shapes."""
+    fuzzy_sets = {f"t{i:02d}": MFTriangular(a=5.0 * i - 5.0, b=5.0 * i, c=5.0 * i + 5.0) for i in range(21)}
+    fuzzy_sets |= {
+        "gauss": MFGaussian(mean=40.0, sigma=3.0),
+        "bell": MFGeneralizedBell(width=4.0, slope=2.0, center=70.0),
+        "dips": MFPiecewiseLinear(xs=(10.0, 20.0, 30.0, 40.0), ys=(0.0, 1.0, 0.0, 0.5)),
+        "plateau": PlateauMF(a=20.0, b=30.0, c=40.0),
+    }
+    return LinguisticVariable(concept="level", uod=(0.0, 100.0), fuzzy_sets=fuzzy_sets)
+
+
+# region POSITIVE TESTS
+
+
+def test_batch_matches_fuzzify(many_terms_variable: LinguisticVariable) -> None:
+    """Test that every row equals the single-value fuzzification, in the order of the term index."""
+    x = np.linspace(0.0, 100.0, 1001)
+
+    memberships = many_terms_variable.fuzzify_batch(x)
+
+    assert memberships.shape == (1001, 25)
+    terms = many_terms_variable.term_bank.terms
+    assert terms == tuple(many_terms_variable.fuzzy_sets)
+    for row, value in zip(memberships, x.tolist(), strict=True):
+        assert dict(zip(terms, row.tolist(), strict=True)) == many_terms_variable.fuzzify(value)
+
+
+def test_sparse_matches_dense(many_terms_variable: LinguisticVariable) -> None:
+    """Test that the sparse result stores exactly the non-zero entries of the dense one."""
+    x = np.random.default_rng(0).uniform(0.0, 100.0, 5000)
+    x[:50] = np.arange(0.0, 100.0, 2.0)  # inputs on the knots, where neighbouring terms are exactly zero
+
+    dense = many_terms_variable.fuzzify_batch(x)
+    sparse = many_terms_variable.fuzzify_batch(x, sparse=True)
+
+    assert sparse.shape == dense.shape
+    assert sparse.nnz == np.count_nonzero(dense)
+    np.testing.assert_array_equal(sparse.toarray(), dense)
+    for i in range(sparse.shape[0]):
+        columns = sparse.indices[sparse.indptr[i] : sparse.indptr[i + 1]]
+        assert (np.diff(columns) > 0).all()
+    assert sparse.row(0) == {term: degree for term, degree in many_terms_variable.fuzzify(x[0]).items() if degree}
+
+
+def test_sparse_of_empty_input(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that an empty input gives an empty matrix with one column per term."""
+    sparse = simple_linguistic_variable.fuzzify_batch([], sparse=True)
+
+    assert sparse.shape == (0, 3)
+    assert sparse.toarray().shape == (0, 3)
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize("x", [[10.0, -0.5, 20.0], [10.0, 100.5], [np.nan], [np.inf]])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_batch_outside_uod_raises(simple_linguistic_variable: LinguisticVariable, x, sparse: bool) -> None:
+    """Test that any input outside the UOD or not finite is rejected for the whole batch."""
+    with pytest.raises(ValueError, match="outside the UOD bounds"):
+        simple_linguistic_variable.fuzzify_batch(x, sparse=sparse)
+
+
+def test_batch_requires_one_dimension(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that matrices of inputs are rejected."""
+    with pytest.raises(ValueError, match="one-dimensional"):
+        simple_linguistic_variable.fuzzify_batch(np.zeros((2, 2)))
+
+
+@pytest.mark.parametrize("resolution", [0, 1])
+def test_batch_resolution_below_two_raises(simple_linguistic_variable: LinguisticVariable, resolution: int) -> None:
+    """Test that the grid for noisy inputs needs at least two points."""
+    with pytest.raises(ValueError, match="at least 2 grid points"):
+        simple_linguistic_variable.fuzzify_batch([40.0], noise=MFGaussian(mean=0.0, sigma=5.0), resolution=resolution)
@@ -0,0 +1,126 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.triangle import MFTriangular
+
+# region POSITIVE TESTS
+
+
+def test_cached_fuzzify_counts_hits_and_misses(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that repeated inputs are served from the cache with the same degrees."""
+    expected = {x: simple_linguistic_variable.fuzzify(x) for x in (10.0, 37.5, 62.5)}
+    assert simple_linguistic_variable.fuzzify_cache_info() is None
+
+    simple_linguistic_variable.enable_fuzzify_cache(maxsize=8)
+    for _ in range(3):
+        for x, degrees in expected.items():
+            assert simple_linguistic_variable.fuzzify(x) == degrees
+
+    info = simple_linguistic_variable.fuzzify_cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (6, 3, 3, 8)
+
+
+def test_results_are_not_shared(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that mutating a returned mapping does not corrupt the cache."""
+    simple_linguistic_variable.enable_fuzzify_cache()
+
+    simple_linguistic_variable.fuzzify(40.0)["cold"] = 99.0
+
+    assert simple_linguistic_variable.fuzzify(40.0)["cold"] == pytest.approx(0.2)
+
+
+def test_least_recently_used_entry_is_evicted(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that the cache stays bounded, evicting the least recently used input."""
+    simple_linguistic_variable.enable_fuzzify_cache(maxsize=2)
+
+    for x in (1.0, 2.0, 1.0, 3.0, 1.0, 2.0):
+        simple_linguistic_variable.fuzzify(x)
+
+    info = simple_linguistic_variable.fuzzify_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
+def test_quantized_keys_share_entries(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that inputs are snapped to the quantization grid, clamped into the UOD."""
+    simple_linguistic_variable.enable_fuzzify_cache(quantum=0.5)
+
+    assert simple_linguistic_variable.fuzzify(37.4) == simple_linguistic_variable.fuzzify(37.5)
+    assert simple_linguistic_variable.fuzzify(37.6) == simple_linguistic_variable.fuzzify(37.5)
+    assert simple_linguistic_variable.fuzzify(37.6)["warm"] == pytest.approx(0.5)
+
+    simple_linguistic_variable.enable_fuzzify_cache(quantum=60.0)
+    assert simple_linguistic_variable.fuzzify(100.0) == {"cold": 0.0, "warm": 0.0, "hot": 1.0}  # 120 -> 100
+    assert simple_linguistic_variable.fuzzify_cache_info().hits == 0
+
+
+def test_changes_invalidate_the_cache(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that changing a term's parameters or the fuzzy sets mapping empties the cache."""
+    simple_linguistic_variable.enable_fuzzify_cache()
+    assert simple_linguistic_variable.fuzzify(40.0)["warm"] == pytest.approx(0.6)
+
+    simple_linguistic_variable.fuzzy_sets["warm"].b = 40.0
+    assert simple_linguistic_variable.fuzzify(40.0)["warm"] == 1.0
+
+    simple_linguistic_variable.fuzzy_sets["mild"] = MFTriangular(a=30.0, b=40.0, c=50.0)
+    assert simple_linguistic_variable.fuzzify(40.0)["mild"] == 1.0
+
+    simple_linguistic_variable.fuzzy_sets = {"any": MFTriangular(a=0.0, b=0.0, c=150.0)}
+    assert simple_linguistic_variable.fuzzify(40.0) == {"any": pytest.approx(110.0 / 150.0)}
+
+    info = simple_linguistic_variable.fuzzify_cache_info()
+    assert (info.hits, info.misses, info.invalidations) == (0, 4, 3)
+
+
+def test_unrelated_changes_keep_the_cache(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that changes to other variables, or re-assigning equal parameters, do not empty the cache."""
+    other = simple_linguistic_variable.model_copy(deep=True)
+    simple_linguistic_variable.enable_fuzzify_cache()
+    simple_linguistic_variable.fuzzify(40.0)
+
+    other.fuzzy_sets["mild"] = MFTriangular(a=30.0, b=40.0, c=50.0)
+    other.uod = (0.0, 200.0)
+    simple_linguistic_variable.fuzzy_sets["warm"].b = 50.0
+    simple_linguistic_variable.fuzzify(40.0)
+
+    info = simple_linguistic_variable.fuzzify_cache_info()
+    assert (info.hits, info.misses, info.invalidations) == (1, 1, 0)
+
+
+def test_copies_get_their_own_cache(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that copies and unpickled variables keep the configuration with an empty cache."""
+    simple_linguistic_variable.enable_fuzzify_cache(maxsize=16, quantum=0.1)
+    simple_linguistic_variable.fuzzify(10.0)
+
+    for copied in (
+        copy.copy(simple_linguistic_variable),
+        copy.deepcopy(simple_linguistic_variable),
+        pickle.loads(pickle.dumps(simple_linguistic_variable)),
+    ):
+        info = copied.fuzzify_cache_info()
+        assert (info.maxsize, info.quantum, info.currsize, info.misses) == (16, 0.1, 0, 0)
+        assert copied == simple_linguistic_variable
+
+    simple_linguistic_variable.disable_fuzzify_cache()
+    assert simple_linguistic_variable.fuzzify_cache_info() is None
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize("maxsize, quantum", [(0, None), (16, 0.0), (16, -1.0)])
+def test_invalid_cache_configuration_raises(simple_linguistic_variable: LinguisticVariable, maxsize, quantum) -> None:
+    """Test that the cache needs a positive size and quantization step."""
+    with pytest.raises(ValidationError):
+        simple_linguistic_variable.enable_fuzzify_cache(maxsize, quantum)
+
+
+def test_cached_fuzzify_still_checks_uod(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that inputs outside the UOD are rejected before the cache is consulted."""
+    simple_linguistic_variable.enable_fuzzify_cache(quantum=10.0)
+
+    with pytest.raises(ValueError, match="outside the UOD bounds"):
+        simple_linguistic_variable.fuzzify(101.0)
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.trapezoidal import MFTrapezoidal
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+@pytest.fixture
+def mixed_variable() -> LinguisticVariable:
+    """Fixture that returns a variable with linear, Gaussian and bell-shaped terms."""
+    return LinguisticVariable(
+        concept="temperature",
+        uod=(0.0, 100.0),
+        fuzzy_sets={
+            "cold": MFTriangular(a=0.0, b=0.0, c=50.0),
+            "warm": MFTrapezoidal(a=25.0, b=45.0, c=55.0, d=75.0),
+            "hot": MFTriangular(a=50.0, b=100.0, c=100.0),
+            "dips": MFPiecewiseLinear(xs=(10.0, 20.0, 30.0, 40.0), ys=(0.0, 1.0, 0.0, 0.5)),
+            "mild": MFGaussian(mean=50.0, sigma=10.0),
+            "bell": MFGeneralizedBell(width=5.0, slope=2.0, center=30.0),
+        },
+    )
+
+
+def brute_force(lv: LinguisticVariable, noise, x: float) -> np.ndarray:
+    """Sup-min degrees of the noise translated to `x`, on a fine grid over the UOD."""
+    grid = np.linspace(*lv.uod, 400001)
+    return np.minimum(noise.evaluate(grid - x)[:, np.newaxis], lv.term_bank.evaluate(grid)).max(axis=0)
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "noise",
+    [
+        MFTriangular(a=-3.0, b=0.0, c=2.0),
+        MFTrapezoidal(a=-2.0, b=-1.0, c=1.0, d=2.0),
+        MFGaussian(mean=0.5, sigma=2.0),
+    ],
+)
+def test_batch_matches_sup_min(mixed_variable: LinguisticVariable, noise) -> None:
+    """Test that every row holds the sup-min degrees of the translated noise, exact for closed-form pairs."""
+    x = np.array([0.0, 0.5, 12.0, 29.0, 47.5, 50.0, 83.3, 100.0])
+
+    degrees = mixed_variable.fuzzify_batch(x, noise=noise)
+
+    assert degrees.shape == (8, 6)
+    closed = [0, 1, 2, 3] if isinstance(noise, MFTriangular | MFTrapezoidal) else [4]
+    sampled = [j for j in range(6) if j not in closed]
+    for row, value in zip(degrees, x.tolist(), strict=True):
+        expected = brute_force(mixed_variable, noise, value)
+        # The grid only approaches the exact supremum from below
+        assert (row[closed] >= expected[closed] - 1e-12).all()
+        np.testing.assert_allclose(row[closed], expected[closed], atol=1e-4)
+        np.testing.assert_allclose(row[sampled], expected[sampled], atol=1e-2)
+
+
+def test_single_input_matches_batch(mixed_variable: LinguisticVariable) -> None:
+    """Test that a fuzzy input equals a batch of one measurement with the input as noise around zero."""
+    reading = MFGaussian(mean=30.0, sigma=1.0)
+
+    degrees = mixed_variable.fuzzify_nonsingleton(reading)
+
+    assert list(degrees) == list(mixed_variable.fuzzy_sets)
+    noise = MFGaussian(mean=0.0, sigma=1.0)
+    assert list(degrees.values()) == mixed_variable.fuzzify_batch([30.0], noise=noise)[0].tolist()
+    assert degrees["bell"] == 1.0
+    assert degrees["mild"] == pytest.approx(np.exp(-0.5 * (20.0 / 11.0) ** 2))
+
+
+def test_noise_widens_memberships(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that a noisy reading has at least the degrees of the crisp one, which a narrow noise approaches."""
+    crisp = simple_linguistic_variable.fuzzify(40.0)
+
+    wide = simple_linguistic_variable.fuzzify_nonsingleton(MFTriangular(a=35.0, b=40.0, c=45.0))
+    narrow = simple_linguistic_variable.fuzzify_nonsingleton(MFTriangular(a=39.999, b=40.0, c=40.001))
+
+    assert all(wide[term] >= crisp[term] for term in crisp)
+    assert wide["hot"] == 0.0
+    assert narrow == pytest.approx(crisp, abs=1e-4)
+
+
+def test_supremum_is_taken_within_uod(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that the parts of a fuzzy input outside the UOD do not count."""
+    degrees = simple_linguistic_variable.fuzzify_nonsingleton(MFGaussian(mean=-50.0, sigma=1.0))
+
+    assert degrees == {"cold": pytest.approx(np.exp(-0.5 * 50.0**2)), "warm": 0.0, "hot": 0.0}
+
+
+def test_sparse_noisy_batch(mixed_variable: LinguisticVariable) -> None:
+    """Test that noisy batches can be returned as sparse memberships."""
+    x = np.linspace(0.0, 100.0, 101)
+    noise = MFTriangular(a=-1.0, b=0.0, c=1.0)
+
+    sparse = mixed_variable.fuzzify_batch(x, sparse=True, noise=noise)
+
+    dense = mixed_variable.fuzzify_batch(x, noise=noise)
+    assert sparse.nnz == np.count_nonzero(dense)
+    np.testing.assert_array_equal(sparse.toarray(), dense)
+
+
+# region NEGATIVE TESTS
+
+
+def test_noisy_batch_outside_uod_raises(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that measurements outside the UOD are rejected even with noise."""
+    with pytest.raises(ValueError, match="outside the UOD bounds"):
+        simple_linguistic_variable.fuzzify_batch([50.0, 120.0], noise=MFGaussian(mean=0.0, sigma=1.0))
+
+
+@pytest.mark.parametrize("x, resolution", [(25.0, 1001), (MFGaussian(mean=0.0, sigma=1.0), 1)])
+def test_invalid_nonsingleton_arguments_raise(simple_linguistic_variable: LinguisticVariable, x, resolution) -> None:
+    """Test that the input must be a membership function and the grid needs at least two points."""
+    with pytest.raises(ValidationError):
+        simple_linguistic_variable.fuzzify_nonsingleton(x, resolution)
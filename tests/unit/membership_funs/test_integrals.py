@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.trapezoidal import MFTrapezoidal
+from src.mostly.membership_functions.triangle import MFTriangular
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize("alpha", [1.0, 0.6, 0.01])
+@pytest.mark.parametrize("implication", ["clip", "scale"])
+def test_integrals_match_fine_sampling(mf, alpha, implication) -> None:
+    """Test that the exact area and moment agree with a fine trapezoidal sampling of the implied set."""
+    bounds = (-8.0, 17.0)
+    x = np.linspace(*bounds, 500_001)
+    mu = mf.evaluate(x)
+    implied = np.minimum(mu, alpha) if implication == "clip" else alpha * mu
+
+    assert mf.area(alpha, implication, bounds) == pytest.approx(np.trapezoid(implied, x), abs=1e-8)
+    assert mf.moment(alpha, implication, bounds) == pytest.approx(np.trapezoid(x * implied, x), abs=1e-7)
+
+
+def test_triangle_closed_forms() -> None:
+    """Test hand-computed areas and centroids of a clipped and a scaled triangle."""
+    mf = MFTriangular(a=0.0, b=2.0, c=10.0)
+
+    assert mf.area() == 5.0
+    assert mf.moment() / mf.area() == pytest.approx(4.0)
+    # Clipped at 0.5 the triangle becomes a trapezoid with parallel sides 10 and 5
+    assert mf.area(0.5, "clip") == pytest.approx(3.75)
+    assert mf.area(0.5, "scale") == 2.5
+    assert mf.moment(0.5, "scale") / mf.area(0.5, "scale") == pytest.approx(4.0)
+
+
+def test_gaussian_closed_forms() -> None:
+    """Test the unbounded area and centroid of a Gaussian."""
+    mf = MFGaussian(mean=3.0, sigma=2.0)
+
+    assert mf.area() == pytest.approx(2.0 * np.sqrt(2.0 * np.pi))
+    assert mf.moment(0.3, "scale") / mf.area(0.3, "scale") == pytest.approx(3.0)
+    assert mf.area(0.3, "clip") < 0.3 * (mf.support()[1] - mf.support()[0])
+
+
+def test_generalized_bell_unbounded_area() -> None:
+    """Test the numeric bell integral against the closed-form area over the real line."""
+    mf = MFGeneralizedBell(width=2.0, slope=4.0, center=5.0)
+    n = 2.0 * mf.slope
+
+    assert mf.area() == pytest.approx(2.0 * mf.width * (np.pi / n) / np.sin(np.pi / n), rel=1e-9)
+    assert mf.moment() / mf.area() == pytest.approx(5.0)
+
+
+def test_open_shoulders_need_bounds() -> None:
+    """Test that a shoulder has an infinite area unless it is bounded, e.g. by the universe of discourse."""
+    mf = MFTrapezoidal(a=0.0, b=4.0, c=10.0, d=10.0)
+
+    assert mf.area() == np.inf
+    assert mf.moment() == np.inf
+    assert mf.area(bounds=(0.0, 10.0)) == 8.0
+
+
+def test_empty_bounds_have_zero_area(regular_triangular_mf: MFTriangular) -> None:
+    """Test that bounds outside the support integrate to zero."""
+    assert regular_triangular_mf.area(bounds=(20.0, 30.0)) == 0.0
+    assert regular_triangular_mf.moment(bounds=(5.0, 5.0)) == 0.0
+
+
+# region NEGATIVE TESTS
+
+
+def test_reversed_bounds_raise(regular_triangular_mf: MFTriangular) -> None:
+    """Test that reversed integration bounds are rejected."""
+    with pytest.raises(ValueError, match="low ≤ high"):
+        regular_triangular_mf.area(bounds=(10.0, 0.0))
+
+
+def test_invalid_implication_raises(regular_triangular_mf: MFTriangular) -> None:
+    """Test that only the clip and scale implications are accepted."""
+    with pytest.raises(ValidationError):
+        regular_triangular_mf.area(0.5, "product")
+
+
+def test_unbounded_numeric_integral_raises(dummy_mf) -> None:
+    """Test that shapes without a closed form or a finite support require bounds."""
+    with pytest.raises(ValueError, match="pass finite `bounds`"):
+        dummy_mf.area()
+    # The dummy degree x + 0.5 exceeds one above x = 0.5, where clipping flattens it
+    assert dummy_mf.area(1.0, "scale", (0.0, 1.0)) == pytest.approx(1.0)
+    assert dummy_mf.area(1.0, "clip", (0.0, 1.0)) == pytest.approx(0.875)
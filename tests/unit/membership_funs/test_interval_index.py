@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+class SquareMF(MFTriangular):
+    """A custom membership function without a closed form."""
+
+    def __call__(self, x: float) -> float:
+        """Return full membership between `a` and `c`."""
+        return 1.0 if self.a <= x <= self.c else 0.0
+
+
+@pytest.fixture
+def partition_variable() -> LinguisticVariable:
+    """Fixture that returns a variable with a triangular partition and some other shapes."""
+    fuzzy_sets = {f"t{i:02d}": MFTriangular(a=5.0 * i - 5.0, b=5.0 * i, c=5.0 * i + 5.0) for i in range(21)}
+    fuzzy_sets |= {
+        "gauss": MFGaussian(mean=40.0, sigma=3.0),
+        "dips": MFPiecewiseLinear(xs=(10.0, 20.0, 30.0, 40.0), ys=(0.0, 1.0, 0.0, 0.5)),
+        "square": SquareMF(a=60.0, b=65.0, c=70.0),
+    }
+    return LinguisticVariable(concept="level", uod=(0.0, 100.0), fuzzy_sets=fuzzy_sets)
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 1e-6, 0.3])
+def test_sparse_fuzzify_keeps_degrees_above_epsilon(partition_variable: LinguisticVariable, epsilon: float) -> None:
+    """Test that the sparse result holds exactly the degrees above `epsilon`, on and between breakpoints."""
+    x = np.concatenate([np.linspace(0.0, 100.0, 2001), partition_variable.interval_index(epsilon).breakpoints])
+
+    for value in x[(x >= 0.0) & (x <= 100.0)].tolist():
+        expected = {term: degree for term, degree in partition_variable.fuzzify(value).items() if degree > epsilon}
+        assert partition_variable.fuzzify_sparse(value, epsilon) == expected
+
+
+def test_few_terms_are_active(partition_variable: LinguisticVariable) -> None:
+    """Test that a triangular partition activates two terms, and the custom shape is active everywhere."""
+    active = [term for term, _ in partition_variable.interval_index().active(12.5)]
+
+    assert active == ["t02", "t03", "gauss", "dips", "square"]
+    assert list(partition_variable.fuzzify_sparse(10.0)) == ["t02", "gauss"]
+
+
+def test_epsilon_cuts_gaussian_tails() -> None:
+    """Test that a positive epsilon narrows the active interval of a Gaussian to where it exceeds epsilon."""
+    lv = LinguisticVariable(concept="x", uod=(20.0, 80.0), fuzzy_sets={"g": MFGaussian(mean=50.0, sigma=1.0)})
+
+    assert lv.fuzzify_sparse(25.0) == lv.fuzzify(25.0)
+    assert lv.fuzzify_sparse(25.0, epsilon=1e-9) == {}
+    assert lv.interval_index(1e-9).breakpoints == pytest.approx(list(MFGaussian(mean=50.0, sigma=1.0).support(1e-9)))
+
+
+def test_index_follows_changes(partition_variable: LinguisticVariable) -> None:
+    """Test that the index is rebuilt after a term is changed or added."""
+    assert "t03" in partition_variable.fuzzify_sparse(13.0)
+
+    partition_variable.fuzzy_sets["t03"].a = 13.5
+    partition_variable.fuzzy_sets["extra"] = MFTriangular(a=12.0, b=13.0, c=14.0)
+
+    assert "t03" not in partition_variable.fuzzify_sparse(13.0)
+    assert partition_variable.fuzzify_sparse(13.0)["extra"] == 1.0
+
+
+def test_index_is_kept_for_the_last_epsilon(partition_variable: LinguisticVariable) -> None:
+    """Test that a new epsilon rebuilds the one cached index instead of caching an index per epsilon."""
+    index = partition_variable.interval_index()
+
+    for epsilon in (1e-3, 1e-6, 0.0):
+        partition_variable.fuzzify_sparse(12.5, epsilon)
+
+    assert list(partition_variable._derived) == ["interval_index"]
+    assert partition_variable.interval_index() is not index
+    assert partition_variable.interval_index() is partition_variable.interval_index(0.0)
+
+
+# region NEGATIVE TESTS
+
+
+def test_sparse_fuzzify_outside_uod_raises(partition_variable: LinguisticVariable) -> None:
+    """Test that inputs outside the UOD are rejected."""
+    with pytest.raises(ValueError, match="outside the UOD bounds"):
+        partition_variable.fuzzify_sparse(101.0)
+
+
+@pytest.mark.parametrize("epsilon", [-0.1, 1.0])
+def test_invalid_epsilon_raises(partition_variable: LinguisticVariable, epsilon: float) -> None:
+    """Test that epsilon must lie in [0, 1)."""
+    with pytest.raises(ValidationError):
+        partition_variable.fuzzify_sparse(50.0, epsilon)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.membership_functions.bimodal_gaussian import MFBimodalGaussian
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.trapezoidal import MFTrapezoidal
+from src.mostly.membership_functions.triangle import MFTriangular
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "mf, support, core, alpha_cut",
+    [
+        (MFTriangular(a=0.0, b=5.0, c=10.0), (0.0, 10.0), (5.0, 5.0), (2.5, 7.5)),
+        (MFTriangular(a=0.0, b=0.0, c=10.0), (-np.inf, 10.0), (-np.inf, 0.0), (-np.inf, 5.0)),
+        (MFTriangular(a=0.0, b=10.0, c=10.0), (0.0, np.inf), (10.0, np.inf), (5.0, np.inf)),
+        (MFTrapezoidal(a=0.0, b=4.0, c=6.0, d=10.0), (0.0, 10.0), (4.0, 6.0), (2.0, 8.0)),
+        (MFTrapezoidal(a=0.0, b=0.0, c=2.0, d=6.0), (-np.inf, 6.0), (-np.inf, 2.0), (-np.inf, 4.0)),
+        (MFTrapezoidal(a=0.0, b=4.0, c=10.0, d=10.0), (0.0, np.inf), (4.0, np.inf), (2.0, np.inf)),
+    ],
+)
+def test_piecewise_linear_intervals(mf, support, core, alpha_cut) -> None:
+    """Test the closed-form intervals of triangles and trapezoids, including shoulders."""
+    assert mf.support() == support
+    assert mf.core() == core
+    assert mf.alpha_cut(0.5) == alpha_cut
+
+
+def test_gaussian_intervals() -> None:
+    """Test the epsilon-truncated support and alpha cuts of a Gaussian."""
+    mf = MFGaussian(mean=5.0, sigma=2.0)
+    half_width = 2.0 * np.sqrt(2.0 * np.log(2.0))
+
+    assert mf.core() == (5.0, 5.0)
+    assert mf.alpha_cut(0.5) == pytest.approx((5.0 - half_width, 5.0 + half_width))
+    assert mf.support(0.5) == mf.alpha_cut(0.5)
+
+
+def test_inverted_bimodal_gaussian_is_subnormal(inverted_bimodal_gaussian_mf: MFBimodalGaussian) -> None:
+    """Test that the product case has a height below one and therefore no core."""
+    height = inverted_bimodal_gaussian_mf.height()
+
+    assert height == pytest.approx(inverted_bimodal_gaussian_mf(5.0))
+    assert inverted_bimodal_gaussian_mf.core() is None
+    assert inverted_bimodal_gaussian_mf.alpha_cut(height) == pytest.approx((5.0, 5.0))
+    assert inverted_bimodal_gaussian_mf.alpha_cut(min(2.0 * height, 1.0)) is None
+    assert inverted_bimodal_gaussian_mf.support(height) is None
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 1e-3, 0.3])
+def test_membership_outside_support_is_at_most_epsilon(mf, epsilon) -> None:
+    """Test that no input outside the support has a degree of membership above `epsilon`."""
+    support = mf.support(epsilon)
+    x = np.linspace(-60.0, 70.0, 13_001)
+    mu = mf.evaluate(x)
+    if support is None:
+        assert np.all(mu <= epsilon)
+        return
+
+    low, high = support
+    outside = (x < low) | (x > high)
+
+    assert np.all(mu[outside] <= epsilon)
+    assert np.all(mu[~outside] >= epsilon)
+
+
+@pytest.mark.parametrize("alpha", [0.1, 0.5, 0.9])
+def test_alpha_cut_matches_sampled_level_set(mf, alpha) -> None:
+    """Test that the alpha cut contains exactly the sampled inputs with a degree of at least `alpha`."""
+    cut = mf.alpha_cut(alpha)
+    x = np.linspace(-60.0, 70.0, 13_001)
+    mu = mf.evaluate(x)
+    if cut is None:
+        assert np.all(mu < alpha)
+        return
+
+    low, high = cut
+    inside = (x >= low) & (x <= high)
+    # Inputs within rounding distance of a boundary may fall on either side
+    boundary = np.isclose(x, low) | np.isclose(x, high)
+    assert np.all(mu[inside & ~boundary] >= alpha)
+    assert np.all(mu[~inside & ~boundary] < alpha)
+
+
+def test_gaussian_support_ends_where_evaluation_underflows(regular_gaussian_mf: MFGaussian) -> None:
+    """Test that the default support of a Gaussian is truncated just past the last nonzero degree."""
+    low, high = regular_gaussian_mf.support()
+
+    assert regular_gaussian_mf(high) == 0.0 == regular_gaussian_mf(low)
+    assert regular_gaussian_mf(high - 0.1) > 0.0
+
+
+def test_generic_fallback_is_unbounded(dummy_mf) -> None:
+    """Test that a membership function without a closed form reports the safe unbounded interval."""
+    assert dummy_mf.alpha_cut(0.5) == (-np.inf, np.inf)
+    assert dummy_mf.core() == (-np.inf, np.inf)
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize("alpha", [0.0, -0.5, 1.5, float("nan")])
+def test_alpha_cut_rejects_invalid_levels(regular_triangular_mf: MFTriangular, alpha: float) -> None:
+    """Test that alpha levels outside (0, 1] are rejected."""
+    with pytest.raises(ValidationError):
+        regular_triangular_mf.alpha_cut(alpha)
+
+
+@pytest.mark.parametrize("epsilon", [-0.1, 1.0])
+def test_support_rejects_invalid_epsilon(regular_triangular_mf: MFTriangular, epsilon: float) -> None:
+    """Test that truncation levels outside [0, 1) are rejected."""
+    with pytest.raises(ValidationError):
+        regular_triangular_mf.support(epsilon)
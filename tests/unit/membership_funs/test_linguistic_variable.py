@@ -2,6 +2,9 @@ import altair as alt
 import pytest
 
 from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.tabulated import MFTabulated
 from src.mostly.membership_functions.triangle import MFTriangular
 from src.mostly.plotting.altair.plot_fuzzy_set import plot_fuzzy_set
 from src.mostly.plotting.altair.plot_linguistic_variable import plot_linguistic_variable
@@ -168,6 +171,80 @@ def test_nan_membership_detected() -> None:
     assert "broken membership function" in str(err)
 
 
+@pytest.mark.parametrize(
+    "fuzzy_sets, expected",
+    [
+        pytest.param(
+            {"cold": MFTriangular(a=0.0, b=0.0, c=30.0), "hot": MFTriangular(a=60.0, b=100.0, c=100.0)},
+            "[30.00, 60.00]",
+            id="gap",
+        ),
+        pytest.param(
+            {"cold": MFTriangular(a=0.0, b=0.0, c=50.0), "hot": MFTriangular(a=50.0, b=100.0, c=100.0)},
+            "[50.00, 50.00]",
+            id="single point",
+        ),
+        pytest.param(
+            {"all": MFPiecewiseLinear(xs=(0.0, 20.0, 40.0, 70.0, 100.0), ys=(1.0, 0.5, 0.0, 0.0, 1.0))},
+            "[40.00, 70.00]",
+            id="dip",
+        ),
+        pytest.param(
+            {
+                "cold": MFGaussian(mean=0.0, sigma=1.0),
+                "hot": MFTriangular(a=50.0, b=100.0, c=100.0),
+                "warm": MFTriangular(a=45.0, b=47.0, c=49.0),
+            },
+            f"[{MFGaussian(mean=0.0, sigma=1.0).support()[1]:.2f}, 45.00], [49.00, 50.00]",
+            id="gaussian tail",
+        ),
+    ],
+)
+def test_uncovered_ranges_are_exact(fuzzy_sets, expected) -> None:
+    """Test that uncovered ranges are reported with the exact bounds of the closed-form shapes."""
+    with pytest.raises(ValueError, match="zero membership to all terms") as exc:
+        LinguisticVariable(concept="temperature", uod=(0.0, 100.0), fuzzy_sets=fuzzy_sets)
+
+    assert f"all terms: {expected}." in str(exc.value)
+
+
+class BumpMF(MFTriangular):
+    """A custom membership function without closed form, positive on (a, c) like a triangle."""
+
+    def __call__(self, x: float) -> float:
+        """Return a quadratic bump."""
+        return max(0.0, (x - self.a) * (self.c - x)) / ((self.b - self.a) * (self.c - self.b))
+
+
+def test_coverage_samples_custom_shapes() -> None:
+    """Test that custom shapes are sampled only within the ranges left uncovered by closed-form shapes."""
+    closed_form = {"cold": MFTriangular(a=0.0, b=0.0, c=30.0), "hot": MFTriangular(a=60.0, b=100.0, c=100.0)}
+
+    LinguisticVariable(
+        concept="temperature", uod=(0.0, 100.0), fuzzy_sets={**closed_form, "warm": BumpMF(a=25.0, b=45.0, c=65.0)}
+    )
+
+    with pytest.raises(ValueError) as exc:
+        LinguisticVariable(
+            concept="temperature", uod=(0.0, 100.0), fuzzy_sets={**closed_form, "warm": BumpMF(a=35.0, b=45.0, c=65.0)}
+        )
+
+    assert "all terms: [30.00, 35.00]." in str(exc.value)
+
+
+def test_nan_in_tabulated_membership_detected() -> None:
+    """Test that tables sampled from a broken membership function are sampled for NaN like custom shapes."""
+    with pytest.raises(ValueError, match="'broken' in linguistic variable 'temperature' returns NaN at x=0.0"):
+        LinguisticVariable(
+            concept="temperature",
+            uod=(0.0, 100.0),
+            fuzzy_sets={
+                "all": MFTriangular(a=0.0, b=0.0, c=100.0),
+                "broken": MFTabulated(mf=BrokenMF(a=25.0, b=50.0, c=75.0), uod=(25.0, 75.0), size=11),
+            },
+        )
+
+
 def test_fuzzify_input_below_uod() -> None:
     """Test that fuzzify raises an error when input is below UOD minimum."""
     lv = LinguisticVariable(
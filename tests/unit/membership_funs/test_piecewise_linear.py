@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+class StepMF(MFTriangular):
+    """A custom membership function that jumps from 0.3 to full membership at `b`."""
+
+    def __call__(self, x: float) -> float:
+        """Return 0.3 between `a` and `b` and full membership between `b` and `c`."""
+        if self.a <= x < self.b:
+            return 0.3
+        return 1.0 if self.b <= x <= self.c else 0.0
+
+
+@pytest.fixture
+def two_peaks_mf() -> MFPiecewiseLinear:
+    """Fixture that returns a piecewise-linear membership function with two peaks."""
+    return MFPiecewiseLinear(xs=(0.0, 2.0, 4.0, 6.0, 8.0), ys=(0.0, 1.0, 0.2, 0.8, 0.0))
+
+
+# region POSITIVE TESTS
+
+
+def test_evaluation_paths_agree(two_peaks_mf: MFPiecewiseLinear) -> None:
+    """Test that the validated, trusted and vectorized paths return exactly the same degrees."""
+    x = np.concatenate([np.linspace(-2.0, 10.0, 1201), two_peaks_mf.xs])
+
+    expected = np.interp(x, two_peaks_mf.xs, two_peaks_mf.ys)
+    np.testing.assert_array_equal(two_peaks_mf.evaluate(x), expected)
+    assert [two_peaks_mf.trusted(v) for v in x.tolist()] == expected.tolist()
+    assert [two_peaks_mf(v) for v in x.tolist()] == expected.tolist()
+
+
+def test_level_sets_are_hulls(two_peaks_mf: MFPiecewiseLinear) -> None:
+    """Test the level sets of a function with two peaks, including the hull over the dip."""
+    assert two_peaks_mf.height() == 1.0
+    assert two_peaks_mf.support() == (0.0, 8.0)
+    assert two_peaks_mf.core() == (2.0, 2.0)
+    assert two_peaks_mf.alpha_cut(0.5) == pytest.approx((1.0, 6.75))
+    assert two_peaks_mf.alpha_cut(0.9) == pytest.approx((1.8, 2.25))
+
+
+def test_integrals_are_exact(two_peaks_mf: MFPiecewiseLinear) -> None:
+    """Test the area of the knots by the trapezoid rule on the knots themselves."""
+    assert two_peaks_mf.area() == pytest.approx(np.trapezoid(two_peaks_mf.ys, two_peaks_mf.xs))
+    assert two_peaks_mf.area(0.5, "scale") == pytest.approx(0.5 * two_peaks_mf.area())
+
+
+@pytest.mark.parametrize("max_error", [1e-2, 1e-4])
+def test_approximation_respects_error_bound(mf, max_error) -> None:
+    """Test that the approximation stays within the bound and reports its achieved error."""
+    x = np.linspace(-30.0, 40.0, 700_001)
+
+    approximation, error = MFPiecewiseLinear.approximate(mf, max_error, bounds=(-30.0, 40.0))
+    actual = np.abs(approximation.evaluate(x) - mf.evaluate(x)).max()
+
+    assert error <= max_error
+    assert actual <= max_error
+    assert actual == pytest.approx(error, rel=0.05, abs=1e-12)
+
+
+def test_approximation_of_triangle_is_exact() -> None:
+    """Test that shapes that are already piecewise linear, shoulders included, convert without error."""
+    mf = MFTriangular(a=0.0, b=0.0, c=10.0)
+
+    approximation, error = MFPiecewiseLinear.approximate(mf)
+
+    assert error == 0.0
+    assert approximation.support() == mf.support()
+    assert approximation.area(0.4, "clip", (0.0, 10.0)) == pytest.approx(mf.area(0.4, "clip", (0.0, 10.0)))
+
+
+def test_approximation_refines_adaptively(regular_generalized_bell_mf: MFGeneralizedBell) -> None:
+    """Test that a tighter bound places more knots, concentrated where the bell bends."""
+    coarse, _ = MFPiecewiseLinear.approximate(regular_generalized_bell_mf, 1e-2, (-5.0, 15.0))
+    fine, _ = MFPiecewiseLinear.approximate(regular_generalized_bell_mf, 1e-4, (-5.0, 15.0))
+    knots = np.asarray(fine.xs)
+
+    assert len(coarse.xs) < len(fine.xs)
+    assert np.sum(np.abs(knots - 5.0) < 4.0) > np.sum(np.abs(knots - 5.0) >= 4.0)
+
+
+def test_approximation_of_zero_function_spans_the_bounds() -> None:
+    """Test that a function that is zero everywhere is approximated exactly over the bounds."""
+    zero = MFPiecewiseLinear(xs=(0.0, 1.0), ys=(0.0, 0.0))
+
+    approximation, error = MFPiecewiseLinear.approximate(zero, bounds=(-2.0, 3.0))
+
+    assert approximation.xs[0] == -2.0 and approximation.xs[-1] == 3.0
+    assert max(approximation.ys) == 0.0
+    assert error == 0.0
+
+
+def test_approximation_of_a_jump_stops_at_float_resolution() -> None:
+    """Test that a jump is kept between two close knots and reported as the achieved error."""
+    step = StepMF(a=0.0, b=4.3, c=10.0)
+
+    approximation, error = MFPiecewiseLinear.approximate(step, 1e-3, (0.0, 10.0))
+    knots = np.asarray(approximation.xs)
+    below, above = knots[knots < 4.3][-1], knots[knots >= 4.3][0]
+
+    assert len(knots) < 200
+    assert above - below < 1e-12
+    # The probes of the narrow segment over the jump fall on few distinct floats
+    assert 1e-3 < error <= 0.7 + 1e-12
+    x = np.linspace(0.0, 10.0, 1001)
+    x = x[np.abs(x - 4.3) > 1e-9]
+    np.testing.assert_allclose(approximation.evaluate(x), step.evaluate(x))
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize(
+    "xs, ys",
+    [
+        ((0.0,), (1.0,)),
+        ((0.0, 1.0), (1.0,)),
+        ((0.0, 0.0, 1.0), (0.0, 1.0, 0.0)),
+        ((0.0, 1.0), (0.0, 1.5)),
+    ],
+)
+def test_invalid_knots_raise(xs, ys) -> None:
+    """Test that malformed knots are rejected."""
+    with pytest.raises(ValidationError):
+        MFPiecewiseLinear(xs=xs, ys=ys)
+
+
+def test_unbounded_approximation_raises() -> None:
+    """Test that shapes whose support is too wide to sample require bounds."""
+    with pytest.raises(ValueError, match="pass `bounds`"):
+        MFPiecewiseLinear.approximate(MFGeneralizedBell(width=1.0, slope=0.5, center=0.0))
+
+
+def test_zero_function_approximation_without_bounds_raises() -> None:
+    """Test that a function that is zero everywhere has no range to approximate without bounds."""
+    with pytest.raises(ValueError, match="zero membership everywhere; pass `bounds`"):
+        MFPiecewiseLinear.approximate(MFPiecewiseLinear(xs=(0.0, 1.0), ys=(0.0, 0.0)))
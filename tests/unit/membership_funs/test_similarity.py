@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.fuzzy_rules.fuzzy_rule import FuzzyRule
+from src.mostly.fuzzy_rules.logical_operators import Is
+from src.mostly.inference.mamdani import MamdaniFIS
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.piecewise_linear import MFPiecewiseLinear
+from src.mostly.membership_functions.tabulated import MFTabulated
+from src.mostly.membership_functions.trapezoidal import MFTrapezoidal
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+@pytest.fixture
+def mixed_linguistic_variable() -> LinguisticVariable:
+    """Fixture that returns a variable mixing piecewise-linear, Gaussian and bell-shaped terms."""
+    return LinguisticVariable(
+        concept="pressure",
+        uod=(0.0, 10.0),
+        fuzzy_sets={
+            "low": MFTriangular(a=0.0, b=0.0, c=4.0),
+            "mid": MFTrapezoidal(a=2.0, b=4.0, c=6.0, d=8.0),
+            "kinked": MFPiecewiseLinear(xs=(1.0, 3.0, 5.0, 9.0), ys=(0.0, 0.9, 0.3, 0.0)),
+            "high": MFTriangular(a=6.0, b=10.0, c=10.0),
+            "around_five": MFGaussian(mean=5.0, sigma=1.5),
+            "around_six": MFGaussian(mean=6.0, sigma=0.8),
+            "bell": MFGeneralizedBell(width=2.0, slope=3.0, center=7.0),
+            "table": MFTabulated(mf=MFGaussian(mean=3.0, sigma=1.0), uod=(0.0, 10.0), size=101),
+        },
+    )
+
+
+def brute_force_similarity(lv: LinguisticVariable, measure: str) -> np.ndarray:
+    """Compute the similarity matrix on a very fine grid."""
+    x = np.linspace(*lv.uod, 400_001)
+    values = lv.term_bank.evaluate(x)
+    areas = np.trapezoid(values, x, axis=0)
+    intersections = np.trapezoid(np.minimum(values[:, :, np.newaxis], values[:, np.newaxis, :]), x, axis=0)
+    if measure == "jaccard":
+        return intersections / (areas[:, np.newaxis] + areas[np.newaxis, :] - intersections)
+    return intersections / np.minimum(areas[:, np.newaxis], areas[np.newaxis, :])
+
+
+# region POSITIVE TESTS
+
+
+@pytest.mark.parametrize("measure", ["jaccard", "overlap"])
+def test_similarity_matches_numerics(mixed_linguistic_variable: LinguisticVariable, measure: str) -> None:
+    """Test closed-form and sampled similarities against a brute-force integration."""
+    similarity = mixed_linguistic_variable.similarity(measure)
+
+    assert list(similarity.index) == list(similarity.columns) == list(mixed_linguistic_variable.fuzzy_sets)
+    expected = brute_force_similarity(mixed_linguistic_variable, measure)
+    np.testing.assert_allclose(similarity.to_numpy(), expected, atol=1e-5)
+    np.testing.assert_array_equal(similarity.to_numpy(), similarity.to_numpy().T)
+    assert (np.diag(similarity.to_numpy()) == 1.0).all()
+
+
+def test_closed_forms_are_exact() -> None:
+    """Test hand-computed similarities of two triangles and of two Gaussians."""
+    lv = LinguisticVariable(
+        concept="x",
+        uod=(-40.0, 40.0),
+        fuzzy_sets={
+            "below": MFTriangular(a=-40.0, b=-40.0, c=40.0),
+            "above": MFTriangular(a=-40.0, b=40.0, c=40.0),
+            "left": MFTriangular(a=-2.0, b=0.0, c=2.0),
+            "right": MFTriangular(a=0.0, b=2.0, c=4.0),
+            "narrow": MFGaussian(mean=0.0, sigma=1.0),
+            "wide": MFGaussian(mean=0.0, sigma=2.0),
+        },
+    )
+
+    jaccard, overlap = lv.similarity("jaccard"), lv.similarity("overlap")
+
+    # The triangles meet at x = 1 with degree 0.5, so they share a triangle of area 0.5 out of 2 each
+    assert jaccard.loc["left", "right"] == pytest.approx(0.5 / 3.5, rel=1e-12)
+    assert overlap.loc["left", "right"] == pytest.approx(0.25, rel=1e-12)
+    # The narrow Gaussian lies entirely below the wide one
+    assert jaccard.loc["narrow", "wide"] == pytest.approx(0.5, rel=1e-12)
+    assert overlap.loc["narrow", "wide"] == pytest.approx(1.0, rel=1e-12)
+
+
+def test_identical_and_disjoint_sets(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that duplicates have a similarity of one and sets without common support of zero."""
+    lv = LinguisticVariable(
+        concept="temperature",
+        uod=(0.0, 100.0),
+        fuzzy_sets={**simple_linguistic_variable.fuzzy_sets, "also_warm": MFTriangular(a=25.0, b=50.0, c=75.0)},
+    )
+
+    similarity = lv.similarity()
+
+    assert similarity.loc["warm", "also_warm"] == 1.0
+    assert similarity.loc["cold", "hot"] == 0.0
+
+
+def test_overlap_exceeds_jaccard(mixed_linguistic_variable: LinguisticVariable) -> None:
+    """Test that the overlap similarity is never below the Jaccard similarity."""
+    jaccard, overlap = mixed_linguistic_variable.similarity("jaccard"), mixed_linguistic_variable.similarity("overlap")
+
+    assert (overlap.to_numpy() >= jaccard.to_numpy()).all()
+
+
+def test_fis_similarity(simple_linguistic_variable: LinguisticVariable, mixed_linguistic_variable) -> None:
+    """Test that a FIS reports one similarity matrix per input and output variable."""
+    fis = MamdaniFIS(
+        input_variables={"pressure": mixed_linguistic_variable},
+        output_variables={"temperature": simple_linguistic_variable},
+        fuzzy_rules=[FuzzyRule(antecedent=Is(concept="pressure", term="low"), consequences={"temperature": "hot"})],
+    )
+
+    similarities = fis.similarity("overlap")
+
+    assert list(similarities) == ["pressure", "temperature"]
+    assert similarities["temperature"].equals(simple_linguistic_variable.similarity("overlap"))
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize("measure, resolution", [("cosine", 1001), ("jaccard", 1)])
+def test_invalid_similarity_arguments_raise(
+    simple_linguistic_variable: LinguisticVariable, measure, resolution
+) -> None:
+    """Test that unknown measures and grids with fewer than two points are rejected."""
+    with pytest.raises(ValidationError):
+        simple_linguistic_variable.similarity(measure, resolution)
@@ -0,0 +1,124 @@
+import pickle
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.base import MembershipFunction
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.tabulated import MFTabulated
+
+
+class CosineMF(MembershipFunction):
+    """A custom membership function with a pure Python body and no array kernel."""
+
+    center: float = 50.0
+    width: float = 50.0
+
+    def __call__(self, x: float) -> float:
+        """Calculate a raised-cosine degree of membership."""
+        z = min(abs(x - self.center) / self.width, 1.0)
+        return 0.5 * (1.0 + float(np.cos(np.pi * z)))
+
+
+@pytest.fixture
+def tabulated_bell_mf(regular_generalized_bell_mf: MFGeneralizedBell) -> MFTabulated:
+    """Fixture that returns a generalized bell tabulated over [0, 10]."""
+    return MFTabulated(mf=regular_generalized_bell_mf, uod=(0.0, 10.0), size=201)
+
+
+# region POSITIVE TESTS
+
+
+def test_evaluation_paths_agree(tabulated_bell_mf: MFTabulated) -> None:
+    """Test that the validated, trusted and vectorized lookups return exactly the same degrees."""
+    x = np.concatenate([np.linspace(-1.0, 11.0, 2401), [0.0, 10.0]])
+
+    expected = tabulated_bell_mf.evaluate(x)
+    assert [tabulated_bell_mf.trusted(v) for v in x.tolist()] == expected.tolist()
+    assert [tabulated_bell_mf(v) for v in x.tolist()] == expected.tolist()
+
+
+def test_lookup_hits_samples_and_clamps(tabulated_bell_mf: MFTabulated) -> None:
+    """Test that the lookup reproduces the samples and clamps inputs outside the range."""
+    samples = np.linspace(0.0, 10.0, 201)
+    wrapped = tabulated_bell_mf.mf
+
+    np.testing.assert_allclose(tabulated_bell_mf.evaluate(samples), wrapped.evaluate(samples), rtol=1e-12)
+    assert tabulated_bell_mf(-5.0) == wrapped(0.0)
+    assert tabulated_bell_mf(15.0) == wrapped(10.0)
+
+
+@pytest.mark.parametrize("size", [51, 201, 1001])
+def test_interpolation_error_is_reported(regular_generalized_bell_mf: MFGeneralizedBell, size: int) -> None:
+    """Test that the reported error matches the observed one and shrinks with the table size."""
+    tabulated = MFTabulated(mf=regular_generalized_bell_mf, uod=(0.0, 10.0), size=size)
+    x = np.linspace(0.0, 10.0, 200_001)
+    observed = np.abs(tabulated.evaluate(x) - regular_generalized_bell_mf.evaluate(x)).max()
+
+    assert observed == pytest.approx(tabulated.interpolation_error(), rel=0.05)
+    assert tabulated.interpolation_error() < 2.0 / size**2 * 100
+
+
+def test_table_follows_wrapped_function(tabulated_bell_mf: MFTabulated) -> None:
+    """Test that changing the wrapped membership function resamples the table."""
+    assert tabulated_bell_mf.trusted(5.0) == 1.0
+
+    tabulated_bell_mf.mf.center = 2.0
+
+    assert tabulated_bell_mf.trusted(2.0) == 1.0
+    assert tabulated_bell_mf.evaluate(2.0) == 1.0
+    assert tabulated_bell_mf.trusted(5.0) < 1.0
+
+
+def test_integrals_of_table(tabulated_bell_mf: MFTabulated) -> None:
+    """Test that the table integrates exactly as the equivalent piecewise-linear function."""
+    pwl = tabulated_bell_mf.as_piecewise_linear()
+
+    assert tabulated_bell_mf.area(0.5, "clip", (0.0, 10.0)) == pwl.area(0.5, "clip", (0.0, 10.0))
+    assert tabulated_bell_mf.area(bounds=(0.0, 10.0)) == pytest.approx(tabulated_bell_mf.mf.area(bounds=(0.0, 10.0)))
+    assert tabulated_bell_mf.alpha_cut(0.5) == pytest.approx((3.0, 7.0), abs=1e-3)
+
+
+def test_pickle_round_trip(tabulated_bell_mf: MFTabulated) -> None:
+    """Test that pickling drops the cached table and lookup closure, which are rebuilt on demand."""
+    restored = pickle.loads(pickle.dumps(tabulated_bell_mf))
+
+    assert restored == tabulated_bell_mf
+    assert restored.trusted(3.3) == tabulated_bell_mf.trusted(3.3)
+
+
+def test_linguistic_variable_tabulated() -> None:
+    """Test that a variable with a custom term can be tabulated over its UOD."""
+    lv = LinguisticVariable(
+        concept="speed",
+        uod=(0.0, 100.0),
+        fuzzy_sets={"medium": CosineMF(), "low": MFGaussian(mean=0.0, sigma=30.0)},
+    )
+
+    tabulated = lv.tabulated(size=2001, terms=["medium"])
+
+    assert isinstance(tabulated.fuzzy_sets["medium"], MFTabulated)
+    assert tabulated.fuzzy_sets["low"] is lv.fuzzy_sets["low"]
+    assert not isinstance(lv.fuzzy_sets["medium"], MFTabulated)
+    for x in (0.0, 12.5, 33.3, 50.0, 99.0):
+        assert tabulated.fuzzify(x) == pytest.approx(lv.fuzzify(x), abs=1e-5)
+    assert lv.tabulated().fuzzy_sets.keys() == lv.fuzzy_sets.keys()
+
+
+# region NEGATIVE TESTS
+
+
+@pytest.mark.parametrize("uod, size", [((10.0, 0.0), 101), ((5.0, 5.0), 101), ((0.0, 10.0), 1)])
+def test_invalid_tables_raise(regular_gaussian_mf: MFGaussian, uod, size) -> None:
+    """Test that empty sampling ranges and tables with fewer than two samples are rejected."""
+    with pytest.raises(ValidationError):
+        MFTabulated(mf=regular_gaussian_mf, uod=uod, size=size)
+
+
+def test_tabulating_unknown_term_raises(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that only existing terms can be tabulated."""
+    with pytest.raises(ValueError, match="not found"):
+        simple_linguistic_variable.tabulated(terms=["freezing"])
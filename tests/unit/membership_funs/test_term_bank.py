@@ -0,0 +1,111 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from src.mostly.linguistic_variable import LinguisticVariable
+from src.mostly.membership_functions.bimodal_gaussian import MFBimodalGaussian
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.generalized_bell import MFGeneralizedBell
+from src.mostly.membership_functions.term_bank import TermBank
+from src.mostly.membership_functions.trapezoidal import MFTrapezoidal
+from src.mostly.membership_functions.triangle import MFTriangular
+
+
+class ConstantMF(MFTriangular):
+    """A subclass with its own scalar body, which must not be packed as a triangle."""
+
+    def __call__(self, x: float) -> float:
+        """Return a constant degree of membership."""
+        return 0.25
+
+
+@pytest.fixture
+def mixed_fuzzy_sets(dummy_mf) -> dict:
+    """Fixture with every built-in shape, including shoulders, and two terms without a kernel."""
+    return {
+        "left_tri": MFTriangular(a=0.0, b=0.0, c=4.0),
+        "gauss": MFGaussian(mean=5.0, sigma=1.5),
+        "tri": MFTriangular(a=2.0, b=5.0, c=8.0),
+        "right_tri": MFTriangular(a=6.0, b=10.0, c=10.0),
+        "trap": MFTrapezoidal(a=1.0, b=3.0, c=6.0, d=9.0),
+        "left_trap": MFTrapezoidal(a=0.0, b=0.0, c=2.0, d=5.0),
+        "right_trap": MFTrapezoidal(a=5.0, b=8.0, c=10.0, d=10.0),
+        "bell": MFGeneralizedBell(width=2.0, slope=4.0, center=5.0),
+        "bell_square": MFGeneralizedBell(width=2.0, slope=1.0, center=3.0),
+        "plateau": MFBimodalGaussian(left_mean=3.0, left_sigma=1.0, right_mean=7.0, right_sigma=0.5),
+        "product": MFBimodalGaussian(left_mean=7.0, left_sigma=1.0, right_mean=3.0, right_sigma=2.0),
+        "custom": ConstantMF(a=0.0, b=5.0, c=10.0),
+        "dummy": dummy_mf,
+    }
+
+
+# region POSITIVE TESTS
+
+
+def test_bank_matches_individual_evaluation(mixed_fuzzy_sets) -> None:
+    """Test that the packed kernels return exactly what each term returns on its own."""
+    bank = TermBank(mixed_fuzzy_sets)
+    x = np.concatenate([np.linspace(-5.0, 15.0, 401), [0.0, 2.0, 3.0, 5.0, 6.0, 7.0, 8.0, 10.0]])
+
+    result = bank.evaluate(x)
+
+    assert bank.terms == tuple(mixed_fuzzy_sets)
+    assert result.shape == (x.size, len(mixed_fuzzy_sets))
+    for term, mf in mixed_fuzzy_sets.items():
+        np.testing.assert_array_equal(result[:, bank.index[term]], mf.evaluate(x), err_msg=term)
+
+
+def test_bank_shapes(mixed_fuzzy_sets) -> None:
+    """Test that the term axis is appended to the input shape."""
+    bank = TermBank(mixed_fuzzy_sets)
+
+    assert bank.evaluate(5.0).shape == (len(bank),)
+    assert bank.evaluate(np.zeros((2, 3))).shape == (2, 3, len(bank))
+
+
+def test_linguistic_variable_term_bank(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that the term bank of a variable agrees with `fuzzify`."""
+    bank = simple_linguistic_variable.term_bank
+
+    for x in (0.0, 30.0, 62.5, 100.0):
+        expected = simple_linguistic_variable.fuzzify(x)
+        assert dict(zip(bank.terms, bank.evaluate(x).tolist(), strict=True)) == expected
+
+
+# region INVALIDATION TESTS
+
+
+def test_term_bank_rebuilt_after_parameter_change(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that mutating a term's parameters invalidates the cached term bank."""
+    assert simple_linguistic_variable.term_bank.evaluate(40.0)[1] == pytest.approx(0.6)
+
+    simple_linguistic_variable.fuzzy_sets["warm"].b = 40.0
+
+    assert simple_linguistic_variable.term_bank.evaluate(40.0)[1] == 1.0
+
+
+def test_term_bank_rebuilt_after_fuzzy_set_mutation(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that adding or replacing terms invalidates the cached term bank."""
+    assert len(simple_linguistic_variable.term_bank) == 3
+
+    simple_linguistic_variable.fuzzy_sets["mild"] = MFGaussian(mean=40.0, sigma=5.0)
+    assert simple_linguistic_variable.term_bank.terms == ("cold", "warm", "hot", "mild")
+
+    simple_linguistic_variable.fuzzy_sets = {"any": MFTrapezoidal(a=0.0, b=0.0, c=50.0, d=150.0)}
+    assert simple_linguistic_variable.term_bank.terms == ("any",)
+
+    simple_linguistic_variable.fuzzy_sets["none"] = MFTriangular(a=0.0, b=0.0, c=10.0)
+    assert simple_linguistic_variable.term_bank.terms == ("any", "none")
+
+
+def test_copies_and_pickles_do_not_share_term_banks(simple_linguistic_variable: LinguisticVariable) -> None:
+    """Test that derived structures are neither shared between copies nor part of equality."""
+    original = simple_linguistic_variable.term_bank
+    clone = copy.deepcopy(simple_linguistic_variable)
+    restored = pickle.loads(pickle.dumps(simple_linguistic_variable))
+
+    assert clone == simple_linguistic_variable == restored
+    assert clone.term_bank is not original
+    assert restored.term_bank is not original
@@ -0,0 +1,47 @@
+import pickle
+
+import numpy as np
+
+from src.mostly.membership_functions.gaussian import MFGaussian
+from src.mostly.membership_functions.triangle import MFTriangular
+
+# region POSITIVE TESTS
+
+
+def test_trusted_matches_validated_call(mf) -> None:
+    """Test that the trusted evaluator returns exactly what the validated path returns."""
+    x = np.concatenate([np.linspace(-20.0, 30.0, 501), [0.0, 3.0, 4.0, 5.0, 6.0, 7.0, 10.0]]).tolist()
+
+    assert [mf.trusted(v) for v in x] == [mf(v) for v in x]
+
+
+def test_trusted_follows_parameter_changes() -> None:
+    """Test that reassigning a parameter recompiles the trusted evaluator."""
+    mf = MFTriangular(a=0.0, b=5.0, c=10.0)
+    assert mf.trusted(5.0) == 1.0
+
+    mf.b = 0.0
+    assert mf.shape == "left"
+    assert mf.trusted(0.0) == mf(0.0) == 1.0
+
+
+def test_trusted_follows_model_copy() -> None:
+    """Test that copies with updated parameters evaluate with the new parameters."""
+    mf = MFGaussian(mean=5.0, sigma=1.0)
+    shifted = mf.model_copy(update={"mean": 6.0})
+
+    assert shifted.trusted(6.0) == 1.0
+    assert mf.trusted(5.0) == 1.0
+
+
+def test_pickle_roundtrip(regular_trapezoidal_mf) -> None:
+    """Test that membership functions stay picklable and evaluate after unpickling."""
+    restored = pickle.loads(pickle.dumps(regular_trapezoidal_mf))
+
+    assert restored == regular_trapezoidal_mf
+    assert restored.trusted(2.0) == 0.5
+
+
+def test_generic_fallback_is_validated_call(dummy_mf) -> None:
+    """Test that membership functions without a compiled evaluator fall back to `__call__`."""
+    assert dummy_mf.trusted(1.0) == 1.5